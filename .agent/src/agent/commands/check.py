@@ -28,6 +28,7 @@ import os
 # from agent.core.ai import ai_service # Moved to local import
 from agent.core.ai.prompts import generate_impact_prompt
 from agent.core.config import config
+from agent.core.git_state import git_state
 from agent.core.context import context_loader
 from agent.core.governance import convene_council_full
 from agent.core.utils import infer_story_id, scrub_sensitive_data
@@ -55,9 +56,7 @@ def _write_preflight_cache(story_id: str, verdict: str) -> None:
         import json as _json
         import time as _time
         _marker_path = config.cache_dir / ".preflight_result"
-        _head_sha = subprocess.run(
-            ["git", "rev-parse", "HEAD"], capture_output=True, text=True
-        ).stdout.strip()
+        _head_sha = git_state.head()
         _marker_path.write_text(_json.dumps({
             "story_id": story_id,
             "timestamp": _time.strftime("%Y-%m-%dT%H:%M:%S"),
@@ -101,7 +100,8 @@ def preflight(
     thorough: bool = typer.Option(True, "--thorough", help="Enable thorough AI review with full-file context (Default: True)."),
     quick: bool = typer.Option(False, "--quick", help="Opt out of thorough mode for fast/cheap runs."),
     legacy_context: bool = typer.Option(False, "--legacy-context", help="Use full legacy context instead of Oracle Pattern."),
-    gate: Optional[str] = typer.Option(None, "--gate", help="Run a specific gate isolated.")
+    gate: Optional[str] = typer.Option(None, "--gate", help="Run a specific gate isolated."),
+    no_review_cache: bool = typer.Option(False, "--no-review-cache", help="Re-review every file with every role instead of reusing cached verdicts for unchanged files."),
 ):
     """
     Run preflight checks (linting, tests, and optional AI governance review).
@@ -117,6 +117,7 @@ def preflight(
         panel_engine: Override panel engine ('adk' or 'native').
         thorough: Enable thorough AI review with full-file context and post-processing validation.
         legacy_context: Use full legacy context instead of Oracle Pattern.
+        no_review_cache: Re-review all files instead of reusing cached per-file verdicts.
     """
     import time as _pf_time
     _preflight_start = _pf_time.time()
@@ -170,8 +171,7 @@ def preflight(
     # Check for unstaged changes (Security Maintenance)
     # Check for unstaged changes (Security Maintenance)
     try:
-        unstaged_res = subprocess.run(["git", "diff", "--name-only"], capture_output=True, text=True)
-        if unstaged_res.stdout.strip():
+        if git_state.unstaged_files():
             console.print("[yellow]⚠️  Warning: Unstaged changes detected.[/yellow]")
             console.print("[dim]    Note: The AI will only review what is STAGED for commit.[/dim]")
             # We proceed instead of blocking
@@ -329,7 +329,6 @@ def preflight(
 
     # 1.5 Run Automated Tests
     from agent.core.check.testing import run_smart_test_selection
-    import subprocess
     
     test_result = run_smart_test_selection(base, skip_tests, interactive, ignore_tests)
     tests_ok = True
@@ -479,13 +478,7 @@ def preflight(
 
     # 2. Get Changed Files (for AI review)
     # Re-run diff cleanly
-    if base:
-        cmd = ["git", "diff", "--name-only", f"origin/{base}...HEAD"]
-    else:
-        cmd = ["git", "diff", "--cached", "--name-only"]
-        
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    files = result.stdout.strip().splitlines()
+    files = git_state.changed_files(base)
     
     if not files or files == ['']:
         console.print("[yellow]⚠️  No files to review.[/yellow]")
@@ -519,8 +512,8 @@ def preflight(
     # but for assimilating roles, we send the same diff to each role agent.
     # We'll stick to a reasonable cap for now to fit in context.
     diff_context_lines = "10" if legacy_context else "3" # Oracle Pattern uses -U3 to reduce noise
-    diff_cmd = cmd = ["git", "diff", "--cached", f"-U{diff_context_lines}", "."] if not base else ["git", "diff", f"origin/{base}...HEAD", f"-U{diff_context_lines}", "."]
-    diff_res = subprocess.run(diff_cmd, capture_output=True, text=True)
+    diff_cmd = ["diff", "--cached", f"-U{diff_context_lines}", "."] if not base else ["diff", f"origin/{base}...HEAD", f"-U{diff_context_lines}", "."]
+    diff_res = git_state.query(*diff_cmd)
     # Full diff for chunking
     full_diff = diff_res.stdout
     if not full_diff:
@@ -567,8 +560,8 @@ def preflight(
                 console.print(f"\n[bold cyan]🔄 Re-running Governance Council (attempt {governance_attempt + 1}/{MAX_GOVERNANCE_RETRIES})...[/bold cyan]")
                 
                 # Re-compute diff after fix was applied
-                diff_cmd = ["git", "diff", "--cached", f"-U{diff_context_lines}", "."] if not base else ["git", "diff", f"origin/{base}...HEAD", f"-U{diff_context_lines}", "."]
-                diff_res = subprocess.run(diff_cmd, capture_output=True, text=True)
+                # Served from cache unless the fix changed the index
+                diff_res = git_state.query(*diff_cmd)
                 full_diff = diff_res.stdout or ""
                 
                 # Re-scrub sensitive data
@@ -631,6 +624,7 @@ def preflight(
                         adrs_content=adrs_content,
                         thorough=thorough,
                         progress_callback=_progress,
+                        use_review_cache=not no_review_cache,
                     )
                 except Exception as e:
                     console.print(f"\n[bold red]❌ Governance Panel Failed:[/bold red] {e}")
@@ -709,9 +703,7 @@ def preflight(
                 import json as _json
                 import time as _time
                 _marker_path = config.cache_dir / ".preflight_result"
-                _head_sha = subprocess.run(
-                    ["git", "rev-parse", "HEAD"], capture_output=True, text=True
-                ).stdout.strip()
+                _head_sha = git_state.head()
                 _overall = result.get("json_report", {}).get("overall_verdict", "UNKNOWN")
                 _role_verdicts = {
                     r["name"]: {"verdict": r.get("verdict", "UNKNOWN"), "summary": r.get("summary", "")}
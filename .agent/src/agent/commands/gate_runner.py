@@ -0,0 +1,324 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Concurrent scheduler for post-apply gates and QA suites.
+
+Independent gates run on a bounded thread pool. Shell commands started
+through :meth:`GateContext.run_command` stream their output line by line,
+labelled with the gate name, and are killed (whole process group) when
+the run is cancelled or times out: SIGTERM first, then SIGKILL after
+``KILL_GRACE_S``. With ``fail_fast`` the first failing *hard* gate
+cancels everything still queued or running. A gate that schedules its own
+sub-gates (the QA gate's suites) passes its context as ``parent`` so that
+cancelling the outer run also kills the inner commands, and so that the
+sub-gates share the outer run's job slots: the waiting gate lends its
+slot to them, keeping at most ``jobs`` gates running at every level.
+
+Every gate's wall-clock duration is written back to its
+``GateResult.elapsed_seconds``, logged as ``gate_duration`` and recorded
+on a ``gate.<name>`` span.
+"""
+
+import collections
+import os
+import signal
+import subprocess
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from opentelemetry import trace
+
+from agent.commands.gates import GateResult
+from agent.core.logger import get_logger
+
+logger = get_logger(__name__)
+tracer = trace.get_tracer(__name__)
+
+OutputCallback = Callable[[str, str], None]
+
+DEFAULT_MAX_JOBS = 4
+# Seconds between SIGTERM and SIGKILL for a cancelled or timed-out command
+KILL_GRACE_S = 5.0
+_TAIL_LINES = 10
+
+
+def default_jobs() -> int:
+    """Job limit from ``AGENT_GATE_JOBS``, else ``min(4, cpu_count)``."""
+    raw = os.getenv("AGENT_GATE_JOBS", "").strip()
+    if raw.isdigit() and int(raw) > 0:
+        return int(raw)
+    return max(1, min(DEFAULT_MAX_JOBS, os.cpu_count() or 1))
+
+
+@dataclass
+class CommandResult:
+    """Outcome of a streamed shell command."""
+
+    returncode: Optional[int]
+    tail: List[str]
+    timed_out: bool = False
+    cancelled: bool = False
+
+
+class GateContext:
+    """Per-gate handle for emitting output and running cancellable commands."""
+
+    def __init__(self, name: str, on_output: Optional[OutputCallback], cancel_event: threading.Event,
+                 parent: "Optional[GateContext]" = None, slots: Optional[threading.Semaphore] = None):
+        self.name = name
+        self._on_output = on_output
+        self._cancel_event = cancel_event
+        self._parent = parent
+        self.slots = slots
+        self._holds_slot = False
+        self._procs: List[subprocess.Popen] = []
+        self._lock = threading.Lock()
+
+    def acquire_slot(self) -> None:
+        """Block until one of the run's job slots is free."""
+        if self.slots is not None and not self._holds_slot:
+            self.slots.acquire()
+            self._holds_slot = True
+
+    def release_slot(self) -> bool:
+        """Give back this gate's job slot; returns True if it held one."""
+        if not self._holds_slot:
+            return False
+        self._holds_slot = False
+        self.slots.release()  # type: ignore[union-attr]
+        return True
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set() or (self._parent is not None and self._parent.cancelled)
+
+    def _track(self, proc: subprocess.Popen, running: bool) -> None:
+        """Register ``proc`` here and with every ancestor, so each can kill it."""
+        ctx: Optional[GateContext] = self
+        while ctx is not None:
+            with ctx._lock:
+                if running:
+                    ctx._procs.append(proc)
+                else:
+                    ctx._procs.remove(proc)
+            ctx = ctx._parent
+
+    def emit(self, line: str) -> None:
+        if self._on_output is not None:
+            self._on_output(self.name, line)
+
+    def run_command(self, cmd: str, timeout: float = 300) -> CommandResult:
+        """Run ``cmd`` in a shell, streaming merged stdout/stderr via :meth:`emit`.
+
+        Raises:
+            FileNotFoundError: If the shell itself cannot be started.
+        """
+        if self.cancelled:
+            return CommandResult(returncode=None, tail=[], cancelled=True)
+        proc = subprocess.Popen(
+            cmd,
+            shell=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+            start_new_session=True,
+        )
+        self._track(proc, running=True)
+        if self.cancelled:  # cancelled while starting; terminate() may have missed it
+            _kill(proc)
+        timed_out = threading.Event()
+
+        def on_timeout() -> None:
+            timed_out.set()
+            _kill(proc)
+
+        timer = threading.Timer(timeout, on_timeout)
+        timer.daemon = True
+        timer.start()
+        tail: collections.deque = collections.deque(maxlen=_TAIL_LINES)
+        try:
+            for line in proc.stdout or ():
+                line = line.rstrip("\n")
+                tail.append(line)
+                self.emit(line)
+            proc.wait()
+        finally:
+            timer.cancel()
+            if proc.stdout is not None:
+                proc.stdout.close()  # marks the command finished for _kill's escalation
+            self._track(proc, running=False)
+        return CommandResult(
+            returncode=proc.returncode,
+            tail=list(tail),
+            timed_out=timed_out.is_set(),
+            cancelled=self.cancelled and not timed_out.is_set(),
+        )
+
+    def terminate(self) -> None:
+        """Kill every command this gate is currently running."""
+        with self._lock:
+            procs = list(self._procs)
+        for proc in procs:
+            _kill(proc)
+
+
+def _kill(proc: subprocess.Popen) -> None:
+    """Kill a shell command and its children (it runs in its own session).
+
+    The process group gets SIGTERM, then SIGKILL after ``KILL_GRACE_S`` if
+    the command is still running or a child still holds its output open.
+    """
+    if proc.poll() is not None:
+        return
+    if not hasattr(os, "killpg"):  # pragma: no cover - Windows
+        proc.kill()
+        return
+    _signal_group(proc, signal.SIGTERM)
+    escalate = threading.Timer(KILL_GRACE_S, _force_kill, (proc,))
+    escalate.daemon = True
+    escalate.start()
+
+
+def _force_kill(proc: subprocess.Popen) -> None:
+    if proc.poll() is None or (proc.stdout is not None and not proc.stdout.closed):
+        _signal_group(proc, signal.SIGKILL)
+
+
+def _signal_group(proc: subprocess.Popen, sig: int) -> None:
+    try:
+        os.killpg(proc.pid, sig)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+@dataclass
+class GateTask:
+    """A gate to schedule. ``hard`` failures trigger ``fail_fast`` cancellation."""
+
+    name: str
+    run: Callable[[GateContext], GateResult]
+    hard: bool = True
+
+
+def _execute(task: GateTask, ctx: GateContext) -> Optional[Tuple[GateResult, float]]:
+    ctx.acquire_slot()
+    try:
+        if ctx.cancelled:
+            return None  # picked up by a worker after fail-fast cancellation
+        start = time.perf_counter()
+        with tracer.start_as_current_span(f"gate.{task.name}") as span:
+            try:
+                result = task.run(ctx)
+            except Exception as exc:
+                logger.exception("gate_error gate=%s", task.name)
+                result = GateResult(name=task.name, passed=False, elapsed_seconds=0.0, details=f"Gate crashed: {exc}")
+            elapsed = time.perf_counter() - start
+            span.set_attribute("gate.passed", result.passed)
+            span.set_attribute("gate.duration_s", elapsed)
+        return result, elapsed
+    finally:
+        ctx.release_slot()
+
+
+def run_gates(
+    tasks: List[GateTask],
+    jobs: Optional[int] = None,
+    fail_fast: bool = False,
+    on_output: Optional[OutputCallback] = None,
+    parent: Optional[GateContext] = None,
+) -> List[GateResult]:
+    """Run ``tasks`` concurrently and return their results in task order.
+
+    Args:
+        tasks: Independent gates to run.
+        jobs: Maximum gates running at once (default: :func:`default_jobs`).
+            A nested run is also bounded by its parent run's slots.
+        fail_fast: Cancel queued and running gates after the first hard failure.
+        on_output: ``(gate_name, line)`` callback for streamed command output.
+            Called from worker threads, serialized by the scheduler.
+        parent: Context of the enclosing gate when this run is nested in
+            another; cancelling the parent cancels these tasks too, and the
+            parent's job slot is lent to them while it waits.
+
+    Returns:
+        One ``GateResult`` per task. Gates cancelled by ``fail_fast`` are
+        reported as failed with a "Cancelled" detail.
+    """
+    if not tasks:
+        return []
+    jobs = max(1, jobs or default_jobs())
+    slots = parent.slots if parent is not None and parent.slots is not None else threading.Semaphore(jobs)
+    cancel_event = threading.Event()
+    emit_lock = threading.Lock()
+
+    def locked_output(name: str, line: str) -> None:
+        with emit_lock:
+            on_output(name, line)  # type: ignore[misc]
+
+    contexts = [
+        GateContext(t.name, locked_output if on_output else None, cancel_event, parent=parent, slots=slots)
+        for t in tasks
+    ]
+    results: Dict[int, GateResult] = {}
+    failed_by: Optional[str] = None
+
+    # A nested run's parent only waits on it, so its slot goes to the sub-gates
+    lent = parent is not None and parent.release_slot()
+    try:
+        with ThreadPoolExecutor(max_workers=min(jobs, len(tasks)), thread_name_prefix="gate") as pool:
+            futures: Dict[Future, int] = {
+                pool.submit(_execute, task, ctx): i for i, (task, ctx) in enumerate(zip(tasks, contexts))
+            }
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = futures[future]
+                    outcome = None if future.cancelled() else future.result()
+                    if outcome is None:
+                        continue
+                    result, elapsed = outcome
+                    result.elapsed_seconds = elapsed
+                    results[index] = result
+                    logger.info(
+                        "gate_duration gate=%s seconds=%.2f passed=%s", tasks[index].name, elapsed, result.passed
+                    )
+                    if fail_fast and failed_by is None and not result.passed and tasks[index].hard:
+                        failed_by = tasks[index].name
+                        cancel_event.set()
+                        for other in pending:
+                            other.cancel()
+                        for ctx in contexts:
+                            ctx.terminate()
+    finally:
+        if lent:
+            parent.acquire_slot()  # type: ignore[union-attr]
+
+    for i, task in enumerate(tasks):
+        if i not in results:
+            results[i] = GateResult(
+                name=task.name, passed=False, elapsed_seconds=0.0,
+                details=f"Cancelled after '{failed_by}' failed." if failed_by else "Cancelled.",
+            )
+    return [results[i] for i in range(len(tasks))]
+
+
+def format_durations(results: List[GateResult]) -> str:
+    """One-line summary of gate durations, slowest first."""
+    ordered = sorted(results, key=lambda r: r.elapsed_seconds, reverse=True)
+    return ", ".join(f"{r.name} {r.elapsed_seconds:.2f}s" for r in ordered)
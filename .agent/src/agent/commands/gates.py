@@ -27,10 +27,14 @@ from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Callable, List, Optional
 from opentelemetry import trace
+from agent.core.git_state import git_state
 from agent.core.logger import get_logger
 
+if TYPE_CHECKING:
+    from agent.commands.gate_runner import GateContext
+
 
 # Re-exported from agent.utils.path_utils so both the commands layer and any
 # legacy tests that patch "agent.commands.gates.validate_path_integrity" continue
@@ -82,6 +86,8 @@ def run_security_scan(
 
     Reads regex patterns from a YAML file and checks each file against them.
     Reports presence of matches without logging matched content (PII-safe).
+    Compiled patterns and per-file results are cached for the process, so
+    repeated gate runs only rescan files whose content changed.
 
     Args:
         filepaths: List of file paths to scan.
@@ -102,10 +108,11 @@ def run_security_scan(
             details="Skipped — no security_patterns.yaml found.",
         )
 
+    from agent.commands import security_scanner  # lazy: keeps gates import-light
+
     try:
-        import yaml  # ADR-025: lazy import
-        patterns: dict = yaml.safe_load(patterns_path.read_text()) or {}
-    except Exception as exc:  # catch yaml.YAMLError + ImportError
+        scanner = security_scanner.load_scanner(patterns_path)
+    except Exception as exc:  # catch yaml.YAMLError + ImportError + bad regex
         elapsed = time.time() - start
         logger.error("Error parsing security patterns: %s", exc)
         return GateResult(
@@ -116,22 +123,14 @@ def run_security_scan(
         )
 
     findings: List[str] = []
-    for filepath in filepaths:
-        if not filepath.exists():
-            continue
-        try:
-            content = filepath.read_text(errors="ignore")
-        except OSError:
-            continue
-
-        for pattern_name, pattern_regex in patterns.items():
-            if re.search(pattern_regex, content):
-                findings.append(f"{pattern_name} in {filepath.name}")
-                logger.warning(
-                    "Security finding: %s detected in %s",
-                    pattern_name,
-                    filepath.name,
-                )
+    for filepath, pattern_names in security_scanner.scan_files(scanner, filepaths):
+        for pattern_name in pattern_names:
+            findings.append(f"{pattern_name} in {filepath.name}")
+            logger.warning(
+                "Security finding: %s detected in %s",
+                pattern_name,
+                filepath.name,
+            )
 
     elapsed = time.time() - start
     if findings:
@@ -152,6 +151,10 @@ def run_security_scan(
 def run_qa_gate(
     test_command: "str | dict[str, str]" = "pytest",
     modified_files: "Optional[List[str]]" = None,
+    jobs: Optional[int] = None,
+    fail_fast: bool = False,
+    on_output: "Optional[Callable[[str, str], None]]" = None,
+    context: "Optional[GateContext]" = None,
 ) -> GateResult:
     """Execute the configured test suite(s) as a QA gate.
 
@@ -170,17 +173,27 @@ def run_qa_gate(
 
     When a dict is provided, only the commands whose key is a prefix of at
     least one modified file are executed. If *modified_files* is empty or
-    None, all commands run (safe default for manual invocations).
+    None, all commands run (safe default for manual invocations). Selected
+    suites run concurrently (see :mod:`agent.commands.gate_runner`).
 
     Args:
         test_command: Either a shell command string or a ``{prefix: command}``
             mapping loaded from ``agent.yaml``.
         modified_files: Repo-relative paths of files changed in this step.
             Used to select which scoped suites to run.
+        jobs: Maximum suites running at once (default ``AGENT_GATE_JOBS``).
+        fail_fast: Kill the remaining suites as soon as one fails.
+        on_output: ``(suite_label, line)`` callback for streamed test output.
+        context: The enclosing gate's context when the QA gate itself runs
+            under :func:`~agent.commands.gate_runner.run_gates`. Cancelling
+            that run then kills these suites, and their output is emitted
+            through it (prefixed with the suite label) unless *on_output* is set.
 
     Returns:
         GateResult aggregating pass/fail across all selected suites.
     """
+    from agent.commands.gate_runner import GateTask, run_gates  # circular at import time
+
     start = time.time()
 
     # ── Resolve which commands to run ────────────────────────────────────────
@@ -206,35 +219,37 @@ def run_qa_gate(
             details="No test suite matched the modified files — skipped.",
         )
 
-    # ── Run each selected command ─────────────────────────────────────────────
-    failures: list[str] = []
-    suite_labels: list[str] = []
-
-    for prefix, cmd in commands_to_run:
-        label = prefix.strip("/") or "default"
-        suite_labels.append(label)
-        logger.info("qa_gate suite=%s cmd=%s", label, cmd)
-        try:
-            result = subprocess.run(
-                cmd,
-                shell=True,
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=300,
-            )
-            if result.returncode != 0:
-                stderr_tail = "\n".join(result.stderr.strip().splitlines()[-10:])
-                failures.append(
-                    f"[{label}] exit {result.returncode}\n{stderr_tail}"
-                )
-        except FileNotFoundError:
-            failures.append(f"[{label}] command not found: {cmd}")
-        except subprocess.TimeoutExpired:
-            failures.append(f"[{label}] timed out after 300s")
+    # ── Run the selected suites concurrently ──────────────────────────────────
+    def suite(label: str, cmd: str):
+        def run(ctx) -> GateResult:
+            logger.info("qa_gate suite=%s cmd=%s", label, cmd)
+            try:
+                outcome = ctx.run_command(cmd, timeout=300)
+            except FileNotFoundError:
+                return GateResult(label, False, 0.0, f"[{label}] command not found: {cmd}")
+            if outcome.timed_out:
+                return GateResult(label, False, 0.0, f"[{label}] timed out after 300s")
+            if outcome.cancelled:
+                return GateResult(label, False, 0.0, f"[{label}] cancelled")
+            if outcome.returncode != 0:
+                tail = "\n".join(outcome.tail)
+                return GateResult(label, False, 0.0, f"[{label}] exit {outcome.returncode}\n{tail}")
+            return GateResult(label, True, 0.0)
+        return run
+
+    labels = [prefix.strip("/") or "default" for prefix, _ in commands_to_run]
+    tasks = [
+        GateTask(name=label, run=suite(label, cmd))
+        for label, (_, cmd) in zip(labels, commands_to_run)
+    ]
+    if on_output is None and context is not None:
+        def on_output(label: str, line: str) -> None:
+            context.emit(line if label == "default" else f"[{label}] {line}")
+    suite_results = run_gates(tasks, jobs=jobs, fail_fast=fail_fast, on_output=on_output, parent=context)
 
     elapsed = time.time() - start
-    suites_run = ", ".join(suite_labels)
+    suites_run = ", ".join(f"{r.name} {r.elapsed_seconds:.1f}s" for r in suite_results)
+    failures = [r.details for r in suite_results if not r.passed]
 
     if failures:
         return GateResult(
@@ -327,10 +342,7 @@ def check_commit_size(max_per_file: int = 20, max_total: int = 100) -> GateResul
 def _check_commit_size_impl(span: trace.Span, max_per_file: int, max_total: int) -> GateResult:
     start = time.time()
     try:
-        result = subprocess.run(
-            ["git", "diff", "--cached", "--numstat"],
-            capture_output=True, text=True, check=False, timeout=30,
-        )
+        result = git_state.query("diff", "--cached", "--numstat", timeout=30)
         if result.returncode != 0:
             elapsed = time.time() - start
             return GateResult(
@@ -528,10 +540,7 @@ def _check_pr_size_impl(span: trace.Span, threshold: int, commit_message: Option
         )
 
     try:
-        result = subprocess.run(
-            ["git", "diff", "--cached", "--numstat"],
-            capture_output=True, text=True, check=False, timeout=30,
-        )
+        result = git_state.query("diff", "--cached", "--numstat", timeout=30)
         if result.returncode != 0:
             elapsed = time.time() - start
             return GateResult(
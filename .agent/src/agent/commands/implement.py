@@ -30,6 +30,7 @@ from typing import Dict, List, Optional
 import typer
 from rich.console import Console
 from rich.markdown import Markdown
+from rich.markup import escape
 
 
 from agent.core.context import context_loader
@@ -37,6 +38,7 @@ from agent.core.config import config
 from agent.core import utils as agent_utils
 from agent.core.utils import find_runbook_file, get_next_id, scrub_sensitive_data
 from agent.commands import gates
+from agent.commands.gate_runner import GateTask, format_durations, run_gates
 from agent.commands.utils import update_story_state
 from agent.utils.validation_formatter import format_implementation_summary
 
@@ -440,6 +442,8 @@ def implement(
     thorough: bool = typer.Option(True, "--thorough", help="Use thorough governance context (Default: True)"),
     quick: bool = typer.Option(False, "--quick", help="Opt out of thorough mode for fast/cheap runs"),
     allow_dirty: bool = typer.Option(False, "--allow-dirty", help="Allow running with uncommitted changes"),
+    gate_jobs: Optional[int] = typer.Option(None, "--gate-jobs", min=1, help="Max post-apply gates/test suites run concurrently (default: AGENT_GATE_JOBS or 4)"),
+    fail_fast: bool = typer.Option(False, "--fail-fast", help="Cancel remaining gates after the first gate failure"),
 ) -> None:
     """Implement a story from its accepted runbook.
 
@@ -1083,16 +1087,15 @@ ADRs:
 
         modified_paths = [Path(f) for f in run_modified_files if f]
 
+        gate_tasks = []
         if skip_security:
             gates.log_skip_audit("Security scan", story_id)
             console.print(f"⚠️  [AUDIT] Security gate skipped at {datetime.now().isoformat()}")
         else:
-            sec = gates.run_security_scan(
+            gate_tasks.append(GateTask("Security Scan", lambda ctx: gates.run_security_scan(
                 modified_paths,
                 config.etc_dir / "security_patterns.yaml",
-            )
-            gate_results.append(sec)
-            _print_gate(sec)
+            )))
 
         import yaml as _yaml
         try:
@@ -1109,43 +1112,20 @@ ADRs:
             gates.log_skip_audit("QA tests", story_id)
             console.print(f"⚠️  [AUDIT] Tests skipped at {datetime.now().isoformat()}")
         else:
-            qa = gates.run_qa_gate(test_cmd, modified_files=run_modified_files)
-            gate_results.append(qa)
-            _print_gate(qa)
+            gate_tasks.append(GateTask("QA Validation", lambda ctx: gates.run_qa_gate(
+                test_cmd, modified_files=run_modified_files,
+                jobs=gate_jobs, fail_fast=fail_fast, context=ctx,
+            )))
 
         # INFRA-137: run_docs_check removed — enforced at source (INFRA-136).
 
-        pr_size = gates.check_pr_size(commit_message=story_title)
-        gate_results.append(pr_size)
-        _print_gate(pr_size)
-
-        # INFRA-170: Deterministic Complexity Gates (ADR-012)
-        # Enforces file length (>500 LOC) and function length (21-50 WARN, >50 BLOCK)
-        from agent.core.governance.complexity import get_complexity_report
-        complexity_passed = True
-        complexity_details = []
-        for f in modified_paths:
-            if f.suffix == ".py":
-                try:
-                    report = get_complexity_report(f.read_text(errors="ignore"), str(f))
-                    if report.file_verdict != "PASS":
-                        complexity_details.append(f"WARN: {f.name} is {report.total_loc} LOC (limit: 500)")
-                    for fn in report.functions:
-                        if fn.verdict == "BLOCK":
-                            complexity_passed = False
-                            complexity_details.append(f"BLOCK: {f.name} function '{fn.name}' is {fn.length} lines (limit: 50)")
-                        elif fn.verdict == "WARN":
-                            complexity_details.append(f"WARN: {f.name} function '{fn.name}' is {fn.length} lines (threshold: 20)")
-                except Exception as e:
-                    complexity_details.append(f"ERROR: Failed to analyze {f.name}: {e}")
-        comp_gate = gates.GateResult(
-            name="Complexity Standards",
-            passed=complexity_passed,
-            details="\n".join(complexity_details) if complexity_details else "All modified functions meet ADR-012 standards.",
-            elapsed_seconds=0.1
-        )
-        gate_results.append(comp_gate)
-        _print_gate(comp_gate)
+        gate_tasks.append(GateTask("PR Size", lambda ctx: gates.check_pr_size(commit_message=story_title)))
+        gate_tasks.append(GateTask("Complexity Standards", lambda ctx: _complexity_gate(modified_paths)))
+
+        gate_results = run_gates(gate_tasks, jobs=gate_jobs, fail_fast=fail_fast, on_output=_print_gate_output)
+        for gate_result in gate_results:
+            _print_gate(gate_result)
+        console.print(f"  [dim]Gate timings: {format_durations(gate_results)}[/dim]")
 
         if linked_journey_ids:
             try:
@@ -1219,6 +1199,41 @@ ADRs:
             console.print(Markdown(full_content[:4000]))
 
 
+def _complexity_gate(modified_paths: List[Path]) -> "gates.GateResult":
+    """INFRA-170: Deterministic Complexity Gates (ADR-012).
+
+    Enforces file length (>500 LOC) and function length (21-50 WARN, >50 BLOCK).
+    """
+    from agent.core.governance.complexity import get_complexity_report
+    complexity_passed = True
+    complexity_details = []
+    for f in modified_paths:
+        if f.suffix == ".py":
+            try:
+                report = get_complexity_report(f.read_text(errors="ignore"), str(f))
+                if report.file_verdict != "PASS":
+                    complexity_details.append(f"WARN: {f.name} is {report.total_loc} LOC (limit: 500)")
+                for fn in report.functions:
+                    if fn.verdict == "BLOCK":
+                        complexity_passed = False
+                        complexity_details.append(f"BLOCK: {f.name} function '{fn.name}' is {fn.length} lines (limit: 50)")
+                    elif fn.verdict == "WARN":
+                        complexity_details.append(f"WARN: {f.name} function '{fn.name}' is {fn.length} lines (threshold: 20)")
+            except Exception as e:
+                complexity_details.append(f"ERROR: Failed to analyze {f.name}: {e}")
+    return gates.GateResult(
+        name="Complexity Standards",
+        passed=complexity_passed,
+        details="\n".join(complexity_details) if complexity_details else "All modified functions meet ADR-012 standards.",
+        elapsed_seconds=0.0
+    )
+
+
+def _print_gate_output(gate: str, line: str) -> None:
+    """Print one line of streamed gate output, labelled with its gate."""
+    console.print(f"    [dim]\\[{escape(gate)}][/dim] {escape(line)}", highlight=False)
+
+
 def _print_gate(result: "gates.GateResult") -> None:
     """Print a single gate result to the console.
 
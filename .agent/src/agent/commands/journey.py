@@ -25,6 +25,7 @@ from rich.prompt import IntPrompt, Prompt
 
 from agent.core.config import config
 from agent.core.utils import sanitize_title, get_copyright_header, get_full_license_header
+from agent.db.artifact_catalog import CatalogEntry, get_catalog
 from agent.db.client import upsert_artifact
 
 app = typer.Typer(help="User journey management.")
@@ -44,8 +45,10 @@ def _get_next_journey_id(scope_dir: Path, prefix: str) -> str:
 
     # A. Scan filesystem — check all scope dirs under journeys_dir
     if config.journeys_dir.exists():
-        for file_path in config.journeys_dir.rglob("JRN-*.yaml"):
-            match = pattern.search(file_path.name)
+        for entry in get_catalog().entries("journey", config.journeys_dir):
+            if not entry.name.startswith("JRN-"):
+                continue
+            match = pattern.search(entry.name)
             if match:
                 num = int(match.group(1))
                 if num > max_num:
@@ -371,6 +374,18 @@ def validate_journey(
         console.print("[bold green]✅ Journey is valid and complete[/bold green]")
 
 
+def _scoped_journeys(journeys_dir: Path, scope: Optional[str] = None) -> List[CatalogEntry]:
+    """Parsed ``<scope>/JRN-*.yaml`` journeys, ordered by scope then file name."""
+    entries = [
+        e for e in get_catalog().entries("journey", journeys_dir)
+        if e.meta.get("valid")
+        and e.name.startswith("JRN-")
+        and e.path.parent.parent == journeys_dir
+        and (not scope or e.path.parent.name.upper() == scope.upper())
+    ]
+    return sorted(entries, key=lambda e: (e.path.parent.name, e.name))
+
+
 @app.command()
 def coverage(
     json_output: bool = typer.Option(
@@ -387,44 +402,32 @@ def coverage(
         raise typer.Exit(0)
 
     results: List[Dict[str, Any]] = []
-    for scope_dir in sorted(journeys_dir.iterdir()):
-        if not scope_dir.is_dir():
-            continue
-        if scope and scope_dir.name.upper() != scope.upper():
-            continue
-        for jfile in sorted(scope_dir.glob("JRN-*.yaml")):
-            try:
-                data = yaml.safe_load(jfile.read_text())
-            except Exception:
-                continue
-            if not isinstance(data, dict):
-                continue
-
-            j_state = (data.get("state") or "DRAFT").upper()
-            tests = data.get("implementation", {}).get("tests", [])
-            jid = data.get("id", jfile.stem)
-            title = data.get("title", "")
-
-            statuses: List[Dict[str, Any]] = []
-            for t in tests:
-                resolved = (config.repo_root / t).resolve()
-                statuses.append({"path": t, "exists": resolved.exists()})
-
-            if not tests:
-                overall = "❌ No tests"
-            elif all(s["exists"] for s in statuses):
-                overall = "✅ Linked"
-            else:
-                overall = "⚠️ Missing"
+    for entry in _scoped_journeys(journeys_dir, scope):
+        j_state = entry.state
+        tests = entry.meta.get("tests", [])
+        jid = entry.artifact_id
+        title = entry.meta.get("title", "")
+
+        statuses: List[Dict[str, Any]] = []
+        for t in tests:
+            resolved = (config.repo_root / t).resolve()
+            statuses.append({"path": t, "exists": resolved.exists()})
+
+        if not tests:
+            overall = "❌ No tests"
+        elif all(s["exists"] for s in statuses):
+            overall = "✅ Linked"
+        else:
+            overall = "⚠️ Missing"
 
-            results.append({
-                "id": jid,
-                "title": title,
-                "state": j_state,
-                "tests": len(tests),
-                "status": overall,
-                "details": statuses,
-            })
+        results.append({
+            "id": jid,
+            "title": title,
+            "state": j_state,
+            "tests": len(tests),
+            "status": overall,
+            "details": statuses,
+        })
 
     if json_output:
         console.print_json(json_mod.dumps(results))
@@ -477,26 +480,19 @@ def _iter_eligible_journeys(
     Eligible = COMMITTED state and no tests already defined.
     """
     results: List[EligibleJourney] = []
-    for scope_dir in sorted(journeys_dir.iterdir()):
-        if not scope_dir.is_dir():
+    for entry in _scoped_journeys(journeys_dir, scope):
+        if journey_id and entry.artifact_id != journey_id:
             continue
-        if scope and scope_dir.name.upper() != scope.upper():
+        if entry.state != "COMMITTED" or entry.meta.get("tests"):
             continue
-        for jfile in sorted(scope_dir.glob("JRN-*.yaml")):
-            try:
-                data = yaml.safe_load(jfile.read_text())
-            except Exception:
-                continue
-            if not isinstance(data, dict):
-                continue
-            jid = data.get("id", jfile.stem)
-            if journey_id and jid != journey_id:
-                continue
-            j_state = (data.get("state") or "DRAFT").upper()
-            tests = data.get("implementation", {}).get("tests", [])
-            if j_state != "COMMITTED" or tests:
-                continue
-            results.append({"file": jfile, "data": data, "jid": jid})
+        # Only eligible journeys need the full document (steps, assertions)
+        try:
+            data = yaml.safe_load(entry.path.read_text())
+        except Exception:
+            continue
+        if not isinstance(data, dict):
+            continue
+        results.append({"file": entry.path, "data": data, "jid": entry.artifact_id})
     return results
 
 
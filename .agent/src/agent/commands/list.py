@@ -24,6 +24,7 @@ from agent.core.config import config
 from agent.core.formatters import format_data
 from agent.core.logger import get_logger
 from agent.core.utils import scrub_sensitive_data
+from agent.db.artifact_catalog import CatalogEntry, get_catalog
 
 console = Console()
 logger = get_logger("commands.list")
@@ -66,6 +67,12 @@ def get_title(file_path: Path) -> tuple[str, str]:
     except Exception:
          return file_path.stem, "(Error reading file)"
 
+def _id_and_title(entry: CatalogEntry) -> tuple[str, str]:
+    """``get_title`` semantics on a cached catalog entry."""
+    if entry.heading_id is not None:
+        return entry.heading_id, entry.heading_title or ""
+    return entry.path.stem, "(No title)"
+
 def write_output(content: str, output_file: str):
     """
     Write formatted output to a file.
@@ -110,26 +117,24 @@ def list_stories(
     stories_data: List[Dict[str, Any]] = []
     
     # Walk through stories dir
-    for file_path in config.stories_dir.rglob("*.md"):
-        content = file_path.read_text(errors="ignore")
-        
-        # Filters
-        if plan_id and plan_id not in content:
+    for entry in get_catalog().entries("story", config.stories_dir):
+        # Filters (referenced artifact IDs are indexed by the catalog)
+        if plan_id and plan_id not in entry.refs:
             continue
-        if runbook_id and runbook_id not in content:
+        if runbook_id and runbook_id not in entry.refs:
             continue
             
-        file_state = get_file_state(file_path)
+        file_state = entry.state
         if state and state.upper() != file_state.upper():
             continue
             
-        id_val, title_val = get_title(file_path)
+        id_val, title_val = _id_and_title(entry)
         
         stories_data.append({
             "ID": scrub_sensitive_data(id_val),
             "Title": scrub_sensitive_data(title_val),
             "State": file_state,
-            "Path": str(file_path.relative_to(config.repo_root))
+            "Path": str(entry.path.relative_to(config.repo_root))
         })
 
     # Handle output formatting
@@ -172,18 +177,18 @@ def list_plans(
     logger.info(f"Listing plans (format={output_format}, output={output_file})")
     plans_data: List[Dict[str, Any]] = []
     
-    for file_path in config.plans_dir.rglob("*.md"):
-        file_state = get_file_state(file_path)
+    for entry in get_catalog().entries("plan", config.plans_dir):
+        file_state = entry.state
         if state and state.upper() != file_state.upper():
             continue
             
-        id_val, title_val = get_title(file_path)
+        id_val, title_val = _id_and_title(entry)
         
         plans_data.append({
             "ID": scrub_sensitive_data(id_val),
             "Title": scrub_sensitive_data(title_val),
             "State": file_state,
-            "Path": str(file_path.relative_to(config.repo_root))
+            "Path": str(entry.path.relative_to(config.repo_root))
         })
 
     # Handle output formatting
@@ -227,26 +232,26 @@ def list_runbooks(
     logger.info(f"Listing runbooks (format={output_format}, output={output_file})")
     runbooks_data: List[Dict[str, Any]] = []
     
-    for file_path in config.runbooks_dir.rglob("*.md"):
-        file_stem = file_path.stem
+    for entry in get_catalog().entries("runbook", config.runbooks_dir):
+        file_stem = entry.path.stem
         
         # Filter by story ID in filename usually? Or content?
         # Bash script: `if [[ "$base" != *"$filter_story"* ]]; then show=0; fi`
         if story_id and story_id not in file_stem:
             continue
             
-        file_state = get_file_state(file_path)
+        file_state = entry.state
         if state and state.upper() != file_state.upper():
             continue
         
         # Runbooks often don't have the same header format, but let's try
-        id_val, title_val = get_title(file_path)
+        id_val, title_val = _id_and_title(entry)
         
         runbooks_data.append({
             "ID": scrub_sensitive_data(id_val),
             "Title": scrub_sensitive_data(title_val),
             "State": file_state,
-            "Path": str(file_path.relative_to(config.repo_root))
+            "Path": str(entry.path.relative_to(config.repo_root))
         })
 
     # Handle output formatting
@@ -289,37 +294,14 @@ def list_journeys(
     logger.info(f"Listing journeys (format={output_format}, output={output_file})")
     journeys_data: List[Dict[str, Any]] = []
 
-    for file_path in config.journeys_dir.rglob("*.yaml"):
-        content = file_path.read_text(errors="ignore")
-
-        # Extract metadata from YAML comments at top of file
-        journey_id = "UNKNOWN"
-        title = "(No title)"
-        file_state = "UNKNOWN"
-        actor = ""
-
-        for line in content.splitlines():
-            line = line.strip()
-            id_match = re.match(r"^#\s*Journey:\s*(.+)$", line)
-            if id_match:
-                journey_id = id_match.group(1).strip()
-            title_match = re.match(r"^#\s*Title:\s*(.+)$", line)
-            if title_match:
-                title = title_match.group(1).strip()
-            state_match = re.match(r"^#\s*State:\s*(.+)$", line)
-            if state_match:
-                file_state = state_match.group(1).strip().upper()
-            if not line.startswith("#"):
-                break
-
-        # Try to extract actor from YAML body
-        try:
-            import yaml
-            data = yaml.safe_load(content)
-            if isinstance(data, dict):
-                actor = data.get("actor", "")
-        except Exception:
-            pass
+    for entry in get_catalog().entries("journey", config.journeys_dir):
+        # Metadata from the YAML comment header, actor from the YAML body
+        comment = entry.meta.get("comment", {})
+        journey_id = comment.get("journey", "UNKNOWN")
+        title = comment.get("title", "(No title)")
+        file_state = comment.get("state", "UNKNOWN").upper()
+        actor = entry.meta.get("actor", "")
+        file_path = entry.path
 
         if state and state.upper() != file_state.upper():
             continue
@@ -76,7 +76,8 @@ QUESTION:
     from agent.core.ai import ai_service  # ADR-025: lazy init
     response = ai_service.complete(
         system_prompt=SYSTEM_PROMPT,
-        user_prompt=user_prompt
+        user_prompt=user_prompt,
+        hedge=None,  # interactive: follow AGENT_AI_HEDGE
     )
     return response
 
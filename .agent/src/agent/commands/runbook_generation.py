@@ -34,7 +34,7 @@ from rich.console import Console
 from agent.core.logger import get_logger
 import asyncio
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from agent.core.ai.prompts import generate_skeleton_prompt, generate_block_prompt
+from agent.core.ai.prompts import block_prompt_prefix, generate_skeleton_prompt, generate_block_prompt
 from agent.core.engine.executor import TaskExecutor
 
 try:
@@ -410,6 +410,9 @@ def generate_runbook_chunked(
     # ─────────────────────────────────────────────────────────────────────
     section_inputs: List[Any] = []  # [(i, section, prompt, modify_contents)]
     all_modify_contents: Dict[str, str] = {}  # accumulated for sr_validation
+    # Skeleton, story and codebase context are identical for every block:
+    # send them as a provider-cached prefix and only the section part per call
+    block_prefix = block_prompt_prefix(skeleton_raw, story_content, context_summary)
 
     for i, section in enumerate(skeleton.sections, 1):
         if i <= completed_steps:
@@ -451,6 +454,7 @@ def generate_runbook_chunked(
             modify_file_contents=modify_contents or None,
             existing_files=all_existing_files or None,
             legacy=_legacy_mode,
+            include_shared=False,
         )
         section_inputs.append((i, section, block_prompt, modify_contents))
 
@@ -463,9 +467,10 @@ def generate_runbook_chunked(
                 ai_service.complete,
                 "You are an implementation specialist. Output ONLY valid JSON.",
                 prompt,
+                cache_prefix=block_prefix,
             )
             if tracker is not None:
-                tracker.record_call(_model_hint, _token_count(prompt), _token_count(raw))
+                tracker.record_call(_model_hint, _token_count(block_prefix) + _token_count(prompt), _token_count(raw))
             return {"step": step, "raw": raw}
 
         if not inputs: return []
@@ -512,7 +517,8 @@ def generate_runbook_chunked(
             for step, sec, _old_prompt, mod_contents in pass_2_inputs:
                 b_prompt = generate_block_prompt(
                     sec.title, sec.description, skeleton_raw, story_content, context_summary,
-                    None, mod_contents or None, all_existing_files or None, pass_1_compiled
+                    None, mod_contents or None, all_existing_files or None, pass_1_compiled,
+                    include_shared=False,
                 )
                 new_pass_2_inputs.append((step, sec, b_prompt, mod_contents))
             
@@ -585,6 +591,7 @@ def generate_runbook_chunked(
                                 "response in markdown fences."
                             ),
                             user_prompt=_prompt,
+                            cache_prefix=block_prefix,
                         )
 
 
@@ -705,11 +712,12 @@ def generate_runbook_chunked(
                         _corrected_raw = ai_service.complete(
                             system_prompt=_correction_sys,
                             user_prompt=_prompt,
+                            cache_prefix=block_prefix,
                         )
                         if tracker is not None:
                             tracker.record_call(
                                 _model_hint,
-                                _token_count(_prompt),
+                                _token_count(block_prefix) + _token_count(_prompt),
                                 _token_count(_corrected_raw),
                             )
                         try:
@@ -33,6 +33,7 @@ from agent.core.secrets import (
     SecretManagerError,
     get_secret_manager,
 )
+from agent.core.unlock_agent import DEFAULT_UNLOCK_TTL
 
 from agent.core.auth.utils import validate_password_strength
 
@@ -512,4 +513,48 @@ def logout_secrets():
          console.print("[red]Keyring library not available.[/red]")
          raise typer.Exit(code=1)
 
+
+@app.command(name="unlock")
+def unlock_agent_cmd(
+    ttl: int = typer.Option(
+        DEFAULT_UNLOCK_TTL, "--ttl", "-t",
+        help="Seconds the unlock agent keeps the derived key in memory"
+    ),
+):
+    """
+    Start an unlock agent that caches the derived key (like ssh-agent).
+
+    Subsequent agent commands fetch the key from the agent instead of
+    re-running key derivation, until the TTL expires or 'agent secret lock'.
+    """
+    manager = get_secret_manager()
+    if not manager.is_initialized():
+        console.print(
+            "[bold red]Error:[/bold red] Secret manager not initialized. "
+            "Run 'agent secret init' first."
+        )
+        raise typer.Exit(code=1)
+
+    _unlock_manager(manager)
+    try:
+        pid = manager.start_unlock_agent(ttl)
+    except (OSError, SecretManagerError) as e:
+        console.print(f"[bold red]Error:[/bold red] Failed to start unlock agent: {e}")
+        raise typer.Exit(code=1)
+
+    console.print(f"[green]✅ Unlock agent running (pid {pid}) for {ttl}s.[/green]")
+
+
+@app.command(name="lock")
+def lock_agent_cmd():
+    """
+    Stop the unlock agent and wipe the cached key.
+    """
+    manager = get_secret_manager()
+    if manager.stop_unlock_agent():
+        console.print("[green]✅ Unlock agent stopped.[/green]")
+    else:
+        console.print("[yellow]No unlock agent running.[/yellow]")
+    manager.lock()
+
 # nolint: loc-ceiling
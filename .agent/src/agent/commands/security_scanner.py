@@ -0,0 +1,194 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compiled, cached scanner for ``security_patterns.yaml``.
+
+The pattern file is compiled once per (path, mtime, size). Patterns are
+also combined into one alternation with a named group per pattern: for
+the common clean file a single pass proves that no pattern matches
+anywhere. Only when the combined pass finds something are the patterns it
+did not report checked individually, since an earlier alternative can
+mask a later one at the same position.
+
+Files are scanned on a thread pool, large files in overlapping chunks,
+and results are remembered per file content hash so unchanged files are
+skipped on later gate runs in the same process.
+"""
+
+import hashlib
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Files larger than this are scanned in chunks instead of read whole
+CHUNK_SIZE = 1 << 20
+# Carried between chunks so matches spanning a boundary are still seen
+CHUNK_OVERLAP = 4096
+MAX_WORKERS = 8
+
+_LEADING_FLAGS = re.compile(r"^\(\?([aiLmsux]+)\)")
+
+
+def _scoped(pattern: str) -> str:
+    """Turn a leading global flag group ``(?i)x`` into a scoped ``(?i:x)``."""
+    match = _LEADING_FLAGS.match(pattern)
+    if not match:
+        return pattern
+    return f"(?{match.group(1)}:{pattern[match.end():]})"
+
+
+class SecurityScanner:
+    """A compiled set of named security patterns."""
+
+    def __init__(self, patterns: Dict[str, str]):
+        self.names: List[str] = list(patterns)
+        self._compiled: List[Tuple[str, "re.Pattern[str]"]] = [
+            (name, re.compile(str(regex))) for name, regex in patterns.items()
+        ]
+        self._group_names: Dict[str, str] = {}
+        self._combined: Optional["re.Pattern[str]"] = None
+        if self._compiled:
+            try:
+                parts = []
+                for index, (name, regex) in enumerate(patterns.items()):
+                    group = f"p{index}"
+                    self._group_names[group] = name
+                    parts.append(f"(?P<{group}>{_scoped(str(regex))})")
+                self._combined = re.compile("|".join(parts))
+            except re.error:
+                # e.g. numbered back-references; fall back to one pass per pattern
+                self._combined = None
+        self.fingerprint = hashlib.sha256(
+            repr(sorted((name, str(regex)) for name, regex in patterns.items())).encode()
+        ).hexdigest()
+
+    def scan_text(self, text: str) -> List[str]:
+        """Names of all patterns found in ``text``, in pattern-file order."""
+        if self._combined is None:
+            return [name for name, regex in self._compiled if regex.search(text)]
+        found = set()
+        for match in self._combined.finditer(text):
+            found.add(self._group_names[match.lastgroup])
+            if len(found) == len(self.names):
+                break
+        if not found:
+            return []
+        for name, regex in self._compiled:
+            if name not in found and regex.search(text):
+                found.add(name)
+        return [name for name in self.names if name in found]
+
+    def scan_file(self, path: Path) -> Tuple[str, List[str]]:
+        """Return ``(sha256, findings)`` for ``path``, reading large files in chunks."""
+        digest = hashlib.sha256()
+        found: set = set()
+        with open(path, "rb") as fh:
+            head = fh.read(CHUNK_SIZE)
+            digest.update(head)
+            if len(head) < CHUNK_SIZE:
+                return digest.hexdigest(), self.scan_text(head.decode("utf-8", errors="ignore"))
+            carry = ""
+            chunk = head
+            while chunk:
+                text = carry + chunk.decode("utf-8", errors="ignore")
+                found.update(self.scan_text(text))
+                carry = text[-CHUNK_OVERLAP:]
+                chunk = fh.read(CHUNK_SIZE)
+                digest.update(chunk)
+        return digest.hexdigest(), [name for name in self.names if name in found]
+
+
+# (patterns path) -> ((mtime_ns, size), scanner)
+_scanners: Dict[str, Tuple[Tuple[int, int], SecurityScanner]] = {}
+# (file path) -> ((mtime_ns, size), sha256, scanner fingerprint, findings)
+_file_results: Dict[str, Tuple[Tuple[int, int], str, str, List[str]]] = {}
+_lock = threading.Lock()
+
+
+def load_scanner(patterns_path: Path) -> SecurityScanner:
+    """Compiled scanner for ``patterns_path``, rebuilt only when the file changes.
+
+    Raises:
+        yaml.YAMLError, ImportError, re.error: If the pattern file is invalid.
+    """
+    st = patterns_path.stat()
+    signature = (st.st_mtime_ns, st.st_size)
+    key = str(patterns_path)
+    with _lock:
+        cached = _scanners.get(key)
+        if cached and cached[0] == signature:
+            return cached[1]
+    import yaml  # ADR-025: lazy import
+
+    patterns = yaml.safe_load(patterns_path.read_text()) or {}
+    if not isinstance(patterns, dict):
+        raise ValueError("security patterns must be a mapping of name -> regex")
+    scanner = SecurityScanner(patterns)
+    with _lock:
+        _scanners[key] = (signature, scanner)
+    return scanner
+
+
+def _scan_one(scanner: SecurityScanner, path: Path) -> Optional[List[str]]:
+    """Findings for one file, reusing the previous result if its content is unchanged."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = str(path)
+    signature = (st.st_mtime_ns, st.st_size)
+    with _lock:
+        cached = _file_results.get(key)
+    if cached and cached[0] == signature and cached[2] == scanner.fingerprint:
+        return cached[3]
+    try:
+        if cached and cached[2] == scanner.fingerprint:
+            # Touched but maybe not modified: hashing is much cheaper than scanning
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            if digest == cached[1]:
+                with _lock:
+                    _file_results[key] = (signature, digest, scanner.fingerprint, cached[3])
+                return cached[3]
+        digest, findings = scanner.scan_file(path)
+    except OSError:
+        return None
+    with _lock:
+        _file_results[key] = (signature, digest, scanner.fingerprint, findings)
+    return findings
+
+
+def scan_files(scanner: SecurityScanner, filepaths: Sequence[Path]) -> List[Tuple[Path, List[str]]]:
+    """Scan ``filepaths`` concurrently. Returns ``(path, findings)`` in input order.
+
+    Unreadable or missing files are skipped.
+    """
+    if not filepaths:
+        return []
+    workers = max(1, min(MAX_WORKERS, len(filepaths)))
+    if workers == 1:
+        results = [_scan_one(scanner, p) for p in filepaths]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="secscan") as pool:
+            results = list(pool.map(lambda p: _scan_one(scanner, p), filepaths))
+    return [(path, found) for path, found in zip(filepaths, results) if found is not None]
+
+
+def clear_cache() -> None:
+    """Forget compiled pattern sets and per-file results."""
+    with _lock:
+        _scanners.clear()
+        _file_results.clear()
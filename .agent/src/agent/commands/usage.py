@@ -0,0 +1,117 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from agent.core.ai.usage import GROUP_BY_COLUMNS, get_usage_ledger
+
+logger = logging.getLogger(__name__)
+console = Console()
+
+app = typer.Typer(help="Report LLM token usage and estimated cost.")
+
+_RELATIVE_SINCE = re.compile(r"^(\d+)([hdw])$")
+
+
+def parse_since(value: Optional[str]) -> Optional[datetime]:
+    """Parse ``24h``/``7d``/``2w`` or an ISO date into an aware datetime."""
+    if not value:
+        return None
+    match = _RELATIVE_SINCE.match(value.strip().lower())
+    if match:
+        amount, unit = int(match.group(1)), match.group(2)
+        delta = {"h": timedelta(hours=amount), "d": timedelta(days=amount), "w": timedelta(weeks=amount)}[unit]
+        return datetime.now(timezone.utc) - delta
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise typer.BadParameter("Use a duration like 24h, 7d, 2w or an ISO date (YYYY-MM-DD).")
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _price_table() -> Dict[tuple, Dict[str, Any]]:
+    """Map (provider, model) to router.yaml pricing, by deployment id and key."""
+    from agent.core.router import router
+
+    prices = {}
+    for key, model_def in router.models.items():
+        provider = model_def.get("provider")
+        for name in (model_def.get("deployment_id"), key):
+            if name:
+                prices.setdefault((provider, name), model_def)
+    return prices
+
+
+def estimate_cost(row: Dict[str, Any], prices: Dict[tuple, Dict[str, Any]]) -> Optional[float]:
+    """Cost in USD for an aggregated row, or None when the model is unpriced."""
+    model_def = prices.get((row.get("provider"), row.get("model")))
+    if not model_def:
+        return None
+    return (
+        (row.get("input_tokens") or 0) / 1000 * float(model_def.get("cost_per_1k_input", 0))
+        + (row.get("output_tokens") or 0) / 1000 * float(model_def.get("cost_per_1k_output", 0))
+    )
+
+
+@app.command("report")
+def report(
+    by: str = typer.Option("command", "--by", help=f"Group by: {', '.join(GROUP_BY_COLUMNS)}."),
+    since: Optional[str] = typer.Option(None, "--since", help="Only include calls since e.g. 24h, 7d or 2026-01-31."),
+) -> None:
+    """
+    Show token usage recorded in .agent/cache/usage.db.
+
+    Costs are estimated from cost_per_1k_input/output in router.yaml;
+    models without pricing show '-'. Estimated rows (providers that
+    report no usage, e.g. gh) are marked with '~'.
+    """
+    if by not in GROUP_BY_COLUMNS:
+        raise typer.BadParameter(f"--by must be one of: {', '.join(GROUP_BY_COLUMNS)}")
+
+    rows = get_usage_ledger().summarize(group_by=by, since=parse_since(since))
+    if not rows:
+        console.print("[yellow]No LLM usage recorded yet.[/yellow]")
+        return
+
+    prices = _price_table()
+    table = Table(title=f"LLM usage by {by}")
+    columns = [by] + [c for c in ("provider", "model") if c != by]
+    for col in columns:
+        table.add_column(col.capitalize(), style="cyan" if col == by else None)
+    for col in ("Calls", "Input", "Cached", "Output", "Cost (USD)"):
+        table.add_column(col, justify="right")
+
+    total_cost = 0.0
+    for row in rows:
+        cost = estimate_cost(row, prices)
+        total_cost += cost or 0.0
+        marker = "~" if row.get("estimated_calls") else ""
+        table.add_row(
+            *[row.get(col) or "-" for col in columns],
+            str(row["calls"]),
+            f"{marker}{row['input_tokens']:,}",
+            f"{row['cached_input_tokens']:,}",
+            f"{marker}{row['output_tokens']:,}",
+            f"{cost:.4f}" if cost is not None else "-",
+        )
+
+    console.print(table)
+    console.print(f"[bold]Estimated total:[/bold] ${total_cost:.4f}")
@@ -63,6 +63,8 @@ def generate_mermaid_graph(graph: Dict[str, List[Dict[str, Any]]], repo_base_url
     output.append("    classDef story fill:#f6ffed,stroke:#b7eb8f,stroke-width:2px")
     output.append("    classDef runbook fill:#fffbe6,stroke:#ffe58f,stroke-width:2px")
     output.append("    classDef code fill:#f0f0f0,stroke:#d9d9d9,stroke-width:2px")
+    output.append("    classDef journey fill:#f9f0ff,stroke:#d3adf7,stroke-width:2px")
+    output.append("    classDef adr fill:#fff0f6,stroke:#ffadd2,stroke-width:2px")
 
     nodes_by_id = {node['id']: node for node in graph['nodes']}
 
@@ -124,6 +124,7 @@ def pr(
                      quick=False,
                      legacy_context=False,
                      gate=None,
+                     no_review_cache=False,
                  )
             except typer.Exit as e:
                 if e.exit_code != 0:
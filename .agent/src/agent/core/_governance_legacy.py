@@ -45,7 +45,9 @@ from datetime import datetime, timezone, timedelta
 import yaml
 
 from agent.core.ai import ai_service
+from agent.core.ai.usage import usage_scope
 from agent.core.config import config
+from agent.core.git_state import git_state
 from agent.core.security import scrub_sensitive_data
 
 logger = logging.getLogger(__name__)
@@ -55,6 +57,16 @@ AUDIT_LOG_FILE = config.agent_dir / "logs" / "audit_events.log"
 # NOTE: load_roles has been extracted to agent.core.governance.roles (INFRA-101).
 # This shim re-imports it to keep internal callers working during the migration.
 from agent.core.governance.roles import load_roles  # noqa: E402
+from agent.core.governance.review_cache import (  # noqa: E402
+    ReviewCache,
+    attribute_review,
+    context_digest,
+    has_verdict,
+    merge_entries,
+    review_cache_enabled,
+    review_key,
+    split_diff_by_file,
+)
 
 
 def log_governance_event(event_type: str, details: str):
@@ -1134,7 +1146,8 @@ def convene_council_full(
     user_question: Optional[str] = None,
     adrs_content: str = "",
     thorough: bool = False,
-    progress_callback: Optional[callable] = None
+    progress_callback: Optional[callable] = None,
+    use_review_cache: bool = False,
 ) -> Dict:
     """
     Run the AI Governance Council review with support for provider switching and context management.
@@ -1154,6 +1167,9 @@ def convene_council_full(
             Code that follows an ADR is compliant and must not be flagged.
         thorough: Enable full-file context augmentation and post-processing validation.
             Uses more tokens but significantly reduces false positives.
+        use_review_cache: Reuse per-file role verdicts from earlier runs
+            (gatekeeper mode, native engine) and only send files whose diff
+            or review context changed. See :mod:`agent.core.governance.review_cache`.
 
     Returns:
         Dict: Contains 'verdict' (PASS/BLOCK), 'log_file' (path), and 'json_report' (detailed data).
@@ -1231,10 +1247,12 @@ def convene_council_full(
     if ai_service.provider == "gh":
          chunk_size = 6000
     
-    if len(full_diff) > chunk_size:
-        diff_chunks = [full_diff[i:i+chunk_size] for i in range(0, len(full_diff), chunk_size)]
-    else:
-        diff_chunks = [full_diff]
+    def _chunk(diff: str) -> List[str]:
+        if len(diff) > chunk_size:
+            return [diff[i:i+chunk_size] for i in range(0, len(diff), chunk_size)]
+        return [diff]
+
+    diff_chunks = _chunk(full_diff)
 
     overall_verdict = "PASS"
     report = f"# Governance Preflight Report\n\nStory: {story_id}\n\n"
@@ -1251,11 +1269,11 @@ def convene_council_full(
     )
     # Scan journeys_dir for JRN IDs
     if hasattr(config, 'journeys_dir') and config.journeys_dir and config.journeys_dir.exists():
+        from agent.db.artifact_catalog import get_catalog
         _jrn_ids = sorted(set(
-            re.match(r'(JRN-\d+)', f.stem).group(1)
-            for _scope in config.journeys_dir.iterdir() if _scope.is_dir()
-            for f in _scope.glob("JRN-*.yaml")
-            if re.match(r'(JRN-\d+)', f.stem)
+            re.match(r'(JRN-\d+)', e.path.stem).group(1)
+            for e in get_catalog().entries("journey", config.journeys_dir)
+            if e.path.parent.parent == config.journeys_dir and re.match(r'(JRN-\d+)', e.path.stem)
         ))
         _available_ids.extend(_jrn_ids)
     _available_ids = sorted(set(_available_ids))
@@ -1280,6 +1298,27 @@ def convene_council_full(
         _file_context = _build_file_context(full_diff)
         if _file_context and progress_callback:
             progress_callback(f"📄 File context: {len(_file_context)} chars from changed files")
+
+    # Context shared by every role and chunk: sent as a provider-cached prefix
+    # so only the per-role system prompt and the diff chunk are billed in full
+    context_prefix = f"<story>{story_content}</story>\n<rules>{rules_content}</rules>\n"
+    if adrs_content:
+        context_prefix += f"<adrs>{adrs_content}</adrs>\n"
+    if instructions_content:
+        context_prefix += f"<instructions>{instructions_content}</instructions>\n"
+    if _available_refs_line:
+        context_prefix += f"\n{_available_refs_line}\n"
+    if _file_context:
+        context_prefix += f"<file_context>\nFull file signatures for changed files (use to avoid false positives about missing code):\n{_file_context}\n</file_context>\n"
+
+    # Per-file verdict cache: retries only re-review files whose diff changed
+    review_cache = None
+    if use_review_cache and mode == "gatekeeper" and review_cache_enabled():
+        file_diffs = split_diff_by_file(full_diff)
+        review_cache = ReviewCache() if file_diffs else None
+        review_context = context_digest(
+            mode, thorough, story_content, rules_content, adrs_content, instructions_content,
+        )
     
     for role in relevant_roles:
         role_name = role["name"]
@@ -1291,13 +1330,32 @@ def convene_council_full(
         role_findings = []
         role_changes = []
         all_role_refs: List[str] = []  # Track references across chunks (INFRA-060)
+        role_chunks = diff_chunks
+        review_failed = False
+
+        if review_cache is not None:
+            file_keys = {
+                path: review_key(role_name, focus_area, path, section, review_context)
+                for path, section in file_diffs.items()
+            }
+            cached_entries = {
+                path: entry for path, key in file_keys.items()
+                if (entry := review_cache.get(key)) is not None
+            }
+            pending = [path for path in file_diffs if path not in cached_entries]
+            role_chunks = _chunk("".join(file_diffs[p] for p in pending)) if pending else []
+            if cached_entries and progress_callback:
+                progress_callback(
+                    f"♻️  @{role_name}: reusing cached verdicts for "
+                    f"{len(cached_entries)}/{len(file_diffs)} file(s)"
+                )
         
         if progress_callback:
-            progress_callback(f"🤖 @{role_name} is reviewing ({len(diff_chunks)} chunks)...")
+            progress_callback(f"🤖 @{role_name} is reviewing ({len(role_chunks)} chunks)...")
 
-        for i, chunk in enumerate(diff_chunks):
-            if len(diff_chunks) > 1 and progress_callback:
-                progress_callback(f"  - Analyzing chunk {i+1}/{len(diff_chunks)}...")
+        for i, chunk in enumerate(role_chunks):
+            if len(role_chunks) > 1 and progress_callback:
+                progress_callback(f"  - Analyzing chunk {i+1}/{len(role_chunks)}...")
             
             if mode == "consultative":
                     system_prompt = f"You are {role_name}. Focus: {focus_area}. Task: Expert consultation. Input: Story, Rules, ADRs, Diff."
@@ -1396,22 +1454,15 @@ def convene_council_full(
                         "REQUIRED_CHANGES:\n- <change 1> (Source: [Exact file path or ADR ID])\n(Only if BLOCK)"
                     )
 
-            # Build user prompt with all available context
-            user_prompt = f"<story>{story_content}</story>\n<rules>{rules_content}</rules>\n"
-            if adrs_content:
-                user_prompt += f"<adrs>{adrs_content}</adrs>\n"
-            if instructions_content:
-                user_prompt += f"<instructions>{instructions_content}</instructions>\n"
-            if _available_refs_line:
-                user_prompt += f"\n{_available_refs_line}\n"
-            if _file_context:
-                user_prompt += f"<file_context>\nFull file signatures for changed files (use to avoid false positives about missing code):\n{_file_context}\n</file_context>\n"
-            user_prompt += f"<diff>{chunk}</diff>"
+            user_prompt = f"<diff>{chunk}</diff>"
             
             try:
                 # Use temperature=0 for deterministic governance findings
                 _gov_temp = 0.0 if mode == "gatekeeper" else None
-                review = ai_service.complete(system_prompt, user_prompt, temperature=_gov_temp)
+                with usage_scope(story=story_id, role=role_name):
+                    review = ai_service.complete(
+                        system_prompt, user_prompt, temperature=_gov_temp, cache_prefix=context_prefix,
+                    )
                 review = scrub_sensitive_data(review) # Scrub AI output
                 if mode == "consultative":
                     role_findings.append(review)
@@ -1420,6 +1471,9 @@ def convene_council_full(
                 else:
                     # Parse the structured AI response
                     parsed = _parse_findings(review)
+                    if not has_verdict(review):
+                        # Empty or truncated replies parse as PASS; never cache them
+                        review_failed = True
                     
                     # Use parsed verdict (more reliable than regex on raw text)
                     if parsed["verdict"] == "BLOCK":
@@ -1444,8 +1498,25 @@ def convene_council_full(
                     if progress_callback:
                         progress_callback(f"❌ Fatal proxy/connection error: {e}")
                     raise e
+                review_failed = True
                 if progress_callback:
                     progress_callback(f"Error during review: {e}")
+
+        if review_cache is not None:
+            if role_chunks and not review_failed:
+                entries = attribute_review(
+                    role_verdict, role_summary, role_findings, role_changes, all_role_refs, pending,
+                )
+                for path, entry in (entries or {}).items():
+                    review_cache.put(file_keys[path], entry)
+            if cached_entries:
+                reused = merge_entries(cached_entries.values())
+                if reused["verdict"] == "BLOCK":
+                    role_verdict = "BLOCK"
+                role_summary = role_summary or reused["summary"]
+                role_findings.extend(f for f in reused["findings"] if f not in role_findings)
+                role_changes.extend(c for c in reused["required_changes"] if c not in role_changes)
+                all_role_refs.extend(reused["references"])
         
         # Post-processing: validate findings against source (always-on)
         # The validator checks are lightweight file reads — not gated by --thorough.
@@ -1593,6 +1664,8 @@ def convene_council_full(
 
     json_report["roles"] = json_roles
     json_report["overall_verdict"] = overall_verdict
+    if review_cache is not None:
+        review_cache.save()
     
     # Save Log
     timestamp = int(time.time())
@@ -1701,13 +1774,11 @@ def find_stagnant_files(repo_path: Path, months: int = 6, ignore_patterns: List[
 
     try:
         # Use git log to get last commit date per file
-        result = subprocess.run(
-            ["git", "log", "--pretty=format:%ad", "--date=iso", "--name-only", "--diff-filter=ACMR", "--", "."],
+        result = git_state.query(
+            "log", "--pretty=format:%ad", "--date=iso", "--name-only", "--diff-filter=ACMR", "--", ".",
             cwd=repo_path,
-            capture_output=True,
-            text=True,
-            check=True,
         )
+        result.check_returncode()
         
         files_by_date = {}
         current_date = None
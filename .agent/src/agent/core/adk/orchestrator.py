@@ -38,6 +38,7 @@ from google.adk.agents import LlmAgent
 from agent.core.adk.adapter import AIServiceModelAdapter
 from agent.core.adk.agents import create_role_agents
 from agent.core.adk.tools import make_tools
+from agent.core.ai.usage import usage_scope
 from agent.core.config import config
 from agent.core.security import scrub_sensitive_data
 
@@ -287,10 +288,12 @@ async def _orchestrate_async(
             progress_callback(f"🤖 @{role_name} is reviewing (ADK)...")
 
         try:
-            raw_output = await asyncio.wait_for(
-                _run_role_agent(agent, user_prompt),
-                timeout=AGENT_TIMEOUT,
-            )
+            # Each gather() task has its own context, so the scope is per-role
+            with usage_scope(story=story_id, role=role_name):
+                raw_output = await asyncio.wait_for(
+                    _run_role_agent(agent, user_prompt),
+                    timeout=AGENT_TIMEOUT,
+                )
             raw_output = scrub_sensitive_data(raw_output)
         except asyncio.TimeoutError:
             raw_output = (
@@ -0,0 +1,222 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Hedged streaming requests for latency-critical calls.
+
+When hedging is enabled the primary provider's stream starts at once. If it
+has not produced a first chunk by the hedge deadline, and the spend budget
+allows, the same request goes to a secondary provider. Whichever stream
+yields first wins; the other is closed and its output discarded.
+
+The deadline is a percentile (``AGENT_AI_HEDGE_PERCENTILE``) of the
+primary's recent time-to-first-token, falling back to
+``AGENT_AI_HEDGE_DELAY_S`` until enough calls have been observed.
+``AGENT_AI_HEDGE_MAX_RATIO`` caps hedges as a share of hedge-eligible
+requests, so a slow provider cannot double spend.
+"""
+
+import contextvars
+import logging
+import os
+import queue
+import threading
+from typing import Callable, Iterator, Optional
+
+from prometheus_client import Counter
+
+from agent.core.router_stats import router_stats
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PERCENTILE = 0.95
+DEFAULT_DELAY_S = 3.0
+DEFAULT_MAX_RATIO = 0.1
+BUDGET_BURST = 2
+MIN_SAMPLES = 5
+
+ai_hedged_requests_total = Counter(
+    "ai_hedged_requests_total",
+    "Hedge-eligible AI requests by outcome "
+    "(not_needed, primary_won, secondary_won, budget_exhausted, no_partner)",
+    ["provider", "outcome"],
+)
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name) or default)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}; using {default}")
+        return default
+
+
+def hedge_enabled(flag: Optional[bool]) -> bool:
+    """Resolve a per-call ``hedge`` flag; None defers to ``AGENT_AI_HEDGE``."""
+    if flag is not None:
+        return flag
+    return os.getenv("AGENT_AI_HEDGE", "").lower() in ("1", "true", "yes", "on")
+
+
+def hedge_delay(provider: str, model: Optional[str]) -> float:
+    """Seconds to wait for the primary's first chunk before hedging."""
+    fraction = _env_float("AGENT_AI_HEDGE_PERCENTILE", DEFAULT_PERCENTILE * 100) / 100
+    observed = router_stats.percentile(
+        provider, model, min(max(fraction, 0.0), 1.0), first_token=True, min_samples=MIN_SAMPLES,
+    )
+    return observed if observed is not None else _env_float("AGENT_AI_HEDGE_DELAY_S", DEFAULT_DELAY_S)
+
+
+class HedgeBudget:
+    """Caps hedges at ``ratio`` of eligible requests (plus a small burst)."""
+
+    def __init__(self, ratio: Optional[float] = None, burst: int = BUDGET_BURST):
+        self.ratio = ratio
+        self.burst = burst
+        self.requests = 0
+        self.hedges = 0
+        self._lock = threading.Lock()
+
+    def note_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def try_acquire(self) -> bool:
+        ratio = self.ratio if self.ratio is not None else _env_float("AGENT_AI_HEDGE_MAX_RATIO", DEFAULT_MAX_RATIO)
+        with self._lock:
+            if self.hedges >= self.burst + ratio * self.requests:
+                return False
+            self.hedges += 1
+            return True
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = self.hedges = 0
+
+
+hedge_budget = HedgeBudget()
+
+_CHUNK, _ERROR, _END = "chunk", "error", "end"
+
+
+def _pump(tag: str, factory: Callable[[], Iterator[str]], out: "queue.Queue", stop: threading.Event) -> None:
+    chunks = None
+    try:
+        chunks = factory()
+        for chunk in chunks:
+            if stop.is_set():
+                break
+            out.put((tag, _CHUNK, chunk))
+    except BaseException as e:  # reported to the consumer
+        out.put((tag, _ERROR, e))
+    finally:
+        close = getattr(chunks, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception as e:
+                logger.debug(f"Closing hedged stream failed: {e}")
+        out.put((tag, _END, None))
+
+
+def hedged_stream(
+    primary: Callable[[], Iterator[str]],
+    secondary: Optional[Callable[[], Iterator[str]]],
+    delay: float,
+    provider: str,
+    budget: Optional[HedgeBudget] = None,
+    on_winner: Optional[Callable[[str], None]] = None,
+) -> Iterator[str]:
+    """Yield the chunks of whichever of ``primary``/``secondary`` starts first.
+
+    ``secondary`` is only started if ``primary`` is silent for ``delay``
+    seconds, or fails before producing anything. ``on_winner`` is called
+    with ``"primary"`` or ``"secondary"`` once a stream wins. Errors from
+    the winning stream propagate; if neither produces output the primary's
+    error is raised.
+    """
+    budget = budget or hedge_budget
+    budget.note_request()
+    out: "queue.Queue" = queue.Queue()
+    stops = {"primary": threading.Event(), "secondary": threading.Event()}
+    context = contextvars.copy_context()
+
+    def start(tag: str, factory: Callable[[], Iterator[str]]) -> None:
+        threading.Thread(
+            target=context.copy().run, args=(_pump, tag, factory, out, stops[tag]),
+            name=f"ai-hedge-{tag}", daemon=True,
+        ).start()
+
+    start("primary", primary)
+    running = {"primary"}
+    errors = {}
+    hedged = False
+    winner = None
+    try:
+        while winner is None:
+            try:
+                tag, kind, payload = out.get(timeout=None if hedged else delay)
+            except queue.Empty:
+                tag, kind, payload = None, None, None
+            if tag is None or (kind == _ERROR and not hedged):
+                # Primary is slow, or failed before its first chunk: hedge
+                if kind == _ERROR:
+                    errors[tag] = payload
+                    running.discard(tag)
+                hedged = True
+                if secondary is None:
+                    ai_hedged_requests_total.labels(provider=provider, outcome="no_partner").inc()
+                elif not budget.try_acquire():
+                    ai_hedged_requests_total.labels(provider=provider, outcome="budget_exhausted").inc()
+                else:
+                    logger.info(f"Hedging {provider} request after {delay:.2f}s without output")
+                    start("secondary", secondary)
+                    running.add("secondary")
+                if not running:
+                    break
+                continue
+            if kind == _CHUNK:
+                winner = tag
+                outcome = "not_needed" if not hedged else f"{tag}_won"
+                ai_hedged_requests_total.labels(provider=provider, outcome=outcome).inc()
+                if on_winner is not None:
+                    on_winner(tag)
+                for other in running - {tag}:
+                    stops[other].set()  # cancel the loser at its next chunk
+                yield payload
+                break
+            if kind == _ERROR:
+                errors[tag] = payload
+            running.discard(tag)
+            if not running:
+                break
+
+        if winner is None:
+            error = errors.get("primary") or errors.get("secondary")
+            if error is not None:
+                raise error
+            return
+
+        while True:
+            tag, kind, payload = out.get()
+            if tag != winner:
+                continue
+            if kind == _CHUNK:
+                yield payload
+            elif kind == _ERROR:
+                raise payload
+            else:
+                return
+    finally:
+        for stop in stops.values():
+            stop.set()
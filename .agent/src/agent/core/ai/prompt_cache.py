@@ -0,0 +1,188 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Provider-side caching of large, stable prompt prefixes.
+
+Governance council roles and runbook blocks resend the same multi-thousand
+token context (story, rules, ADRs, instructions, source) with only a small
+variable suffix. Callers pass that context as cache_prefix to
+``AIService.complete`` and the provider path decides how to reuse it:
+
+- Anthropic: the prefix is the first block of the user message, carrying
+  an ``ephemeral`` cache-control breakpoint; repeat calls with the same
+  system prompt (diff chunks, autoheal retries) hit it.
+- Gemini / Vertex: the prefix is stored with the role's system instruction
+  as an explicit context cache (``client.caches``) and referenced by name
+  for ``AGENT_AI_CACHE_TTL_S``.
+- Other providers: the prefix is prepended to the user prompt (OpenAI
+  caches repeated prefixes automatically).
+
+The prefix carries story and source text, so it is always sent as user
+content; the role instructions stay in the system prompt on every provider.
+
+Providers report cache reads and writes, which the usage ledger records as
+``cached_input_tokens`` / ``cache_write_tokens``. Set
+``AGENT_AI_PROMPT_CACHE=0`` to send prefixes uncached.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+CACHING_PROVIDERS = ("anthropic", "vertex-anthropic", "gemini", "vertex")
+DEFAULT_TTL_S = 600
+DEFAULT_MIN_TOKENS = 1024
+# Re-create a Gemini cache this long before it expires server-side
+REFRESH_MARGIN_S = 30
+# After a failed cache create (model unsupported, prefix too small), don't retry for this long
+FAILURE_BACKOFF_S = 600
+DEFAULT_MAX_OUTPUT_TOKENS = 16384
+# Claude 3.x models cap output lower; keep the historical limit for them
+LEGACY_MAX_OUTPUT_TOKENS = 4096
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        value = int(os.getenv(name) or default)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}; using {default}")
+        return default
+    return value if value > 0 else default
+
+
+def prompt_cache_enabled() -> bool:
+    return os.getenv("AGENT_AI_PROMPT_CACHE", "1").lower() not in ("0", "false", "no", "off")
+
+
+def join_prompt(cache_prefix: Optional[str], user_prompt: str) -> str:
+    """Uncached form of a prefixed prompt."""
+    return f"{cache_prefix}\n\n{user_prompt}" if cache_prefix else user_prompt
+
+
+def cacheable_prefix(provider: str, cache_prefix: Optional[str]) -> Optional[str]:
+    """``cache_prefix`` if ``provider`` should cache it, else None.
+
+    Prefixes below ``AGENT_AI_CACHE_MIN_TOKENS`` are not worth a cache
+    write (and are rejected by Gemini's context cache).
+    """
+    if not cache_prefix or provider not in CACHING_PROVIDERS or not prompt_cache_enabled():
+        return None
+    from agent.core.tokens import token_manager
+
+    if token_manager.count_tokens(cache_prefix) < _env_int("AGENT_AI_CACHE_MIN_TOKENS", DEFAULT_MIN_TOKENS):
+        return None
+    return cache_prefix
+
+
+def max_output_tokens(model: Optional[str]) -> int:
+    """Anthropic ``max_tokens``: ``AGENT_AI_MAX_OUTPUT_TOKENS`` or a per-model default."""
+    default = LEGACY_MAX_OUTPUT_TOKENS if "claude-3" in (model or "") else DEFAULT_MAX_OUTPUT_TOKENS
+    return _env_int("AGENT_AI_MAX_OUTPUT_TOKENS", default)
+
+
+def anthropic_content(user_prompt: str, cache_prefix: Optional[str]) -> Union[str, List[Dict[str, Any]]]:
+    """User message ``content`` for the Messages API with the prefix as a cached first block."""
+    if not cache_prefix:
+        return user_prompt
+    return [
+        {"type": "text", "text": cache_prefix, "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": user_prompt},
+    ]
+
+
+class GenaiContextCache:
+    """Explicit Gemini/Vertex context caches, one per (provider, model, system prompt, prefix).
+
+    Creation is serialised per key so concurrent council roles share a
+    single cache. Failed creates are remembered for ``FAILURE_BACKOFF_S``
+    and the caller falls back to an uncached request.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self._clock = clock
+        self._entries: Dict[Tuple[str, str, str], Tuple[Optional[str], float]] = {}
+        self._key_locks: Dict[Tuple[str, str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self, client: Any, provider: str, model: Optional[str], system_prompt: str, prefix: str,
+    ) -> Optional[str]:
+        """Name of a live cache holding ``system_prompt`` and ``prefix``, creating one if needed."""
+        digest = hashlib.sha256()
+        for part in (system_prompt, prefix):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        key = (provider, model or "", digest.hexdigest())
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            name, expires_at = self._entries.get(key, (None, 0.0))
+            now = self._clock()
+            if expires_at - REFRESH_MARGIN_S > now:
+                return name
+            ttl = _env_int("AGENT_AI_CACHE_TTL_S", DEFAULT_TTL_S)
+            try:
+                from google.genai import types
+
+                cached = client.caches.create(
+                    model=model,
+                    config=types.CreateCachedContentConfig(
+                        system_instruction=system_prompt,
+                        contents=[types.Content(role="user", parts=[types.Part(text=prefix)])],
+                        ttl=f"{ttl}s",
+                        display_name=f"agent-prefix-{key[2][:12]}",
+                    ),
+                )
+                name = cached.name
+                logger.debug(f"Created {provider} context cache {name} for {model}")
+            except Exception as e:
+                logger.debug(f"{provider} context cache unavailable for {model}: {e}")
+                name, ttl = None, FAILURE_BACKOFF_S
+            self._entries[key] = (name, now + ttl)
+            return name
+
+    def reset(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._key_locks.clear()
+
+
+genai_context_cache = GenaiContextCache()
+
+
+def genai_request(
+    client: Any,
+    provider: str,
+    model: Optional[str],
+    system_prompt: str,
+    user_prompt: str,
+    cache_prefix: Optional[str],
+) -> Tuple[Dict[str, Any], str]:
+    """Config overrides and ``contents`` for a Gemini/Vertex request.
+
+    A cached-content request may not also set ``system_instruction``, so the
+    role's system prompt is stored in the cache alongside the prefix.
+    """
+    name = (
+        genai_context_cache.get(client, provider, model, system_prompt, cache_prefix)
+        if cache_prefix else None
+    )
+    if name:
+        return {"cached_content": name}, user_prompt
+    return {"system_instruction": system_prompt}, join_prompt(cache_prefix, user_prompt)
@@ -112,6 +112,36 @@ def _build_modify_targets_block(modify_file_contents: Optional[Dict[str, str]])
     )
 
 
+def block_prompt_prefix(skeleton_json: str, story_content: str, context_summary: str) -> str:
+    """
+    Build the part of the Phase 2 block prompt shared by every section.
+
+    Passed to ``AIService.complete`` as ``cache_prefix`` so providers can
+    cache it across the parallel block requests.
+
+    Args:
+        skeleton_json: The full skeleton JSON for context.
+        story_content: The original story content.
+        context_summary: Relevant codebase context (targeted introspection).
+
+    Returns:
+        The shared prompt prefix.
+    """
+    return f"""
+You are the Implementation Specialist in the AI Governance Panel.
+Your task is to generate a DETAILED implementation block for a specific section of a runbook.
+
+FULL RUNBOOK SKELETON (FOR COHERENCE):
+{skeleton_json}
+
+STORY CONTEXT:
+{story_content}
+
+TARGETED FILE CONTENTS (this is the GROUND TRUTH — base all SEARCH blocks on these exact contents):
+{context_summary}
+""".strip()
+
+
 def generate_block_prompt(
     section_title: str,
     section_desc: str,
@@ -123,6 +153,7 @@ def generate_block_prompt(
     existing_files: Optional[List[str]] = None,
     implementation_context: Optional[str] = None,
     legacy: bool = False,
+    include_shared: bool = True,
 ) -> str:
     """
     Generate a Phase 2 prompt for creating a detailed implementation block.
@@ -138,6 +169,8 @@ def generate_block_prompt(
         modify_file_contents: Dict mapping file paths to their actual on-disk
             content. When provided, injected verbatim so the AI can write
             exact <<<SEARCH blocks without hallucinating.
+        include_shared: Start with :func:`block_prompt_prefix`. Pass False
+            when the prefix is sent separately as a cached prefix.
 
     Returns:
         A system prompt for the AI.
@@ -220,22 +253,13 @@ Ensure all generated tests exactly match the logic, classes, and APIs within thi
             '  decisions, threshold standards, rollback procedures, and CI/CD integration notes.'
         )
 
+    shared = block_prompt_prefix(skeleton_json, story_content, context_summary) if include_shared else ""
     prompt = f"""
-You are the Implementation Specialist in the AI Governance Panel.
-Your task is to generate a DETAILED implementation block for a specific section of a runbook.
+{shared}
 
 TARGET SECTION:
 Title: {section_title}
 Objective: {section_desc}
-
-FULL RUNBOOK SKELETON (FOR COHERENCE):
-{skeleton_json}
-
-STORY CONTEXT:
-{story_content}
-
-TARGETED FILE CONTENTS (this is the GROUND TRUTH — base all SEARCH blocks on these exact contents):
-{context_summary}
 {_build_modify_targets_block(modify_file_contents)}
 {dedup_block}
 {existing_block}
@@ -0,0 +1,358 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared retry, failover and circuit-breaking policy for AI calls.
+
+Provider SDKs raise their own exception hierarchies. :func:`classify`
+maps them onto the provider-neutral types in :mod:`agent.core.ai.protocols`
+so that ``complete`` and ``stream_complete`` can share one policy:
+
+- :class:`AIRateLimitError` and :class:`AIConnectionError` are retryable,
+  with jittered exponential backoff that honours ``Retry-After``.
+- Anything else fails immediately and is not counted against the provider.
+- A :class:`CircuitBreaker` per provider/model skips a backend after
+  repeated failures, so an outage costs one fast failover instead of a
+  full timeout per request.
+- :func:`first_byte_deadline` bounds how long a stream may take to start.
+"""
+
+import contextvars
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from agent.core.ai.protocols import (
+    AIAuthenticationError,
+    AIConnectionError,
+    AIInvalidRequestError,
+    AIProviderError,
+    AIRateLimitError,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FIRST_BYTE_TIMEOUT_S = 60.0
+DEFAULT_BREAKER_THRESHOLD = 5
+DEFAULT_BREAKER_COOLDOWN_S = 30.0
+MAX_BACKOFF_S = 60.0
+
+# Capacity errors (503 overloaded, Anthropic's 529) back off like rate limits
+RATE_LIMIT_STATUSES = {429, 503, 529}
+UNAVAILABLE_STATUSES = {408, 500, 502, 504}
+
+# Last resort for errors that carry no type or status (e.g. the gh CLI,
+# which only reports on stderr)
+_RATE_LIMIT_TEXT = re.compile(
+    r"\b(429|503)\b|rate.?limit|too many requests|resource.?exhausted|unavailable|high demand|overloaded",
+    re.I,
+)
+_UNAVAILABLE_TEXT = re.compile(
+    r"\b50[24]\b|timeout|connection (reset|aborted)|remote ?disconnected|server disconnected|"
+    r"remote protocol error|eof occurred|dns resolution",
+    re.I,
+)
+
+
+class FirstByteTimeout(AIConnectionError):
+    """Raised when a stream produces no output within its first-byte deadline."""
+
+
+class CircuitOpenError(AIProviderError):
+    """Raised instead of calling a provider/model whose breaker is open."""
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name) or default)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}; using {default}")
+        return default
+
+
+def first_byte_timeout() -> float:
+    """Seconds a stream may stay silent before failing over (``AGENT_AI_FIRST_BYTE_TIMEOUT_S``, 0 disables)."""
+    return max(0.0, _env_float("AGENT_AI_FIRST_BYTE_TIMEOUT_S", DEFAULT_FIRST_BYTE_TIMEOUT_S))
+
+
+def _sdk_errors() -> Dict[str, Tuple[type, ...]]:
+    """Typed retryable exceptions of whichever provider SDKs are installed."""
+    rate: list = []
+    conn: list = []
+    auth: list = []
+    try:
+        import openai
+        rate.append(openai.RateLimitError)
+        conn += [openai.APIConnectionError, openai.InternalServerError]
+        auth += [openai.AuthenticationError, openai.PermissionDeniedError]
+    except (ImportError, AttributeError):
+        pass
+    try:
+        import anthropic
+        rate.append(anthropic.RateLimitError)
+        conn += [anthropic.APIConnectionError, anthropic.InternalServerError]
+        auth += [anthropic.AuthenticationError, anthropic.PermissionDeniedError]
+    except (ImportError, AttributeError):
+        pass
+    try:
+        from google.api_core import exceptions as gexc
+        rate.append(gexc.ResourceExhausted)
+        conn += [gexc.ServiceUnavailable, gexc.InternalServerError, gexc.DeadlineExceeded]
+        auth += [gexc.Unauthenticated, gexc.PermissionDenied]
+    except ImportError:
+        pass
+    try:
+        import httpx
+        conn.append(httpx.TransportError)
+    except ImportError:
+        pass
+    conn += [ConnectionError, TimeoutError]
+
+    def types(candidates: list) -> Tuple[type, ...]:
+        # Tests may stub SDK modules; only real exception classes are usable
+        return tuple(t for t in candidates if isinstance(t, type) and issubclass(t, BaseException))
+
+    return {"rate": types(rate), "conn": types(conn), "auth": types(auth)}
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    for attr in ("status_code", "code", "status"):
+        value = getattr(exc, attr, None)
+        if isinstance(value, int) and 100 <= value < 600:
+            return value
+    response = getattr(exc, "response", None)
+    value = getattr(response, "status_code", None)
+    return value if isinstance(value, int) else None
+
+
+def retry_after(exc: BaseException) -> Optional[float]:
+    """Seconds the provider asked us to wait, from ``Retry-After(-Ms)`` headers."""
+    explicit = getattr(exc, "retry_after", None)
+    if isinstance(explicit, (int, float)):
+        return float(explicit)
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        ms = headers.get("retry-after-ms")
+        if ms:
+            return max(0.0, float(ms) / 1000)
+        value = headers.get("retry-after")
+    except Exception:
+        return None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def classify(exc: BaseException, provider: Optional[str] = None) -> AIProviderError:
+    """Map ``exc`` onto a provider-neutral :class:`AIProviderError`.
+
+    SDK exception types are checked first, then HTTP status codes; message
+    matching only applies to untyped errors.
+    """
+    if isinstance(exc, AIProviderError):
+        return exc
+    sdk = _sdk_errors()
+    kwargs: Dict[str, Any] = {"provider": provider, "original_exception": exc}
+    message = str(exc) or type(exc).__name__
+    status = _status_code(exc)
+    if isinstance(exc, sdk["rate"]) or status in RATE_LIMIT_STATUSES:
+        wait = retry_after(exc)
+        return AIRateLimitError(message, retry_after=wait, **kwargs)
+    if isinstance(exc, sdk["auth"]) or status in (401, 403):
+        return AIAuthenticationError(message, **kwargs)
+    if isinstance(exc, sdk["conn"]) or status in UNAVAILABLE_STATUSES:
+        return AIConnectionError(message, **kwargs)
+    if status is not None:
+        return AIInvalidRequestError(message, **kwargs)
+    if _RATE_LIMIT_TEXT.search(message):
+        return AIRateLimitError(message, **kwargs)
+    if _UNAVAILABLE_TEXT.search(message):
+        return AIConnectionError(message, **kwargs)
+    return AIProviderError(message, **kwargs)
+
+
+def is_retryable(error: AIProviderError) -> bool:
+    """Rate limits and connectivity failures are worth another attempt."""
+    return isinstance(error, (AIRateLimitError, AIConnectionError)) and not isinstance(error, CircuitOpenError)
+
+
+def backoff_delay(
+    attempt: int,
+    base: float = 1.0,
+    cap: float = MAX_BACKOFF_S,
+    retry_after: Optional[float] = None,
+    rand: Callable[[], float] = random.random,
+) -> float:
+    """Delay before retry ``attempt`` (0-based).
+
+    Uses "equal jitter": half of ``base * 2**attempt`` (capped) plus a random
+    share of the other half, so concurrent callers spread out while still
+    backing off. A provider-supplied ``retry_after`` is a floor and may
+    exceed ``cap``; callers decide whether that is worth waiting for.
+    """
+    ceiling = min(cap, base * (2 ** attempt))
+    delay = ceiling / 2 + rand() * ceiling / 2
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker for one provider/model.
+
+    After ``threshold`` failures in a row the breaker opens and
+    :meth:`allow` refuses calls for ``cooldown`` seconds. It then lets one
+    probe through (half-open); success closes it, failure re-opens it.
+    A probe that ends without a verdict (a non-retryable error, or a stream
+    closed early) must call :meth:`release` so the next call can probe.
+    """
+
+    def __init__(self, threshold: int = DEFAULT_BREAKER_THRESHOLD,
+                 cooldown: float = DEFAULT_BREAKER_COOLDOWN_S,
+                 clock: Callable[[], float] = time.monotonic):
+        self.threshold = max(1, threshold)
+        self.cooldown = cooldown
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._probing or self._clock() - self._opened_at >= self.cooldown:
+                return "half-open"
+            return "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._probing or self._clock() - self._opened_at < self.cooldown:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.threshold:
+                self._opened_at = self._clock()
+            self._probing = False
+
+    def release(self) -> None:
+        """End an in-flight probe without changing state (no-op otherwise)."""
+        with self._lock:
+            self._probing = False
+
+
+_breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def breaker_for(provider: str, model: Optional[str]) -> CircuitBreaker:
+    """The shared breaker for ``provider``/``model``.
+
+    Thresholds come from ``AGENT_AI_BREAKER_THRESHOLD`` and
+    ``AGENT_AI_BREAKER_COOLDOWN_S``.
+    """
+    key = (provider, model or "")
+    with _breakers_lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            breaker = _breakers[key] = CircuitBreaker(
+                threshold=int(_env_float("AGENT_AI_BREAKER_THRESHOLD", DEFAULT_BREAKER_THRESHOLD)),
+                cooldown=_env_float("AGENT_AI_BREAKER_COOLDOWN_S", DEFAULT_BREAKER_COOLDOWN_S),
+            )
+        return breaker
+
+
+def reset_breakers() -> None:
+    """Forget all breaker state (e.g. after reconfiguring providers)."""
+    with _breakers_lock:
+        _breakers.clear()
+
+
+_END = object()
+
+
+def first_byte_deadline(chunks: Iterator[str], timeout: float) -> Iterator[str]:
+    """Re-yield ``chunks``, raising :class:`FirstByteTimeout` if the first is late.
+
+    The source is drained on a daemon thread (in a copy of the caller's
+    context, so tracing spans nest correctly). Only the first chunk is
+    time-bounded; once output is flowing the provider's own read timeout
+    applies. Closing this generator closes the source at its next chunk.
+    """
+    if timeout <= 0:
+        yield from chunks
+        return
+
+    items: "queue.Queue[object]" = queue.Queue()
+    stop = threading.Event()
+
+    def pump() -> None:
+        try:
+            for chunk in chunks:
+                if stop.is_set():
+                    break
+                items.put(chunk)
+        except BaseException as e:  # re-raised in the consumer
+            items.put(e)
+        finally:
+            close = getattr(chunks, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception as e:
+                    logger.debug(f"Closing provider stream failed: {e}")
+            items.put(_END)
+
+    context = contextvars.copy_context()
+    threading.Thread(target=context.run, args=(pump,), name="ai-stream", daemon=True).start()
+    try:
+        try:
+            item = items.get(timeout=timeout)
+        except queue.Empty:
+            raise FirstByteTimeout(f"No output within {timeout:g}s") from None
+        while item is not _END:
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+            item = items.get()
+    finally:
+        stop.set()
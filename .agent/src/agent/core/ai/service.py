@@ -18,7 +18,7 @@ import os
 import subprocess
 import sys
 import time
-from typing import Any, Generator, List, Optional
+from typing import Any, Callable, Generator, List, Optional, Set
 import warnings
 
 from prometheus_client import Counter, Histogram
@@ -39,13 +39,44 @@ logging.getLogger("backoff").setLevel(logging.ERROR)
 from agent.core.config import get_valid_providers
 from agent.core.ai import protocols  # noqa: F401 — ensures protocols module is importable
 from agent.core.ai import streaming  # noqa: F401 — ensures streaming module is importable
+from agent.core.ai.hedging import hedge_delay, hedge_enabled, hedged_stream
+from agent.core.ai.prompt_cache import (
+    anthropic_content,
+    cacheable_prefix,
+    genai_request,
+    join_prompt,
+    max_output_tokens,
+)
+from agent.core.ai.protocols import AIRateLimitError
+from agent.core.ai.resilience import (
+    MAX_BACKOFF_S,
+    CircuitOpenError,
+    FirstByteTimeout,
+    backoff_delay,
+    breaker_for,
+    classify,
+    first_byte_timeout,
+    first_byte_deadline,
+    is_retryable,
+)
+from agent.core.ai.usage import (
+    record_completion,
+    usage_from_anthropic,
+    usage_from_genai,
+    usage_from_openai,
+)
 from agent.core.logger import get_logger
 from agent.core.router import router
+from agent.core.router_stats import DEFAULT_RATE_LIMIT_COOLDOWN_S, router_stats
+from agent.core.tokens import token_manager
 from agent.core.secrets import get_secret
 
 console = Console()
 logger = get_logger(__name__)
 
+# Attempts to start a stream on one provider before failing over
+STREAM_START_ATTEMPTS = 3
+
 ai_command_runs_total = Counter(
     "ai_command_runs_total",
     "Total number of AI command executions",
@@ -512,33 +543,31 @@ class AIService:
             f"[bold cyan]🤖 AI Provider selected: {provider_match}[/bold cyan]"
         )
 
+    # Chain order: gemini -> vertex -> openai -> anthropic -> vertex-anthropic -> ollama -> gh
+    # gh is last: free-tier rate limits make it an absolute last resort
+    # (context limits are handled by chunking, not provider selection)
+    FALLBACK_CHAIN = ['gemini', 'vertex', 'openai', 'anthropic', 'claude', 'vertex-anthropic', 'ollama', 'gh']
+
+    def _fallback_candidates(self, current_provider: str) -> List[str]:
+        """Configured providers after ``current_provider`` in the fallback chain."""
+        try:
+            start_search = self.FALLBACK_CHAIN.index(current_provider) + 1
+        except ValueError:
+            start_search = 0
+        return [p for p in self.FALLBACK_CHAIN[start_search:] if p in self.clients]
+
     def try_switch_provider(self, current_provider: str) -> bool:
         """
         Switches to the next available provider in the chain.
         Returns True if switched, False if no providers left.
         """
-        # Chain order: gemini -> vertex -> openai -> anthropic -> vertex-anthropic -> ollama -> gh
-        # gh is last: free-tier rate limits make it an absolute last resort
-        # (context limits are handled by chunking, not provider selection)
-        fallback_chain = ['gemini', 'vertex', 'openai', 'anthropic', 'claude', 'vertex-anthropic', 'ollama', 'gh']
-        
-        current_idx = -1
-        try:
-            current_idx = fallback_chain.index(current_provider)
-        except ValueError:
-            pass
-        
-        # Look for next available
-        start_search = current_idx + 1
-        for i in range(start_search, len(fallback_chain)):
-            candidate = fallback_chain[i]
-            if candidate in self.clients:
-                self.provider = candidate
-                # Switching provider via fallback essentially "forces" the
-                # new path for this session
-                self.is_forced = True 
-                return True
-                
+        for candidate in self._fallback_candidates(current_provider):
+            self.provider = candidate
+            # Switching provider via fallback essentially "forces" the
+            # new path for this session
+            self.is_forced = True
+            return True
+
         return False
 
     def complete(
@@ -550,6 +579,8 @@ class AIService:
         stop_sequences: Optional[List[str]] = None,
         auto_fallback: bool = False,
         rich_status: Optional[Any] = None,
+        hedge: Optional[bool] = False,
+        cache_prefix: Optional[str] = None,
     ) -> str:
         """
         Sends a completion request with automatic fallback.
@@ -563,6 +594,12 @@ class AIService:
                 If None, uses each provider's default.
             auto_fallback: Whether to automatically switch providers on failure.
             rich_status: Optional rich.status.Status object to update with pre-check message.
+            hedge: Stream the request and race a second provider if the first
+                is slow to respond. None follows ``AGENT_AI_HEDGE``.
+            cache_prefix: Large context shared by many calls (rules, ADRs,
+                source). It is sent ahead of ``user_prompt`` and cached
+                provider-side where supported (see
+                :mod:`agent.core.ai.prompt_cache`).
         """
         self._ensure_initialized()
         
@@ -572,7 +609,10 @@ class AIService:
         # SMART ROUTING: If not forced and no specific model requested,
         # let the router decide
         if not self.is_forced and not model_to_use:
-            route = router.route(user_prompt)
+            routed_prompt = join_prompt(cache_prefix, user_prompt)
+            route = router.route(
+                routed_prompt, input_tokens=token_manager.count_tokens(routed_prompt)
+            )
             if route:
                 routed_provider = route.get("provider")
                 if routed_provider in self.clients:
@@ -594,11 +634,40 @@ class AIService:
             rich_status.update(f"{rich_status.status}\n[dim]🔒 {sec_msg}[/dim]")
         else:
             logger.debug(sec_msg)
-        
+
         # Fallback Loop
         attempted_providers = set()
         current_p = provider_to_use
-        
+
+        if hedge_enabled(hedge):
+            start_time = time.time()
+            winner: List[str] = []
+            try:
+                content = "".join(self._hedged_stream(
+                    provider_to_use, model_to_use, system_prompt, user_prompt, temperature, stop_sequences,
+                    cache_prefix, started=attempted_providers, on_winner=winner.append,
+                )).strip()
+            except Exception as e:
+                current_p = self._switch_untried(provider_to_use, attempted_providers) if auto_fallback else None
+                if current_p is None:
+                    raise
+                console.print(
+                    f"[yellow]⚠️ Hedged request to {provider_to_use} failed: {e}. "
+                    f"Falling back to {current_p}...[/yellow]"
+                )
+            else:
+                duration = time.time() - start_time
+                if content:
+                    logging.info(
+                        f"AI Completion Success | Provider: {winner[0]} (hedged) | "
+                        f"Duration: {duration:.2f}s"
+                    )
+                    ai_command_runs_total.labels(provider=winner[0]).inc()
+                    ai_completion_latency.labels(provider=winner[0]).observe(duration)
+                else:
+                    logging.warning(f"AI Completion Empty | Provider: {provider_to_use} (hedged)")
+                return content
+
         while current_p and current_p not in attempted_providers:
             attempted_providers.add(current_p)
             try:
@@ -613,6 +682,7 @@ class AIService:
 
                 import contextlib
                 _span_ctx = _tracer.start_as_current_span("ai.completion") if _tracer else contextlib.nullcontext()
+                model_used = (model_to_use if current_p == provider_to_use else None) or self.models.get(current_p)
                 with _span_ctx as span:
                     if span is not None and hasattr(span, "set_attribute"):
                         span.set_attribute("ai.provider", current_p)
@@ -623,32 +693,35 @@ class AIService:
                         extra={"provider": current_p, "model": model_to_use}
                     )
                     
-                    content = None
-                    last_inner_exception = None
-                    for attempt in range(3):
-                        try:
-                            content = self._try_complete(
-                                current_p,
-                                system_prompt,
-                                user_prompt,
-                                model_to_use if current_p == provider_to_use else None,
-                                temperature=temperature,
-                                stop_sequences=stop_sequences
-                            )
-                            break
-                        except Exception as inner_ex:
-                            last_inner_exception = inner_ex
-                            ex_str = str(inner_ex)
-                            # Retry on known transient network/connection errors
-                            if any(msg in ex_str for msg in ["Connection reset", "RemoteDisconnected", "EOF occurred", "Connection aborted"]):
-                                if attempt < 2:
-                                    logging.warning(f"Connection error with {current_p}: {inner_ex}. Retrying in 2 seconds (Attempt {attempt + 1}/3)...")
-                                    time.sleep(2)
-                                    continue
-                            raise inner_ex
-                    else:
-                        if last_inner_exception:
-                            raise last_inner_exception
+                    breaker = breaker_for(current_p, model_used)
+                    if not breaker.allow():
+                        raise CircuitOpenError(
+                            f"Circuit open for {current_p}/{model_used or 'default'}; skipping",
+                            provider=current_p,
+                        )
+                    try:
+                        content = self._try_complete(
+                            current_p,
+                            system_prompt,
+                            user_prompt,
+                            model_to_use if current_p == provider_to_use else None,
+                            temperature=temperature,
+                            stop_sequences=stop_sequences,
+                            cache_prefix=cache_prefix,
+                        )
+                    except Exception as inner_ex:
+                        # Retries already happened in _try_complete; count the outage
+                        if isinstance(inner_ex, TimeoutError) or is_retryable(classify(inner_ex, current_p)):
+                            breaker.record_failure()
+                        else:
+                            breaker.release()
+                        _record_route_stats(current_p, model_used, time.time() - start_time, error=inner_ex)
+                        raise
+                    except BaseException:
+                        breaker.release()
+                        raise
+                    breaker.record_success()
+                    _record_route_stats(current_p, model_used, time.time() - start_time, content or "")
                 
                 duration = time.time() - start_time
                 if content:
@@ -716,6 +789,9 @@ class AIService:
         model: Optional[str] = None,
         temperature: Optional[float] = None,
         stop_sequences: Optional[List[str]] = None,
+        auto_fallback: bool = False,
+        hedge: Optional[bool] = False,
+        cache_prefix: Optional[str] = None,
     ) -> Generator[str, None, None]:
         """
         Generator that yields text chunks from an AI provider.
@@ -723,11 +799,24 @@ class AIService:
         Supports token-by-token streaming for Gemini, Vertex, Anthropic,
         OpenAI, and Ollama. Falls back to single-chunk for GH CLI.
 
+        Until the first chunk arrives the request is retried with backoff on
+        rate limits and connection errors, and abandoned if nothing arrives
+        within ``AGENT_AI_FIRST_BYTE_TIMEOUT_S``. With ``auto_fallback`` the
+        stream then fails over to the next provider, as ``complete`` does.
+        Providers whose circuit breaker is open are skipped. Once output has
+        started, errors propagate so callers keep the partial text.
+
         Args:
             system_prompt: System-level instruction for the AI model.
             user_prompt: The user query or content to process.
             model: Model override. If None, uses provider default.
             temperature: Temperature override.
+            auto_fallback: Whether to switch providers if the stream cannot start.
+            hedge: Race a second provider if the first is slow to start (see
+                :mod:`agent.core.ai.hedging`). None follows ``AGENT_AI_HEDGE``;
+                interactive callers pass None so users can opt in.
+            cache_prefix: Shared context sent ahead of ``user_prompt`` and
+                cached provider-side where supported.
 
         Yields:
             str: Text chunks as they arrive from the provider.
@@ -736,10 +825,201 @@ class AIService:
             Exception: On provider errors after retry exhaustion.
         """
         self._ensure_initialized()
-        provider = self.provider or "gemini"
+        first_provider = provider = self.provider or "gemini"
+        attempted = set()
+        if hedge_enabled(hedge):
+            started = False
+            try:
+                for chunk in self._hedged_stream(
+                    first_provider, model, system_prompt, user_prompt, temperature, stop_sequences,
+                    cache_prefix, started=attempted,
+                ):
+                    started = True
+                    yield chunk
+                return
+            except Exception as e:
+                next_provider = None if started or not auto_fallback \
+                    else self._switch_untried(first_provider, attempted)
+                if next_provider is None:
+                    raise
+                console.print(
+                    f"[yellow]⚠️ Hedged stream from {first_provider} failed: {e}. "
+                    f"Falling back to {next_provider}...[/yellow]"
+                )
+                provider = next_provider
+        while True:
+            attempted.add(provider)
+            model_used = (model if provider == first_provider else None) or self.models.get(provider)
+            started = False
+            try:
+                for chunk in self._stream_resilient(
+                    provider, model_used, system_prompt, user_prompt, temperature, stop_sequences,
+                    cache_prefix,
+                ):
+                    started = True
+                    yield chunk
+                return
+            except Exception as e:
+                if started or not auto_fallback or not self.try_switch_provider(provider) \
+                        or self.provider in attempted:
+                    raise
+                console.print(
+                    f"[yellow]⚠️ Provider {provider} failed to stream: {e}. "
+                    f"Falling back to {self.provider}...[/yellow]"
+                )
+                provider = self.provider
+
+    def _hedged_stream(
+        self,
+        provider: str,
+        model: Optional[str],
+        system_prompt: str,
+        user_prompt: str,
+        temperature: Optional[float] = None,
+        stop_sequences: Optional[List[str]] = None,
+        cache_prefix: Optional[str] = None,
+        started: Optional[Set[str]] = None,
+        on_winner: Optional[Callable[[str], None]] = None,
+    ) -> Generator[str, None, None]:
+        """Stream from ``provider``, hedging to the next healthy provider if it is slow.
+
+        Providers are added to ``started`` as their requests go out, and
+        ``on_winner`` receives the provider whose output is returned. Each
+        request records its own usage, including the cancelled one.
+        """
         model_used = model or self.models.get(provider)
+        partner = self._hedge_partner(provider)
+        tags = {"primary": provider, "secondary": partner}
+
+        def stream_from(p: str, m: Optional[str]):
+            def factory():
+                if started is not None:
+                    started.add(p)
+                return self._stream_resilient(
+                    p, m, system_prompt, user_prompt, temperature, stop_sequences, cache_prefix,
+                )
+            return factory
+
+        yield from hedged_stream(
+            stream_from(provider, model_used),
+            stream_from(partner, self.models.get(partner)) if partner else None,
+            hedge_delay(provider, model_used),
+            provider,
+            on_winner=(lambda tag: on_winner(tags[tag])) if on_winner else None,
+        )
 
+    def _switch_untried(self, provider: str, attempted: Set[str]) -> Optional[str]:
+        """Switch to the next provider after ``provider`` not in ``attempted``."""
+        for candidate in self._fallback_candidates(provider):
+            if candidate not in attempted:
+                self.provider = candidate
+                self.is_forced = True
+                return candidate
+        return None
+
+    def _hedge_partner(self, provider: str) -> Optional[str]:
+        """Next configured provider in the fallback chain whose breaker is closed."""
+        for candidate in self._fallback_candidates(provider):
+            if breaker_for(candidate, self.models.get(candidate)).state == "closed":
+                return candidate
+        return None
+
+    def _stream_resilient(
+        self,
+        provider: str,
+        model_used: Optional[str],
+        system_prompt: str,
+        user_prompt: str,
+        temperature: Optional[float] = None,
+        stop_sequences: Optional[List[str]] = None,
+        cache_prefix: Optional[str] = None,
+    ) -> Generator[str, None, None]:
+        """Stream from one provider with retries, first-byte deadline and breaker."""
+        breaker = breaker_for(provider, model_used)
+        started = False
+        streamed: List[str] = []
+        stream_start = time.time()
+        first_token_s = None
+        try:
+            if not breaker.allow():
+                raise CircuitOpenError(
+                    f"Circuit open for {provider}/{model_used or 'default'}; skipping",
+                    provider=provider,
+                )
+            for attempt in range(STREAM_START_ATTEMPTS):
+                chunks = first_byte_deadline(
+                    self._stream_provider(
+                        provider, model_used, system_prompt, user_prompt,
+                        temperature, stop_sequences, cache_prefix,
+                    ),
+                    first_byte_timeout(),
+                )
+                try:
+                    for chunk in chunks:
+                        if not started:
+                            started = True
+                            first_token_s = time.time() - stream_start
+                        streamed.append(chunk)
+                        yield chunk
+                    break
+                except Exception as e:
+                    failure = classify(e, provider)
+                    # A late first byte is an outage signal: fail over, don't wait again
+                    if started or not is_retryable(failure) or isinstance(failure, FirstByteTimeout) \
+                            or attempt >= STREAM_START_ATTEMPTS - 1:
+                        raise
+                    wait_time = backoff_delay(attempt, retry_after=getattr(failure, "retry_after", None))
+                    if wait_time > MAX_BACKOFF_S:
+                        raise
+                    logging.warning(
+                        f"Stream from {provider} failed to start: {e}. "
+                        f"Retrying ({attempt + 1}/{STREAM_START_ATTEMPTS}) in {wait_time:.1f}s"
+                    )
+                    time.sleep(wait_time)
+                finally:
+                    chunks.close()
+        except Exception as e:
+            if isinstance(e, TimeoutError) or is_retryable(classify(e, provider)):
+                breaker.record_failure()
+            elif not isinstance(e, CircuitOpenError):
+                breaker.release()
+            if not isinstance(e, CircuitOpenError):
+                _record_route_stats(provider, model_used, time.time() - stream_start, error=e)
+            raise
+        except GeneratorExit:
+            # The caller stopped reading (e.g. the agent loop once the Action
+            # block closes). Output was flowing, so the provider is healthy.
+            breaker.record_success()
+            _record_route_stats(
+                provider, model_used, time.time() - stream_start, "".join(streamed),
+                first_token_s=first_token_s,
+            )
+            raise
+        except BaseException:
+            # Interrupted: no verdict on the provider
+            breaker.release()
+            raise
+        breaker.record_success()
+        _record_route_stats(
+            provider, model_used, time.time() - stream_start, "".join(streamed),
+            first_token_s=first_token_s,
+        )
+
+    def _stream_provider(
+        self,
+        provider: str,
+        model_used: Optional[str],
+        system_prompt: str,
+        user_prompt: str,
+        temperature: Optional[float] = None,
+        stop_sequences: Optional[List[str]] = None,
+        cache_prefix: Optional[str] = None,
+    ) -> Generator[str, None, None]:
+        """Stream one completion from ``provider`` without retries or failover."""
         timeout_ms = int(os.environ.get("AGENT_AI_TIMEOUT_MS", 120000))
+        cached = cacheable_prefix(provider, cache_prefix)
+        if not cached:
+            user_prompt = join_prompt(cache_prefix, user_prompt)
 
         # OBSERVABILITY: OTel span for streaming
         try:
@@ -765,8 +1045,11 @@ class AIService:
                 from google.genai import types
 
                 client = self._build_genai_client(provider)
+                cache_kwargs, contents = genai_request(
+                    client, provider, model_used, system_prompt, user_prompt, cached,
+                )
                 gen_config_kwargs = {
-                    "system_instruction": system_prompt,
+                    **cache_kwargs,
                     "http_options": types.HttpOptions(timeout=timeout_ms),
                     "automatic_function_calling": types.AutomaticFunctionCallingConfig(
                         disable=True
@@ -778,36 +1061,70 @@ class AIService:
                     gen_config_kwargs["stop_sequences"] = stop_sequences
                 config = types.GenerateContentConfig(**gen_config_kwargs)
 
+                usage_metadata = None
+                streamed = []
                 try:
                     for chunk in client.models.generate_content_stream(
-                        model=model_used, contents=user_prompt, config=config
+                        model=model_used, contents=contents, config=config
                     ):
+                        # Usage is cumulative; the last chunk carries the totals
+                        usage_metadata = getattr(chunk, "usage_metadata", None) or usage_metadata
                         if chunk.text:
+                            streamed.append(chunk.text)
                             yield chunk.text
                 except ValueError as e:
                     # @Robustness: Handle ReAct text output being misinterpreted as a function call.
                     extracted_text = self._handle_malformed_func_call_error(e)
                     if extracted_text:
+                        streamed.append(extracted_text)
                         yield extracted_text
                     else:
                         # If it's not the error we're looking for, re-raise it.
                         raise e
+                except GeneratorExit:
+                    # The caller stopped reading; the tokens so far were still billed
+                    record_completion(
+                        provider, model_used, usage_from_genai(usage_metadata),
+                        (system_prompt, cached or "", user_prompt), "".join(streamed),
+                    )
+                    raise
+                record_completion(
+                    provider, model_used, usage_from_genai(usage_metadata),
+                    (system_prompt, cached or "", user_prompt), "".join(streamed),
+                )
 
             elif provider in ("anthropic", "vertex-anthropic"):
                 client = self.clients[provider]
                 stream_kwargs = {
                     "model": model_used,
-                    "max_tokens": 4096,
+                    "max_tokens": max_output_tokens(model_used),
                     "system": system_prompt,
-                    "messages": [{"role": "user", "content": user_prompt}],
+                    "messages": [{"role": "user", "content": anthropic_content(user_prompt, cached)}],
                 }
                 if temperature is not None:
                     stream_kwargs["temperature"] = temperature
                 if stop_sequences:
                     stream_kwargs["stop_sequences"] = stop_sequences
+                streamed = []
+                final_usage = None
                 with client.messages.stream(**stream_kwargs) as stream:
-                    for text in stream.text_stream:
-                        yield text
+                    try:
+                        for text in stream.text_stream:
+                            streamed.append(text)
+                            yield text
+                        final_usage = getattr(stream.get_final_message(), "usage", None)
+                    except GeneratorExit:
+                        # Closed early: the snapshot holds the usage reported so far
+                        snapshot = getattr(stream, "current_message_snapshot", None)
+                        record_completion(
+                            provider, model_used, usage_from_anthropic(getattr(snapshot, "usage", None)),
+                            (system_prompt, cached or "", user_prompt), "".join(streamed),
+                        )
+                        raise
+                record_completion(
+                    provider, model_used, usage_from_anthropic(final_usage),
+                    (system_prompt, cached or "", user_prompt), "".join(streamed),
+                )
 
             elif provider in ("openai", "ollama"):
                 client = self.clients[provider]
@@ -823,15 +1140,35 @@ class AIService:
                     create_kwargs["temperature"] = temperature
                 if stop_sequences:
                     create_kwargs["stop"] = stop_sequences
+                if provider == "openai":
+                    # Final chunk (with empty choices) carries the usage totals
+                    create_kwargs["stream_options"] = {"include_usage": True}
                 response = client.chat.completions.create(**create_kwargs)
-                for chunk in response:
-                    if chunk.choices and chunk.choices[0].delta.content:
-                        yield chunk.choices[0].delta.content
+                streamed = []
+                final_usage = None
+                try:
+                    for chunk in response:
+                        final_usage = getattr(chunk, "usage", None) or final_usage
+                        if chunk.choices and chunk.choices[0].delta.content:
+                            streamed.append(chunk.choices[0].delta.content)
+                            yield chunk.choices[0].delta.content
+                except GeneratorExit:
+                    record_completion(
+                        provider, model_used, usage_from_openai(final_usage),
+                        (system_prompt, user_prompt), "".join(streamed),
+                    )
+                    raise
+                record_completion(
+                    provider, model_used, usage_from_openai(final_usage),
+                    (system_prompt, user_prompt), "".join(streamed),
+                )
 
             elif provider == "gh":
-                # GH CLI does not support streaming; yield full response as one chunk
-                result = self.complete(
-                    system_prompt, user_prompt, model=model, temperature=temperature, stop_sequences=stop_sequences
+                # GH CLI does not support streaming; yield full response as one chunk.
+                # Call the provider directly: the caller already holds gh's breaker.
+                result = self._try_complete(
+                    provider, system_prompt, user_prompt, model_used,
+                    temperature=temperature, stop_sequences=stop_sequences,
                 )
                 if result:
                     yield result
@@ -969,9 +1306,13 @@ class AIService:
         user_prompt: str,
         model: Optional[str] = None,
         temperature: Optional[float] = None,
-        stop_sequences: Optional[List[str]] = None
+        stop_sequences: Optional[List[str]] = None,
+        cache_prefix: Optional[str] = None,
     ) -> str:
         model_used = model or self.models.get(provider)
+        cached = cacheable_prefix(provider, cache_prefix)
+        if not cached:
+            user_prompt = join_prompt(cache_prefix, user_prompt)
         from agent.core.config import config as _cfg
         max_retries = max(3, _cfg.panel_num_retries)
         
@@ -984,8 +1325,11 @@ class AIService:
                     bg_client = self._build_genai_client(provider)
                     
                     timeout_ms = int(os.environ.get("AGENT_AI_TIMEOUT_MS", 300000))
+                    cache_kwargs, contents = genai_request(
+                        bg_client, provider, model_used, system_prompt, user_prompt, cached,
+                    )
                     gen_config_kwargs = {
-                        "system_instruction": system_prompt,
+                        **cache_kwargs,
                         "http_options": types.HttpOptions(timeout=timeout_ms),
                         "automatic_function_calling": types.AutomaticFunctionCallingConfig(disable=True),
                     }
@@ -996,15 +1340,18 @@ class AIService:
                     config = types.GenerateContentConfig(**gen_config_kwargs)
                     response_stream = bg_client.models.generate_content_stream(
                         model=model_used,
-                        contents=user_prompt,
+                        contents=contents,
                         config=config
                     )
                     
                     full_text = ""
+                    usage_metadata = None
                     # Streaming keeps the connection alive,
                     # preventing 60s/120s idle timeouts
                     try:
                         for chunk in response_stream:
+                            # Usage is cumulative; the last chunk carries the totals
+                            usage_metadata = getattr(chunk, "usage_metadata", None) or usage_metadata
                             if chunk.text:
                                 full_text += chunk.text
                     except ValueError as e:
@@ -1016,7 +1363,11 @@ class AIService:
                         else:
                             # If it's not the error we're looking for, re-raise it.
                             raise e
-                            
+
+                    record_completion(
+                        provider, model_used, usage_from_genai(usage_metadata),
+                        (system_prompt, cached or "", user_prompt), full_text,
+                    )
                     return full_text.strip()
 
                 elif provider == "openai":
@@ -1036,7 +1387,12 @@ class AIService:
                         create_kwargs["stop"] = stop_sequences
                     response = client.chat.completions.create(**create_kwargs)
                     if response.choices:
-                        return response.choices[0].message.content.strip()
+                        content = response.choices[0].message.content
+                        record_completion(
+                            provider, model_used, usage_from_openai(getattr(response, "usage", None)),
+                            (system_prompt, user_prompt), content or "",
+                        )
+                        return content.strip()
                     return ""
 
                 elif provider == "gh":
@@ -1048,6 +1404,10 @@ class AIService:
                         cmd, input=combined_prompt, text=True, capture_output=True
                     )
                     if result.returncode == 0:
+                        # gh reports no usage; record a tokenizer estimate
+                        record_completion(
+                            provider, model_used, None, (system_prompt, user_prompt), result.stdout,
+                        )
                         return result.stdout.strip()
                     
                     # Check 429 or Context Limit
@@ -1109,11 +1469,11 @@ class AIService:
                     # (similar to Gemini)
                     stream_kwargs = {
                         "model": model_used,
-                        "max_tokens": 4096,
+                        "max_tokens": max_output_tokens(model_used),
                         "timeout": _timeout_s,
                         "system": system_prompt,
                         "messages": [
-                            {"role": "user", "content": user_prompt}
+                            {"role": "user", "content": anthropic_content(user_prompt, cached)}
                         ],
                     }
                     if temperature is not None:
@@ -1123,6 +1483,11 @@ class AIService:
                     with client.messages.stream(**stream_kwargs) as stream:
                         for text in stream.text_stream:
                             full_text += text
+                        final_usage = getattr(stream.get_final_message(), "usage", None)
+                    record_completion(
+                        provider, model_used, usage_from_anthropic(final_usage),
+                        (system_prompt, cached or "", user_prompt), full_text,
+                    )
                     return full_text.strip()
 
                 elif provider == "ollama":
@@ -1142,6 +1507,10 @@ class AIService:
                     response = client.chat.completions.create(**ollama_kwargs)
                     if response.choices:
                         content = response.choices[0].message.content
+                        record_completion(
+                            provider, model_used, usage_from_openai(getattr(response, "usage", None)),
+                            (system_prompt, user_prompt), content or "",
+                        )
                         return content.strip() if content else ""
                     return ""
                 
@@ -1189,69 +1558,75 @@ class AIService:
                     # If corporate proxy killed the proxy prematurely, abort
                     raise e
                     
-                # Catch transient network errors and retry
-                transient_indicators = [
-                    "remote protocol error",  
-                    "server disconnected", 
-                    "timeout", 
-                    "connection reset",
-                    "rate limit",
-                    "dns resolution",
-                    "429",
-                    "resource exhausted",
-                    "503",
-                    "unavailable",
-                    "high demand",
-                ]
-                
-                if (
-                    any(ind in error_str for ind in transient_indicators)
-                    and attempt < max_retries - 1
-                ):
+                # Retry rate limits and connectivity failures with jittered
+                # backoff; anything else goes straight back to the caller.
+                failure = classify(e, provider)
+                if not is_retryable(failure) or attempt >= max_retries - 1:
+                    raise e
+
+                if isinstance(failure, AIRateLimitError):
                     # Treat 503/unavailable/high-demand same as rate-limit
-                    rate_limit_indicators = [
-                        "429", "rate limit", "resource exhausted",
-                        "503", "unavailable", "high demand",
-                    ]
-                    if any(ind in error_str for ind in rate_limit_indicators):
-                         rate_limit_max = _cfg.panel_num_retries
-                         if attempt < rate_limit_max - 1:
-                             # Base 5s, then 10s, 20s, up to 60s
-                             wait_time = min(5 * (2 ** attempt), 60)
-                             msg = (
-                                 f"[yellow]⚠️ Rate limit ({provider}). "
-                                 f"Backoff retry {attempt+1}/{rate_limit_max} "
-                                 f"in {wait_time}s...[/yellow]"
-                             )
-                             console.print(msg)
-                             logging.warning(f"Rate limit ({provider}). Backoff retry {attempt+1}/{rate_limit_max} in {wait_time}s")
-                             time.sleep(wait_time)
-                             continue
-                         else:
-                             msg = (
-                                 f"[yellow]⚠️ Rate limit ({provider}). "
-                                 f"Exhausted {rate_limit_max} retries, "
-                                 f"switching providers...[/yellow]"
-                             )
-                             console.print(msg)
-                             logging.error(f"Rate limit ({provider}). Exhausted {rate_limit_max} retries.")
-                             raise e
-                    
-                    wait_time = (attempt + 1) * 2
+                    rate_limit_max = _cfg.panel_num_retries
+                    # Base 5s, then 10s, 20s, up to 60s (or Retry-After)
+                    wait_time = backoff_delay(attempt, base=5, retry_after=failure.retry_after)
+                    if attempt >= rate_limit_max - 1 or wait_time > MAX_BACKOFF_S:
+                        msg = (
+                            f"[yellow]⚠️ Rate limit ({provider}). "
+                            f"Exhausted {rate_limit_max} retries, "
+                            f"switching providers...[/yellow]"
+                        )
+                        console.print(msg)
+                        logging.error(f"Rate limit ({provider}). Exhausted {rate_limit_max} retries.")
+                        raise e
                     msg = (
-                        f"[yellow]⚠️ AI Provider error: {e}. "
-                        f"Retrying ({attempt+1}/{max_retries}) "
-                        f"in {wait_time}s...[/yellow]"
+                        f"[yellow]⚠️ Rate limit ({provider}). "
+                        f"Backoff retry {attempt+1}/{rate_limit_max} "
+                        f"in {wait_time:.1f}s...[/yellow]"
                     )
                     console.print(msg)
-                    logging.warning(f"AI Provider error: {e}. Retrying ({attempt+1}/{max_retries}) in {wait_time}s")
+                    logging.warning(f"Rate limit ({provider}). Backoff retry {attempt+1}/{rate_limit_max} in {wait_time:.1f}s")
                     time.sleep(wait_time)
                     continue
-                else:
-                    raise e
+
+                wait_time = backoff_delay(attempt, base=2)
+                msg = (
+                    f"[yellow]⚠️ AI Provider error: {e}. "
+                    f"Retrying ({attempt+1}/{max_retries}) "
+                    f"in {wait_time:.1f}s...[/yellow]"
+                )
+                console.print(msg)
+                logging.warning(f"AI Provider error: {e}. Retrying ({attempt+1}/{max_retries}) in {wait_time:.1f}s")
+                time.sleep(wait_time)
+                continue
             
         return ""
 
+def _record_route_stats(
+    provider: str,
+    model: Optional[str],
+    latency_s: float,
+    output_text: str = "",
+    error: Optional[BaseException] = None,
+    first_token_s: Optional[float] = None,
+) -> None:
+    """Feed one call outcome into the SmartRouter's rolling health window."""
+    rate_limited_for = None
+    if error is not None:
+        failure = classify(error, provider)
+        if isinstance(failure, AIRateLimitError):
+            rate_limited_for = failure.retry_after or DEFAULT_RATE_LIMIT_COOLDOWN_S
+    output_tokens = 0
+    if output_text:
+        try:
+            output_tokens = token_manager.count_tokens(output_text, provider=provider)
+        except Exception:
+            output_tokens = len(output_text) // 4
+    router_stats.record(
+        provider, model, latency_s, output_tokens,
+        ok=error is None, rate_limited_for=rate_limited_for, first_token_s=first_token_s,
+    )
+
+
 def get_embeddings_model() -> "HuggingFaceEmbeddings":
     """
     Returns a configured document embedding model for vector search.
@@ -0,0 +1,313 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Provider-reported token usage and the local usage ledger.
+
+Every ``AIService`` call records the input/output (and cached) token counts
+reported by the provider SDK into ``.agent/cache/usage.db``, attributed to
+the current command, story and governance role. Attribution labels come
+from process defaults (set once per CLI command) overlaid with a
+``contextvars`` scope, so concurrent council roles are tagged correctly.
+
+Set ``AGENT_USAGE_LEDGER=0`` to disable persistence (tests, CI).
+"""
+
+import contextlib
+import contextvars
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from prometheus_client import Counter
+
+from agent.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+ai_tokens_total = Counter(
+    "ai_tokens_total",
+    "Total LLM tokens reported by providers",
+    ["provider", "type"],
+)
+
+LABEL_KEYS = ("command", "story", "role")
+GROUP_BY_COLUMNS = ("command", "story", "role", "provider", "model")
+
+_default_labels: Dict[str, str] = {}
+_scoped_labels: contextvars.ContextVar[Dict[str, str]] = contextvars.ContextVar(
+    "usage_labels", default={}
+)
+
+
+@dataclass
+class TokenUsage:
+    """Token counts for a single provider call."""
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_input_tokens: int = 0
+    cache_write_tokens: int = 0
+    estimated: bool = False
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+
+def _as_int(value: Any) -> int:
+    """Coerce SDK counters (possibly None or missing) to int."""
+    return value if isinstance(value, int) and not isinstance(value, bool) else 0
+
+
+def usage_from_openai(usage: Any) -> Optional[TokenUsage]:
+    """Extract usage from an OpenAI/Ollama ``CompletionUsage`` object."""
+    if usage is None:
+        return None
+    prompt = _as_int(getattr(usage, "prompt_tokens", None))
+    completion = _as_int(getattr(usage, "completion_tokens", None))
+    if not prompt and not completion:
+        return None
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = _as_int(getattr(details, "cached_tokens", None)) if details is not None else 0
+    return TokenUsage(input_tokens=prompt, output_tokens=completion, cached_input_tokens=cached)
+
+
+def usage_from_anthropic(usage: Any) -> Optional[TokenUsage]:
+    """
+    Extract usage from an Anthropic ``Usage`` object.
+
+    Anthropic reports cache reads/writes separately from ``input_tokens``;
+    they are folded into the input total so every provider means the same
+    thing by "input".
+    """
+    if usage is None:
+        return None
+    uncached = _as_int(getattr(usage, "input_tokens", None))
+    output = _as_int(getattr(usage, "output_tokens", None))
+    cache_read = _as_int(getattr(usage, "cache_read_input_tokens", None))
+    cache_write = _as_int(getattr(usage, "cache_creation_input_tokens", None))
+    if not (uncached or output or cache_read or cache_write):
+        return None
+    return TokenUsage(
+        input_tokens=uncached + cache_read + cache_write,
+        output_tokens=output,
+        cached_input_tokens=cache_read,
+        cache_write_tokens=cache_write,
+    )
+
+
+def usage_from_genai(metadata: Any) -> Optional[TokenUsage]:
+    """Extract usage from a google-genai ``usage_metadata`` object."""
+    if metadata is None:
+        return None
+    prompt = _as_int(getattr(metadata, "prompt_token_count", None))
+    output = _as_int(getattr(metadata, "candidates_token_count", None))
+    output += _as_int(getattr(metadata, "thoughts_token_count", None))
+    if not prompt and not output:
+        return None
+    cached = _as_int(getattr(metadata, "cached_content_token_count", None))
+    return TokenUsage(input_tokens=prompt, output_tokens=output, cached_input_tokens=cached)
+
+
+def estimate_usage(prompts: Sequence[str], output_text: str) -> TokenUsage:
+    """Fallback for providers that report nothing (e.g. ``gh`` CLI)."""
+    from agent.core.tokens import token_manager
+
+    return TokenUsage(
+        input_tokens=sum(token_manager.count_tokens(p or "") for p in prompts),
+        output_tokens=token_manager.count_tokens(output_text or ""),
+        estimated=True,
+    )
+
+
+def set_default_labels(**labels: Optional[str]) -> None:
+    """Set process-wide attribution labels (e.g. the CLI command)."""
+    for key, value in labels.items():
+        if key not in LABEL_KEYS:
+            raise ValueError(f"Unknown usage label: {key}")
+        if value:
+            _default_labels[key] = value
+        else:
+            _default_labels.pop(key, None)
+
+
+@contextlib.contextmanager
+def usage_scope(**labels: Optional[str]) -> Iterator[None]:
+    """Attribute calls made inside the block to the given story/role."""
+    for key in labels:
+        if key not in LABEL_KEYS:
+            raise ValueError(f"Unknown usage label: {key}")
+    merged = {**_scoped_labels.get(), **{k: v for k, v in labels.items() if v}}
+    token = _scoped_labels.set(merged)
+    try:
+        yield
+    finally:
+        _scoped_labels.reset(token)
+
+
+def current_labels() -> Dict[str, str]:
+    """Return the effective labels: process defaults overlaid by the scope."""
+    return {**_default_labels, **_scoped_labels.get()}
+
+
+class UsageLedger:
+    """SQLite-backed ledger of per-call token usage (``usage.db``, mode 0600)."""
+
+    def __init__(self, db_path: Optional[Path] = None) -> None:
+        if db_path is None:
+            from agent.core.config import config
+            db_path = config.cache_dir / "usage.db"
+
+        self._db_path = Path(db_path)
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        if not self._db_path.exists():
+            fd = os.open(str(self._db_path), os.O_CREAT | os.O_WRONLY, 0o600)
+            os.close(fd)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS llm_usage (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                ts TEXT NOT NULL,
+                provider TEXT NOT NULL,
+                model TEXT NOT NULL DEFAULT '',
+                command TEXT NOT NULL DEFAULT '',
+                story TEXT NOT NULL DEFAULT '',
+                role TEXT NOT NULL DEFAULT '',
+                input_tokens INTEGER NOT NULL DEFAULT 0,
+                output_tokens INTEGER NOT NULL DEFAULT 0,
+                cached_input_tokens INTEGER NOT NULL DEFAULT 0,
+                cache_write_tokens INTEGER NOT NULL DEFAULT 0,
+                estimated INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS idx_llm_usage_ts ON llm_usage(ts);
+        """)
+        self._conn.commit()
+
+    def record(self, provider: str, model: Optional[str], usage: TokenUsage,
+               labels: Optional[Dict[str, str]] = None) -> None:
+        """Append one call to the ledger."""
+        labels = labels if labels is not None else current_labels()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO llm_usage (ts, provider, model, command, story, role, input_tokens, "
+                "output_tokens, cached_input_tokens, cache_write_tokens, estimated) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    datetime.now(timezone.utc).isoformat(),
+                    provider,
+                    model or "",
+                    labels.get("command", ""),
+                    labels.get("story", ""),
+                    labels.get("role", ""),
+                    usage.input_tokens,
+                    usage.output_tokens,
+                    usage.cached_input_tokens,
+                    usage.cache_write_tokens,
+                    int(usage.estimated),
+                ),
+            )
+            self._conn.commit()
+
+    def summarize(self, group_by: str = "command", since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Aggregate usage grouped by ``group_by`` plus provider and model.
+
+        Provider/model are always part of the grouping so callers can price
+        each row from ``router.yaml``.
+        """
+        if group_by not in GROUP_BY_COLUMNS:
+            raise ValueError(f"group_by must be one of: {', '.join(GROUP_BY_COLUMNS)}")
+        columns = [group_by] + [c for c in ("provider", "model") if c != group_by]
+        select_cols = ", ".join(columns)
+        query = (
+            f"SELECT {select_cols}, COUNT(*) AS calls, SUM(input_tokens) AS input_tokens, "
+            "SUM(output_tokens) AS output_tokens, SUM(cached_input_tokens) AS cached_input_tokens, "
+            "SUM(cache_write_tokens) AS cache_write_tokens, SUM(estimated) AS estimated_calls "
+            "FROM llm_usage"
+        )
+        params: List[Any] = []
+        if since is not None:
+            query += " WHERE ts >= ?"
+            params.append(since.astimezone(timezone.utc).isoformat())
+        query += f" GROUP BY {select_cols} ORDER BY {group_by}, SUM(input_tokens) DESC"
+        with self._lock:
+            return [dict(r) for r in self._conn.execute(query, params).fetchall()]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+_ledger: Optional[UsageLedger] = None
+_ledger_lock = threading.Lock()
+
+
+def ledger_enabled() -> bool:
+    """Persistence is on unless ``AGENT_USAGE_LEDGER`` is 0/false/no."""
+    return os.getenv("AGENT_USAGE_LEDGER", "1").strip().lower() not in ("0", "false", "no")
+
+
+def get_usage_ledger() -> UsageLedger:
+    """Return the process-wide ledger, creating it on first use."""
+    global _ledger
+    with _ledger_lock:
+        if _ledger is None:
+            _ledger = UsageLedger()
+        return _ledger
+
+
+def record_usage(provider: str, model: Optional[str], usage: Optional[TokenUsage]) -> None:
+    """
+    Export ``usage`` to metrics and the ledger. Never raises.
+
+    Accounting must not break a completion that already succeeded, so
+    ledger errors are logged at debug level and swallowed.
+    """
+    if usage is None:
+        return
+    try:
+        ai_tokens_total.labels(provider=provider, type="input").inc(usage.input_tokens)
+        ai_tokens_total.labels(provider=provider, type="output").inc(usage.output_tokens)
+        if usage.cached_input_tokens:
+            ai_tokens_total.labels(provider=provider, type="cached_input").inc(usage.cached_input_tokens)
+        if ledger_enabled():
+            get_usage_ledger().record(provider, model, usage)
+    except Exception as e:
+        logger.debug(f"Failed to record token usage: {e}")
+
+
+def record_completion(
+    provider: str,
+    model: Optional[str],
+    usage: Optional[TokenUsage],
+    prompts: Sequence[str],
+    output_text: str,
+) -> None:
+    """Record provider-reported usage, estimating it when none was reported."""
+    if usage is None:
+        try:
+            usage = estimate_usage(prompts, output_text)
+        except Exception as e:
+            logger.debug(f"Failed to estimate token usage: {e}")
+            return
+    record_usage(provider, model, usage)
@@ -16,7 +16,6 @@
 Core logic for impact analysis.
 """
 
-import subprocess
 import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -24,7 +23,8 @@ from typing import Any, Dict, List, Optional
 from opentelemetry import trace
 from agent.core.logger import get_logger
 from agent.core.config import config
-from agent.core.utils import scrub_sensitive_data
+from agent.core.git_state import git_state
+from agent.core.utils import find_story_file, scrub_sensitive_data
 from agent.core.ai.prompts import generate_impact_prompt
 from agent.core.check.models import ImpactResult
 
@@ -46,10 +46,7 @@ def update_story_impact_summary(story_id: str, analysis: str, found_file: Option
         True if the file was found and updated successfully, False otherwise.
     """
     if not found_file:
-        for file_path in config.stories_dir.rglob(f"{story_id}*.md"):
-            if file_path.name.startswith(story_id):
-                found_file = file_path
-                break
+        found_file = find_story_file(story_id)
     
     if not found_file:
         return False
@@ -114,11 +111,7 @@ def run_impact_analysis(
     }
     
     # 1. Find the story file
-    found_file = None
-    for file_path in config.stories_dir.rglob(f"{story_id}*.md"):
-        if file_path.name.startswith(story_id):
-            found_file = file_path
-            break
+    found_file = find_story_file(story_id)
             
     if not found_file:
          result["error"] = f"Story file not found for {story_id}"
@@ -129,13 +122,13 @@ def run_impact_analysis(
 
     # 2. Get Diff
     if base:
-        cmd = ["git", "diff", "--name-only", f"{base}...HEAD"]
-        diff_cmd = ["git", "diff", f"{base}...HEAD", "."]
+        cmd = ["diff", "--name-only", f"{base}...HEAD"]
+        diff_cmd = ["diff", f"{base}...HEAD", "."]
     else:
-        cmd = ["git", "diff", "--cached", "--name-only"]
-        diff_cmd = ["git", "diff", "--cached", "."]
+        cmd = ["diff", "--cached", "--name-only"]
+        diff_cmd = ["diff", "--cached", "."]
         
-    res = subprocess.run(cmd, capture_output=True, text=True)
+    res = git_state.query(*cmd)
     files = res.stdout.strip().splitlines()
     
     if not files or files == ['']:
@@ -152,7 +145,7 @@ def run_impact_analysis(
             if provider:
                 ai_service.set_provider(provider)
                 
-            diff_res = subprocess.run(diff_cmd, capture_output=True, text=True)
+            diff_res = git_state.query(*diff_cmd)
             full_diff = diff_res.stdout
             
             full_diff_scrubbed = scrub_sensitive_data(full_diff)
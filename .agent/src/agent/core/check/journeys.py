@@ -14,9 +14,9 @@
 
 # Licensed under the Apache License, Version 2.0 (the "License");
 
-import subprocess
 import sqlite3
 from agent.core.config import config
+from agent.core.git_state import git_state
 from agent.core.logger import get_logger
 from agent.core.check.models import JourneyCoverageGateResult, JourneyImpactMappingResult
 from agent.core.check.system import ValidateStoryResult
@@ -105,15 +105,8 @@ def run_journey_impact_mapping(base: str | None) -> JourneyImpactMappingResult:
         logger.info("Rebuilt journey index", extra={"index": _idx})
         result["rebuilt_index"] = True
 
-    _pf_cmd = (
-        ["git", "diff", "--name-only", f"origin/{base}...HEAD"]
-        if base
-        else ["git", "diff", "--cached", "--name-only"]
-    )
     try:
-        _pf_res = subprocess.run(_pf_cmd, capture_output=True, text=True)
-        _pf_files = _pf_res.stdout.strip().splitlines()
-        _pf_files = [f for f in _pf_files if f]
+        _pf_files = [f for f in git_state.changed_files(base) if f]
     except Exception as e:
         logger.error("Failed to get git diff", extra={"error": str(e)})
         _pf_files = []
@@ -22,6 +22,7 @@ from datetime import datetime
 from pathlib import Path
 
 from agent.core.config import config
+from agent.core.git_state import git_state
 from agent.core.logger import get_logger
 from agent.core.utils import scrub_sensitive_data
 from opentelemetry import trace
@@ -96,7 +97,8 @@ def _persist_result(result: PreflightResult) -> None:
 def _get_current_diff() -> str:
     """Retrieves the current git diff of the workspace."""
     try:
-        result = subprocess.run(["git", "diff", "HEAD"], capture_output=True, text=True, check=True)
+        result = git_state.query("diff", "HEAD", worktree=True)
+        result.check_returncode()
         return result.stdout
     except subprocess.CalledProcessError:
         return ""
\ No newline at end of file
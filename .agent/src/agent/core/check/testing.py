@@ -14,8 +14,8 @@
 
 # Licensed under the Apache License, Version 2.0 (the "License");
 
-import subprocess
 from pathlib import Path
+from agent.core.git_state import git_state
 from agent.core.logger import get_logger
 from agent.core.check.models import SmartTestSelectionResult
 from opentelemetry import trace
@@ -52,14 +52,8 @@ def run_smart_test_selection(base: str | None, skip_tests: bool, interactive: bo
         return result
 
     # Identify changed files
-    if base:
-        cmd = ["git", "diff", "--name-only", f"origin/{base}...HEAD"]
-    else:
-        cmd = ["git", "diff", "--cached", "--name-only"]
-        
     try:
-        diff_res = subprocess.run(cmd, capture_output=True, text=True)
-        files = [Path(f) for f in diff_res.stdout.strip().splitlines() if f]
+        files = [Path(f) for f in git_state.changed_files(base) if f]
     except Exception as e:
         logger.error("Error finding changed files", extra={"error": str(e)})
         result["error"] = f"Error finding changed files: {e}"
@@ -159,13 +159,10 @@ class Config:
             
         # 3. Git (Gold Standard - verify it has .agent if possible, otherwise accept)
         try:
-            import subprocess
-            root = subprocess.check_output(
-                ["git", "rev-parse", "--show-toplevel"], 
-                stderr=subprocess.DEVNULL
-            ).decode().strip()
+            from agent.core.git_state import git_state
+            root = git_state.repo_root()
             if root:
-                return Path(root).resolve()
+                return root
         except Exception:
             pass
 
@@ -178,15 +175,14 @@ class Config:
     def _load_repo_info(self):
         """Try to load repo info from git config."""
         try:
-            import subprocess
             from urllib.parse import urlparse
-            
+
+            from agent.core.git_state import git_state
+
             # Get remote URL
-            url = subprocess.check_output(
-                ["git", "config", "--get", "remote.origin.url"], 
-                cwd=self.repo_root, 
-                stderr=subprocess.DEVNULL
-            ).decode().strip()
+            res = git_state.query("config", "--get", "remote.origin.url", cwd=self.repo_root)
+            res.check_returncode()
+            url = res.stdout.strip()
             
             if url:
                 # Handle SSH (git@github.com:owner/repo.git) and HTTPS
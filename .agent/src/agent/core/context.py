@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import logging
 import os
 import re as _re
@@ -21,6 +22,7 @@ from typing import Dict, Any
 import yaml
 
 from agent.core.config import config
+from agent.core.context_cache import section_cache
 from agent.core.utils import scrub_sensitive_data
 
 logger = logging.getLogger(__name__)
@@ -44,23 +46,20 @@ class ContextLoader:
         """
         from agent.core.context_source import load_source_tree, load_source_snippets
 
-        source_tree = load_source_tree()
-        source_code = load_source_snippets()
+        # Sections are cached independently (see context_cache); any that are
+        # stale or not built yet are loaded concurrently.
+        loaders = [load_source_tree, load_source_snippets, self._load_agents]
+        if legacy_context:
+            from agent.core.context_docs import load_adrs
+            loaders += [load_adrs, self._load_global_rules, self._load_role_instructions]
+        sections = await asyncio.gather(*(asyncio.to_thread(loader) for loader in loaders))
+        source_tree, source_code, agents = sections[:3]
+        adrs, rules, instructions = sections[3:] if legacy_context else ("", "", "")
         logger.debug(
             "Source context: tree=%d chars, snippets=%d chars",
             len(source_tree), len(source_code),
         )
 
-        if legacy_context:
-            from agent.core.context_docs import load_adrs
-            adrs = load_adrs()
-            rules = self._load_global_rules()
-            instructions = self._load_role_instructions()
-        else:
-            adrs = ""
-            rules = ""
-            instructions = ""
-
         # NotebookLM MCP / Local Vector DB integration
         context_str = ""
         if not legacy_context and story_id and not os.environ.get("AGENT_DISABLE_MCP"):
@@ -76,7 +75,7 @@ class ContextLoader:
 
         return {
             "rules": rules,
-            "agents": self._load_agents(),
+            "agents": agents,
             "instructions": instructions,
             "adrs": adrs,
             "source_tree": source_tree,
@@ -98,6 +97,9 @@ class ContextLoader:
 
     def _load_global_rules(self) -> str:
         """Loads all .mdc files from the rules directory."""
+        return section_cache.get("rules", [self.rules_dir], self._build_global_rules, suffixes=(".mdc",))
+
+    def _build_global_rules(self) -> str:
         context = "GOVERNANCE RULES:\n"
         has_rules = False
         if self.rules_dir.exists():
@@ -113,6 +115,9 @@ class ContextLoader:
 
     def _load_agents(self) -> dict:
         """Loads agent definitions from agents.yaml."""
+        return section_cache.get("agents", [self.agents_path], self._build_agents)
+
+    def _build_agents(self) -> dict:
         if not self.agents_path.exists():
             return {"description": "No agents defined.", "checks": ""}
 
@@ -137,6 +142,11 @@ class ContextLoader:
 
     def _load_role_instructions(self) -> str:
         """Loads detailed instructions for each role found in agents.yaml."""
+        return section_cache.get(
+            "instructions", [self.agents_path, self.instructions_dir], self._build_role_instructions,
+        )
+
+    def _build_role_instructions(self) -> str:
         if not self.agents_path.exists():
             return ""
 
@@ -257,11 +267,11 @@ class ContextLoader:
         impact = "TEST IMPACT MATRIX:\n"
         # Extract files mentioned in the story
         paths = set(_re.findall(r"[\w\.\-/]+\.(?:py|md|yaml|yml|json|txt|sh)", story_content))
+        test_files = self._test_files(tests_dir)
         for p in paths:
             module_path = p.replace("/", ".").replace(".py", "")
-            for test_file in tests_dir.rglob("test_*.py"):
+            for test_file, content in test_files:
                 try:
-                    content = test_file.read_text(errors="ignore")
                     if module_path in content or test_file.name.replace("test_", "") in p:
                         impact += f"\n--- IMPACTED TEST: {test_file.name} ---\n"
                         # extract patch lines
@@ -280,11 +290,11 @@ class ContextLoader:
 
         contracts = "BEHAVIORAL CONTRACTS:\n"
         paths = set(_re.findall(r"[\w\.\-/]+\.(?:py|md|yaml|yml|json|txt|sh)", story_content))
+        test_files = self._test_files(tests_dir)
         for p in paths:
-            for test_file in tests_dir.rglob("test_*.py"):
+            for test_file, content in test_files:
                 if test_file.name.replace("test_", "") in p:
                     try:
-                        content = test_file.read_text(errors="ignore")
                         for line in content.splitlines():
                             if "assert " in line or "=" in line and ("(" in line or "," in line):
                                 contracts += f"{line.strip()}\n"
@@ -292,4 +302,10 @@ class ContextLoader:
                         pass
         return contracts
 
+    @staticmethod
+    def _test_files(tests_dir: Path) -> list:
+        """Cached ``(path, content)`` pairs for ``test_*.py`` files under ``tests_dir``."""
+        from agent.core.context_docs import load_test_files
+        return [(path, content) for path, content in load_test_files(tests_dir) if path.name.startswith("test_")]
+
 context_loader = ContextLoader()
@@ -0,0 +1,140 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+In-process cache for context sections.
+
+Each section (source tree, outlines, ADRs, rules, ...) is cached on its own,
+keyed by a fingerprint of the files it reads: paths, mtimes and sizes from
+a stat-only walk. A section is rebuilt only when its inputs change, so the
+council, runbook, implement and panel flows stop re-reading the tree on
+every ``load_context`` call.
+
+Set ``AGENT_NO_CONTEXT_CACHE=1`` (or pass ``--no-context-cache``) to always
+rebuild.
+"""
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+SKIP_DIRS = frozenset({"__pycache__", ".pytest_cache", "node_modules", ".git"})
+
+
+def cache_enabled() -> bool:
+    """False when ``AGENT_NO_CONTEXT_CACHE`` is set to a truthy value."""
+    return os.environ.get("AGENT_NO_CONTEXT_CACHE", "").lower() not in ("1", "true", "yes")
+
+
+def _walk(root: str, suffixes: Tuple[str, ...], out: List[Tuple[str, int, int]]) -> None:
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    # Directories count too: empty ones still appear in the tree
+                    out.append((entry.path, -1, -1))
+                    _walk(entry.path, suffixes, out)
+            elif not suffixes or entry.name.endswith(suffixes):
+                st = entry.stat()
+                out.append((entry.path, st.st_mtime_ns, st.st_size))
+        except OSError:
+            continue
+
+
+def fingerprint(paths: Iterable[Path], suffixes: Tuple[str, ...] = ()) -> int:
+    """Stat-only fingerprint of files (and directory trees) under ``paths``.
+
+    Only files ending in one of ``suffixes`` count (all files if empty).
+    Missing paths contribute a marker, so creating them changes the result.
+    """
+    items: List[Tuple[str, int, int]] = []
+    for path in paths:
+        path_str = str(path)
+        try:
+            st = os.stat(path_str)
+        except OSError:
+            items.append((path_str, -2, -2))
+            continue
+        if os.path.isdir(path_str):
+            items.append((path_str, -1, -1))
+            _walk(path_str, suffixes, items)
+        else:
+            items.append((path_str, st.st_mtime_ns, st.st_size))
+    return hash(tuple(sorted(items)))
+
+
+class SectionCache:
+    """Thread-safe map of section name -> (key, value)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[Any, Any]] = {}
+
+    def get(
+        self,
+        section: str,
+        paths: Iterable[Path],
+        build: Callable[[], T],
+        suffixes: Tuple[str, ...] = (),
+        extra: Any = None,
+    ) -> T:
+        """Return ``section``, rebuilding it with ``build()`` if its inputs changed.
+
+        Args:
+            paths: Files/directories the section reads.
+            suffixes: Restrict the fingerprint to files with these suffixes.
+            extra: Other inputs (budgets, flags) that belong in the key.
+        """
+        started = time.perf_counter()
+        if not cache_enabled():
+            value = build()
+            self._log(section, "built (cache disabled)", started)
+            return value
+
+        paths = list(paths)
+        key = (tuple(str(p) for p in paths), suffixes, extra, fingerprint(paths, suffixes))
+        with self._lock:
+            cached: Optional[Tuple[Any, Any]] = self._entries.get(section)
+        if cached is not None and cached[0] == key:
+            self._log(section, "cached", started)
+            return cached[1]
+
+        value = build()
+        with self._lock:
+            self._entries[section] = (key, value)
+        self._log(section, "built", started)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _log(section: str, outcome: str, started: float) -> None:
+        logger.debug("Context section %s %s in %.1f ms", section, outcome, (time.perf_counter() - started) * 1000)
+
+
+section_cache = SectionCache()
@@ -21,8 +21,11 @@ and extracting behavioral contracts from tests to feed into the AI context.
 
 import logging
 import re as _re
+from pathlib import Path
+from typing import List, Tuple
 
 from agent.core.config import config
+from agent.core.context_cache import section_cache
 from agent.core.utils import scrub_sensitive_data
 
 logger = logging.getLogger(__name__)
@@ -34,6 +37,29 @@ def load_adrs() -> str:
     Each ADR is summarized as: Title + State + Decision (first paragraph only).
     This keeps the token budget lean while giving AI full architectural context.
     """
+    adrs_dir = config.agent_dir / "adrs"
+    return section_cache.get("adrs", [adrs_dir], lambda: _build_adrs(adrs_dir), suffixes=(".md",))
+
+
+def load_test_files(tests_dir: Path) -> List[Tuple[Path, str]]:
+    """``(path, content)`` for every ``*.py`` under ``tests_dir``, sorted by path.
+
+    Read once and reused until a test file changes, so impact and contract
+    lookups scan memory rather than the disk for every referenced path.
+    """
+    def build() -> List[Tuple[Path, str]]:
+        files = []
+        for test_file in sorted(tests_dir.rglob("*.py")):
+            try:
+                files.append((test_file, test_file.read_text(errors="ignore")))
+            except OSError:
+                continue
+        return files
+
+    return section_cache.get("test_files", [tests_dir], build, suffixes=(".py",))
+
+
+def _build_adrs(adrs_dir: Path) -> str:
     import re
 
     context = "ARCHITECTURAL DECISION RECORDS (ADRs):\n"
@@ -42,7 +68,6 @@ def load_adrs() -> str:
     context += "Code that follows an ADR is COMPLIANT and must NOT be flagged as a required change or cause a BLOCK. "
     context += "If a conflict exists, note it as an informational finding only.\n\n"
     has_adrs = False
-    adrs_dir = config.agent_dir / "adrs"
 
     if adrs_dir.exists():
         for adr_file in sorted(adrs_dir.glob("*.md")):
@@ -119,9 +144,8 @@ def load_test_impact(story_content: str) -> str:
     test_count = 0
     patch_pattern = _re.compile(r'patch\(["\']([^"\']+)["\']\)')
 
-    for test_file in sorted(tests_dir.rglob("*.py")):
+    for test_file, content in load_test_files(tests_dir):
         try:
-            content = test_file.read_text(errors="ignore")
             patches = patch_pattern.findall(content)
             
             relevant_patches = []
@@ -168,13 +192,12 @@ def load_behavioral_contracts(story_content: str) -> str:
     assert_pattern = _re.compile(r'(assert\w*\s*.*?(?:default|fallback|timeout|temperature|auto_)\s*[=!<>]+\s*[^\n,)]+)')
     param_pattern = _re.compile(r'(\w+\([^)]*(?:default|fallback|auto_)\w*\s*=\s*[^,)]+)')
 
-    for test_file in sorted(tests_dir.rglob("*.py")):
+    for test_file, content in load_test_files(tests_dir):
         # Only check tests that might be related to the stems
         if not any(stem in test_file.name for stem in stems):
             continue
             
         try:
-            content = test_file.read_text(errors="ignore")
             found = []
             found.extend(assert_pattern.findall(content))
             found.extend(param_pattern.findall(content))
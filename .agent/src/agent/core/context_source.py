@@ -22,8 +22,10 @@ snippets (like imports and signatures) to give the AI context about the codebase
 import logging
 import os
 import re as _re
+from pathlib import Path
 
 from agent.core.config import config
+from agent.core.context_cache import section_cache
 from agent.core.utils import scrub_sensitive_data
 
 logger = logging.getLogger(__name__)
@@ -37,7 +39,14 @@ def load_source_tree() -> str:
     src_dir = config.agent_dir / "src"
     if not src_dir.exists() or not src_dir.is_dir():
         return ""
+    # Rebuilt only when files under src/ change (see context_cache)
+    return section_cache.get(
+        "source_tree", [src_dir], lambda: _build_source_tree(src_dir),
+        extra=str(config.repo_root),
+    )
+
 
+def _build_source_tree(src_dir: Path) -> str:
     exclude_dirs = {"__pycache__", ".pytest_cache", "node_modules", ".git"}
     exclude_exts = {".pyc", ".pyo"}
     exclude_files = {".env", ".env.local", ".env.production"}
@@ -151,7 +160,13 @@ def load_source_snippets(budget: int = 0) -> str:
         budget = int(
             os.environ.get("AGENT_SOURCE_CONTEXT_CHAR_LIMIT", "16000")
         )
+    return section_cache.get(
+        "source_snippets", [src_dir], lambda: _build_source_snippets(src_dir, budget),
+        suffixes=(".py",), extra=(budget, str(config.repo_root)),
+    )
+
 
+def _build_source_snippets(src_dir: Path, budget: int) -> str:
     exclude_dirs = {"__pycache__", ".pytest_cache"}
     # Match class/def/async def signatures, including indented and decorated
     sig_pattern = _re.compile(
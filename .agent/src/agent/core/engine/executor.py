@@ -13,14 +13,17 @@
 # limitations under the License.
 
 import asyncio
+import contextlib
 import json
 import logging
+import time
 from typing import Any, AsyncGenerator, Dict, List, Optional
 
 from opentelemetry import metrics, trace
 
 from agent.core.ai.service import AIService
 from agent.core.engine.parser import BaseParser, ReActJsonParser
+from agent.core.engine.streaming import ReActStreamScanner, stream_chunks
 from agent.core.engine.typedefs import AgentAction, AgentFinish, AgentStep
 from agent.core.mcp.client import MCPClient, Tool
 from agent.core.security import scrub_sensitive_data
@@ -47,6 +50,11 @@ class ThoughtEvent(TypedDict):
     type: Literal["thought"]
     content: str
 
+class ThoughtDeltaEvent(TypedDict):
+    """Fragment of a Thought as it streams in, before the step is parsed."""
+    type: Literal["thought_delta"]
+    content: str
+
 class ToolCallEvent(TypedDict):
     type: Literal["tool_call"]
     tool: str
@@ -66,7 +74,7 @@ class ErrorEvent(TypedDict):
     type: Literal["error"]
     content: str
 
-AgentEvent = Union[ThoughtEvent, ToolCallEvent, ToolResultEvent, FinalAnswerEvent, ErrorEvent]
+AgentEvent = Union[ThoughtEvent, ThoughtDeltaEvent, ToolCallEvent, ToolResultEvent, FinalAnswerEvent, ErrorEvent]
 
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
@@ -98,6 +106,11 @@ class AgentExecutor:
     and MCPClient for tool execution. The loop continues indefinitely until the
     agent determines it has a final answer. It orchestrates safety guardrails 
     to prevent infinite execution and redundant tool calls.
+
+    With ``stream`` enabled, each step reads ``stream_complete`` and emits
+    ``thought_delta`` events as the Thought arrives; the step is parsed as soon
+    as the Action block closes. Failed or empty streams fall back to
+    ``complete``.
     """
     guardrail: Optional["ExecutionGuardrail"]
 
@@ -111,6 +124,7 @@ class AgentExecutor:
         allowed_tools: Optional[List[str]] = None,
         model: Optional[str] = None,
         max_steps: int = 100,
+        stream: bool = True,
     ):
         self.llm = llm
         self.mcp = mcp_client
@@ -120,6 +134,7 @@ class AgentExecutor:
         self.model = model
         self.max_steps = max_steps
         self.allowed_tools = allowed_tools
+        self.stream = stream
         
         self.guardrail = ExecutionGuardrail(
             max_iterations=max_steps, 
@@ -134,6 +149,8 @@ class AgentExecutor:
         """
         with tracer.start_as_current_span("agent.run") as run_span:
             run_span.set_attribute("user_prompt", scrub_sensitive_data(user_prompt))
+            run_started = time.perf_counter()
+            first_tool_call_ms: Optional[float] = None
             steps_taken = 0
             history: List[AgentStep] = []
             
@@ -173,16 +190,56 @@ class AgentExecutor:
                 # 1. THINK
                 with tracer.start_as_current_span("agent.think") as think_span:
                     logger.info(f"Agent Step {steps_taken}: Thinking...")
+                    step_started = time.perf_counter()
+                    llm_response = ""
+                    if self.stream:
+                        scanner = ReActStreamScanner()
+                        try:
+                            # aclosing: stopping early signals the pump immediately rather
+                            # than at garbage collection, so the provider stream closes at
+                            # its next chunk and records usage, breaker and route stats
+                            async with contextlib.aclosing(stream_chunks(lambda: self.llm.stream_complete(
+                                system_prompt=full_system_prompt,
+                                user_prompt=conversation_context,
+                                model=self.model,
+                                stop_sequences=["\nObservation:"],
+                                auto_fallback=True,
+                            ))) as chunks:
+                                async for chunk in chunks:
+                                    if not scanner.text:
+                                        ttft_ms = (time.perf_counter() - step_started) * 1000
+                                        think_span.set_attribute("agent.time_to_first_token_ms", ttft_ms)
+                                        if steps_taken == 1:
+                                            run_span.set_attribute("agent.time_to_first_token_ms", ttft_ms)
+                                    delta = scanner.feed(chunk)
+                                    if delta:
+                                        yield {"type": "thought_delta", "content": delta}
+                                    if scanner.closed:
+                                        # Dispatch now; the rest would be a hallucinated Observation
+                                        think_span.set_attribute("agent.stream.stopped_early", True)
+                                        break
+                                else:
+                                    delta = scanner.flush()
+                                    if delta:
+                                        yield {"type": "thought_delta", "content": delta}
+                            llm_response = scanner.text
+                        except Exception as e:
+                            logger.warning(f"Streaming completion failed, retrying without streaming: {e}")
+                            llm_response = ""
                     try:
-                        llm_response = await asyncio.to_thread(
-                            self.llm.complete,
-                            system_prompt=full_system_prompt,
-                            user_prompt=conversation_context,
-                            model=self.model,
-                            stop_sequences=["\nObservation:"],
-                            auto_fallback=True
-                        )
+                        if not llm_response.strip():
+                            llm_response = await asyncio.to_thread(
+                                self.llm.complete,
+                                system_prompt=full_system_prompt,
+                                user_prompt=conversation_context,
+                                model=self.model,
+                                stop_sequences=["\nObservation:"],
+                                auto_fallback=True
+                            )
                         think_span.set_attribute("llm_response", llm_response)
+                        think_span.set_attribute(
+                            "agent.think_ms", (time.perf_counter() - step_started) * 1000
+                        )
                     except Exception as e:
                         logger.error(f"LLM Error: {e}")
                         agent_errors_counter.add(1, {"error.type": "llm"})
@@ -354,6 +411,9 @@ class AgentExecutor:
                     }
 
                     # 3. ACT
+                    if first_tool_call_ms is None:
+                        first_tool_call_ms = (time.perf_counter() - run_started) * 1000
+                        run_span.set_attribute("agent.time_to_first_tool_call_ms", first_tool_call_ms)
                     with tracer.start_as_current_span("agent.act") as act_span:
                         act_span.set_attribute("tool", action.tool)
                         act_span.set_attribute("tool_input", scrub_sensitive_data(str(action.tool_input)))
@@ -0,0 +1,238 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Token streaming for the ReAct loop.
+
+:func:`stream_chunks` bridges a provider's blocking chunk generator onto the
+event loop. :class:`ReActStreamScanner` watches the text as it arrives so
+the executor can surface the Thought while it is still being written and
+stop reading once the Action block is complete.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import AsyncIterator, Callable, Iterator, List, Optional
+
+from agent.core.engine.parser import ReActJsonParser
+
+logger = logging.getLogger(__name__)
+
+ACTION_MARKER = "Action:"
+INPUT_MARKER = "Action Input:"
+THOUGHT_PREFIX = "thought:"
+
+_DONE = object()
+
+
+async def stream_chunks(produce: Callable[[], Iterator[str]]) -> AsyncIterator[str]:
+    """Yield chunks from the blocking iterator returned by ``produce()``.
+
+    The iterator is drained on a daemon thread. Leaving the ``async for``
+    early closes the provider stream at its next chunk, so abandoning a
+    completion never blocks the loop. Errors raised by the provider are
+    re-raised here.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    stop = threading.Event()
+
+    def put(item: object) -> None:
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:
+            stop.set()  # loop already closed; nobody is listening
+
+    def pump() -> None:
+        chunks = None
+        try:
+            chunks = produce()
+            for chunk in chunks:
+                if stop.is_set():
+                    break
+                if chunk:
+                    put(chunk)
+        except BaseException as e:  # surfaced to the consumer
+            put(e)
+        finally:
+            close = getattr(chunks, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception as e:
+                    logger.debug(f"Closing provider stream failed: {e}")
+            put(_DONE)
+
+    threading.Thread(target=pump, name="agent-stream", daemon=True).start()
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+
+class ReActStreamScanner:
+    """Incremental scanner for streamed ReAct output.
+
+    Feed chunks with :meth:`feed`; each call returns the Thought text that
+    became safe to show. :attr:`closed` turns true once the first complete
+    Action block has arrived, either a JSON object (``Action: {...}``) or
+    the classic ``Action: tool`` / ``Action Input: ...`` pair; :attr:`text`
+    then ends with that block. Anything the model writes after it is
+    hallucinated Observation text, so the caller can stop reading and
+    dispatch the tool straight away.
+    """
+
+    def __init__(self) -> None:
+        self._parts: List[str] = []
+        self._text = ""
+        self._thought_sent = 0
+        self._action_at = -1  # first Action marker; the Thought ends here
+        self._body_at = -1  # start of the action body being scanned
+        self._mode: Optional[str] = None  # "json", "input" or "line"
+        self._pos = 0
+        self._depth = 0
+        self._quote: Optional[str] = None
+        self._escape = False
+        self.closed = False
+
+    @property
+    def text(self) -> str:
+        """Everything received so far."""
+        if self._parts:
+            self._text += "".join(self._parts)
+            self._parts = []
+        return self._text
+
+    def feed(self, chunk: str) -> str:
+        """Consume ``chunk`` and return newly visible Thought text."""
+        if self.closed or not chunk:
+            return ""
+        self._parts.append(chunk)
+        text = self.text
+        if self._body_at < 0:
+            self._find_action(text, len(text) - len(chunk))
+        delta = self._thought_delta(text)
+        if self._body_at >= 0:
+            self._scan_action(text)
+        return delta
+
+    def flush(self) -> str:
+        """Return Thought text held back while waiting for more input.
+
+        Call once the stream has ended without an Action block.
+        """
+        if self._action_at >= 0:
+            return ""
+        self._action_at = len(self.text)
+        return self._thought_delta(self.text)
+
+    def _find_action(self, text: str, new_from: int) -> None:
+        start = max(self._pos, new_from - len(ACTION_MARKER))
+        idx = text.find(ACTION_MARKER, start)
+        while idx >= 0 and text.startswith(INPUT_MARKER, idx):
+            idx = text.find(ACTION_MARKER, idx + 1)
+        if idx < 0:
+            return
+        if self._action_at < 0:
+            self._action_at = idx
+        self._body_at = self._pos = idx + len(ACTION_MARKER)
+        self._mode = None
+
+    def _thought_delta(self, text: str) -> str:
+        if self._action_at >= 0:
+            end = self._action_at
+        else:
+            # Hold back a tail that could be the start of a split marker
+            end = max(0, len(text) - len(ACTION_MARKER) + 1)
+        thought = text[:end].lstrip()
+        head = thought[:len(THOUGHT_PREFIX)].lower()
+        if end < len(text) and len(thought) < len(THOUGHT_PREFIX) and THOUGHT_PREFIX.startswith(head):
+            return ""  # may still become "Thought:"
+        if head == THOUGHT_PREFIX:
+            thought = thought[len(THOUGHT_PREFIX):].lstrip()
+        thought = thought.rstrip()
+        delta = thought[self._thought_sent:]
+        self._thought_sent = max(self._thought_sent, len(thought))
+        return delta
+
+    def _scan_action(self, text: str) -> None:
+        if self._mode is None:
+            body = text[self._pos:].lstrip()
+            if not body:
+                return
+            self._mode = "json" if body[0] in "{`" else "line"
+        if self._mode == "line":
+            self._scan_line(text)
+        else:
+            self._scan_json(text)
+
+    def _scan_json(self, text: str) -> None:
+        for i in range(self._pos, len(text)):
+            ch = text[i]
+            if self._escape:
+                self._escape = False
+            elif self._quote:
+                if ch == "\\":
+                    self._escape = True
+                elif ch == self._quote:
+                    self._quote = None
+            elif ch in ('"', "'") and self._depth:
+                self._quote = ch
+            elif ch == "{":
+                self._depth += 1
+            elif ch == "}" and self._depth:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._pos = i + 1
+                    self._close_json(text)
+                    return
+        self._pos = len(text)
+
+    def _close_json(self, text: str) -> None:
+        if self._mode == "input":
+            self._close(self._pos)
+            return
+        data = ReActJsonParser._extract_json(text, self._body_at)
+        if isinstance(data, dict) and "tool" in data:
+            self._close(self._pos)
+            return
+        # Not an action object; keep reading for a later Action marker
+        self._body_at = -1
+        self._find_action(text, self._pos)
+        if self._body_at >= 0:
+            self._scan_action(text)
+
+    def _scan_line(self, text: str) -> None:
+        idx = text.find(INPUT_MARKER, self._body_at)
+        if idx < 0:
+            return
+        value_at = idx + len(INPUT_MARKER)
+        value = text[value_at:].lstrip()
+        if value.startswith("{"):
+            self._mode = "input"
+            self._pos = value_at
+            self._scan_json(text)
+        elif "\n" in value:
+            self._close(text.index("\n", len(text) - len(value)) + 1)
+
+    def _close(self, end: int) -> None:
+        # Drop whatever followed the action block
+        self._text = self.text[:end]
+        self.closed = True
@@ -0,0 +1,267 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Process-wide, memoized view of git state.
+
+A single preflight asks git the same questions many times: the staged
+file list, the staged diff, ``HEAD``. :data:`git_state` answers repeat
+queries from memory as long as the repository has not changed, so each
+command spawns a handful of git processes instead of dozens.
+
+Read-only queries are keyed by a fingerprint built without spawning git:
+
+- the index (mtime, size, inode) and ``HEAD`` (its content and the ref it
+  points at), plus ``packed-refs``, ``config``, ``FETCH_HEAD`` and the
+  ``origin`` remote refs;
+- for queries that read the working tree (``worktree=True``), also the
+  stat of every tracked file listed in the index.
+
+When no fingerprint can be taken (not a repository, unreadable index) the
+query always runs. Every spawn is counted per agent command and git
+subcommand (``spawn_counts()`` and the ``git_spawns_total`` metric).
+"""
+
+import struct
+import subprocess
+import sys
+import threading
+from collections import Counter as _Tally
+from pathlib import Path
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from prometheus_client import Counter
+
+git_spawns_total = Counter(
+    "git_spawns_total",
+    "git subprocesses started by the agent",
+    ["command", "subcommand"],
+)
+
+_ENTRY_FIXED = 62  # stat fields, object id and flags of an index entry
+
+
+def _stat_key(path: Path) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def find_git_dirs(start: Path) -> Optional[Tuple[Path, Path]]:
+    """Locate ``(git_dir, common_dir)`` for ``start`` without running git.
+
+    Linked worktrees keep their own index and ``HEAD`` in ``git_dir`` while
+    refs live in ``common_dir``.
+    """
+    for parent in (start, *start.parents):
+        dot_git = parent / ".git"
+        if dot_git.is_dir():
+            return dot_git, dot_git
+        if dot_git.is_file():
+            try:
+                text = dot_git.read_text().strip()
+            except OSError:
+                return None
+            if not text.startswith("gitdir:"):
+                return None
+            git_dir = (parent / text[len("gitdir:"):].strip()).resolve()
+            common = git_dir
+            try:
+                common = (git_dir / (git_dir / "commondir").read_text().strip()).resolve()
+            except OSError:
+                pass
+            return git_dir, common
+    return None
+
+
+def index_paths(index_file: Path) -> Optional[List[str]]:
+    """Tracked paths from a version 2/3 index; ``None`` if it cannot be read."""
+    try:
+        data = index_file.read_bytes()
+    except OSError:
+        return None
+    if len(data) < 12 or data[:4] != b"DIRC":
+        return None
+    version, count = struct.unpack(">II", data[4:12])
+    if version not in (2, 3):
+        return None  # v4 prefix-compresses paths
+    paths, pos = [], 12
+    for _ in range(count):
+        flags = struct.unpack(">H", data[pos + 60:pos + 62])[0]
+        start = pos + _ENTRY_FIXED + (2 if version == 3 and flags & 0x4000 else 0)
+        end = data.find(b"\0", start)
+        if end < 0:
+            return None
+        paths.append(data[start:end].decode("utf-8", "surrogateescape"))
+        # Entries are NUL-padded to a multiple of eight bytes
+        pos += (end - pos + 8) & ~7
+    return paths
+
+
+class GitState:
+    """Shared cache of read-only git queries, invalidated by repository changes."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._results: Dict[Hashable, subprocess.CompletedProcess] = {}
+        self._tracked: Dict[Hashable, List[str]] = {}
+        self._spawns: _Tally = _Tally()
+
+    def reset(self) -> None:
+        """Forget cached results and spawn counts."""
+        with self._lock:
+            self._results.clear()
+            self._tracked.clear()
+            self._spawns.clear()
+
+    # -- spawning -----------------------------------------------------------
+
+    def run(self, *args: str, cwd=None, **kwargs) -> subprocess.CompletedProcess:
+        """Run ``git *args`` uncached (for writes and one-off commands), counting the spawn.
+
+        ``kwargs`` go to :func:`subprocess.run`; output is captured as text
+        unless the caller says otherwise.
+        """
+        kwargs.setdefault("capture_output", True)
+        kwargs.setdefault("text", True)
+        if cwd is not None:
+            kwargs["cwd"] = str(cwd)
+        self._count(args)
+        return subprocess.run(["git", *args], **kwargs)
+
+    def _count(self, args: Tuple[str, ...]) -> None:
+        # Config resolves the repo root while agent.core.ai is still importing;
+        # spawns before the usage module loads carry no command label.
+        usage = sys.modules.get("agent.core.ai.usage")
+        command = usage.current_labels().get("command", "") if usage else ""
+        subcommand = next((a for a in args if not a.startswith("-")), "")
+        with self._lock:
+            self._spawns[(command, subcommand)] += 1
+        git_spawns_total.labels(command=command, subcommand=subcommand).inc()
+
+    def spawn_counts(self) -> Dict[Tuple[str, str], int]:
+        """Spawns so far, keyed by ``(agent command, git subcommand)``."""
+        with self._lock:
+            return dict(self._spawns)
+
+    def total_spawns(self, command: Optional[str] = None) -> int:
+        """Spawns so far, optionally only those made by ``command``."""
+        return sum(n for (cmd, _), n in self.spawn_counts().items() if command in (None, cmd))
+
+    # -- fingerprints -------------------------------------------------------
+
+    def fingerprint(self, cwd=None, worktree: bool = False) -> Optional[Hashable]:
+        """State that a query's answer depends on, or ``None`` if unknown."""
+        base = Path(cwd).resolve() if cwd is not None else Path.cwd()
+        dirs = find_git_dirs(base)
+        if dirs is None:
+            return None
+        git_dir, common = dirs
+        index = _stat_key(git_dir / "index")
+        try:
+            head = (git_dir / "HEAD").read_text().strip()
+        except OSError:
+            return None
+        head_ref = None
+        if head.startswith("ref:"):
+            head_ref = _stat_key(common / head[4:].strip())
+        state = (
+            str(base), index, head, head_ref,
+            _stat_key(common / "packed-refs"),
+            _stat_key(common / "config"),
+            _stat_key(git_dir / "FETCH_HEAD"),
+            _stat_key(common / "refs" / "remotes" / "origin"),
+        )
+        if not worktree:
+            return state
+        top = git_dir.parent if git_dir == common else self._toplevel(git_dir)
+        if top is None:
+            return None
+        paths = self._tracked_paths(git_dir / "index", index)
+        if paths is None:
+            return None
+        return state + (hash(tuple(_stat_key(top / p) for p in paths)),)
+
+    @staticmethod
+    def _toplevel(git_dir: Path) -> Optional[Path]:
+        # Linked worktrees record their checkout in <git_dir>/gitdir
+        try:
+            return Path((git_dir / "gitdir").read_text().strip()).parent
+        except OSError:
+            return None
+
+    def _tracked_paths(self, index_file: Path, index_key) -> Optional[List[str]]:
+        key = (str(index_file), index_key)
+        with self._lock:
+            if key in self._tracked:
+                return self._tracked[key]
+        paths = index_paths(index_file)
+        if paths is not None:
+            with self._lock:
+                self._tracked[key] = paths
+        return paths
+
+    # -- queries ------------------------------------------------------------
+
+    def query(self, *args: str, cwd=None, worktree: bool = False, **kwargs) -> subprocess.CompletedProcess:
+        """Run a read-only ``git *args``, reusing the last answer if nothing changed.
+
+        Args:
+            worktree: The answer depends on unstaged file contents
+                (e.g. ``git diff`` without ``--cached``).
+            kwargs: Passed to :meth:`run` on a cache miss (e.g. ``timeout``).
+
+        Failed runs (non-zero exit, e.g. ``index.lock`` contention) are not
+        cached; the next call asks git again.
+        """
+        fp = self.fingerprint(cwd, worktree=worktree)
+        key = (args, fp) if fp is not None else None
+        if key is not None:
+            with self._lock:
+                if key in self._results:
+                    return self._results[key]
+        result = self.run(*args, cwd=cwd, **kwargs)
+        if key is not None and result.returncode == 0:
+            with self._lock:
+                self._results[key] = result
+        return result
+
+    def _stdout(self, *args: str, cwd=None, worktree: bool = False) -> str:
+        return (self.query(*args, cwd=cwd, worktree=worktree).stdout or "").strip()
+
+    def repo_root(self, cwd=None) -> Optional[Path]:
+        """Top level of the working tree, or ``None`` outside a repository."""
+        root = self._stdout("rev-parse", "--show-toplevel", cwd=cwd)
+        return Path(root).resolve() if root else None
+
+    def head(self, cwd=None) -> str:
+        """``HEAD`` commit SHA."""
+        return self._stdout("rev-parse", "HEAD", cwd=cwd)
+
+    def branch(self, cwd=None) -> str:
+        """Current branch name (empty when detached)."""
+        return self._stdout("branch", "--show-current", cwd=cwd)
+
+    def changed_files(self, base: Optional[str] = None, cwd=None) -> List[str]:
+        """Staged paths, or paths changed on ``HEAD`` since ``origin/<base>``."""
+        args = ("diff", "--name-only", f"origin/{base}...HEAD") if base else ("diff", "--cached", "--name-only")
+        return self._stdout(*args, cwd=cwd).splitlines()
+
+    def unstaged_files(self, cwd=None) -> List[str]:
+        """Tracked paths with unstaged modifications."""
+        return self._stdout("diff", "--name-only", cwd=cwd, worktree=True).splitlines()
+
+
+git_state = GitState()
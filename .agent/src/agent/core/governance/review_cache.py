@@ -0,0 +1,206 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Per-file, per-role cache of governance review verdicts.
+
+A preflight retry after a one-file autoheal fix, or a second ``agent
+preflight`` on an unchanged tree, used to re-send the whole diff to every
+role. Verdicts are now cached per (role, file, file-diff hash, review
+context hash), where the context covers the story, rules, ADRs and
+instructions. Only role/file pairs whose inputs changed are reviewed
+again, and cached verdicts are merged in for the rest.
+
+A role's batch is cached only when every cited finding can be attributed to
+a reviewed file. Batches with findings that cite only an ADR, failed
+reviews, and replies with no explicit ``VERDICT:`` line (empty or truncated
+output parses as PASS) are re-run next time rather than guessed at.
+
+Entries live in ``.agent/cache/review_cache.json``. Set
+``AGENT_NO_REVIEW_CACHE=1`` (or pass ``agent preflight --no-review-cache``)
+to review everything again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MAX_ENTRIES = 5000
+# Bump when the review prompt or parsing changes in a way that invalidates verdicts
+CACHE_VERSION = 2
+
+_CITATION = re.compile(r"\(Source:\s*[^)]+\)|\[Source:\s*[^\]]+\]", re.IGNORECASE)
+_PATH_TOKEN = re.compile(r"[\w./-]+\.\w+")
+_VERDICT = re.compile(r"^VERDICT:\s*(PASS|BLOCK)\b", re.MULTILINE | re.IGNORECASE)
+
+
+def review_cache_enabled() -> bool:
+    """False when ``AGENT_NO_REVIEW_CACHE`` is set to a truthy value."""
+    return os.environ.get("AGENT_NO_REVIEW_CACHE", "").lower() not in ("1", "true", "yes")
+
+
+def has_verdict(review: Optional[str]) -> bool:
+    """True when ``review`` states an explicit ``VERDICT: PASS|BLOCK`` line."""
+    return bool(review and _VERDICT.search(review))
+
+
+def _digest(*parts: str) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode("utf-8", "replace"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def split_diff_by_file(diff: str) -> Dict[str, str]:
+    """Map each file in a unified git diff to its own section.
+
+    Text before the first ``diff --git`` header (or a diff without headers)
+    is kept under the ``""`` key so nothing is dropped.
+    """
+    sections: Dict[str, str] = {}
+    path, lines = "", []
+    for line in diff.splitlines(keepends=True):
+        if line.startswith("diff --git "):
+            if lines:
+                sections[path] = sections.get(path, "") + "".join(lines)
+            # "diff --git a/<old> b/<new>": the new path names the file
+            path = line.rstrip("\n").rsplit(" b/", 1)[-1]
+            lines = [line]
+        else:
+            lines.append(line)
+    if lines:
+        sections[path] = sections.get(path, "") + "".join(lines)
+    return sections
+
+
+def context_digest(mode: str, thorough: bool, *context: str) -> str:
+    """Hash of everything besides the diff that shapes a role's verdict."""
+    return _digest(str(CACHE_VERSION), mode, str(thorough), *context)
+
+
+def review_key(role_name: str, focus: str, path: str, file_diff: str, context: str) -> str:
+    return _digest(role_name, focus, path, _digest(file_diff), context)
+
+
+def _files_cited(text: str, paths: List[str]) -> List[str]:
+    hits = [p for p in paths if p and p in text]
+    if hits:
+        return hits
+    for token in _PATH_TOKEN.findall(text):
+        token = token[2:] if token.startswith("./") else token
+        matches = [p for p in paths if p == token or p.endswith("/" + token)]
+        if len(matches) == 1 and matches[0] not in hits:
+            hits.append(matches[0])
+    return hits
+
+
+def attribute_review(
+    verdict: str,
+    summary: str,
+    findings: List[str],
+    required_changes: List[str],
+    references: List[str],
+    paths: List[str],
+) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Split one role's batch review into per-file cache entries.
+
+    Uncited items are dropped: the source validator filters them anyway.
+    Returns None when the batch cannot be cached safely, because a cited
+    item names none of ``paths`` or a BLOCK has nothing to pin it to.
+    """
+    entries = {
+        p: {"verdict": "PASS", "summary": summary, "findings": [], "required_changes": [],
+            "references": list(references)}
+        for p in paths
+    }
+    attributed = False
+    for field, items in (("findings", findings), ("required_changes", required_changes)):
+        for item in items:
+            if not _CITATION.search(item):
+                continue
+            cited = _files_cited(item, paths)
+            if not cited:
+                return None
+            attributed = True
+            for p in cited:
+                entries[p][field].append(item)
+                if verdict == "BLOCK":
+                    entries[p]["verdict"] = "BLOCK"
+    if verdict == "BLOCK" and not attributed:
+        return None
+    return entries
+
+
+def merge_entries(entries: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine cached per-file entries into one role result (order-preserving)."""
+    merged: Dict[str, Any] = {"verdict": "PASS", "summary": "", "findings": [],
+                              "required_changes": [], "references": []}
+    for entry in entries:
+        if entry.get("verdict") == "BLOCK":
+            merged["verdict"] = "BLOCK"
+        merged["summary"] = merged["summary"] or entry.get("summary", "")
+        for field in ("findings", "required_changes", "references"):
+            merged[field].extend(i for i in entry.get(field, []) if i not in merged[field])
+    return merged
+
+
+class ReviewCache:
+    """JSON-backed store of per-file review entries, pruned to ``MAX_ENTRIES``."""
+
+    def __init__(self, path: Optional[Path] = None):
+        if path is None:
+            from agent.core.config import config
+            path = config.cache_dir / "review_cache.json"
+        self.path = Path(path)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            data = {}
+        if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+            entries = data.get("entries")
+            if isinstance(entries, dict):
+                self._entries = entries
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        return entry if isinstance(entry, dict) else None
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        self._entries[key] = dict(entry, ts=time.time())
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write pending entries (best effort; a failed write only costs a re-review)."""
+        if not self._dirty:
+            return
+        if len(self._entries) > MAX_ENTRIES:
+            newest = sorted(self._entries.items(), key=lambda kv: kv[1].get("ts", 0), reverse=True)
+            self._entries = dict(newest[:MAX_ENTRIES])
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"version": CACHE_VERSION, "entries": self._entries}))
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning("Could not save review cache: %s", e)
@@ -12,17 +12,55 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""Graph builder for project artifacts visualization."""
+"""Graph builder for project artifacts visualization.
 
+Nodes and typed edges live in hashed adjacency maps, so inserting or
+removing an edge and neighbourhood/impact queries cost O(degree) rather
+than a scan of every edge. The graph follows the artifact catalog's change
+feed (:meth:`ArtifactCatalog.changes`) and persists its inputs to
+``.agent/cache/project_graph.json``; later builds, in-process or not, only
+re-apply the artifacts that changed since.
+"""
+
+import json
 import logging
 import os
 import re
+import threading
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from agent.db.artifact_catalog import CatalogEntry, get_catalog
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+SNAPSHOT_NAME = "project_graph.json"
+SNAPSHOT_VERSION = 1
+
+# Edge types
+CONTAINS = "contains"      # plan -> story it lists / story naming its parent plan
+IMPLEMENTS = "implements"  # runbook -> story (same ID)
+CODE = "code"              # runbook -> file it touches
+JOURNEY = "journey"        # story -> journey covering it
+ADR = "adr"                # artifact -> ADR it references
+
+# When a story and its runbook share an ID, the earlier kind names the node
+KIND_PRIORITY = {"plan": 0, "story": 1, "runbook": 2, "journey": 3, "adr": 4}
+NODE_ORDER = {"plan": 0, "story": 1, "runbook": 2, "journey": 3, "adr": 4, "code": 5}
+
+# (referencing type, referenced type) -> (edge type, True if the edge points back at the referrer)
+_REF_EDGES = {
+    ("plan", "story"): (CONTAINS, False),
+    ("story", "plan"): (CONTAINS, True),
+    ("story", "journey"): (JOURNEY, False),
+    ("journey", "story"): (JOURNEY, True),
+}
+
+_EXTENSION_RE = re.compile(r'\.[a-zA-Z0-9]+$')
+_NODE_ID_RE = re.compile(r'[^a-zA-Z0-9_]')
+
 
 class ProjectGraph:
     """Builds a graph representation of project artifacts."""
@@ -30,12 +68,36 @@ class ProjectGraph:
     def __init__(self, root_path: str):
         self.root_path = Path(root_path).resolve()
         self.nodes: Dict[str, Dict[str, Any]] = {}
-        self.edges: List[Dict[str, str]] = []
-        
+        # Adjacency: node -> {neighbour: edge type}
+        self._out: Dict[str, Dict[str, str]] = {}
+        self._in: Dict[str, Dict[str, str]] = {}
+        self._by_type: Dict[str, Set[Tuple[str, str]]] = {}
+        # Catalog-derived inputs (what the snapshot stores): node id -> {path: claim}
+        self._claims: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._path_ids: Dict[str, str] = {}
+        self._node_refs: Dict[str, Set[str]] = {}
+        self._referrers: Dict[str, Set[str]] = {}
+        self._cursors: Dict[str, str] = {}
+        self._lock = threading.RLock()
+
         # Define artifact directories based on project structure
         self.plans_dir = self.root_path / ".agent" / "cache" / "plans"
         self.stories_dir = self.root_path / ".agent" / "cache" / "stories"
         self.runbooks_dir = self.root_path / ".agent" / "cache" / "runbooks"
+        self.journeys_dir = self.root_path / ".agent" / "cache" / "journeys"
+        self.adrs_dir = self.root_path / ".agent" / "adrs"
+        self.snapshot_path = self.root_path / ".agent" / "cache" / SNAPSHOT_NAME
+
+    # -- edges -------------------------------------------------------------
+
+    @property
+    def edges(self) -> List[Dict[str, str]]:
+        """All edges as ``{"source", "target", "type"}`` dicts, sorted."""
+        return [
+            {"source": source, "target": target, "type": edge_type}
+            for source in sorted(self._out)
+            for target, edge_type in sorted(self._out[source].items())
+        ]
 
     def _add_node(self, node_id: str, node_type: str, title: str, path: str) -> None:
         """Adds a node to the graph if it doesn't exist."""
@@ -49,38 +111,69 @@ class ProjectGraph:
             }
             logger.debug(f"Added node: {node_id} (type: {node_type})")
 
-    def _add_edge(self, source: str, target: str) -> None:
+    def _add_edge(self, source: str, target: str, edge_type: str = IMPLEMENTS) -> None:
         """Adds a directed edge to the graph."""
-        edge = {"source": source, "target": target}
-        if edge not in self.edges:
-            self.edges.append(edge)
-            logger.debug(f"Added edge: {source} -> {target}")
-
-    def _extract_id_from_filename(self, file_path: Path) -> Optional[str]:
-        """Extract artifact ID from filename like 'INFRA-016-runbook.md' -> 'INFRA-016'."""
-        name = file_path.stem  # Remove .md
-        # Match pattern like SCOPE-NNN (e.g., INFRA-016, MOBILE-001)
-        match = re.match(r'^([A-Z]+-\d+)', name)
-        if match:
-            return match.group(1)
-        return None
-
-    def _extract_title_from_content(self, file_path: Path) -> str:
-        """Extract title from first markdown header."""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith('# '):
-                        # Remove the # and extract title after any ID prefix
-                        header = line[2:].strip()
-                        # Handle formats like "# INFRA-016: Title Here"
-                        if ':' in header:
-                            return header.split(':', 1)[1].strip()
-                        return header
-        except Exception as e:
-            logger.warning(f"Could not read title from {file_path}: {e}")
-        return "Untitled"
+        if target in self._out.get(source, ()):
+            return
+        self._out.setdefault(source, {})[target] = edge_type
+        self._in.setdefault(target, {})[source] = edge_type
+        self._by_type.setdefault(edge_type, set()).add((source, target))
+        logger.debug(f"Added edge: {source} -> {target} ({edge_type})")
+
+    def _remove_edge(self, source: str, target: str) -> None:
+        edge_type = self._out.get(source, {}).pop(target, None)
+        if edge_type is None:
+            return
+        self._in[target].pop(source, None)
+        self._by_type[edge_type].discard((source, target))
+        for index, node in ((self._out, source), (self._in, target)):
+            if not index.get(node):
+                index.pop(node, None)
+
+    def _drop_edges(self, node_id: str) -> None:
+        """Remove every edge touching ``node_id``, and code nodes left unlinked."""
+        for target in list(self._out.get(node_id, ())):
+            self._remove_edge(node_id, target)
+            if self.nodes.get(target, {}).get("type") == "code" and target not in self._in:
+                del self.nodes[target]
+        for source in list(self._in.get(node_id, ())):
+            self._remove_edge(source, node_id)
+
+    # -- queries -----------------------------------------------------------
+
+    def neighbours(self, node_id: str, edge_type: Optional[str] = None, direction: str = "both") -> List[str]:
+        """Adjacent node IDs, optionally limited to one edge type and direction (``out``/``in``/``both``)."""
+        maps = {"out": (self._out,), "in": (self._in,), "both": (self._out, self._in)}[direction]
+        found = {
+            other
+            for index in maps
+            for other, kind in index.get(node_id, {}).items()
+            if edge_type is None or kind == edge_type
+        }
+        found.discard(node_id)
+        return sorted(found)
+
+    def impact(self, node_id: str, depth: int = 2) -> Set[str]:
+        """Nodes within ``depth`` hops of ``node_id`` in either direction (excluding itself)."""
+        seen = {node_id}
+        queue = deque([(node_id, 0)])
+        while queue:
+            current, hops = queue.popleft()
+            if hops == depth:
+                continue
+            for index in (self._out, self._in):
+                for other in index.get(current, ()):
+                    if other not in seen:
+                        seen.add(other)
+                        queue.append((other, hops + 1))
+        seen.discard(node_id)
+        return seen
+
+    def edges_of_type(self, edge_type: str) -> List[Tuple[str, str]]:
+        """``(source, target)`` pairs of one edge type, from the type index."""
+        return sorted(self._by_type.get(edge_type, ()))
+
+    # -- catalog entries -> claims -------------------------------------------
 
     def _determine_node_type(self, file_path: Path) -> str:
         """Determine artifact type based on directory or filename."""
@@ -103,98 +196,224 @@ class ProjectGraph:
         
         return 'story'  # Default to story
 
-    def _process_artifact(self, file_path: Path) -> None:
-        """Processes a single governance artifact file."""
-        node_id = self._extract_id_from_filename(file_path)
+    def _claim(self, kind: str, entry: CatalogEntry) -> Optional[Dict[str, Any]]:
+        """What one catalog entry contributes to the graph (None if it has no ID)."""
+        node_id = entry.artifact_id
         if not node_id:
-            logger.debug(f"Skipping {file_path}: no valid ID found")
-            return
+            logger.debug(f"Skipping {entry.path}: no valid ID found")
+            return None
+        if kind == "journey":
+            title = entry.meta.get("title") or entry.meta.get("comment", {}).get("title") or node_id
+            node_type = "journey"
+        else:
+            # "# INFRA-016: Title Here" -> "Title Here"
+            header = entry.h1
+            if header is None:
+                title = "Untitled"
+            else:
+                title = header.split(':', 1)[1].strip() if ':' in header else header
+            node_type = "adr" if kind == "adr" else self._determine_node_type(entry.path)
+        return {
+            "id": node_id,
+            "kind": kind,
+            "type": node_type,
+            "title": str(title),
+            "path": str(entry.path),
+            "refs": sorted(set(entry.refs) - {node_id}),
+            "code": list(entry.meta.get("code_paths", [])) if kind == "runbook" else [],
+        }
+
+    def _set_claim(self, path: str, claim: Optional[Dict[str, Any]], dirty: Set[str]) -> None:
+        """Replace (or with None, remove) the claim made by the file at ``path``."""
+        old_id = self._path_ids.pop(path, None)
+        if old_id is not None:
+            claims = self._claims.get(old_id, {})
+            claims.pop(path, None)
+            if not claims:
+                self._claims.pop(old_id, None)
+            dirty.add(old_id)
+        if claim is not None:
+            self._claims.setdefault(claim["id"], {})[path] = claim
+            self._path_ids[path] = claim["id"]
+            dirty.add(claim["id"])
 
-        title = self._extract_title_from_content(file_path)
-        node_type = self._determine_node_type(file_path)
+    def _refresh_node(self, node_id: str) -> None:
+        """Re-derive ``node_id`` and its edges from its claims: O(degree)."""
+        self._drop_edges(node_id)
+        for ref in self._node_refs.pop(node_id, ()):
+            referrers = self._referrers.get(ref)
+            if referrers is not None:
+                referrers.discard(node_id)
+                if not referrers:
+                    del self._referrers[ref]
+        self.nodes.pop(node_id, None)
+        claims = self._claims.get(node_id)
+        if not claims:
+            return
 
-        self._add_node(node_id, node_type, title, str(file_path))
+        winner = min(claims.values(), key=lambda c: (KIND_PRIORITY.get(c["kind"], 99), c["path"]))
+        self._add_node(node_id, winner["type"], winner["title"], winner["path"])
+        refs = {ref for claim in claims.values() for ref in claim["refs"]}
+        self._node_refs[node_id] = refs
+        for ref in refs:
+            self._referrers.setdefault(ref, set()).add(node_id)
+            if ref in self.nodes:
+                self._link(node_id, ref)
+        for referrer in self._referrers.get(node_id, ()):
+            if referrer in self.nodes:
+                self._link(referrer, node_id)
 
         # For runbooks, find the associated story (same ID prefix)
-        if node_type == 'runbook':
-            # Runbook INFRA-016-runbook.md -> Story INFRA-016
-            self._add_edge(source=node_id, target=node_id)  # Self-reference for now
-            self._parse_runbook_content(file_path, node_id)
+        for claim in claims.values():
+            if claim["kind"] == "runbook":
+                # Runbook INFRA-016-runbook.md -> Story INFRA-016
+                self._add_edge(source=node_id, target=node_id)  # Self-reference for now
+                self._link_runbook_code(claim["code"], node_id)
+
+    def _link(self, referrer: str, referenced: str) -> None:
+        """Add the typed edge implied by ``referrer`` mentioning ``referenced``, if any."""
+        from_type = self.nodes[referrer]["type"]
+        to_type = self.nodes[referenced]["type"]
+        if to_type == "adr" and from_type != "adr":
+            self._add_edge(referrer, referenced, ADR)
+            return
+        rule = _REF_EDGES.get((from_type, to_type))
+        if rule:
+            edge_type, reverse = rule
+            source, target = (referenced, referrer) if reverse else (referrer, referenced)
+            self._add_edge(source, target, edge_type)
 
-    def _parse_runbook_content(self, file_path: Path, runbook_id: str) -> None:
-        """Parses runbook content for file paths to link as code nodes."""
+    def _link_runbook_code(self, code_paths: List[str], runbook_id: str) -> None:
+        """Links [NEW | MODIFY | DELETE] file paths from a runbook as code nodes."""
+        for code_path_str in code_paths:
+            # Validate it looks like a file path:
+            # - Must contain / or .
+            # - Should not start with special chars
+            # - Should have a file extension
+            if not code_path_str:
+                continue
+            if code_path_str.startswith(('#', '[', '(')):
+                continue
+            if '/' not in code_path_str and '.' not in code_path_str:
+                continue
+            if not _EXTENSION_RE.search(code_path_str):
+                # Doesn't end with file extension - skip
+                continue
+
+            # Create a clean node ID from the path (replace special chars with _)
+            node_id = _NODE_ID_RE.sub('_', code_path_str)
+            self._add_node(
+                node_id=node_id,
+                node_type='code',
+                title=Path(code_path_str).name,
+                path=code_path_str
+            )
+            self._add_edge(source=runbook_id, target=node_id, edge_type=CODE)
+
+    # -- sync & snapshot -----------------------------------------------------
+
+    def _sources(self) -> List[Tuple[str, Path]]:
+        return [
+            ('plan', self.plans_dir),
+            ('story', self.stories_dir),
+            ('runbook', self.runbooks_dir),
+            ('journey', self.journeys_dir),
+            ('adr', self.adrs_dir),
+        ]
+
+    def sync(self) -> int:
+        """Apply catalog changes since the last sync. Returns artifacts (re)applied or removed."""
+        with self._lock:
+            catalog = get_catalog()
+            dirty: Set[str] = set()
+            applied = 0
+            for kind, artifact_dir in self._sources():
+                changes = catalog.changes(kind, artifact_dir, self._cursors.get(kind))
+                if changes.full:
+                    for path, node_id in list(self._path_ids.items()):
+                        if self._claims[node_id][path]["kind"] == kind:
+                            self._set_claim(path, None, dirty)
+                for entry in changes.updated:
+                    self._set_claim(str(entry.path), self._claim(kind, entry), dirty)
+                for path in changes.removed:
+                    self._set_claim(str(path), None, dirty)
+                applied += len(changes.updated) + len(changes.removed)
+                if changes.cursor != self._cursors.get(kind):
+                    self._cursors[kind] = changes.cursor
+                    dirty.add("")  # cursor moved: snapshot is stale even without graph changes
+            for node_id in sorted(dirty - {""}):
+                self._refresh_node(node_id)
+            if dirty:
+                self.save_snapshot()
+            return applied
+
+    def load_snapshot(self) -> bool:
+        """Restore inputs and cursors from the snapshot. Returns False if absent or stale."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Regex to find [NEW | MODIFY | DELETE] file/path
-            # Match patterns like: [NEW] path/to/file.py or [MODIFY] `path/to/file.py`
-            pattern = re.compile(r'\[(?:NEW|MODIFY|DELETE)\]\s+`?([^`\s\[\]]+)`?')
-            
-            for match in pattern.finditer(content):
-                code_path_str = match.group(1).strip()
-                
-                # Validate it looks like a file path:
-                # - Must contain / or .
-                # - Should not start with special chars
-                # - Should have a file extension
-                if not code_path_str:
-                    continue
-                if code_path_str.startswith(('#', '[', '(')):
-                    continue
-                if '/' not in code_path_str and '.' not in code_path_str:
-                    continue
-                if not re.search(r'\.[a-zA-Z0-9]+$', code_path_str):
-                    # Doesn't end with file extension - skip
-                    continue
-                
-                # Create a clean node ID from the path (replace special chars with _)
-                node_id = re.sub(r'[^a-zA-Z0-9_]', '_', code_path_str)
-                self._add_node(
-                    node_id=node_id,
-                    node_type='code',
-                    title=Path(code_path_str).name,
-                    path=code_path_str
-                )
-                self._add_edge(source=runbook_id, target=node_id)
-
-        except Exception as e:
-            logger.warning(f"Could not parse content of runbook {file_path}: {e}")
+            data = json.loads(self.snapshot_path.read_text())
+        except (OSError, ValueError):
+            return False
+        if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION \
+                or data.get("root") != str(self.root_path):
+            return False
+        with self._lock:
+            dirty: Set[str] = set()
+            for claim in data.get("claims", []):
+                self._set_claim(claim["path"], claim, dirty)
+            self._cursors = dict(data.get("cursors", {}))
+            for node_id in sorted(dirty):
+                self._refresh_node(node_id)
+        return True
+
+    def save_snapshot(self) -> None:
+        """Persist inputs and cursors (only inside an existing ``.agent/cache``)."""
+        if not self.snapshot_path.parent.is_dir():
+            return
+        data = {
+            "version": SNAPSHOT_VERSION,
+            "root": str(self.root_path),
+            "cursors": self._cursors,
+            "claims": [claim for claims in self._claims.values() for claim in claims.values()],
+        }
+        tmp = self.snapshot_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            tmp.write_text(json.dumps(data, sort_keys=True))
+            os.replace(tmp, self.snapshot_path)
+        except OSError as e:
+            logger.debug(f"Could not save graph snapshot: {e}")
 
     def build(self) -> Dict[str, List[Dict[str, Any]]]:
         """
-        Scans the repository, builds the graph, and returns it.
+        Brings the graph up to date with the repository and returns it.
         """
         logger.info(f"Starting graph build from root: {self.root_path}")
-        
-        # Scan each artifact directory
-        for artifact_dir, node_type in [
-            (self.plans_dir, 'plan'),
-            (self.stories_dir, 'story'),
-            (self.runbooks_dir, 'runbook'),
-        ]:
-            if artifact_dir.exists():
-                for file_path in artifact_dir.rglob("*.md"):
-                    self._process_artifact(file_path)
-        
-        # Create edges between related artifacts (same ID prefix)
-        # Story INFRA-016 -> Runbook INFRA-016
-        for node_id, node in list(self.nodes.items()):
-            if node['type'] == 'story':
-                # Look for matching runbook
-                for other_id, other_node in self.nodes.items():
-                    if other_node['type'] == 'runbook' and other_id == node_id:
-                        self._add_edge(source=node_id, target=other_id)
+        with self._lock:
+            if not self._cursors:
+                self.load_snapshot()
+            self.sync()
+            nodes = sorted(self.nodes.values(), key=lambda n: (NODE_ORDER.get(n["type"], 99), n["id"]))
+            return {
+                "nodes": [dict(node) for node in nodes],
+                "edges": self.edges,
+            }
 
-        return {
-            "nodes": list(self.nodes.values()),
-            "edges": self.edges,
-        }
+
+_graphs: Dict[Path, ProjectGraph] = {}
+_graphs_lock = threading.Lock()
+
+
+def get_graph(root_path: str = '.') -> ProjectGraph:
+    """Process-wide graph for ``root_path``, kept current by :meth:`ProjectGraph.build`."""
+    root = Path(root_path).resolve()
+    with _graphs_lock:
+        graph = _graphs.get(root)
+        if graph is None:
+            graph = _graphs[root] = ProjectGraph(str(root))
+        return graph
 
 
 def build_from_repo(root_path: str = '.') -> Dict[str, List[Dict[str, Any]]]:
     """
     Factory function to build and return the project graph.
     """
-    graph_builder = ProjectGraph(root_path)
-    return graph_builder.build()
\ No newline at end of file
+    return get_graph(root_path).build()
@@ -0,0 +1,182 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tiered location of SEARCH blocks in file content.
+
+Most SEARCH blocks that fail an exact match differ from the file only in
+layout. :func:`locate_block` tries progressively looser tiers and returns
+the verbatim file region, so the block can be repaired without an LLM:
+
+1. ``exact`` — the block is a substring of the file.
+2. ``whitespace`` — equal after normalising line endings, trailing
+   whitespace, runs of inner whitespace and trailing commas.
+3. ``indentation`` — as ``whitespace``, also ignoring leading indentation.
+4. ``fuzzy`` — same-length windows anchored on the block's first or last
+   line, scored with :class:`difflib.SequenceMatcher`.
+
+Tiers 2-4 only accept a region that is the single match in the file; an
+ambiguous block is reported as unmatched rather than guessed. Tiers that
+ignore indentation record the offset between the SEARCH block and the file
+region, and :meth:`BlockMatch.apply` shifts the REPLACE text by it.
+"""
+
+import difflib
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+TIERS = ("exact", "whitespace", "indentation", "fuzzy")
+DEFAULT_FUZZY_THRESHOLD = 0.9
+
+
+@dataclass(frozen=True)
+class BlockMatch:
+    """Where a SEARCH block matched and how loosely."""
+
+    tier: str
+    text: str  # the matching region, verbatim from the file
+    offset: int  # character offset of ``text`` in the file
+    start_line: int  # 0-based
+    score: float = 1.0
+    search_indent: str = ""  # leading whitespace of the SEARCH block's first line
+    indent: str = ""  # leading whitespace of the region's first line
+
+    def reindent(self, replacement: str) -> str:
+        """Shift ``replacement`` from the SEARCH block's indentation to the region's."""
+        if self.indent == self.search_indent:
+            return replacement
+        extra = self.indent[len(self.search_indent):] if self.indent.startswith(self.search_indent) else None
+        lines = []
+        for line in replacement.splitlines(keepends=True):
+            if not line.strip():
+                lines.append(line)
+            elif line.startswith(self.search_indent):
+                lines.append(self.indent + line[len(self.search_indent):])
+            elif extra is not None:
+                lines.append(extra + line)
+            else:
+                lines.append(line.lstrip(" \t"))
+        return "".join(lines)
+
+    def apply(self, content: str, replacement: str) -> str:
+        """Return ``content`` with this region replaced by ``replacement``.
+
+        ``replacement`` is re-indented to the region first (see :meth:`reindent`).
+        """
+        replacement = self.reindent(replacement)
+        return content[:self.offset] + replacement + content[self.offset + len(self.text):]
+
+
+def _whitespace_key(line: str) -> str:
+    body = line.strip()
+    indent = line[:len(line) - len(line.lstrip())]
+    return indent + " ".join(body.split()).rstrip(",").rstrip()
+
+
+def _indentation_key(line: str) -> str:
+    return " ".join(line.split()).rstrip(",").rstrip()
+
+
+def _trim_blank(lines: List[str]) -> List[str]:
+    start, end = 0, len(lines)
+    while start < end and not lines[start].strip():
+        start += 1
+    while end > start and not lines[end - 1].strip():
+        end -= 1
+    return lines[start:end]
+
+
+def _indent(line: str) -> str:
+    return line[:len(line) - len(line.lstrip(" \t"))]
+
+
+def _region(tier: str, lines: List[str], start: int, size: int, search_first: str, score: float = 1.0) -> BlockMatch:
+    window = lines[start:start + size]
+    text = "".join(window)
+    if text.endswith("\r\n"):
+        text = text[:-2]
+    elif text.endswith("\n"):
+        text = text[:-1]
+    offset = sum(len(line) for line in lines[:start])
+    first = next((line for line in window if line.strip()), "")
+    return BlockMatch(tier, text, offset, start, score, _indent(search_first), _indent(first))
+
+
+def _unique_window(file_keys: List[str], search_keys: List[str]) -> Optional[int]:
+    size = len(search_keys)
+    starts = [
+        s for s in range(len(file_keys) - size + 1)
+        if file_keys[s] == search_keys[0] and file_keys[s:s + size] == search_keys
+    ]
+    return starts[0] if len(starts) == 1 else None
+
+
+def _fuzzy_window(file_keys: List[str], search_keys: List[str], threshold: float) -> Optional[Tuple[int, float]]:
+    size = len(search_keys)
+    last = len(file_keys) - size
+    candidates = set()
+    for i, key in enumerate(file_keys):
+        if key == search_keys[0] and i <= last:
+            candidates.add(i)
+        if key == search_keys[-1] and 0 <= i - size + 1 <= last:
+            candidates.add(i - size + 1)
+    target = "\n".join(search_keys)
+    passing = []
+    for start in sorted(candidates):
+        score = difflib.SequenceMatcher(None, "\n".join(file_keys[start:start + size]), target).ratio()
+        if score >= threshold:
+            passing.append((start, score))
+    return passing[0] if len(passing) == 1 else None
+
+
+def locate_block(
+    content: str,
+    search: str,
+    fuzzy_threshold: Optional[float] = DEFAULT_FUZZY_THRESHOLD,
+) -> Optional[BlockMatch]:
+    """Find ``search`` in ``content``, trying each tier in :data:`TIERS` order.
+
+    Args:
+        content: Current file content.
+        search: The SEARCH block text.
+        fuzzy_threshold: Minimum similarity for the ``fuzzy`` tier; ``None``
+            stops after the deterministic tiers.
+
+    Returns:
+        The match, or ``None`` if no tier found a unique region.
+    """
+    if not search.strip():
+        return None
+    index = content.find(search)
+    if index >= 0:
+        return BlockMatch("exact", search, index, content.count("\n", 0, index))
+
+    file_lines = content.splitlines(keepends=True)
+    search_lines = _trim_blank(search.splitlines())
+    if not file_lines or not search_lines:
+        return None
+
+    keys = {}
+    for tier, key_fn in (("whitespace", _whitespace_key), ("indentation", _indentation_key)):
+        keys[tier] = ([key_fn(line) for line in file_lines], [key_fn(line) for line in search_lines])
+        start = _unique_window(*keys[tier])
+        if start is not None:
+            return _region(tier, file_lines, start, len(search_lines), search_lines[0])
+
+    if fuzzy_threshold is None:
+        return None
+    found = _fuzzy_window(*keys["indentation"], fuzzy_threshold)
+    if found is None:
+        return None
+    start, score = found
+    return _region("fuzzy", file_lines, start, len(search_lines), search_lines[0], round(score, 3))
@@ -90,6 +90,7 @@ def backup_file(file_path: Path) -> Optional[Path]:
 # Search/Replace application
 # ---------------------------------------------------------------------------
 
+from agent.core.implement.block_match import locate_block as _locate_block  # noqa: E402
 from agent.core.implement.sr_validation import (  # noqa: E402
     fuzzy_find_and_replace as _fuzzy_find_and_replace,
 )
@@ -154,6 +155,17 @@ def apply_search_replace_to_file(
                 )
                 continue
 
+            # Layout drift (whitespace, indentation, trailing commas): repair
+            # against the unique verbatim region before any fuzzy scoring
+            _match = _locate_block(working_content, block["search"], fuzzy_threshold=None)
+            if _match is not None:
+                logging.info(
+                    "search_replace_tier_match file=%s block=%d/%d tier=%s",
+                    filepath, i + 1, len(blocks), _match.tier,
+                )
+                working_content = _match.apply(working_content, block["replace"])
+                continue
+
             # Fuzzy match fallback: find best matching region
             _fuzzy_result = _fuzzy_find_and_replace(
                 working_content, block["search"], block["replace"], filepath, i + 1, len(blocks)
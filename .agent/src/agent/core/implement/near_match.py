@@ -0,0 +1,141 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Near-match lookup of failed SEARCH blocks in large files.
+
+When a SEARCH block does not match, the correction prompt needs the part
+of the file the block was aiming at. :class:`LineIndex` maps every
+normalised line and every pair of consecutive lines (a 2-line shingle) to
+where it occurs. Each search line or shingle found in the file votes for
+an alignment offset (file line minus search line), weighted by how rare
+it is. Agreeing votes pick out candidate regions in time proportional to
+the matches rather than to ``file lines x search lines``.
+
+:func:`context_windows` renders the top candidates as tight excerpts that
+together fit a token budget.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+CHARS_PER_TOKEN = 4
+DEFAULT_CONTEXT_TOKENS = 1500
+DEFAULT_TOP_K = 3
+MIN_LINE_CHARS = 4  # shorter lines (braces, `pass`) carry no signal
+
+
+def _key(line: str) -> str:
+    return " ".join(line.split())
+
+
+@dataclass(frozen=True)
+class Candidate:
+    """A file region that may be what a SEARCH block intended."""
+
+    start_line: int  # 0-based, inclusive
+    end_line: int  # exclusive
+    score: float  # share of the block's evidence found at this alignment
+
+
+class LineIndex:
+    """Line and shingle postings for one file's content."""
+
+    def __init__(self, content: str):
+        self.content = content
+        self.lines = content.splitlines()
+        keys = [_key(line) for line in self.lines]
+        self._lines: Dict[str, List[int]] = defaultdict(list)
+        self._shingles: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+        for i, key in enumerate(keys):
+            if len(key) >= MIN_LINE_CHARS:
+                self._lines[key].append(i)
+            if i and (keys[i - 1] or key):
+                self._shingles[(keys[i - 1], key)].append(i - 1)
+
+    def candidates(self, search: str, top_k: int = DEFAULT_TOP_K) -> List[Candidate]:
+        """Rank up to ``top_k`` non-overlapping regions by evidence for ``search``."""
+        search_keys = [_key(line) for line in search.splitlines()]
+        size = len(search_keys)
+        if not size or not self.lines:
+            return []
+
+        votes: Dict[int, float] = defaultdict(float)
+        possible = 0.0
+        for j, key in enumerate(search_keys):
+            if len(key) >= MIN_LINE_CHARS:
+                possible += 1.0
+                hits = self._lines.get(key, ())
+                for i in hits:
+                    votes[i - j] += 1.0 / len(hits)
+            if j and (search_keys[j - 1] or key):
+                possible += 1.0
+                hits = self._shingles.get((search_keys[j - 1], key), ())
+                for i in hits:
+                    votes[i - (j - 1)] += 1.0 / len(hits)
+        if not votes or not possible:
+            return []
+
+        picked: List[Candidate] = []
+        for offset, weight in sorted(votes.items(), key=lambda kv: (-kv[1], kv[0])):
+            start = max(0, offset)
+            end = min(len(self.lines), offset + size)
+            if end <= start or any(start < c.end_line and c.start_line < end for c in picked):
+                continue
+            picked.append(Candidate(start, end, round(min(1.0, weight / possible), 3)))
+            if len(picked) == top_k:
+                break
+        return picked
+
+
+def context_windows(
+    content: str,
+    search: str,
+    budget_tokens: int = DEFAULT_CONTEXT_TOKENS,
+    top_k: int = DEFAULT_TOP_K,
+    index: Optional[LineIndex] = None,
+) -> str:
+    """Excerpts around the likeliest targets of ``search``, within ``budget_tokens``.
+
+    The whole file is returned when it fits the budget. Otherwise each of
+    the top candidates gets an equal share, padded evenly above and below.
+    Without any candidate, the start of the file is returned.
+    """
+    budget_chars = budget_tokens * CHARS_PER_TOKEN
+    if len(content) <= budget_chars:
+        return content
+    index = index if index is not None and index.content is content else LineIndex(content)
+    found = index.candidates(search, top_k) or [Candidate(0, 1, 0.0)]
+    share = budget_chars // len(found)
+
+    excerpts = []
+    for cand in found:
+        start, end = cand.start_line, cand.end_line
+        used = sum(len(line) + 1 for line in index.lines[start:end])
+        # Trim the region itself if it alone exceeds the share
+        while end - start > 1 and used > share:
+            end -= 1
+            used -= len(index.lines[end]) + 1
+        # Grow one line at a time, alternating below and above
+        grew = True
+        while grew:
+            grew = False
+            for nxt in (end, start - 1):
+                if 0 <= nxt < len(index.lines) and used + len(index.lines[nxt]) + 1 <= share:
+                    used += len(index.lines[nxt]) + 1
+                    start, end = (start, end + 1) if nxt == end else (start - 1, end)
+                    grew = True
+        header = f"--- lines {start + 1}-{end} (match score {cand.score:.0%}) ---"
+        excerpts.append(header + "\n" + "\n".join(index.lines[start:end]))
+    return "\n...\n".join(excerpts)
@@ -16,6 +16,7 @@
 Orchestration logic for runbook verification and LLM correction loops.
 """
 
+from collections import Counter
 from typing import List, Optional, Tuple
 from pydantic import BaseModel, Field
 from opentelemetry import metrics, trace
@@ -45,6 +46,10 @@ rewrite_counter = meter.create_counter(
     "verification.rewrite_cycles",
     description="Number of rewrite cycles attempted",
 )
+repair_counter = meter.create_counter(
+    "verification.local_repairs",
+    description="SEARCH blocks repaired without an LLM rewrite, by match tier",
+)
 
 class RunbookStep(BaseModel):
     """Represents a single step in a runbook."""
@@ -72,11 +77,16 @@ class VerificationOrchestrator:
         self.ai_service = ai_service
         self.max_retries = max_retries
         self.telemetry = VerificationTelemetry("runbook_verification")
+        self.repairs: Counter = Counter()
 
     def verify_and_correct(self, runbook_steps: List[RunbookStep]) -> Tuple[bool, List[RunbookStep]]:
         """
         Verify all steps and attempt to correct them via LLM if they fail.
 
+        Blocks that differ from the file only in layout are repaired locally
+        first; only blocks no match tier can place are sent for a rewrite.
+        ``repairs`` counts the local repairs by the tier that matched.
+
         :param runbook_steps: List of parsed runbook steps.
         :return: (Final success status, Final steps)
         """
@@ -88,14 +98,14 @@ class VerificationOrchestrator:
             self.telemetry.start()
             
             while attempts <= self.max_retries:
-                errors = self._verify_all_steps(current_steps)
+                current_steps, errors = self._repair_steps(current_steps)
                 
                 if not errors:
                     logger.info(f"Runbook verified successfully after {attempts} rewrites.")
                     span.set_attribute("final_status", "success")
                     span.set_attribute("attempts", attempts)
                     success_counter.add(1)
-                    self.telemetry.emit("Success", {"attempts": attempts})
+                    self.telemetry.emit("Success", {"attempts": attempts, "repairs": dict(self.repairs)})
                     return True, current_steps
                 
                 if attempts == self.max_retries:
@@ -123,14 +133,31 @@ class VerificationOrchestrator:
         :param steps: Steps to check.
         :return: List of verification errors.
         """
+        return self._repair_steps(steps)[1]
+
+    def _repair_steps(self, steps: List[RunbookStep]) -> Tuple[List[RunbookStep], List[VerificationError]]:
+        """
+        Locate every MODIFY block, rewriting near-matches to the exact file text.
+
+        :param steps: Steps to check.
+        :return: (Steps with repaired search blocks, errors for blocks that could not be placed)
+        """
+        repaired = []
         errors = []
         for step in steps:
-            if step.action == "MODIFY":
-                if step.path and step.search:
-                    success, error = self.verifier.verify_block(step.path, step.search)
-                    if error:
-                        errors.append(error)
-        return errors
+            if step.action == "MODIFY" and step.path and step.search:
+                match, error = self.verifier.locate_block(step.path, step.search)
+                if error:
+                    errors.append(error)
+                elif match and match.tier != "exact":
+                    self.repairs[match.tier] += 1
+                    repair_counter.add(1, {"tier": match.tier})
+                    update = {"search": match.text}
+                    if step.replace is not None:
+                        update["replace"] = match.reindent(step.replace)
+                    step = step.model_copy(update=update)
+            repaired.append(step)
+        return repaired, errors
 
     def _request_rewrite(self, steps: List[RunbookStep], errors: List[VerificationError]) -> Optional[List[RunbookStep]]:
         """
@@ -23,8 +23,10 @@ import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
+from agent.core.implement.block_match import BlockMatch, locate_block
+from agent.core.implement.near_match import DEFAULT_CONTEXT_TOKENS, LineIndex, context_windows
 from agent.core.logger import get_logger
 from agent.core.security import scrub_sensitive_data
 from agent.core.telemetry import get_tracer
@@ -32,6 +34,16 @@ from agent.core.telemetry import get_tracer
 logger = get_logger(__name__)
 tracer = get_tracer()
 
+
+def _context_budget() -> int:
+    """Token budget for file context in correction prompts (``AGENT_VERIFY_CONTEXT_TOKENS``)."""
+    try:
+        value = int(os.getenv("AGENT_VERIFY_CONTEXT_TOKENS") or DEFAULT_CONTEXT_TOKENS)
+    except ValueError:
+        return DEFAULT_CONTEXT_TOKENS
+    return value if value > 0 else DEFAULT_CONTEXT_TOKENS
+
+
 @dataclass
 class VerificationError:
     """Represents a failed verification of a runbook block."""
@@ -45,7 +57,9 @@ class RunbookVerifier:
     Verifier for idempotent runbook execution.
     
     Checks that SEARCH blocks in a runbook exactly match the current
-    state of the target files.
+    state of the target files. File contents are cached and only re-read
+    when a file's mtime or size changes, so repeated correction cycles do
+    not re-read every target.
     """
 
     def __init__(self, root_dir: Path):
@@ -55,6 +69,36 @@ class RunbookVerifier:
         :param root_dir: The root directory of the repository.
         """
         self.root_dir = root_dir
+        self._contents: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        self._indexes: Dict[int, LineIndex] = {}
+
+    def _read(self, file_path_str: str, search_block: str) -> Tuple[Optional[str], Optional[VerificationError]]:
+        """Return the (cached) content of a target file, or the error reading it."""
+        full_path = self.root_dir / file_path_str
+        try:
+            st = full_path.stat()
+        except OSError:
+            return None, VerificationError(
+                file_path=file_path_str,
+                search_block=search_block,
+                error_message=f"File not found: {file_path_str}"
+            )
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._contents.get(file_path_str)
+        if cached and cached[0] == stamp:
+            return cached[1], None
+        try:
+            content = full_path.read_text(encoding="utf-8")
+        except Exception as e:
+            return None, VerificationError(
+                file_path=file_path_str,
+                search_block=search_block,
+                error_message=f"Could not read file {file_path_str}: {str(e)}"
+            )
+        if cached:
+            self._indexes.pop(hash(cached[1]), None)
+        self._contents[file_path_str] = (stamp, content)
+        return content, None
 
     def verify_block(self, file_path_str: str, search_block: str) -> Tuple[bool, Optional[VerificationError]]:
         """
@@ -66,24 +110,10 @@ class RunbookVerifier:
         """
         with tracer.start_as_current_span("verify_block") as span:
             span.set_attribute("file_path", file_path_str)
-            
-            full_path = self.root_dir / file_path_str
-            
-            if not full_path.exists():
-                return False, VerificationError(
-                    file_path=file_path_str,
-                    search_block=search_block,
-                    error_message=f"File not found: {file_path_str}"
-                )
-
-            try:
-                content = full_path.read_text(encoding="utf-8")
-            except Exception as e:
-                return False, VerificationError(
-                    file_path=file_path_str,
-                    search_block=search_block,
-                    error_message=f"Could not read file {file_path_str}: {str(e)}"
-                )
+
+            content, error = self._read(file_path_str, search_block)
+            if error:
+                return False, error
 
             if search_block in content:
                 logger.info(f"Verification successful for {file_path_str}")
@@ -103,34 +133,56 @@ class RunbookVerifier:
                 suggested_context=scrub_sensitive_data(relevant_context)
             )
 
+    def locate_block(self, file_path_str: str, search_block: str) -> Tuple[Optional[BlockMatch], Optional[VerificationError]]:
+        """
+        Find a search block in a file, tolerating layout drift.
+
+        Tries the tiers of :func:`~agent.core.implement.block_match.locate_block`
+        (exact, whitespace, indentation, anchored fuzzy). A non-exact match
+        carries the verbatim file text the block should be repaired to.
+
+        :param file_path_str: Repo-relative path to the file.
+        :param search_block: The SEARCH text from the runbook.
+        :return: (Match or None, Optional error details)
+        """
+        with tracer.start_as_current_span("locate_block") as span:
+            span.set_attribute("file_path", file_path_str)
+
+            content, error = self._read(file_path_str, search_block)
+            if error:
+                return None, error
+
+            match = locate_block(content, search_block)
+            if match:
+                span.set_attribute("match_tier", match.tier)
+                if match.tier != "exact":
+                    logger.info(f"SEARCH block in {file_path_str} matched at tier '{match.tier}' (score {match.score})")
+                return match, None
+
+            logger.warning(f"Verification failed for {file_path_str}: no tier matched the SEARCH block.")
+            return None, VerificationError(
+                file_path=file_path_str,
+                search_block=search_block,
+                error_message="The SEARCH block does not match the file content.",
+                suggested_context=scrub_sensitive_data(self._get_relevant_context(content, search_block))
+            )
+
     def _get_relevant_context(self, file_content: str, search_block: str) -> str:
         """
         Extract relevant context from the file to help correct the SEARCH block.
-        Uses fuzzy sequence matching to find the most likely intended location 
-        and returns surrounding lines.
+        Ranks the likeliest target regions with a line/shingle index (cached
+        per file) and returns excerpts around them sized to the context
+        token budget (``AGENT_VERIFY_CONTEXT_TOKENS``).
 
         :param file_content: Full content of the file.
         :param search_block: The block that failed to match.
         :return: A snippet of the file content.
         """
-        import difflib
-        
-        file_lines = file_content.splitlines()
-        search_lines = search_block.splitlines()
-        
-        if not file_lines or not search_lines:
+        if not file_content.strip() or not search_block.strip():
             return ""
-            
-        # If file is small, just return it entirely
-        if len(file_lines) <= 200:
-            return file_content
-            
-        # Find the best contiguous match for the search block
-        matcher = difflib.SequenceMatcher(None, file_lines, search_lines)
-        match = matcher.find_longest_match(0, len(file_lines), 0, len(search_lines))
-        
-        # Give context of 30 lines above and 30 lines below the best match
-        start_idx = max(0, match.a - 30)
-        end_idx = min(len(file_lines), match.a + match.size + 30)
-        
-        return "\n".join(file_lines[start_idx:end_idx])
+
+        key = hash(file_content)
+        index = self._indexes.get(key)
+        if index is None:
+            index = self._indexes[key] = LineIndex(file_content)
+        return context_windows(file_content, search_block, budget_tokens=_context_budget(), index=index)
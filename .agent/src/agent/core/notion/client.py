@@ -14,63 +14,162 @@
 
 import logging
 import os
-import urllib.request
-import urllib.error
-import json
+import threading
+import time
 from typing import Optional, Dict, Any, List
 
+import httpx
+
 from agent.core.net_utils import check_ssl_error
+from agent.core.notion.rate_limit import TokenBucket
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BASE_URL = "https://api.notion.com/v1"
+# Notion allows an average of 3 requests/second per integration, with short bursts
+DEFAULT_RATE = 3.0
+DEFAULT_BURST = 3
+MAX_CONNECTIONS = 8
+MAX_RETRIES = 5
+PAGE_SIZE = 100
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        value = float(os.getenv(name) or default)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}; using {default}")
+        return default
+    return value if value > 0 else default
+
+
+class NotionAPIError(Exception):
+    """Non-success response from the Notion API."""
+
+    def __init__(self, status: int, body: str):
+        super().__init__(f"Notion API Error {status}: {body}")
+        self.status = status
+        self.body = body
+
+
 class NotionClient:
-    def __init__(self, api_key: str):
+    """Notion REST client over a pooled keep-alive connection.
+
+    All requests share one ``httpx.Client`` (safe across threads) and one
+    token bucket sized to Notion's rate limit. 429 responses honour
+    ``Retry-After``; transient 5xx responses are retried with backoff.
+    """
+
+    def __init__(self, api_key: str, base_url: Optional[str] = None, rate: Optional[float] = None):
         self.api_key = api_key
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
             "Notion-Version": "2022-06-28",
         }
-        self.base_url = "https://api.notion.com/v1"
+        self.base_url = (base_url or os.getenv("NOTION_BASE_URL") or DEFAULT_BASE_URL).rstrip("/")
+        rate = rate or _env_float("NOTION_RATE_LIMIT", DEFAULT_RATE)
+        self.limiter = TokenBucket(rate=rate, capacity=max(1, DEFAULT_BURST))
+        self._http: Optional[httpx.Client] = None
+        self._http_lock = threading.Lock()
+
+    @property
+    def http(self) -> httpx.Client:
+        """Lazily created pooled HTTP client."""
+        if self._http is None:
+            with self._http_lock:
+                if self._http is None:
+                    self._http = httpx.Client(
+                        base_url=self.base_url + "/",
+                        headers=self.headers,
+                        timeout=_env_float("NOTION_TIMEOUT", 30.0),
+                        limits=httpx.Limits(
+                            max_connections=MAX_CONNECTIONS,
+                            max_keepalive_connections=MAX_CONNECTIONS,
+                        ),
+                    )
+        return self._http
+
+    def close(self) -> None:
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
+    def __enter__(self) -> "NotionClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
 
     def _request(self, method: str, endpoint: str, payload: Optional[Dict[str, Any]] = None) -> Any:
-        url = f"{self.base_url}/{endpoint}"
-        data = None
-        if payload:
-            data = json.dumps(payload).encode("utf-8")
-        
-        req = urllib.request.Request(url, data=data, headers=self.headers, method=method)
-        
-        timeout = int(os.getenv("NOTION_TIMEOUT", "30"))
-        try:
-            with urllib.request.urlopen(req, timeout=timeout) as res:
-                if res.getcode() == 200:
-                    resp_body = res.read().decode("utf-8")
-                    return json.loads(resp_body)
+        for attempt in range(MAX_RETRIES + 1):
+            self.limiter.acquire()
+            try:
+                res = self.http.request(method, endpoint, json=payload if payload else None)
+            except httpx.HTTPError as e:
+                ssl_msg = check_ssl_error(e, url="api.notion.com")
+                if ssl_msg:
+                    # SSL Error is fatal and specific
+                    logger.error(ssl_msg)
+                    raise Exception(ssl_msg) from e
+                if attempt < MAX_RETRIES and isinstance(e, httpx.TransportError):
+                    time.sleep(min(2 ** attempt, 30))
+                    continue
+                raise
+
+            if res.is_success:
+                return res.json() if res.content else {}
+            if res.status_code in RETRY_STATUSES and attempt < MAX_RETRIES:
+                delay = self._retry_delay(res, attempt)
+                logger.warning(f"Notion API {res.status_code} on {method} {endpoint}; retrying in {delay:.1f}s")
+                if res.status_code == 429:
+                    # Pause every worker sharing this client, not just this one
+                    self.limiter.penalize(delay)
                 else:
-                    logger.error(f"Notion API Error {res.getcode()}: {res.read().decode('utf-8')}")
-                    raise Exception(f"Notion API Error {res.getcode()}")
-        except Exception as e:
-            ssl_msg = check_ssl_error(e, url="api.notion.com")
-            if ssl_msg:
-                # SSL Error is fatal and specific
-                logger.error(ssl_msg)
-                raise Exception(ssl_msg) from e
-            elif isinstance(e, urllib.error.HTTPError):
-                 error_body = e.read().decode('utf-8')
-                 logger.error(f"HTTP Error {e.code}: {e.reason}")
-                 logger.error(f"Response Body: {error_body}")
-                 raise e
+                    time.sleep(delay)
+                continue
+
+            logger.error(f"HTTP Error {res.status_code}: {res.reason_phrase}")
+            logger.error(f"Response Body: {res.text}")
+            raise NotionAPIError(res.status_code, res.text)
+        raise NotionAPIError(0, "retries exhausted")  # pragma: no cover - loop always returns/raises
+
+    @staticmethod
+    def _retry_delay(res: httpx.Response, attempt: int) -> float:
+        retry_after = res.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+        return float(min(2 ** attempt, 30))
+
+    def _paginate(self, method: str, endpoint: str, payload: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Collect ``results`` across every page of a cursor-paginated endpoint."""
+        results: List[Dict[str, Any]] = []
+        cursor = None
+        while True:
+            if method == "GET":
+                sep = "&" if "?" in endpoint else "?"
+                url = f"{endpoint}{sep}page_size={PAGE_SIZE}"
+                if cursor:
+                    url += f"&start_cursor={cursor}"
+                data = self._request("GET", url)
             else:
-                 raise e
+                body = dict(payload or {}, page_size=PAGE_SIZE)
+                if cursor:
+                    body["start_cursor"] = cursor
+                data = self._request(method, endpoint, body)
+            results.extend(data.get("results", []))
+            cursor = data.get("next_cursor")
+            if not data.get("has_more") or not cursor:
+                return results
 
     def query_database(self, database_id: str, filter: Optional[Dict[str, Any]] = None, sorts: Optional[List[Dict[str, str]]] = None) -> List[Dict[str, Any]]:
         """
-        Queries a Notion database.
+        Queries a Notion database, following ``next_cursor`` until all pages are read.
         """
-        # Ensure database_id is just the UUID if a full URL was passed? 
-        # For now assume calling code handles ID extraction or simple ID.
-        
         payload: Dict[str, Any] = {}
         if filter:
             payload["filter"] = filter
@@ -78,15 +177,14 @@ class NotionClient:
             payload["sorts"] = sorts
 
         # Query endpoint is POST
-        data = self._request("POST", f"databases/{database_id}/query", payload)
-        return data.get("results", [])
+        return self._paginate("POST", f"databases/{database_id}/query", payload)
 
-    def update_page_properties(self, page_id: str, properties: Dict[str, Any]) -> None:
+    def update_page_properties(self, page_id: str, properties: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Updates properties of a Notion page.
+        Updates properties of a Notion page. Returns the updated page.
         """
         payload = {"properties": properties}
-        self._request("PATCH", f"pages/{page_id}", payload)
+        return self._request("PATCH", f"pages/{page_id}", payload)
 
     def retrieve_page(self, page_id: str) -> Dict[str, Any]:
          """Retrieves a Notion page."""
@@ -102,28 +200,11 @@ class NotionClient:
 
     def retrieve_comments(self, page_id: str) -> List[Dict[str, Any]]:
       """Retrieves comments from a Notion page."""
-      data = self._request("GET", f"comments?block_id={page_id}")
-      return data.get("results", [])
+      return self._paginate("GET", f"comments?block_id={page_id}")
 
     def retrieve_block_children(self, block_id: str) -> List[Dict[str, Any]]:
         """Retrieves children blocks of a block (or page) with pagination."""
-        results = []
-        has_more = True
-        start_cursor = None
-
-        while has_more:
-            # Construct URL with cursor if present
-            endpoint = f"blocks/{block_id}/children"
-            if start_cursor:
-                endpoint += f"?start_cursor={start_cursor}"
-            
-            data = self._request("GET", endpoint)
-            
-            results.extend(data.get("results", []))
-            has_more = data.get("has_more", False)
-            start_cursor = data.get("next_cursor")
-            
-        return results
+        return self._paginate("GET", f"blocks/{block_id}/children")
 
     def append_block_children(self, block_id: str, children: List[Dict[str, Any]]) -> None:
         """Appends block children to a block (or page)."""
@@ -137,8 +218,7 @@ class NotionClient:
         }
         if query:
             payload["query"] = query
-        data = self._request("POST", "search", payload)
-        return data.get("results", [])
+        return self._paginate("POST", "search", payload)
 
     def retrieve_database(self, database_id: str) -> Dict[str, Any]:
         """Retrieves a database object including its property schema."""
@@ -15,19 +15,24 @@
 """
 Autonomous test failure healer.
 
-Reads pytest tracebacks, identifies the failing source file, asks the AI
-for a surgical fix, writes it back, and re-runs the targeted test command.
+Reads pytest tracebacks, identifies the failing source files, asks the AI
+for surgical SEARCH/REPLACE edits (one request per file, run concurrently),
+applies them, and re-runs just the failing tests before the full command.
 Changes are staged (not committed) so the developer retains full control.
 """
 
+import os
 import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from opentelemetry import trace
 
 from agent.core.ai.service import ai_service
+from agent.core.git_state import git_state
+from agent.core.implement.block_match import locate_block
 from agent.core.logger import get_logger
 from agent.core.utils import scrub_sensitive_data
 
@@ -44,22 +49,84 @@ _FILE_RE = re.compile(
     r'(\.agent/src/[^\s:]+\.py):\d+:',
 )
 
+# Same two forms, capturing the line number
+_LINE_RE = re.compile(
+    r'File ["\']([^"\']+\.py)["\'], line (\d+)'
+    r'|'
+    r'([^\s:"\']+\.py):(\d+):',
+)
+
+# Node IDs from pytest's short test summary, e.g.
+#   FAILED tests/test_utils.py::TestX::test_y[case-1] - AssertionError
+_NODE_RE = re.compile(r"^(?:FAILED|ERROR)\s+(\S+::\S+)", re.MULTILINE)
+
+_SR_RE = re.compile(r"<<<SEARCH\n(.*?)\n===\n(.*?)\n?>>>", re.DOTALL)
+
 # Files that TestHealer must NEVER overwrite — prevents self-modification.
 _PROTECTED_RE = re.compile(
     r"agent/core/preflight/(healer|test_healer)\.py$"
     r"|commands/tests/test_preflight_autoheal\.py$"
 )
 
+# Files up to this size are sent whole; larger ones as excerpts around the
+# lines the traceback points at.
+FULL_FILE_CHARS = 24_000
+EXCERPT_RADIUS = 40
+
+# pytest options whose value is a separate argument
+_VALUE_OPTS = {
+    "-p", "-c", "-o", "-W", "-n", "--tb", "--rootdir", "--confcutdir", "--basetemp",
+    "--junitxml", "--maxfail", "--cov", "--cov-report", "--cov-config", "--durations",
+}
+# Selection options dropped from targeted re-runs: the node IDs select instead
+_SELECT_VALUE_OPTS = {"-k", "-m", "--ignore", "--deselect"}
+_SELECT_FLAGS = {"--lf", "--last-failed"}
+
+
+def _max_workers() -> int:
+    try:
+        value = int(os.getenv("AGENT_MAX_CONCURRENT_API_CALLS") or 2)
+    except ValueError:
+        return 2
+    return max(1, value)
+
+
+def targeted_command(cmd: List[str], node_ids: List[str]) -> Optional[List[str]]:
+    """Rewrite a pytest command to run only ``node_ids``.
+
+    Keeps the interpreter/pytest prefix and non-selecting options; drops
+    positional test paths and ``-k``/``-m`` style selection. Returns
+    ``None`` for commands that are not pytest invocations.
+    """
+    runner = next(
+        (i for i, arg in enumerate(cmd) if Path(str(arg)).name in ("pytest", "py.test")),
+        None,
+    )
+    if runner is None or not node_ids:
+        return None
+    targeted = [str(arg) for arg in cmd[:runner + 1]]
+    args = [str(arg) for arg in cmd[runner + 1:]]
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        name = arg.split("=", 1)[0]
+        width = 2 if "=" not in arg and name in _VALUE_OPTS | _SELECT_VALUE_OPTS else 1
+        if arg.startswith("-") and name not in _SELECT_VALUE_OPTS and name not in _SELECT_FLAGS:
+            targeted.extend(args[i:i + width])
+        i += width  # selection options and positional test paths are dropped
+    return targeted + node_ids
+
 
 class TestHealer:  # noqa: N801 — name intentional; not a pytest collection target
     """Handles autonomous correction of unit test failures.
 
     Workflow per attempt:
-    1. Extract the failing source file(s) from the pytest traceback.
-    2. Read current file content from disk.
-    3. Send scrubbed traceback + file content to the AI for a surgical fix.
-    4. Write the fixed content back and stage it (``git add``).
-    5. Re-run the exact failing test command.
+    1. Extract the failing source file(s) and test node IDs from the traceback.
+    2. Read current file content from disk (whole, or excerpts for large files).
+    3. Ask the AI for SEARCH/REPLACE edits, one request per file, concurrently.
+    4. Apply each file's edits, then stage the changed files in one ``git add``.
+    5. Re-run only the failing node IDs; if they pass, re-run the exact
+       failing command to confirm nothing else broke.
     6. Return True if tests pass, False otherwise.
 
     The budget is shared across ALL heal_failure() calls on this instance.
@@ -95,51 +162,48 @@ class TestHealer:  # noqa: N801 — name intentional; not a pytest collection ta
 
         logger.info("test_healer_attempt", extra={"attempt": self._attempts, "files": failing_files})
 
+        targets: List[Tuple[str, Path]] = []
         for file_path in failing_files:
-            resolved = Path(file_path)
-            if not resolved.exists():
-                for prefix in ("", ".agent/src/"):
-                    candidate = Path(prefix + file_path)
-                    if candidate.exists():
-                        resolved = candidate
-                        break
-
-            if not resolved.exists():
+            resolved = self._resolve(file_path)
+            if resolved is None:
                 logger.warning("test_healer_file_not_found", extra={"file": file_path})
                 continue
+            targets.append((file_path, resolved))
+        if not targets:
+            return False
 
-            original_content = resolved.read_text()
-            fix_prompt = (
-                f"The following pytest failure occurred in `{resolved}`:\n\n"
-                f"```\n{scrubbed_tb[:4000]}\n```\n\n"
-                f"Current file content:\n```python\n{original_content[:6000]}\n```\n\n"
-                "Provide a MINIMAL surgical fix. "
-                "Return ONLY the full corrected file content inside a ```python ... ``` fence. "
-                "Do not add explanation or prose outside the fence."
-            )
-
-            response = ai_service.complete(
-                system_prompt=(
-                    "You are a senior Python engineer fixing a failing pytest test. "
-                    "Return only the corrected file, no prose."
-                ),
-                user_prompt=fix_prompt,
-            )
-
-            if not response:
-                logger.warning("test_healer_empty_response", extra={"file": str(resolved)})
-                continue
-
-            fixed_content = self._extract_code_fence(response)
-            if not fixed_content:
-                logger.warning("test_healer_no_fence", extra={"file": str(resolved)})
-                continue
+        lines = self._extract_line_numbers(scrubbed_tb)
+        with ThreadPoolExecutor(max_workers=min(len(targets), _max_workers()),
+                                thread_name_prefix="test-heal") as pool:
+            applied = [
+                path for path in pool.map(
+                    lambda target: self._repair_file(target[1], scrubbed_tb, lines.get(target[0], [])),
+                    targets,
+                )
+                if path
+            ]
+        if not applied:
+            return False
+        # One add after the pool: concurrent adds would race on .git/index.lock
+        git_state.run("add", *applied)
+        return self._rerun(cmd, cwd, self._extract_failing_nodes(scrubbed_tb))
 
-            resolved.write_text(fixed_content)
-            subprocess.run(["git", "add", str(resolved)], capture_output=True)
-            logger.info("test_healer_fix_applied", extra={"file": str(resolved)})
+    def _rerun(self, cmd: List[str], cwd: Optional[str], node_ids: List[str]) -> bool:
+        """Re-run the failing nodes, then (only if they pass) the full command."""
+        targeted = targeted_command(cmd, node_ids)
+        if targeted and targeted != cmd:
+            with tracer.start_as_current_span("test_healer_targeted_rerun") as span:
+                span.set_attribute("nodes", len(node_ids))
+                res = subprocess.run(targeted, cwd=cwd, capture_output=True, text=True)
+                logger.info(
+                    "test_healer_targeted_result",
+                    extra={"returncode": res.returncode, "nodes": node_ids, "attempt": self._attempts},
+                )
+                # 1 = tests failed; 2/4/5 (interrupted, usage error, nothing
+                # collected) say nothing about the fix, so fall through
+                if res.returncode == 1:
+                    return False
 
-        # Re-run the failing test command
         with tracer.start_as_current_span("test_healer_rerun"):
             res = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
             passed = res.returncode == 0
@@ -149,6 +213,80 @@ class TestHealer:  # noqa: N801 — name intentional; not a pytest collection ta
             )
             return passed
 
+    @staticmethod
+    def _resolve(file_path: str) -> Optional[Path]:
+        for prefix in ("", ".agent/src/"):
+            candidate = Path(prefix + file_path)
+            if candidate.exists():
+                return candidate
+        return None
+
+    def _repair_file(self, resolved: Path, scrubbed_tb: str, line_numbers: List[int]) -> Optional[str]:
+        """Ask for and apply SEARCH/REPLACE edits to one file; returns its path if changed."""
+        original_content = resolved.read_text()
+        fix_prompt = (
+            f"The following pytest failure occurred in `{resolved}`:\n\n"
+            f"```\n{scrubbed_tb[:4000]}\n```\n\n"
+            f"{self._file_context(original_content, line_numbers)}\n\n"
+            "Provide a MINIMAL surgical fix as one or more SEARCH/REPLACE blocks:\n"
+            "<<<SEARCH\n<exact lines copied from the file>\n===\n<replacement lines>\n>>>\n"
+            "Each SEARCH must match the file exactly and identify a single location. "
+            "Do not add explanation or prose outside the blocks."
+        )
+
+        response = ai_service.complete(
+            system_prompt=(
+                "You are a senior Python engineer fixing a failing pytest test. "
+                "Return only SEARCH/REPLACE blocks, no prose."
+            ),
+            user_prompt=fix_prompt,
+        )
+
+        if not response:
+            logger.warning("test_healer_empty_response", extra={"file": str(resolved)})
+            return None
+
+        edits = _SR_RE.findall(response)
+        if not edits:
+            logger.warning("test_healer_no_edits", extra={"file": str(resolved)})
+            return None
+
+        fixed_content = original_content
+        for search, replace in edits:
+            # Deterministic tiers only: a fuzzy window may cover lines the model never saw
+            match = locate_block(fixed_content, search, fuzzy_threshold=None)
+            if match is None:
+                # Never apply a partial fix
+                logger.warning("test_healer_search_not_found", extra={"file": str(resolved)})
+                return None
+            fixed_content = match.apply(fixed_content, replace)
+
+        if fixed_content == original_content:
+            return None
+        resolved.write_text(fixed_content)
+        logger.info("test_healer_fix_applied", extra={"file": str(resolved), "edits": len(edits)})
+        return str(resolved)
+
+    @staticmethod
+    def _file_context(content: str, line_numbers: List[int]) -> str:
+        """The whole file if small, else excerpts around the traceback's lines."""
+        if len(content) <= FULL_FILE_CHARS or not line_numbers:
+            return f"Current file content:\n```python\n{content}\n```"
+        lines = content.splitlines()
+        spans: List[List[int]] = []
+        for number in sorted(set(line_numbers)):
+            start = max(0, number - 1 - EXCERPT_RADIUS)
+            end = min(len(lines), number + EXCERPT_RADIUS)
+            if spans and start <= spans[-1][1]:
+                spans[-1][1] = max(spans[-1][1], end)
+            else:
+                spans.append([start, end])
+        excerpts = "\n".join(
+            f"--- lines {start + 1}-{end} ---\n```python\n" + "\n".join(lines[start:end]) + "\n```"
+            for start, end in spans
+        )
+        return f"Relevant excerpts of the file ({len(lines)} lines):\n{excerpts}"
+
     def _extract_failing_files(self, traceback: str) -> List[str]:
         """Return unique source file paths from a pytest traceback.
 
@@ -169,7 +307,14 @@ class TestHealer:  # noqa: N801 — name intentional; not a pytest collection ta
         return seen
 
     @staticmethod
-    def _extract_code_fence(response: str) -> Optional[str]:
-        """Extract content from the first ```python ... ``` fence."""
-        match = re.search(r"```(?:python)?\s*\n(.*?)```", response, re.DOTALL)
-        return match.group(1).strip() if match else None
+    def _extract_line_numbers(traceback: str) -> Dict[str, List[int]]:
+        """Map each path in the traceback to the line numbers it was cited at."""
+        found: Dict[str, List[int]] = {}
+        for quoted, q_line, bare, b_line in _LINE_RE.findall(traceback):
+            found.setdefault(quoted or bare, []).append(int(q_line or b_line))
+        return found
+
+    @staticmethod
+    def _extract_failing_nodes(traceback: str) -> List[str]:
+        """Unique failing test node IDs from pytest's short test summary."""
+        return list(dict.fromkeys(_NODE_RE.findall(traceback)))
@@ -14,11 +14,12 @@
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
 from agent.core.config import config
+from agent.core.router_stats import ModelHealth, RouterStats, router_stats
 from agent.core.tokens import token_manager
 
 logger = logging.getLogger(__name__)
@@ -26,13 +27,16 @@ logger = logging.getLogger(__name__)
 class SmartRouter:
     """
     Routes AI requests to the optimal model based on configuration,
-    complexity (tier), context window checks, and cost.
+    complexity (tier), context window checks, and cost, skipping models
+    that recent calls show as rate limited or failing.
     """
-    def __init__(self, config_path: Optional[Path] = None):
+    def __init__(self, config_path: Optional[Path] = None, stats: Optional[RouterStats] = None):
         self.config_path = config_path or (config.etc_dir / "router.yaml")
         self.config = self._load_config()
         self.models = self.config.get("models", {})
         self.settings = self.config.get("settings", {})
+        self.stats = stats or router_stats
+        self._ranked: Dict[Optional[str], List[Tuple[str, Dict[str, Any]]]] = {}
 
     def _load_config(self) -> Dict[str, Any]:
         if not self.config_path.exists():
@@ -50,7 +54,101 @@ class SmartRouter:
             logger.error(f"Failed to load router config: {e}")
             return {"models": {}, "settings": {}}
 
-    def route(self, prompt: str, tier: str = None) -> Optional[Dict[str, Any]]:
+    def _ranked_models(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """All models sorted by provider priority, then input cost.
+
+        Sorted once per configured provider rather than on every route.
+        """
+        configured_provider = getattr(config, "LLM_PROVIDER", None)
+        ranked = self._ranked.get(configured_provider)
+        if ranked is not None:
+            return ranked
+
+        # Retrieve strict priority list from settings
+        priority_list = self.settings.get("provider_priority", ["gemini", "openai", "ollama", "gh"])
+
+        # Promote the user's configured provider (from agent.yaml) to the front
+        if configured_provider and configured_provider in priority_list:
+            priority_list = [configured_provider] + [
+                p for p in priority_list if p != configured_provider
+            ]
+
+        def sort_key(candidate):
+            model_key, model_def = candidate
+            provider = model_def.get("provider", "").lower()
+
+            # 1. Priority Index (lower is better)
+            try:
+                p_index = priority_list.index(provider)
+            except ValueError:
+                p_index = len(priority_list)  # Fallback for unknown providers
+
+            # 2. Cost (secondary factor)
+            cost = model_def.get("cost_per_1k_input", 999.0)
+
+            return (p_index, cost)
+
+        ranked = self._ranked[configured_provider] = sorted(self.models.items(), key=sort_key)
+        return ranked
+
+    def _health(self, model_def: Dict[str, Any]) -> Optional[ModelHealth]:
+        return self.stats.health(model_def.get("provider", ""), model_def.get("deployment_id"))
+
+    def _healthy(self, candidates: List[Tuple[str, Dict[str, Any]]]) -> List[Tuple[str, Dict[str, Any]]]:
+        """Drop rate-limited or failing models, unless that would drop them all."""
+        max_error_rate = float(self.settings.get("max_error_rate", 0.5))
+        min_samples = int(self.settings.get("min_samples", 5))
+
+        def ok(model_def: Dict[str, Any]) -> bool:
+            health = self._health(model_def)
+            if health is None:
+                return True
+            if health.rate_limited:
+                return False
+            return health.samples < min_samples or health.error_rate <= max_error_rate
+
+        healthy = [c for c in candidates if ok(c[1])]
+        return healthy or candidates
+
+    def _apply_policy(
+        self, candidates: List[Tuple[str, Dict[str, Any]]], policy: str, p95_budget_s: Optional[float]
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """Order ``candidates`` (already in static rank order) by ``policy``.
+
+        - ``priority``: static rank only.
+        - ``fastest``: lowest observed p95 first; unmeasured models last.
+        - ``cheapest_under_p95``: cheapest model whose p95 is within
+          ``p95_budget_s`` (unmeasured models qualify); if none do, fastest.
+        """
+        if policy == "priority" or len(candidates) < 2:
+            return candidates
+
+        def p95(candidate) -> float:
+            health = self._health(candidate[1])
+            return health.p95_s if health and health.p95_s is not None else float("inf")
+
+        fastest = sorted(candidates, key=p95)  # stable: ties keep static rank
+        if policy == "fastest":
+            return fastest
+        if policy == "cheapest_under_p95":
+            if p95_budget_s is None:
+                logger.warning("Routing policy cheapest_under_p95 has no p95_budget_s; using priority.")
+                return candidates
+            within = [c for c in candidates if p95(c) == float("inf") or p95(c) <= p95_budget_s]
+            if not within:
+                return fastest
+            return sorted(within, key=lambda c: c[1].get("cost_per_1k_input", 999.0))
+        logger.warning(f"Unknown routing policy {policy!r}; using priority.")
+        return candidates
+
+    def route(
+        self,
+        prompt: str,
+        tier: str = None,
+        input_tokens: Optional[int] = None,
+        policy: Optional[str] = None,
+        p95_budget_s: Optional[float] = None,
+    ) -> Optional[Dict[str, Any]]:
         """
         Selects the best model for the given prompt and requested tier.
         
@@ -58,6 +156,12 @@ class SmartRouter:
             prompt: The input text to be processed.
             tier: Optional tier override (light, standard, advanced). 
                   If None, uses default from settings.
+            input_tokens: Pre-computed token count for ``prompt``, so callers
+                  that already counted it don't pay for a second encode.
+            policy: Routing policy override (``priority``, ``fastest`` or
+                  ``cheapest_under_p95``). Defaults to settings ``routing_policy``.
+            p95_budget_s: Latency budget for ``cheapest_under_p95``. Defaults to
+                  settings ``p95_budget_s``.
         
         Returns:
             Dictionary containing model configuration or None if no match found.
@@ -67,55 +171,30 @@ class SmartRouter:
         # 1. Estimate Token Count
         # We start with a generic provider assumption to get a rough count first
         # Ideally we'd iterate, but input length is static.
-        input_tokens = token_manager.count_tokens(prompt, provider="openai") # standard estimator
+        if input_tokens is None:
+            input_tokens = token_manager.count_tokens(prompt, provider="openai") # standard estimator
         
-        # 2. Filter Candidates
-        candidates = []
-        for model_key, model_def in self.models.items():
-            # Check Tier suitability
-            if not self._tier_matches(model_def.get("tier"), requested_tier):
-                continue
-                
-            # Check Context Window
-            # Leave buffer for output tokens (heuristic: 10% or fixed 2k?)
+        # 2. Filter Candidates (already ranked by priority then cost)
+        candidates = [
+            (model_key, model_def)
+            for model_key, model_def in self._ranked_models()
+            # Check Tier suitability and Context Window
             # For strict routing, input must be < context_window
-            if input_tokens > model_def.get("context_window", 4096):
-                continue
-                
-            candidates.append((model_key, model_def))
-            
+            if self._tier_matches(model_def.get("tier"), requested_tier)
+            and input_tokens <= model_def.get("context_window", 4096)
+        ]
+
         if not candidates:
             logger.warning(f"No suitable models found for tier {requested_tier} with {input_tokens} tokens.")
             return None
-            
-        # 3. Sort by Priority then Cost
-        # Retrieve strict priority list from settings
-        priority_list = self.settings.get("provider_priority", ["gemini", "openai", "ollama", "gh"])
 
-        # Promote the user's configured provider (from agent.yaml) to the front
-        configured_provider = getattr(config, "LLM_PROVIDER", None)
-        if configured_provider and configured_provider in priority_list:
-            priority_list = [configured_provider] + [
-                p for p in priority_list if p != configured_provider
-            ]
-        
-        def sort_key(candidate):
-            model_key, model_def = candidate
-            provider = model_def.get("provider", "").lower()
-            
-            # 1. Priority Index (lower is better)
-            try:
-                p_index = priority_list.index(provider)
-            except ValueError:
-                p_index = len(priority_list)  # Fallback for unknown providers
-                
-            # 2. Cost (secondary factor)
-            cost = model_def.get("cost_per_1k_input", 999.0)
-            
-            return (p_index, cost)
+        # 3. Apply observed health and the routing policy
+        candidates = self._apply_policy(
+            self._healthy(candidates),
+            policy or self.settings.get("routing_policy", "priority"),
+            p95_budget_s if p95_budget_s is not None else self.settings.get("p95_budget_s"),
+        )
 
-        candidates.sort(key=sort_key)
-        
         best_model_key, best_model_def = candidates[0]
         
         logger.info(f"Routed to {best_model_key} (Provider: {best_model_def.get('provider')}, Tier: {best_model_def.get('tier')}, " 
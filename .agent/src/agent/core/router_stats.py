@@ -0,0 +1,145 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Rolling per-model latency and health statistics for the SmartRouter.
+
+``AIService`` records every completion here; :class:`SmartRouter` reads
+the snapshots to skip unhealthy models and apply latency-aware policies.
+"""
+
+import math
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, NamedTuple, Optional, Tuple
+
+DEFAULT_WINDOW = 50
+DEFAULT_MAX_AGE_S = 900.0  # forget samples older than 15 minutes
+DEFAULT_RATE_LIMIT_COOLDOWN_S = 30.0
+
+
+class _Sample(NamedTuple):
+    at: float
+    latency_s: float
+    output_tokens: int
+    ok: bool
+    first_token_s: Optional[float]
+
+
+@dataclass(frozen=True)
+class ModelHealth:
+    """Summary of a model's recent calls."""
+
+    samples: int
+    p50_s: Optional[float]
+    p95_s: Optional[float]
+    tokens_per_s: Optional[float]
+    error_rate: float
+    rate_limited: bool
+
+
+def _percentile(sorted_values: list, fraction: float) -> float:
+    # Nearest-rank percentile; exact enough for a 50-sample window
+    index = max(0, math.ceil(fraction * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+class RouterStats:
+    """Thread-safe rolling window of call outcomes per (provider, model)."""
+
+    def __init__(self, window: Optional[int] = None, max_age_s: float = DEFAULT_MAX_AGE_S,
+                 clock: Callable[[], float] = time.monotonic):
+        self.window = window or int(os.getenv("AGENT_ROUTER_STATS_WINDOW") or DEFAULT_WINDOW)
+        self.max_age_s = max_age_s
+        self._clock = clock
+        self._samples: Dict[Tuple[str, str], Deque[_Sample]] = {}
+        self._limited_until: Dict[Tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, provider: str, model: Optional[str], latency_s: float,
+               output_tokens: int = 0, ok: bool = True,
+               rate_limited_for: Optional[float] = None,
+               first_token_s: Optional[float] = None) -> None:
+        """Add one call outcome.
+
+        Args:
+            first_token_s: Time to the first streamed chunk, for streamed calls.
+            rate_limited_for: Seconds the provider asked us to back off; the
+                model is reported as rate limited until then.
+        """
+        key = (provider, model or "")
+        now = self._clock()
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.window)
+            samples.append(_Sample(now, max(0.0, latency_s), max(0, output_tokens), ok, first_token_s))
+            if rate_limited_for is not None:
+                self._limited_until[key] = now + max(rate_limited_for, 0.0)
+            elif ok:
+                self._limited_until.pop(key, None)
+
+    def health(self, provider: str, model: Optional[str]) -> Optional[ModelHealth]:
+        """Snapshot for ``provider``/``model``, or None when nothing was recorded."""
+        key = (provider, model or "")
+        now = self._clock()
+        with self._lock:
+            samples = self._samples.get(key)
+            while samples and now - samples[0].at > self.max_age_s:
+                samples.popleft()
+            rate_limited = self._limited_until.get(key, 0.0) > now
+            if not samples:
+                return ModelHealth(0, None, None, None, 0.0, True) if rate_limited else None
+            recent = list(samples)
+        ok = [s for s in recent if s.ok]
+        latencies = sorted(s.latency_s for s in ok)
+        busy = sum(s.latency_s for s in ok if s.output_tokens)
+        produced = sum(s.output_tokens for s in ok)
+        return ModelHealth(
+            samples=len(recent),
+            p50_s=_percentile(latencies, 0.50) if latencies else None,
+            p95_s=_percentile(latencies, 0.95) if latencies else None,
+            tokens_per_s=produced / busy if busy > 0 else None,
+            error_rate=1 - len(ok) / len(recent),
+            rate_limited=rate_limited,
+        )
+
+    def percentile(self, provider: str, model: Optional[str], fraction: float,
+                   first_token: bool = False, min_samples: int = 1) -> Optional[float]:
+        """Latency (or time-to-first-token) percentile of recent successful calls.
+
+        Returns None until at least ``min_samples`` values are available.
+        """
+        key = (provider, model or "")
+        now = self._clock()
+        with self._lock:
+            recent = [s for s in self._samples.get(key, ()) if s.ok and now - s.at <= self.max_age_s]
+        values = sorted(
+            s.first_token_s if first_token else s.latency_s
+            for s in recent
+            if not first_token or s.first_token_s is not None
+        )
+        if len(values) < max(1, min_samples):
+            return None
+        return _percentile(values, fraction)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self._limited_until.clear()
+
+
+router_stats = RouterStats()
@@ -0,0 +1,154 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+In-process cache of decrypted secret values.
+
+Plaintext is held in ``bytearray`` buffers that are pinned in RAM with
+``mlock(2)`` where the platform allows it and zeroed on invalidation, so
+cached secrets never reach swap and do not linger after eviction.
+Entries are keyed by service and invalidated whenever the backing
+``{service}.json`` file changes (mtime + size).
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+FileSignature = Tuple[int, int]
+
+_libc: Optional[ctypes.CDLL] = None
+_libc_loaded = False
+
+
+def _get_libc() -> Optional[ctypes.CDLL]:
+    """Load libc once; returns None on platforms without mlock."""
+    global _libc, _libc_loaded
+    if not _libc_loaded:
+        _libc_loaded = True
+        try:
+            name = ctypes.util.find_library("c")
+            lib = ctypes.CDLL(name, use_errno=True) if name else None
+            _libc = lib if lib is not None and hasattr(lib, "mlock") else None
+        except OSError:
+            _libc = None
+    return _libc
+
+
+def _buffer_address(buf: bytearray) -> Tuple[int, int]:
+    """Return (address, length) of a non-empty bytearray."""
+    array = (ctypes.c_char * len(buf)).from_buffer(buf)
+    return ctypes.addressof(array), len(buf)
+
+
+def lock_buffer(buf: bytearray) -> bool:
+    """
+    Best-effort pin of ``buf`` in physical memory.
+
+    Returns True when the pages were locked. Failure (RLIMIT_MEMLOCK,
+    unsupported platform) is not an error: the value is still zeroed on
+    release, it just may be paged out under memory pressure.
+    """
+    libc = _get_libc()
+    if libc is None or not buf:
+        return False
+    try:
+        addr, length = _buffer_address(buf)
+        return libc.mlock(ctypes.c_void_p(addr), ctypes.c_size_t(length)) == 0
+    except Exception:
+        return False
+
+
+def wipe_buffer(buf: bytearray) -> None:
+    """Zero ``buf`` in place and release any mlock on it."""
+    if not buf:
+        return
+    buf[:] = bytes(len(buf))
+    libc = _get_libc()
+    if libc is not None:
+        try:
+            addr, length = _buffer_address(buf)
+            libc.munlock(ctypes.c_void_p(addr), ctypes.c_size_t(length))
+        except Exception:
+            pass
+
+
+def file_signature(path: Path) -> Optional[FileSignature]:
+    """Return the (mtime_ns, size) signature of ``path`` or None if missing."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class SecretCache:
+    """
+    Thread-safe cache of decrypted values keyed by (service, key).
+
+    Each service remembers the signature of the file its values were
+    decrypted from; a lookup with a different signature evicts (and wipes)
+    every cached value for that service.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._signatures: Dict[str, FileSignature] = {}
+        self._values: Dict[str, Dict[str, bytearray]] = {}
+
+    def get(self, service: str, key: str, signature: Optional[FileSignature]) -> Optional[str]:
+        """Return the cached plaintext, or None on miss / stale file."""
+        with self._lock:
+            if signature is None or self._signatures.get(service) != signature:
+                self._evict_locked(service)
+                return None
+            buf = self._values.get(service, {}).get(key)
+            return buf.decode("utf-8") if buf is not None else None
+
+    def put(self, service: str, key: str, signature: Optional[FileSignature], value: str) -> None:
+        """Store ``value`` for the file version identified by ``signature``."""
+        if signature is None:
+            return
+        with self._lock:
+            if self._signatures.get(service) != signature:
+                self._evict_locked(service)
+                self._signatures[service] = signature
+            buf = bytearray(value.encode("utf-8"))
+            lock_buffer(buf)
+            previous = self._values.setdefault(service, {}).get(key)
+            if previous is not None:
+                wipe_buffer(previous)
+            self._values[service][key] = buf
+
+    def invalidate(self, service: Optional[str] = None) -> None:
+        """Wipe one service, or every service when ``service`` is None."""
+        with self._lock:
+            services = [service] if service else list(self._values)
+            for svc in services:
+                self._evict_locked(svc)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(v) for v in self._values.values())
+
+    def _evict_locked(self, service: str) -> None:
+        for buf in self._values.pop(service, {}).values():
+            wipe_buffer(buf)
+        self._signatures.pop(service, None)
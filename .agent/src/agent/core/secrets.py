@@ -32,6 +32,8 @@ from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
+from agent.core.secret_cache import SecretCache, file_signature
+
 logger = logging.getLogger(__name__)
 
 # PBKDF2 configuration - 100,000 iterations per security standards
@@ -109,6 +111,8 @@ class SecretManager:
         self.config_file = self.secrets_dir / "config.json"
         self._master_key: Optional[bytes] = None
         self._salt: Optional[bytes] = None
+        # Decrypted values, invalidated by service file mtime/size
+        self._cache = SecretCache()
     
     def is_initialized(self) -> bool:
         """Check if secret management is initialized."""
@@ -259,6 +263,7 @@ class SecretManager:
             # 8. Update In-Memory State
             self._salt = new_salt
             self._master_key = new_master_key
+            self._cache.invalidate()
             
             self._log_operation("rotate_key", "system", "all", "success")
             
@@ -286,7 +291,65 @@ class SecretManager:
         
         # Derive key
         self._master_key = self._derive_key(master_password, self._salt)
-        
+        self._cache.invalidate()
+        self._verify_master_key()
+
+    def unlock_from_agent(self, socket_path: Optional[Path] = None) -> bool:
+        """
+        Unlock with a key held by a running unlock agent, skipping PBKDF2.
+
+        Returns False (leaving the manager locked) when no agent is running,
+        the agent holds a key for a different salt, or the key is rejected.
+        """
+        from agent.core import unlock_agent
+
+        if not self.is_initialized() or not unlock_agent.is_supported():
+            return False
+        salt = base64.b64decode(self._load_json(self.config_file)["salt"])
+        path = socket_path or unlock_agent.default_socket_path(self.secrets_dir)
+        key = unlock_agent.request_key(salt, path)
+        if key is None:
+            return False
+
+        self._salt = salt
+        self._master_key = key
+        self._cache.invalidate()
+        try:
+            self._verify_master_key()
+        except InvalidPasswordError:
+            self._log_operation("unlock", "system", "agent", "failure")
+            return False
+        self._log_operation("unlock", "system", "agent", "success")
+        return True
+
+    def start_unlock_agent(self, ttl: int, socket_path: Optional[Path] = None) -> int:
+        """Hand the derived key to a detached unlock agent for ``ttl`` seconds."""
+        from agent.core import unlock_agent
+
+        if not self.is_unlocked() or self._salt is None:
+            raise SecretManagerError("Secret manager not unlocked")
+        path = socket_path or unlock_agent.default_socket_path(self.secrets_dir)
+        pid = unlock_agent.start_agent(self._master_key, self._salt, path, ttl=ttl)
+        self._log_operation("agent_start", "system", "master_key", "success")
+        return pid
+
+    def stop_unlock_agent(self, socket_path: Optional[Path] = None) -> bool:
+        """Stop a running unlock agent. Returns False if none was running."""
+        from agent.core import unlock_agent
+
+        path = socket_path or unlock_agent.default_socket_path(self.secrets_dir)
+        stopped = unlock_agent.stop_agent(path)
+        if stopped:
+            self._log_operation("agent_stop", "system", "master_key", "success")
+        return stopped
+
+    def lock(self) -> None:
+        """Forget the master key and wipe every cached decrypted value."""
+        self._master_key = None
+        self._cache.invalidate()
+
+    def _verify_master_key(self) -> None:
+        """Check the in-memory key against the first stored secret."""
         # Verify password by trying to load and decrypt existing secrets
         # If there are no secrets yet, we can't verify, so we trust the user
         for service_file in self.secrets_dir.glob("*.json"):
@@ -401,6 +464,7 @@ class SecretManager:
         secrets[key]["updated_at"] = datetime.now(UTC).isoformat()
         
         self._save_service_secrets(service, secrets)
+        self._cache.invalidate(service)
         self._log_operation("set", service, key, "success")
     
     def has_secret(self, service: str, key: str) -> bool:
@@ -422,10 +486,19 @@ class SecretManager:
         """
         # Try secret manager first
         if self.is_unlocked():
+            # Stat before reading so a concurrent rewrite can only make the
+            # cached entry look stale, never fresh.
+            signature = file_signature(self._get_service_file(service))
+            cached = self._cache.get(service, key, signature)
+            if cached is not None:
+                self._log_operation("get", service, key, "success")
+                return cached
+
             secrets = self._load_service_secrets(service)
             if key in secrets:
                 try:
                     value = self._decrypt_value(secrets[key])
+                    self._cache.put(service, key, signature, value)
                     self._log_operation("get", service, key, "success")
                     return value
                 except Exception as e:
@@ -480,6 +553,7 @@ class SecretManager:
             return False
         
         del secrets[key]
+        self._cache.invalidate(service)
         
         if secrets:
             self._save_service_secrets(service, secrets)
@@ -567,14 +641,24 @@ def get_secret_manager() -> SecretManager:
     Get or create the global SecretManager instance.
     
     Automatically attempts to unlock using:
-    1. System Keyring (secure local storage)
-    2. AGENT_MASTER_KEY (CI/CD override)
+    1. Unlock agent (key cached by 'agent secret unlock', no KDF cost)
+    2. System Keyring (secure local storage)
+    3. AGENT_MASTER_KEY (CI/CD override)
     """
     global _secret_manager
     if _secret_manager is None:
         _secret_manager = SecretManager()
-        
-        # 1. Try Keyring (Secure Local)
+
+        # 1. Try the unlock agent
+        if _secret_manager.is_initialized():
+            try:
+                if _secret_manager.unlock_from_agent():
+                    logger.info("Secret manager auto-unlocked via unlock agent")
+                    return _secret_manager
+            except Exception as e:
+                logger.warning(f"Unlock agent access failed: {e}")
+
+        # 2. Try Keyring (Secure Local)
         # AGENT_SKIP_KEYRING=1 disables keychain access in tests/CI to prevent
         # macOS keychain dialogs that block unattended runs.
         _skip_keyring = os.getenv("AGENT_SKIP_KEYRING", "").strip() in ("1", "true", "yes")
@@ -595,7 +679,7 @@ def get_secret_manager() -> SecretManager:
             except Exception as e:
                 logger.warning(f"Keyring access failed: {e}")
 
-        # 2. Try Env Var (CI/CD)
+        # 3. Try Env Var (CI/CD)
         master_key = os.getenv("AGENT_MASTER_KEY")
         if master_key and _secret_manager.is_initialized() and not _secret_manager.is_unlocked():
             try:
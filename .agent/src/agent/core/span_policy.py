@@ -0,0 +1,155 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Attribute size caps and per-span-name sampling for the tracing pipeline.
+
+Configured from the environment so it can be tuned without code changes:
+
+- ``AGENT_TRACE_ATTR_MAX_CHARS``: default cap for any string attribute
+  (``0`` disables capping). Defaults to 4096.
+- ``AGENT_TRACE_ATTR_CAPS``: per-attribute overrides,
+  e.g. ``llm_response=2048,parsed_result=512``.
+- ``AGENT_TRACE_SAMPLING``: per-span-name sampling rates using glob
+  patterns, first match wins, e.g. ``agent.parse=0.1,tool.*=0.5``.
+"""
+
+import fnmatch
+import hashlib
+import os
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from opentelemetry.sdk.trace.sampling import (
+    ALWAYS_ON,
+    Decision,
+    ParentBased,
+    Sampler,
+    SamplingResult,
+)
+
+from agent.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_ATTR_CHARS = 4096
+TRUNCATION_PREFIX_CHARS = 256
+
+
+def _parse_pairs(raw: str) -> List[Tuple[str, str]]:
+    """Parse ``a=1,b=2`` into ordered (key, value) pairs, skipping junk."""
+    pairs = []
+    for item in raw.split(","):
+        key, sep, value = item.strip().partition("=")
+        if sep and key.strip() and value.strip():
+            pairs.append((key.strip(), value.strip()))
+    return pairs
+
+
+@dataclass(frozen=True)
+class SpanPolicy:
+    """Size caps and sampling rules applied to every span."""
+
+    max_attr_chars: int = DEFAULT_MAX_ATTR_CHARS
+    attr_caps: Dict[str, int] = field(default_factory=dict)
+    sampling_rules: Tuple[Tuple[str, float], ...] = ()
+
+    @classmethod
+    def from_env(cls) -> "SpanPolicy":
+        """Build the policy from ``AGENT_TRACE_*`` environment variables."""
+        max_chars = DEFAULT_MAX_ATTR_CHARS
+        raw_max = os.getenv("AGENT_TRACE_ATTR_MAX_CHARS")
+        if raw_max:
+            try:
+                max_chars = int(raw_max)
+            except ValueError:
+                logger.warning(f"Ignoring invalid AGENT_TRACE_ATTR_MAX_CHARS={raw_max!r}")
+
+        caps: Dict[str, int] = {}
+        for key, value in _parse_pairs(os.getenv("AGENT_TRACE_ATTR_CAPS", "")):
+            try:
+                caps[key] = int(value)
+            except ValueError:
+                logger.warning(f"Ignoring invalid attribute cap {key}={value!r}")
+
+        rules = []
+        for pattern, value in _parse_pairs(os.getenv("AGENT_TRACE_SAMPLING", "")):
+            try:
+                rules.append((pattern, min(max(float(value), 0.0), 1.0)))
+            except ValueError:
+                logger.warning(f"Ignoring invalid sampling rate {pattern}={value!r}")
+
+        return cls(max_attr_chars=max_chars, attr_caps=caps, sampling_rules=tuple(rules))
+
+    def cap_for(self, key: str) -> int:
+        """Return the character cap for ``key`` (0 means unlimited)."""
+        return self.attr_caps.get(key, self.max_attr_chars)
+
+    def sample_rate(self, span_name: str) -> Optional[float]:
+        """Return the rate of the first rule matching ``span_name``, if any."""
+        for pattern, rate in self.sampling_rules:
+            if fnmatch.fnmatchcase(span_name, pattern):
+                return rate
+        return None
+
+
+def truncate_value(value: str, cap: int) -> str:
+    """
+    Cap ``value`` at roughly ``cap`` characters.
+
+    Oversized values keep a short prefix plus the original length and a
+    SHA-256 digest, so identical payloads can still be correlated across
+    spans without shipping them. Scrub sensitive values before capping
+    them, so neither the prefix nor the digest covers a raw secret.
+    """
+    if cap <= 0 or len(value) <= cap:
+        return value
+    digest = hashlib.sha256(value.encode("utf-8", "surrogatepass")).hexdigest()[:16]
+    prefix = value[:min(TRUNCATION_PREFIX_CHARS, cap)]
+    return f"{prefix}…[truncated {len(value)} chars sha256:{digest}]"
+
+
+class SpanNameSampler(Sampler):
+    """
+    Head sampler applying per-span-name rates from a ``SpanPolicy``.
+
+    Spans without a matching rule defer to ``ParentBased(ALWAYS_ON)``, so
+    the default behaviour (record everything) is unchanged.
+    """
+
+    def __init__(self, policy: SpanPolicy, fallback: Optional[Sampler] = None) -> None:
+        self._policy = policy
+        self._fallback = fallback or ParentBased(ALWAYS_ON)
+
+    def should_sample(
+        self,
+        parent_context,
+        trace_id: int,
+        name: str,
+        kind=None,
+        attributes=None,
+        links: Optional[Sequence] = None,
+        trace_state=None,
+    ) -> SamplingResult:
+        rate = self._policy.sample_rate(name)
+        if rate is None:
+            return self._fallback.should_sample(
+                parent_context, trace_id, name, kind, attributes, links, trace_state
+            )
+        decision = Decision.RECORD_AND_SAMPLE if random.random() < rate else Decision.DROP
+        return SamplingResult(decision, attributes if decision != Decision.DROP else None)
+
+    def get_description(self) -> str:
+        return f"SpanNameSampler{{rules={len(self._policy.sampling_rules)}}}"
@@ -23,14 +23,15 @@ import os
 import time
 import functools
 import logging
-from typing import Any, Dict, Optional, Callable, TypeVar, Coroutine, ParamSpec
+from typing import Any, Dict, Optional, Callable, Sequence, TypeVar, Coroutine, ParamSpec
 from opentelemetry import trace
 from opentelemetry.sdk.trace import TracerProvider, ReadableSpan
-from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter, SpanExportResult
 from opentelemetry.sdk.resources import Resource
 
 from agent.core.security import scrub_sensitive_data
 from agent.core.logger import get_logger
+from agent.core.span_policy import SpanNameSampler, SpanPolicy, truncate_value
 
 logger = get_logger(__name__)
 
@@ -48,44 +49,133 @@ _PII_SENSITIVE_KEYS = frozenset({
 })
 
 # Substrings — any attribute key containing these is also scrubbed
-_PII_SENSITIVE_SUBSTRINGS = ("prompt", "completion", "input", "output")
+_PII_SENSITIVE_SUBSTRINGS = ("prompt", "completion", "input", "output", "response")
 
 _TRACER_NAME = "agentic-infra"
 _INITIALIZED = False
 
 
-class PiiScrubbingSpanProcessor:
+def _is_sensitive(key: str) -> bool:
+    """Return True if the attribute key should be scrubbed."""
+    if key in _PII_SENSITIVE_KEYS:
+        return True
+    key_lower = key.lower()
+    return any(sub in key_lower for sub in _PII_SENSITIVE_SUBSTRINGS)
+
+
+def _rewrite_string_attributes(span: ReadableSpan, rewrite: Callable[[str, str], str]) -> None:
+    """
+    Apply ``rewrite(key, value)`` to every string attribute of an ended span.
+
+    Ended spans expose a read-only mapping, so changed values are written
+    back by replacing the span's internal attribute dict.
     """
-    SpanProcessor that scrubs PII from span attributes before export.
+    if not span.attributes:
+        return
+    changed: Dict[str, str] = {}
+    for key, value in span.attributes.items():
+        if isinstance(value, str):
+            new_value = rewrite(key, value)
+            if new_value != value:
+                changed[key] = new_value
+    if not changed:
+        return
+    try:
+        for key, value in changed.items():
+            span.attributes[key] = value
+    except TypeError:
+        # ReadableSpan uses a MappingProxyType — patch internals
+        attrs = dict(span.attributes)
+        attrs.update(changed)
+        object.__setattr__(span, "_attributes", attrs)
+
 
-    Ensures that all exported spans have sensitive attributes
-    (prompts, completions, inputs, outputs) run through
-    ``scrub_sensitive_data`` regardless of whether the calling code
-    remembered to scrub manually.
+def _scrub_span(span: ReadableSpan, policy: Optional[SpanPolicy] = None) -> None:
+    """
+    Run ``scrub_sensitive_data`` over the span's sensitive attributes.
+
+    With a ``policy`` the scrubbed values are then capped. Scrubbing must
+    come first: a cut through a secret leaves a fragment no pattern matches.
+    """
+    def _rewrite(key: str, value: str) -> str:
+        if not _is_sensitive(key):
+            return value
+        value = scrub_sensitive_data(value)
+        return truncate_value(value, policy.cap_for(key)) if policy else value
+
+    _rewrite_string_attributes(span, _rewrite)
+
+
+class PiiScrubbingSpanExporter(SpanExporter):
+    """
+    SpanExporter wrapper that scrubs PII in the export worker thread.
+
+    Paired with ``BatchSpanProcessor`` this moves the regex passes of
+    ``scrub_sensitive_data`` off the thread that ends the span. Sensitive
+    attributes reach it uncapped and are capped here, after scrubbing,
+    according to ``policy``.
+    """
+
+    def __init__(self, next_exporter: SpanExporter, policy: Optional[SpanPolicy] = None) -> None:
+        """Wrap an existing exporter, scrubbing (then capping) each batch before export."""
+        self._next = next_exporter
+        self._policy = policy or SpanPolicy()
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        """Scrub and cap every span in the batch then forward it."""
+        for span in spans:
+            _scrub_span(span, self._policy)
+        return self._next.export(spans)
+
+    def shutdown(self) -> None:
+        """Shutdown the wrapped exporter."""
+        self._next.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Flush the wrapped exporter."""
+        return self._next.force_flush(timeout_millis)
+
+
+class PiiScrubbingSpanProcessor:
+    """
+    SpanProcessor that caps and scrubs span attributes before export.
+
+    On span end string attributes are capped according to the
+    ``SpanPolicy`` (cheap: a length check, plus prefix + hash for oversized
+    values). Sensitive attributes are scrubbed before they are capped.
+    Scrubbing runs inline by default; pass ``scrub_inline=False`` when the
+    wrapped processor exports through a ``PiiScrubbingSpanExporter``, which
+    then scrubs and caps the sensitive attributes in the export worker.
     """
 
-    def __init__(self, next_processor: BatchSpanProcessor) -> None:
-        """Wrap an existing processor, scrubbing spans before forwarding."""
+    def __init__(
+        self,
+        next_processor: BatchSpanProcessor,
+        policy: Optional[SpanPolicy] = None,
+        scrub_inline: bool = True,
+    ) -> None:
+        """Wrap an existing processor, capping (and scrubbing) spans before forwarding."""
         self._next = next_processor
+        self._policy = policy or SpanPolicy()
+        self._scrub_inline = scrub_inline
 
     def on_start(self, span: ReadableSpan, parent_context: object = None) -> None:
         """Forward span start to the next processor."""
         self._next.on_start(span, parent_context)
 
     def on_end(self, span: ReadableSpan) -> None:
-        """Scrub PII-sensitive attributes then forward to the next processor."""
-        if span.attributes:
-            for key, value in list(span.attributes.items()):
-                if isinstance(value, str) and self._is_sensitive(key):
-                    # Mutate in-place where possible; for immutable mappings
-                    # fall back to patching the internal dict.
-                    try:
-                        span.attributes[key] = scrub_sensitive_data(value)
-                    except TypeError:
-                        # ReadableSpan uses a MappingProxyType — patch internals
-                        attrs = dict(span.attributes)
-                        attrs[key] = scrub_sensitive_data(value)
-                        object.__setattr__(span, "_attributes", attrs)
+        """Cap attribute sizes, optionally scrub, then forward to the next processor."""
+        policy = self._policy
+        scrub = self._scrub_inline
+
+        def _rewrite(key: str, value: str) -> str:
+            if _is_sensitive(key):
+                if not scrub:
+                    return value  # scrubbed, then capped, by the exporter
+                value = scrub_sensitive_data(value)
+            return truncate_value(value, policy.cap_for(key))
+
+        _rewrite_string_attributes(span, _rewrite)
         self._next.on_end(span)
 
     def shutdown(self) -> None:
@@ -99,10 +189,7 @@ class PiiScrubbingSpanProcessor:
     @staticmethod
     def _is_sensitive(key: str) -> bool:
         """Return True if the attribute key should be scrubbed."""
-        if key in _PII_SENSITIVE_KEYS:
-            return True
-        key_lower = key.lower()
-        return any(sub in key_lower for sub in _PII_SENSITIVE_SUBSTRINGS)
+        return _is_sensitive(key)
 
 
 def initialize_telemetry() -> None:
@@ -110,8 +197,10 @@ def initialize_telemetry() -> None:
     Initialize the OpenTelemetry TracerProvider and OTLP Exporter.
 
     Configures the exporter to point to Langfuse or a generic OTLP collector.
-    Wraps the exporter with a ``PiiScrubbingSpanProcessor`` to ensure all
-    exported spans have sensitive attributes scrubbed.
+    ``PiiScrubbingSpanProcessor`` caps plain attributes on span end, and
+    ``PiiScrubbingSpanExporter`` scrubs then caps sensitive ones in the
+    batch worker; span-name
+    sampling rules come from ``SpanPolicy.from_env``.
     Fails gracefully if configuration is missing.
     """
     global _INITIALIZED
@@ -128,17 +217,18 @@ def initialize_telemetry() -> None:
         logger.warning("OTEL_EXPORTER_OTLP_ENDPOINT not set. Tracing will be inactive.")
         return
 
+    policy = SpanPolicy.from_env()
     resource = Resource.create({"service.name": "agentic-service"})
-    provider = TracerProvider(resource=resource)
+    provider = TracerProvider(resource=resource, sampler=SpanNameSampler(policy))
 
     # Langfuse expects OTLP traces. Headers should be set via environment variables.
     # OTEL_EXPORTER_OTLP_HEADERS="Authorization=Basic <base64>"
     from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter  # ADR-025: lazy import
-    exporter = OTLPSpanExporter(endpoint=otlp_endpoint)
+    exporter = PiiScrubbingSpanExporter(OTLPSpanExporter(endpoint=otlp_endpoint), policy=policy)
     batch_processor = BatchSpanProcessor(exporter)
 
-    # Wrap with PII scrubbing so every exported span is clean
-    pii_processor = PiiScrubbingSpanProcessor(batch_processor)
+    # Cap plain attributes on span end; sensitive ones are scrubbed and capped in the export worker
+    pii_processor = PiiScrubbingSpanProcessor(batch_processor, policy=policy, scrub_inline=False)
     provider.add_span_processor(pii_processor)
 
     trace.set_tracer_provider(provider)
@@ -13,9 +13,15 @@
 # limitations under the License.
 
 import logging
+import threading
+from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
+# Recent tiktoken results; the same prompt is typically counted by the
+# router, the usage estimator and budget checks within one call.
+_COUNT_MEMO_SIZE = 128
+
 class TokenManager:
     """
     Manages token counting for various AI models.
@@ -23,6 +29,8 @@ class TokenManager:
     """
     def __init__(self):
         self._encoding_cache = {}
+        self._count_memo: "OrderedDict[tuple, int]" = OrderedDict()
+        self._memo_lock = threading.Lock()
 
     def count_tokens(self, text: str, provider: str = "openai", model_name: str = "gpt-4o") -> int:
         """
@@ -56,14 +64,26 @@ class TokenManager:
             return len(text) // 4
 
     def _count_openai(self, text: str, model_name: str) -> int:
+        # Key on a hash rather than the text so large prompts aren't retained
+        memo_key = (model_name, len(text), hash(text))
+        with self._memo_lock:
+            cached = self._count_memo.get(memo_key)
+            if cached is not None:
+                self._count_memo.move_to_end(memo_key)
+                return cached
         try:
             # Map common names to encodings if needed, or rely on tiktoken's auto-detect
             # for 'gpt-4o', tiktoken usually knows it.
             encoding = self._get_encoding(model_name)
-            return len(encoding.encode(text))
+            count = len(encoding.encode(text))
         except Exception as e:
             logger.warning(f"Failed to count tokens with tiktoken: {e}. using heuristic.")
             return len(text) // 4
+        with self._memo_lock:
+            self._count_memo[memo_key] = count
+            if len(self._count_memo) > _COUNT_MEMO_SIZE:
+                self._count_memo.popitem(last=False)
+        return count
 
     def _get_encoding(self, model_name: str):
         if model_name in self._encoding_cache:
@@ -0,0 +1,301 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+ssh-agent style unlock agent for the SecretManager.
+
+``agent secret unlock`` derives the master key once and hands it to a
+detached helper process that serves it over a user-only Unix socket until
+its TTL expires. Short-lived CLI processes ask the agent for the key
+instead of paying the PBKDF2 cost on every start. The agent only answers
+requests whose salt matches the one the key was derived with, so a
+rotated password invalidates it implicitly.
+
+Protocol: one JSON object per connection, newline-terminated, in each
+direction. Operations are ``get_key``, ``status`` and ``stop``.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import select
+import socket
+import stat
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from agent.core.secret_cache import lock_buffer, wipe_buffer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_UNLOCK_TTL = 900  # seconds
+SOCKET_ENV_VAR = "AGENT_UNLOCK_SOCK"
+_IO_TIMEOUT = 2.0
+_MAX_MESSAGE = 4096
+
+
+def is_supported() -> bool:
+    """Unix domain sockets are required; Windows falls back to keyring/env."""
+    return hasattr(socket, "AF_UNIX") and hasattr(os, "getuid")
+
+
+def default_socket_path(secrets_dir: Path) -> Path:
+    """
+    Resolve the agent socket for a secrets directory.
+
+    ``AGENT_UNLOCK_SOCK`` overrides the default, which lives in a private
+    per-user directory (``XDG_RUNTIME_DIR``, else ``agent-unlock-<uid>``
+    under the system temp dir, short enough for the 104/108 byte
+    ``sun_path`` limit) and is namespaced by secrets directory.
+    """
+    override = os.getenv(SOCKET_ENV_VAR)
+    if override:
+        return Path(override)
+    digest = hashlib.sha256(str(Path(secrets_dir).resolve()).encode("utf-8")).hexdigest()[:12]
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        base = Path(runtime_dir)
+    else:
+        base = Path(tempfile.gettempdir()) / f"agent-unlock-{uid}"
+    return base / f"agent-unlock-{digest}.sock"
+
+
+def _socket_is_trusted(socket_path: Path) -> bool:
+    """
+    Only talk to a socket this user created with mode 0600.
+
+    The server checks its peer, but a client that connected to a socket
+    planted by another user would accept whatever key it handed out.
+    """
+    try:
+        st = socket_path.lstat()
+    except OSError:
+        return False
+    if not stat.S_ISSOCK(st.st_mode) or st.st_uid != os.getuid() \
+            or stat.S_IMODE(st.st_mode) != stat.S_IRUSR | stat.S_IWUSR:
+        logger.warning(f"Ignoring unlock agent socket {socket_path}: not a 0600 socket owned by this user")
+        return False
+    return True
+
+
+def _prepare_socket_dir(socket_path: Path) -> None:
+    """Create the socket's directory as 0700 and refuse one owned by someone else."""
+    parent = socket_path.parent
+    try:
+        parent.mkdir(mode=stat.S_IRWXU, parents=True)
+    except FileExistsError:
+        pass
+    st = parent.lstat()
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid():
+        raise OSError(f"Unlock agent directory {parent} is not a directory owned by this user")
+    if stat.S_IMODE(st.st_mode) & (stat.S_IWGRP | stat.S_IWOTH) and not st.st_mode & stat.S_ISVTX:
+        raise OSError(f"Unlock agent directory {parent} is writable by other users")
+
+
+def _send(conn: socket.socket, payload: Dict[str, Any]) -> None:
+    conn.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+
+
+def _recv(conn: socket.socket) -> Dict[str, Any]:
+    data = b""
+    while not data.endswith(b"\n") and len(data) < _MAX_MESSAGE:
+        chunk = conn.recv(_MAX_MESSAGE)
+        if not chunk:
+            break
+        data += chunk
+    return json.loads(data.decode("utf-8")) if data.strip() else {}
+
+
+def _peer_is_owner(conn: socket.socket) -> bool:
+    """Reject peers running as another user where the OS exposes credentials."""
+    peercred = getattr(socket, "SO_PEERCRED", None)
+    if peercred is None:
+        return True  # Socket mode 0600 is the only guard on this platform
+    creds = conn.getsockopt(socket.SOL_SOCKET, peercred, struct.calcsize("3i"))
+    _pid, uid, _gid = struct.unpack("3i", creds)
+    return uid == os.getuid()
+
+
+def _request(socket_path: Path, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Send one request to the agent; returns None if no agent is listening."""
+    if not is_supported() or not socket_path.exists() or not _socket_is_trusted(socket_path):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(_IO_TIMEOUT)
+            conn.connect(str(socket_path))
+            _send(conn, payload)
+            return _recv(conn)
+    except (OSError, ValueError) as e:
+        logger.debug(f"Unlock agent unavailable at {socket_path}: {e}")
+        return None
+
+
+def request_key(salt: bytes, socket_path: Path) -> Optional[bytes]:
+    """Fetch the derived master key for ``salt`` from a running agent."""
+    response = _request(socket_path, {"op": "get_key", "salt": base64.b64encode(salt).decode("ascii")})
+    if not response or "key" not in response:
+        return None
+    return base64.b64decode(response["key"])
+
+
+def agent_status(socket_path: Path) -> Optional[Dict[str, Any]]:
+    """Return ``{"pid": ..., "expires_at": ...}`` or None if no agent runs."""
+    response = _request(socket_path, {"op": "status"})
+    return response if response and "expires_at" in response else None
+
+
+def stop_agent(socket_path: Path) -> bool:
+    """Ask a running agent to wipe its key and exit."""
+    response = _request(socket_path, {"op": "stop"})
+    return bool(response and response.get("ok"))
+
+
+def start_agent(key: bytes, salt: bytes, socket_path: Path, ttl: int = DEFAULT_UNLOCK_TTL) -> int:
+    """
+    Spawn a detached agent holding ``key`` for ``ttl`` seconds.
+
+    The key travels over the child's stdin, never argv or the environment.
+    Any agent already bound to ``socket_path`` is replaced. Returns the pid.
+    """
+    if not is_supported():
+        raise OSError("Unlock agent requires Unix domain socket support")
+    stop_agent(socket_path)
+
+    # Make this package importable in the child regardless of how we were launched
+    src_root = str(Path(__file__).resolve().parents[2])
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (src_root, env.get("PYTHONPATH")) if p)
+
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "agent.core.unlock_agent", "--socket", str(socket_path), "--ttl", str(int(ttl))],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+        close_fds=True,
+        env=env,
+    )
+    handoff = json.dumps({
+        "key": base64.b64encode(key).decode("ascii"),
+        "salt": base64.b64encode(salt).decode("ascii"),
+    }).encode("utf-8")
+    proc.stdin.write(handoff)
+    proc.stdin.close()
+
+    deadline = time.monotonic() + 5.0
+    while time.monotonic() < deadline:
+        if agent_status(socket_path):
+            return proc.pid
+        if proc.poll() is not None:
+            break
+        time.sleep(0.05)
+    raise OSError(f"Unlock agent failed to start on {socket_path}")
+
+
+def serve(key: bytes, salt: bytes, socket_path: Path, ttl: int) -> None:
+    """
+    Serve ``key`` on ``socket_path`` until ``ttl`` elapses or ``stop``.
+
+    The key is kept in an mlocked buffer and wiped before exit; the socket
+    file is created with mode 0600 in a directory only this user can write
+    to, and removed on shutdown.
+    """
+    _prepare_socket_dir(socket_path)
+    key_buf = bytearray(key)
+    lock_buffer(key_buf)
+    salt_b64 = base64.b64encode(salt).decode("ascii")
+    expires_at = time.time() + ttl
+
+    if socket_path.exists() and stat.S_ISSOCK(socket_path.stat().st_mode):
+        socket_path.unlink()
+
+    old_umask = os.umask(0o177)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(str(socket_path))
+    finally:
+        os.umask(old_umask)
+    os.chmod(socket_path, stat.S_IRUSR | stat.S_IWUSR)
+    server.listen(8)
+
+    try:
+        while True:
+            remaining = expires_at - time.time()
+            if remaining <= 0:
+                break
+            readable, _, _ = select.select([server], [], [], remaining)
+            if not readable:
+                continue
+            conn, _ = server.accept()
+            with conn:
+                conn.settimeout(_IO_TIMEOUT)
+                try:
+                    if not _peer_is_owner(conn):
+                        _send(conn, {"error": "permission denied"})
+                        continue
+                    message = _recv(conn)
+                    op = message.get("op")
+                    if op == "get_key":
+                        if message.get("salt") != salt_b64:
+                            _send(conn, {"error": "salt mismatch"})
+                        else:
+                            _send(conn, {"key": base64.b64encode(bytes(key_buf)).decode("ascii"), "expires_at": expires_at})
+                    elif op == "status":
+                        _send(conn, {"pid": os.getpid(), "expires_at": expires_at})
+                    elif op == "stop":
+                        _send(conn, {"ok": True})
+                        break
+                    else:
+                        _send(conn, {"error": f"unknown op: {op}"})
+                except (OSError, ValueError) as e:
+                    logger.debug(f"Unlock agent request failed: {e}")
+    finally:
+        wipe_buffer(key_buf)
+        server.close()
+        try:
+            socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Entry point for the detached agent process (``python -m``)."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Agent secret unlock agent")
+    parser.add_argument("--socket", required=True)
+    parser.add_argument("--ttl", type=int, default=DEFAULT_UNLOCK_TTL)
+    args = parser.parse_args(argv)
+
+    handoff = json.loads(sys.stdin.read())
+    serve(
+        base64.b64decode(handoff["key"]),
+        base64.b64decode(handoff["salt"]),
+        Path(args.socket),
+        args.ttl,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
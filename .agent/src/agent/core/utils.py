@@ -17,7 +17,6 @@ import logging
 
 logger = logging.getLogger(__name__)
 import json
-import subprocess
 from pathlib import Path
 from typing import Optional
 
@@ -26,6 +25,7 @@ from rich.console import Console
 from rich.prompt import Prompt
 
 from agent.core.config import config
+from agent.core.git_state import git_state
 
 console = Console()
 
@@ -128,7 +128,7 @@ def sanitize_title(title: str) -> str:
 
 def get_current_branch():
     try:
-        return subprocess.check_output(["git", "branch", "--show-current"]).decode().strip()
+        return git_state.branch()
     except Exception:
         return ""
 
@@ -177,12 +177,10 @@ def find_story_file(story_id: str) -> Optional[Path]:
     """
     if not story_id:
         return None
-        
-    for file_path in config.stories_dir.rglob(f"{story_id}*.md"):
-        # Ensure it matches the ID prefix strictly to avoid partial matches if intended
-        if file_path.name.startswith(story_id):
-            return file_path
-    return None
+
+    from agent.db.artifact_catalog import get_catalog
+
+    return get_catalog().find("story", config.stories_dir, story_id)
 
     return context
 
@@ -243,6 +241,22 @@ def find_runbook_file(runbook_id: str) -> Optional[Path]:
             return file_path
     return None
 
+_SCRUB_PATTERNS = {
+    # Local part must start with alphanumeric to avoid matching git diff line
+    # prefixes (+ / -) before Python decorators like +@pytest.mark.asyncio.
+    "EMAIL": r"[a-zA-Z0-9][a-zA-Z0-9_.+-]*@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+",
+    # Simple IP regex, avoiding loopback/local matches might be too complex for a single regex,
+    # so we redact all IPv4-looking strings to be safe foundation models don't ingest infrastructure IPs.
+    "IP": r"\b(?:\d{1,3}\.){3}\d{1,3}\b",
+    "OPENAI_KEY": r"sk-[a-zA-Z0-9]{20,}",
+    "GITHUB_KEY": r"ghp_[a-zA-Z0-9]{20,}",
+    "GOOGLE_KEY": r"AIza[0-9A-Za-z-_]{35}",
+    "PRIVATE_KEY": r"-----BEGIN [A-Z]+ PRIVATE KEY-----",
+}
+# Compiled once; scrubbing runs for every artifact written to agent.db
+_SCRUB_COMPILED = [(re.compile(pattern), f"[REDACTED:{label}]") for label, pattern in _SCRUB_PATTERNS.items()]
+
+
 def scrub_sensitive_data(text: str) -> str:
     """
     Scrub sensitive data (PII, Secrets) from text using regex patterns.
@@ -251,22 +265,9 @@ def scrub_sensitive_data(text: str) -> str:
     if not text:
         return ""
 
-    patterns = {
-        # Local part must start with alphanumeric to avoid matching git diff line
-        # prefixes (+ / -) before Python decorators like +@pytest.mark.asyncio.
-        "EMAIL": r"[a-zA-Z0-9][a-zA-Z0-9_.+-]*@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+",
-        # Simple IP regex, avoiding loopback/local matches might be too complex for a single regex,
-        # so we redact all IPv4-looking strings to be safe foundation models don't ingest infrastructure IPs.
-        "IP": r"\b(?:\d{1,3}\.){3}\d{1,3}\b",
-        "OPENAI_KEY": r"sk-[a-zA-Z0-9]{20,}",
-        "GITHUB_KEY": r"ghp_[a-zA-Z0-9]{20,}",
-        "GOOGLE_KEY": r"AIza[0-9A-Za-z-_]{35}",
-        "PRIVATE_KEY": r"-----BEGIN [A-Z]+ PRIVATE KEY-----",
-    }
-    
     scrubbed_text = text
-    for label, pattern in patterns.items():
-        scrubbed_text = re.sub(pattern, f"[REDACTED:{label}]", scrubbed_text)
+    for pattern, replacement in _SCRUB_COMPILED:
+        scrubbed_text = pattern.sub(replacement, scrubbed_text)
         
     return scrubbed_text
 
@@ -284,22 +285,12 @@ def find_best_matching_story(files: str) -> Optional[str]:
     from agent.core.ai import ai_service
     
     # 1. Gather Stories
+    from agent.db.artifact_catalog import get_catalog
+
     stories_context = ""
-    for file_path in config.stories_dir.rglob("*.md"):
-        title = "Unknown"
-        state = "UNKNOWN"
-        try:
-             # Fast read headers
-             content = file_path.read_text(errors="ignore")
-             t_match = re.search(r"^#\s*[^:]+:\s*(.*)$", content, re.MULTILINE)
-             if t_match:
-                 title = t_match.group(1).strip()
-             s_match = re.search(r"^## State\s*\n+([A-Z]+)", content, re.MULTILINE)
-             if s_match:
-                 state = s_match.group(1).strip()
-        except Exception:
-            pass
-        stories_context += f"Story: {file_path.stem} | Title: {title} | State: {state}\n"
+    for entry in get_catalog().entries("story", config.stories_dir):
+        title = entry.heading_title or "Unknown"
+        stories_context += f"Story: {entry.path.stem} | Title: {title} | State: {entry.state}\n"
 
     if not stories_context:
         return None
@@ -0,0 +1,469 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Persistent catalog of parsed governance artifacts.
+
+Stories, plans, runbooks, ADRs and journeys are parsed once into the
+``artifact_catalog`` table of ``agent.db`` (heading, state, referenced
+IDs, journey fields). Every query first stat-walks the requested root and
+re-parses only files whose mtime/size changed, so ``list``, ``journey``,
+the project graph and story lookups no longer read every file per call.
+
+Parsing rules mirror what the consumers previously did inline; bump
+``PARSER_VERSION`` whenever they change so stale rows are re-parsed.
+
+Every write stamps the row with an increasing ``seq`` (deletions leave a
+tombstone), so derived indexes such as the project graph can follow the
+catalog with :meth:`ArtifactCatalog.changes` instead of rebuilding.
+"""
+
+import contextlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+TABLE = "artifact_catalog"
+PARSER_VERSION = 1
+
+CREATE_SQL = f"""
+CREATE TABLE IF NOT EXISTS {TABLE} (
+    path TEXT PRIMARY KEY,
+    root TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    artifact_id TEXT,
+    heading_id TEXT,
+    heading_title TEXT,
+    h1 TEXT,
+    state TEXT NOT NULL,
+    refs TEXT NOT NULL DEFAULT '[]',
+    meta TEXT NOT NULL DEFAULT '{{}}',
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    parser_version INTEGER NOT NULL,
+    seq INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_{TABLE}_root ON {TABLE}(root, kind);
+CREATE INDEX IF NOT EXISTS idx_{TABLE}_id ON {TABLE}(kind, artifact_id);
+CREATE TABLE IF NOT EXISTS {TABLE}_removed (
+    path TEXT PRIMARY KEY,
+    root TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    seq INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS {TABLE}_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+# Run after _migrate() so the seq column exists on older databases
+INDEX_SQL = f"""
+CREATE INDEX IF NOT EXISTS idx_{TABLE}_seq ON {TABLE}(root, kind, seq);
+CREATE INDEX IF NOT EXISTS idx_{TABLE}_removed_seq ON {TABLE}_removed(root, kind, seq);
+"""
+
+# File suffix scanned for each artifact kind
+KIND_SUFFIX = {
+    "story": ".md",
+    "plan": ".md",
+    "runbook": ".md",
+    "adr": ".md",
+    "journey": ".yaml",
+}
+
+_ID_RE = re.compile(r"^([A-Z]+-\d+)")
+_HEADING_RE = re.compile(r"^#\s*([^:]+):\s*(.*)$")
+_STATE_SECTION_RE = re.compile(r"^## State\s*\n+([A-Z]+)", re.MULTILINE)
+_STATE_LINE_RE = re.compile(r"^State:\s*([A-Za-z]+)", re.MULTILINE | re.IGNORECASE)
+_REF_RE = re.compile(r"\b[A-Z]+-\d+\b")
+_CODE_PATH_RE = re.compile(r"\[(?:NEW|MODIFY|DELETE)\]\s+`?([^`\s\[\]]+)`?")
+_JOURNEY_COMMENT_RE = {
+    "journey": re.compile(r"^#\s*Journey:\s*(.+)$"),
+    "title": re.compile(r"^#\s*Title:\s*(.+)$"),
+    "state": re.compile(r"^#\s*State:\s*(.+)$"),
+}
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """Parsed metadata for one artifact file."""
+
+    path: Path
+    kind: str
+    artifact_id: Optional[str]
+    heading_id: Optional[str]
+    heading_title: Optional[str]
+    h1: Optional[str]
+    state: str
+    refs: Tuple[str, ...] = ()
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+
+@dataclass
+class CatalogChanges:
+    """Result of :meth:`ArtifactCatalog.changes`.
+
+    ``full`` means the cursor could not be honoured (first call, new or
+    recreated database): ``updated`` then holds every entry and the caller
+    should drop what it derived before.
+    """
+
+    cursor: str
+    full: bool
+    updated: List[CatalogEntry] = field(default_factory=list)
+    removed: List[Path] = field(default_factory=list)
+
+
+def _markdown_fields(content: str, path: Path, kind: str) -> Dict[str, Any]:
+    first_line = content.split("\n", 1)[0].strip()
+    heading = _HEADING_RE.match(first_line)
+    h1 = next(
+        (line.strip()[2:].strip() for line in content.splitlines() if line.strip().startswith("# ")),
+        None,
+    )
+    state_match = _STATE_SECTION_RE.search(content)
+    if state_match:
+        state = state_match.group(1).strip()
+    else:
+        line_match = _STATE_LINE_RE.search(content)
+        state = line_match.group(1).strip().upper() if line_match else "UNKNOWN"
+    id_match = _ID_RE.match(path.stem)
+    meta: Dict[str, Any] = {}
+    if kind == "runbook":
+        meta["code_paths"] = [m.group(1).strip() for m in _CODE_PATH_RE.finditer(content)]
+    return {
+        "artifact_id": id_match.group(1) if id_match else None,
+        "heading_id": heading.group(1).strip() if heading else None,
+        "heading_title": heading.group(2).strip() if heading else None,
+        "h1": h1,
+        "state": state,
+        "refs": sorted(set(_REF_RE.findall(content))),
+        "meta": meta,
+    }
+
+
+def _journey_fields(content: str, path: Path) -> Dict[str, Any]:
+    import yaml  # ADR-025: lazy import
+
+    comment: Dict[str, str] = {}
+    for line in content.splitlines():
+        line = line.strip()
+        for key, pattern in _JOURNEY_COMMENT_RE.items():
+            match = pattern.match(line)
+            if match:
+                comment[key] = match.group(1).strip()
+        if not line.startswith("#"):
+            break
+
+    try:
+        data = yaml.safe_load(content)
+    except Exception:
+        data = None
+    meta: Dict[str, Any] = {"comment": comment, "valid": isinstance(data, dict)}
+    state = "DRAFT"
+    artifact_id = path.stem
+    if isinstance(data, dict):
+        implementation = data.get("implementation") or {}
+        if not isinstance(implementation, dict):
+            implementation = {}
+        state = str(data.get("state") or "DRAFT").upper()
+        artifact_id = str(data.get("id", path.stem))
+        meta.update({
+            "title": data.get("title", ""),
+            "actor": data.get("actor", ""),
+            "files": list(implementation.get("files") or []),
+            "tests": list(implementation.get("tests") or []),
+        })
+    return {
+        "artifact_id": artifact_id,
+        "heading_id": None,
+        "heading_title": None,
+        "h1": None,
+        "state": state,
+        "refs": sorted(set(_REF_RE.findall(content))),
+        "meta": meta,
+    }
+
+
+def parse_file(path: Path, kind: str) -> Dict[str, Any]:
+    """Parse one artifact file into catalog columns."""
+    content = path.read_text(errors="ignore")
+    if kind == "journey":
+        return _journey_fields(content, path)
+    return _markdown_fields(content, path, kind)
+
+
+def _walk(root: Path, suffix: str) -> Iterator[Tuple[str, os.stat_result]]:
+    """Yield ``(path, stat)`` for files under ``root`` ending in ``suffix``."""
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith(suffix) and entry.is_file():
+                            yield entry.path, entry.stat()
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+def _as_dir(root: Any) -> Optional[Path]:
+    """``root`` as an existing directory path, else None."""
+    try:
+        path = Path(root)
+    except TypeError:
+        return None
+    return path if path.is_dir() else None
+
+
+class ArtifactCatalog:
+    """mtime-invalidated artifact metadata cache backed by SQLite."""
+
+    def __init__(self, db_path: Optional[Path]):
+        self._lock = threading.RLock()
+        self._db_path = db_path
+        self._memory: Optional[sqlite3.Connection] = None
+        # (kind, root) -> (filesystem signature, entries) for repeat queries in-process
+        self._hot: Dict[Tuple[str, str], Tuple[int, List[CatalogEntry]]] = {}
+
+    def _open(self) -> Optional[sqlite3.Connection]:
+        if self._memory is not None or self._db_path is None:
+            return None
+        try:
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self._db_path), timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._init_schema(conn)
+        except (sqlite3.OperationalError, OSError) as e:
+            # Read-only checkout etc.: still serve queries, just without persistence
+            logger.warning("artifact catalog falling back to in-memory cache: %s", e)
+            return None
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Short-lived connection to ``agent.db`` (in-memory if it is unusable)."""
+        conn = self._open()
+        if conn is None:
+            if self._memory is None:
+                self._memory = sqlite3.connect(":memory:", check_same_thread=False)
+                self._init_schema(self._memory)
+                self._memory.row_factory = sqlite3.Row
+            yield self._memory
+            return
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _init_schema(conn: sqlite3.Connection) -> None:
+        conn.executescript(CREATE_SQL)
+        # Catalogs created before the change feed
+        columns = {row[1] for row in conn.execute(f"PRAGMA table_info({TABLE})")}
+        if "seq" not in columns:
+            conn.execute(f"ALTER TABLE {TABLE} ADD COLUMN seq INTEGER NOT NULL DEFAULT 0")
+        conn.executescript(INDEX_SQL)
+        # Identifies this database so cursors from a deleted one are not reused
+        conn.execute(f"INSERT OR IGNORE INTO {TABLE}_meta (key, value) VALUES ('epoch', ?)", (uuid.uuid4().hex,))
+        conn.commit()
+
+    def refresh(self, kind: str, root: Path) -> int:
+        """Sync rows for ``root`` with the filesystem. Returns files re-parsed."""
+        with self._lock, self._connect() as conn:
+            return self._refresh(conn, kind, root)[0]
+
+    def _refresh(self, conn: sqlite3.Connection, kind: str, root: Path) -> Tuple[int, int]:
+        """Returns ``(files re-parsed, filesystem signature)``."""
+        root_key = str(Path(root))
+        suffix = KIND_SUFFIX[kind]
+        known = {
+            row["path"]: (row["mtime_ns"], row["size"], row["parser_version"])
+            for row in conn.execute(
+                f"SELECT path, mtime_ns, size, parser_version FROM {TABLE} WHERE root = ? AND kind = ?",
+                (root_key, kind),
+            )
+        }
+        changed = 0
+        seen = set()
+        signature = []
+        seq = None
+        with conn:
+            for path_str, st in _walk(Path(root), suffix):
+                seen.add(path_str)
+                signature.append((path_str, st.st_mtime_ns, st.st_size))
+                if known.get(path_str) == (st.st_mtime_ns, st.st_size, PARSER_VERSION):
+                    continue
+                path = Path(path_str)
+                try:
+                    fields = parse_file(path, kind)
+                except OSError:
+                    continue
+                seq = (seq or self._last_seq(conn)) + 1
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {TABLE} (path, root, kind, name, artifact_id, heading_id, "
+                    "heading_title, h1, state, refs, meta, mtime_ns, size, parser_version, seq) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        path_str, root_key, kind, path.name, fields["artifact_id"], fields["heading_id"],
+                        fields["heading_title"], fields["h1"], fields["state"], json.dumps(fields["refs"]),
+                        json.dumps(fields["meta"], default=str), st.st_mtime_ns, st.st_size, PARSER_VERSION,
+                        seq,
+                    ),
+                )
+                conn.execute(f"DELETE FROM {TABLE}_removed WHERE path = ?", (path_str,))
+                changed += 1
+            gone = [p for p in known if p not in seen]
+            if gone:
+                seq = (seq or self._last_seq(conn)) + 1
+                conn.executemany(f"DELETE FROM {TABLE} WHERE path = ?", [(p,) for p in gone])
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO {TABLE}_removed (path, root, kind, seq) VALUES (?, ?, ?, ?)",
+                    [(p, root_key, kind, seq) for p in gone],
+                )
+        return changed, hash(tuple(sorted(signature)))
+
+    @staticmethod
+    def _last_seq(conn: sqlite3.Connection) -> int:
+        row = conn.execute(
+            f"SELECT MAX(COALESCE((SELECT MAX(seq) FROM {TABLE}), 0), "
+            f"COALESCE((SELECT MAX(seq) FROM {TABLE}_removed), 0))"
+        ).fetchone()
+        return row[0] or 0
+
+    @staticmethod
+    def _entry(row: sqlite3.Row) -> CatalogEntry:
+        return CatalogEntry(
+            path=Path(row["path"]),
+            kind=row["kind"],
+            artifact_id=row["artifact_id"],
+            heading_id=row["heading_id"],
+            heading_title=row["heading_title"],
+            h1=row["h1"],
+            state=row["state"],
+            refs=tuple(json.loads(row["refs"])),
+            meta=json.loads(row["meta"]),
+        )
+
+    def entries(self, kind: str, root: Path) -> List[CatalogEntry]:
+        """All artifacts of ``kind`` under ``root``, sorted by path."""
+        root = _as_dir(root)
+        if root is None:
+            return []
+        key = (kind, str(root))
+        with self._lock, self._connect() as conn:
+            _, signature = self._refresh(conn, kind, root)
+            hot = self._hot.get(key)
+            if hot is not None and hot[0] == signature:
+                return list(hot[1])
+            rows = conn.execute(
+                f"SELECT * FROM {TABLE} WHERE root = ? AND kind = ? ORDER BY path",
+                (key[1], kind),
+            ).fetchall()
+            entries = [self._entry(row) for row in rows]
+            self._hot[key] = (signature, entries)
+        return list(entries)
+
+    def changes(self, kind: str, root: Path, cursor: Optional[str] = None) -> CatalogChanges:
+        """Entries of ``kind`` under ``root`` written or removed since ``cursor``.
+
+        Pass the returned ``cursor`` to the next call. ``None`` (or a cursor
+        from another database) yields a full listing.
+        """
+        try:
+            root_dir: Optional[Path] = Path(root)
+        except TypeError:
+            root_dir = None
+        with self._lock, self._connect() as conn:
+            if root_dir is not None:
+                # A missing root still refreshes, tombstoning what it held
+                self._refresh(conn, kind, root_dir)
+            epoch = conn.execute(f"SELECT value FROM {TABLE}_meta WHERE key = 'epoch'").fetchone()[0]
+            last = self._last_seq(conn)
+            since = None
+            if cursor and cursor.startswith(f"{epoch}:"):
+                try:
+                    since = int(cursor.split(":", 1)[1])
+                except ValueError:
+                    since = None
+            result = CatalogChanges(cursor=f"{epoch}:{last}", full=since is None or since > last)
+            if root_dir is None:
+                return result
+            root_key = str(root_dir)
+            since = 0 if result.full else since
+            rows = conn.execute(
+                f"SELECT * FROM {TABLE} WHERE root = ? AND kind = ? AND (? OR seq > ?) ORDER BY path",
+                (root_key, kind, result.full, since),
+            ).fetchall()
+            result.updated = [self._entry(row) for row in rows]
+            if not result.full:
+                result.removed = [
+                    Path(row["path"]) for row in conn.execute(
+                        f"SELECT path FROM {TABLE}_removed WHERE root = ? AND kind = ? AND seq > ? ORDER BY path",
+                        (root_key, kind, since),
+                    )
+                ]
+        return result
+
+    def find(self, kind: str, root: Path, prefix: str) -> Optional[Path]:
+        """First file (by path) under ``root`` whose name starts with ``prefix``."""
+        root = _as_dir(root)
+        if not prefix or root is None:
+            return None
+        pattern = re.sub(r"([*?\[])", r"[\1]", prefix) + "*"
+        with self._lock, self._connect() as conn:
+            self._refresh(conn, kind, root)
+            row = conn.execute(
+                f"SELECT path FROM {TABLE} WHERE root = ? AND kind = ? AND name GLOB ? ORDER BY path LIMIT 1",
+                (str(root), kind, pattern),
+            ).fetchone()
+        return Path(row["path"]) if row else None
+
+
+_catalogs: Dict[str, ArtifactCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_catalog() -> ArtifactCatalog:
+    """Process-wide catalog stored in the local ``agent.db``."""
+    try:
+        from agent.core.config import config
+        db_path: Optional[Path] = Path(config.cache_dir) / "agent.db"
+    except Exception:
+        db_path = None
+    key = str(db_path)
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = _catalogs[key] = ArtifactCatalog(db_path)
+        return catalog
@@ -12,14 +12,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
 import re
 import sqlite3
 import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from agent.core.utils import scrub_sensitive_data
 from agent.db.init import init_db
+from agent.db.pool import pooled_connection
+
+# Ids per keyed lookup; stays under SQLite's 999-parameter limit
+_KEY_CHUNK = 900
+# Artifact type -> type of the artifacts its outgoing links point at
+_LINK_TARGET = {"plan": "story", "runbook": "story", "story": "adr"}
+
+_STATE_LINE_RE = re.compile(r'^(?:Status|State):\s*(\w+)', re.MULTILINE | re.IGNORECASE)
+_STATE_SECTION_RE = re.compile(r'^##\s*(?:Status|State)\s*\n+([A-Za-z]+)', re.MULTILINE)
+_RELATED_STORIES_RE = re.compile(r'^##\s+Related Stor(?:y|ies)(.*?)(^##|\Z)', re.DOTALL | re.MULTILINE)
+_LINKED_ADRS_RE = re.compile(r'^##\s+Linked ADRs(.*?)(^##|\Z)', re.DOTALL | re.MULTILINE)
+_STORY_ID_RE = re.compile(r'\b[A-Z]+-\d+\b')
+_ADR_ID_RE = re.compile(r'\bADR-\d+\b')
 
 
 def get_db_path() -> Path:
@@ -36,12 +51,12 @@ def get_connection() -> sqlite3.Connection:
 def extract_state(content: str) -> str:
     """Extracts state from markdown content."""
     # 1. Look for Key: Value pair ("Status: OPEN" or "State: DRAFT")
-    match = re.search(r'^(?:Status|State):\s*(\w+)', content, re.MULTILINE | re.IGNORECASE)
+    match = _STATE_LINE_RE.search(content)
     if match:
         return match.group(1).strip().upper()
         
     # 2. Look for Header based status (Common in ADRs)
-    match = re.search(r'^##\s*(?:Status|State)\s*\n+([A-Za-z]+)', content, re.MULTILINE)
+    match = _STATE_SECTION_RE.search(content)
     if match:
         return match.group(1).strip().upper()
         
@@ -50,11 +65,11 @@ def extract_state(content: str) -> str:
 def extract_related_stories(content: str) -> Set[str]:
     """Extracts related story IDs from Plan markdown."""
     stories = set()
-    section_match = re.search(r'^##\s+Related Stor(?:y|ies)(.*?)(^##|\Z)', content, re.DOTALL | re.MULTILINE)
+    section_match = _RELATED_STORIES_RE.search(content)
     if section_match:
         section_content = section_match.group(1)
         # Format: PRE-123 or STORY-123
-        ids = re.findall(r'\b[A-Z]+-\d+\b', section_content)
+        ids = _STORY_ID_RE.findall(section_content)
         for i in ids:
             stories.add(i)
     return stories
@@ -62,115 +77,199 @@ def extract_related_stories(content: str) -> Set[str]:
 def extract_linked_adrs(content: str) -> Set[str]:
     """Extracts linked ADR IDs from Story markdown."""
     adrs = set()
-    section_match = re.search(r'^##\s+Linked ADRs(.*?)(^##|\Z)', content, re.DOTALL | re.MULTILINE)
+    section_match = _LINKED_ADRS_RE.search(content)
     if section_match:
         section_content = section_match.group(1)
         # Format: ADR-001
-        ids = re.findall(r'\bADR-\d+\b', section_content)
+        ids = _ADR_ID_RE.findall(section_content)
         for i in ids:
             adrs.add(i)
     return adrs
 
+@dataclass
+class UpsertResult:
+    """Outcome of :func:`upsert_artifacts`."""
+
+    written: int = 0
+    unchanged: int = 0
+    ok: bool = True
+
+    @property
+    def total(self) -> int:
+        return self.written + self.unchanged
+
+
+def content_hash(content: str) -> str:
+    """Hash of an artifact's content as supplied, before scrubbing.
+
+    Stored alongside each row so bulk writers can skip unchanged artifacts
+    without re-scrubbing them.
+    """
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _lookup(cursor: sqlite3.Cursor, sql: str, keys: Iterable[Tuple[str, str]]) -> List[tuple]:
+    """Rows of ``sql`` (``... WHERE <id column> IN``) whose first two columns are in ``keys``.
+
+    Queries by id alone, in parameter-limit sized chunks, so SQLite can use
+    the primary-key index; the type is matched here.
+    """
+    wanted = set(keys)
+    ids = sorted({key[0] for key in wanted})
+    found: List[tuple] = []
+    for start in range(0, len(ids), _KEY_CHUNK):
+        chunk = ids[start:start + _KEY_CHUNK]
+        cursor.execute(f"{sql} ({','.join('?' * len(chunk))})", chunk)
+        found.extend(row for row in cursor.fetchall() if (row[0], row[1]) in wanted)
+    return found
+
+
+def _desired_links(id: str, type: str, content: str) -> Set[Tuple[str, str, str]]:
+    """Outgoing ``(target_id, target_type, rel_type)`` links parsed from an artifact."""
+    if type == "plan":
+        return {(story_id, "story", "contains") for story_id in extract_related_stories(content)}
+    if type == "story":
+        return {(adr_id, "adr", "related") for adr_id in extract_linked_adrs(content)}
+    if type == "runbook":
+        # Runbook ID usually == Story ID
+        return {(id, "story", "implements")}
+    return set()
+
+
+def _write_artifacts(cursor: sqlite3.Cursor, rows: List[Dict[str, Any]], author: str,
+                     skip_unchanged: bool) -> UpsertResult:
+    """Upsert ``rows``, log their history and rebuild their outgoing links.
+
+    Existing versions/hashes, link targets and current links are each read
+    with keyed queries and written back with ``executemany``.
+    """
+    known: Dict[Tuple[str, str], Tuple[int, Optional[str]]] = {
+        (r[0], r[1]): (r[2], r[3])
+        for r in _lookup(cursor, "SELECT id, type, version, content_hash FROM artifacts WHERE id IN",
+                         ((row["id"], row["type"]) for row in rows))
+    }
+
+    timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+    stamp = int(time.time())
+    result = UpsertResult()
+    artifacts: List[tuple] = []
+    history: List[tuple] = []
+    latest: Dict[Tuple[str, str], str] = {}
+    for row in rows:
+        id, type = row["id"], row["type"]
+        digest = content_hash(row["content"])
+        version, previous = known.get((id, type), (0, None))
+        if skip_unchanged and previous == digest:
+            result.unchanged += 1
+            latest.setdefault((id, type), "")
+            continue
+        # Compliance: Scrub content before persistence
+        content = scrub_sensitive_data(row["content"])
+        latest[(id, type)] = content
+        version += 1
+        known[(id, type)] = (version, digest)
+        artifacts.append((id, type, content, timestamp, version, extract_state(content),
+                          row.get("author") or author, digest))
+        history.append((f"{id}-{type}-v{version}-{stamp}", id, type, timestamp,
+                        row.get("author") or author, f"Updated to version {version}", ""))
+        result.written += 1
+
+    if not artifacts:
+        return result
+
+    cursor.executemany("""
+        INSERT OR REPLACE INTO artifacts (id, type, content, last_modified, version, state, author, content_hash)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """, artifacts)
+    cursor.executemany("""
+        INSERT INTO history (change_id, artifact_id, artifact_type, timestamp, author, description, delta)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, history)
+
+    # Unchanged rows that can link to a type just written are reconciled too:
+    # a target that just arrived may complete a link that was skipped before.
+    written_types = {row[1] for row in artifacts}
+    relink = {src for src, target in _LINK_TARGET.items() if target in written_types}
+    latest = {key: content for key, content in latest.items() if content or key[1] in relink}
+    stale = [key for key, content in latest.items() if not content]
+    if stale:
+        for r in _lookup(cursor, "SELECT id, type, content FROM artifacts WHERE id IN", stale):
+            latest[(r[0], r[1])] = r[2]
+    wanted = {key: _desired_links(key[0], key[1], content) for key, content in latest.items()}
+    # In a distributed system, a missing link target is common (not yet pulled),
+    # so links are only created to artifacts that exist to keep FKs stable.
+    present = set(_lookup(cursor, "SELECT id, type FROM artifacts WHERE id IN",
+                          {(t_id, t_type) for links in wanted.values() for t_id, t_type, _ in links}))
+    desired = {
+        (src_id, src_type, t_id, t_type, rel)
+        for (src_id, src_type), links in wanted.items()
+        for t_id, t_type, rel in links
+        if (t_id, t_type) in present
+    }
+    current = set(_lookup(
+        cursor,
+        "SELECT source_id, source_type, target_id, target_type, rel_type FROM links WHERE source_id IN",
+        wanted,
+    ))
+    cursor.executemany("""
+        DELETE FROM links WHERE source_id = ? AND source_type = ? AND target_id = ? AND target_type = ?
+    """, [link[:4] for link in current - desired])
+    cursor.executemany("""
+        INSERT OR REPLACE INTO links (source_id, source_type, target_id, target_type, rel_type)
+        VALUES (?, ?, ?, ?, ?)
+    """, sorted(desired - current))
+    return result
+
+
 def upsert_artifact(id: str, type: str, content: str, author: str = "agent") -> bool:
     """Inserts or updates an artifact in the local cache and manages links."""
+    result = upsert_artifacts([{"id": id, "type": type, "content": content, "author": author}])
+    return result.ok and result.total == 1
+
+
+def upsert_artifacts(items: Iterable[Dict[str, Any]], author: str = "agent",
+                     skip_unchanged: bool = False) -> UpsertResult:
+    """Upsert many artifacts in a single transaction on a pooled WAL connection.
+
+    Each item needs ``id``, ``type`` and ``content``; ``author`` defaults to
+    *author*. Items missing a field are skipped. Either every row is written
+    or, on error, none are.
+
+    Args:
+        skip_unchanged: Leave rows whose content hash matches the stored one
+            untouched (no version bump or history entry).
+
+    Returns:
+        Rows written and left unchanged; ``ok`` is False if the transaction failed.
+    """
+    rows = [item for item in items if item.get("id") and item.get("type") and item.get("content") is not None]
+    if not rows:
+        return UpsertResult()
     # Retry loop for auto-initialization
     for attempt in range(2):
-        conn: Optional[sqlite3.Connection] = None
         try:
-            conn = get_connection()
-            conn.execute("PRAGMA foreign_keys = ON") 
-            cursor = conn.cursor()
-            
-            # Check if exists (using composite key)
-            cursor.execute("SELECT version FROM artifacts WHERE id = ? AND type = ?", (id, type))
-            row = cursor.fetchone()
-            version = 1
-            if row:
-                version = row[0] + 1
-                
-            # Compliance: Scrub content before persistence
-            content = scrub_sensitive_data(content)
-                
-            state = extract_state(content)
-            timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
-            
-            # Upsert Artifact
-            cursor.execute("""
-                INSERT OR REPLACE INTO artifacts (id, type, content, last_modified, version, state, author)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (id, type, content, timestamp, version, state, author))
-            
-            # Log History
-            change_id = f"{id}-{type}-v{version}-{int(time.time())}"
-            cursor.execute("""
-                INSERT INTO history (change_id, artifact_id, artifact_type, timestamp, author, description, delta)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (change_id, id, type, timestamp, author, f"Updated to version {version}", ""))
-            
-            # Handle Links
-            # 1. Clear existing links from this source
-            cursor.execute("DELETE FROM links WHERE source_id = ? AND source_type = ?", (id, type))
-            
-            # 2. Parse and Insert new links
-            if type == "plan":
-                related_stories = extract_related_stories(content)
-                for story_id in related_stories:
-                    # Check existence to ensure FK stability
-                    cursor.execute("SELECT 1 FROM artifacts WHERE id = ? AND type = 'story'", (story_id,))
-                    if cursor.fetchone():
-                        cursor.execute("""
-                            INSERT INTO links (source_id, source_type, target_id, target_type, rel_type)
-                            VALUES (?, ?, ?, ?, ?)
-                        """, (id, type, story_id, "story", "contains"))
-                    else:
-                        # In a distributed system, a missing link target is common (not yet pulled).
-                        # We gracefully skip it for now.
-                        pass
-
-            elif type == "story":
-                linked_adrs = extract_linked_adrs(content)
-                for adr_id in linked_adrs:
-                    cursor.execute("SELECT 1 FROM artifacts WHERE id = ? AND type = 'adr'", (adr_id,))
-                    if cursor.fetchone():
-                        cursor.execute("""
-                            INSERT INTO links (source_id, source_type, target_id, target_type, rel_type)
-                            VALUES (?, ?, ?, ?, ?)
-                        """, (id, type, adr_id, "adr", "related"))
-
-            elif type == "runbook":
-                # Runbook ID usually == Story ID
-                story_id = id
-                cursor.execute("SELECT 1 FROM artifacts WHERE id = ? AND type = 'story'", (story_id,))
-                if cursor.fetchone():
-                    cursor.execute("""
-                            INSERT INTO links (source_id, source_type, target_id, target_type, rel_type)
-                            VALUES (?, ?, ?, ?, ?)
-                        """, (id, type, story_id, "story", "implements"))
-
-            conn.commit()
-            return True
+            conn = pooled_connection(get_db_path())
+            with conn:
+                # Take the write lock up front so versions read below stay current
+                conn.execute("BEGIN IMMEDIATE")
+                return _write_artifacts(conn.cursor(), rows, author, skip_unchanged)
 
         except sqlite3.OperationalError as e:
             if "no such table" in str(e) and attempt == 0:
                 print(f"Database table missing, initializing schema... ({e})")
-                if conn:
-                    conn.close()
                 init_db()
                 continue
             else:
                 print(f"Operational error in DB: {e}")
-                return False
+                return UpsertResult(ok=False)
 
         except Exception as e:
             print(f"Warning: Failed to sync to local DB: {e}")
             import traceback
             traceback.print_exc()
-            return False
-        finally:
-            if conn:
-                conn.close()
-                
-    return False
+            return UpsertResult(ok=False)
+
+    return UpsertResult(ok=False)
 
 def get_artifact_counts() -> dict:
     """Returns a count of artifacts by type."""
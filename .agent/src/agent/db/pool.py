@@ -0,0 +1,112 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Per-thread reusable connections to ``agent.db``.
+
+Opening a SQLite connection per write costs a file open, schema parse and
+(in rollback-journal mode) an fsync per commit. Bulk writers instead borrow
+a long-lived connection for their thread, opened once in WAL mode with
+``synchronous=NORMAL`` so a transaction commits with a single WAL append.
+
+A pooled connection is reopened transparently if the database file is
+deleted or replaced (e.g. ``agent sync flush``) or the path changes.
+"""
+
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+_local = threading.local()
+_registry_lock = threading.Lock()
+_registry: List[sqlite3.Connection] = []
+# Bumped by close_connections() so threads drop their cached handles
+_generation = 0
+
+# Columns added to the artifacts table after its first release
+_ARTIFACT_COLUMNS = (("content_hash", "TEXT"),)
+
+
+def _file_id(db_path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(db_path)
+    except OSError:
+        return None
+    return st.st_dev, st.st_ino
+
+
+def _migrate(conn: sqlite3.Connection) -> None:
+    """Add columns missing from databases created by older releases."""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(artifacts)")}
+    if not columns:
+        return  # Not initialised yet; schema.sql has the current columns
+    for column, ddl in _ARTIFACT_COLUMNS:
+        if column not in columns:
+            conn.execute(f"ALTER TABLE artifacts ADD COLUMN {column} {ddl}")
+    conn.commit()
+
+
+def _open(db_path: Path) -> sqlite3.Connection:
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path), timeout=10, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA foreign_keys = ON")
+    _migrate(conn)
+    with _registry_lock:
+        _registry.append(conn)
+    return conn
+
+
+def pooled_connection(db_path: Path) -> sqlite3.Connection:
+    """Return this thread's connection to ``db_path``, opening it on first use.
+
+    Callers must not close it; commit or roll back instead.
+    """
+    cached = getattr(_local, "entry", None)
+    if cached is not None:
+        path, file_id, generation, conn = cached
+        if path == db_path and generation == _generation and file_id is not None \
+                and file_id == _file_id(db_path):
+            return conn
+        _discard(conn)
+    conn = _open(db_path)
+    _local.entry = (db_path, _file_id(db_path), _generation, conn)
+    return conn
+
+
+def _discard(conn: sqlite3.Connection) -> None:
+    with _registry_lock:
+        if conn in _registry:
+            _registry.remove(conn)
+    try:
+        conn.close()
+    except sqlite3.Error:
+        pass
+
+
+def close_connections() -> None:
+    """Close every pooled connection (before deleting the database, at exit, in tests)."""
+    global _generation
+    with _registry_lock:
+        conns = list(_registry)
+        _registry.clear()
+        _generation += 1
+    for conn in conns:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+    _local.entry = None
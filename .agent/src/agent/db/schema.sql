@@ -6,6 +6,7 @@ CREATE TABLE IF NOT EXISTS artifacts (
     version INTEGER DEFAULT 1,
     state TEXT,
     author TEXT,
+    content_hash TEXT, -- sha256 of content; lets bulk scans skip unchanged rows
     PRIMARY KEY (id, type)
 );
 
@@ -45,3 +46,39 @@ CREATE TABLE IF NOT EXISTS journey_file_index (
 );
 
 CREATE INDEX IF NOT EXISTS idx_journey_file_index_jid ON journey_file_index(journey_id);
+
+CREATE TABLE IF NOT EXISTS artifact_catalog (
+    path TEXT PRIMARY KEY,
+    root TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    artifact_id TEXT,
+    heading_id TEXT,
+    heading_title TEXT,
+    h1 TEXT,
+    state TEXT NOT NULL,
+    refs TEXT NOT NULL DEFAULT '[]',
+    meta TEXT NOT NULL DEFAULT '{}',
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    parser_version INTEGER NOT NULL,
+    seq INTEGER NOT NULL DEFAULT 0 -- change-feed position, see ArtifactCatalog.changes
+);
+
+CREATE INDEX IF NOT EXISTS idx_artifact_catalog_root ON artifact_catalog(root, kind);
+CREATE INDEX IF NOT EXISTS idx_artifact_catalog_id ON artifact_catalog(kind, artifact_id);
+CREATE INDEX IF NOT EXISTS idx_artifact_catalog_seq ON artifact_catalog(root, kind, seq);
+
+CREATE TABLE IF NOT EXISTS artifact_catalog_removed (
+    path TEXT PRIMARY KEY,
+    root TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    seq INTEGER NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_artifact_catalog_removed_seq ON artifact_catalog_removed(root, kind, seq);
+
+CREATE TABLE IF NOT EXISTS artifact_catalog_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
@@ -42,6 +42,23 @@ CREATE INDEX IF NOT EXISTS idx_artifacts_type ON public.artifacts(type);
 CREATE INDEX IF NOT EXISTS idx_history_artifact ON public.history(artifact_id, artifact_type);
 CREATE INDEX IF NOT EXISTS idx_links_source ON public.links(source_id, source_type);
 CREATE INDEX IF NOT EXISTS idx_links_target ON public.links(target_id, target_type);
+-- Incremental pulls filter on updated_at and page by (updated_at, id, type)
+DROP INDEX IF EXISTS public.idx_artifacts_updated_at;
+CREATE INDEX IF NOT EXISTS idx_artifacts_sync_key ON public.artifacts(updated_at, id, type);
+
+-- The server stamps updated_at on every insert and update so `agent sync pull`
+-- watermarks never depend on a client's clock
+CREATE OR REPLACE FUNCTION public.touch_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at = clock_timestamp();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS artifacts_touch_updated_at ON public.artifacts;
+CREATE TRIGGER artifacts_touch_updated_at
+    BEFORE INSERT OR UPDATE ON public.artifacts
+    FOR EACH ROW EXECUTE FUNCTION public.touch_updated_at();
 
 -- Row Level Security (RLS)
 ALTER TABLE public.artifacts ENABLE ROW LEVEL SECURITY;
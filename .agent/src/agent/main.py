@@ -55,6 +55,7 @@ from agent.commands import (
     runbook,
     secret,
     story,
+    usage,
     visualize,
     voice,
     workflow,
@@ -71,10 +72,15 @@ def cli(
     ctx: typer.Context,
     verbose: int = typer.Option(0, "--verbose", "-v", count=True, help="Increase verbosity level."),
     version: bool = typer.Option(None, "--version", help="Show version and exit"),
-    provider: str = typer.Option(None, "--provider", help="Force AI provider (gh, gemini, vertex, openai, anthropic)")
+    provider: str = typer.Option(None, "--provider", help="Force AI provider (gh, gemini, vertex, openai, anthropic)"),
+    no_context_cache: bool = typer.Option(
+        False, "--no-context-cache", help="Rebuild governance/source context on every load instead of caching it."
+    ),
 ) -> None:
     """A CLI for managing and interacting with the AI agent."""
     # Environment variables loaded by config.py at import time (dotenv)
+    if no_context_cache:
+        os.environ["AGENT_NO_CONTEXT_CACHE"] = "1"
 
     from agent.core.logger import configure_logging
     configure_logging(verbose)
@@ -107,6 +113,11 @@ def cli(
             typer.echo(f"Error setting provider: {e}")
             raise typer.Exit(1)
 
+    if ctx.invoked_subcommand:
+        # Attribute every LLM call in this process to the command being run
+        from agent.core.ai.usage import set_default_labels
+        set_default_labels(command=ctx.invoked_subcommand)
+
     if ctx.invoked_subcommand is None:
          # Restoring default behavior: missing command is an error (unless version/provider handled above)
          typer.echo(ctx.get_help())
@@ -166,6 +177,7 @@ app.add_typer(importer.app, name="import")
 app.add_typer(mcp.app, name="mcp")
 app.add_typer(secret.app, name="secret")
 app.add_typer(journey.app, name="journey")
+app.add_typer(usage.app, name="usage")
 app.add_typer(visualize.app, name="visualize")
 
 # List Commands
@@ -0,0 +1,144 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Bulk transfer helpers for the Supabase artifact sync.
+
+Pushes send array-body upserts in batches; pulls page through the rows by
+``(updated_at, id, type)`` key. Both sides keep a watermark in
+``.agent/cache/supabase_sync.json`` so that only rows changed since the
+previous sync move:
+
+- ``push``: the newest local ``last_modified`` that was pushed.
+- ``pull``: the newest remote ``updated_at`` at the start of the last
+  complete pull.
+"""
+
+import json
+import os
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from agent.core.config import config
+from agent.sync.pagination import fetch_page, row_key
+
+WATERMARK_FILE = config.cache_dir / "supabase_sync.json"
+
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_PAGE_SIZE = 1000  # PostgREST's default max-rows
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        value = int(os.getenv(name, default))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+def batch_size() -> int:
+    """Rows per upsert request (``AGENT_SYNC_BATCH_SIZE``)."""
+    return _env_int("AGENT_SYNC_BATCH_SIZE", DEFAULT_BATCH_SIZE)
+
+
+def page_size() -> int:
+    """Rows per page request (``AGENT_SYNC_PAGE_SIZE``)."""
+    return _env_int("AGENT_SYNC_PAGE_SIZE", DEFAULT_PAGE_SIZE)
+
+
+def load_watermarks() -> Dict[str, str]:
+    try:
+        data = json.loads(WATERMARK_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+    return {k: v for k, v in data.items() if isinstance(v, str)} if isinstance(data, dict) else {}
+
+
+def save_watermark(key: str, value: Optional[str]) -> None:
+    """Record ``value`` as the ``key`` watermark (ignored if not a string)."""
+    if not isinstance(value, str) or not value:
+        return
+    marks = load_watermarks()
+    marks[key] = value
+    try:
+        WATERMARK_FILE.parent.mkdir(parents=True, exist_ok=True)
+        WATERMARK_FILE.write_text(json.dumps(marks, indent=2, sort_keys=True))
+    except OSError as e:
+        print(f"Warning: could not save sync watermark: {e}")
+
+
+def push_rows(client: Any, rows: List[Dict[str, Any]], size: Optional[int] = None,
+              verbose: bool = False) -> Tuple[int, int]:
+    """Upsert ``rows`` into the remote ``artifacts`` table, ``size`` rows per request.
+
+    ``updated_at`` is left to the ``artifacts_touch_updated_at`` trigger so
+    that pull watermarks only ever compare server timestamps.
+
+    Returns:
+        ``(pushed, failed)`` row counts. A failed batch does not stop later ones.
+    """
+    size = size or batch_size()
+    pushed = failed = 0
+    for start in range(0, len(rows), size):
+        batch = [{k: v for k, v in row.items() if k != "updated_at"} for row in rows[start:start + size]]
+        try:
+            client.table("artifacts").upsert(batch, returning="minimal", default_to_null=False).execute()
+            pushed += len(batch)
+            if verbose:
+                print(f"  Pushed {', '.join(row['id'] for row in batch)}")
+        except Exception as e:
+            failed += len(batch)
+            print(f"Failed to push batch of {len(batch)} starting at {batch[0].get('id')}: {e}")
+    return pushed, failed
+
+
+def latest_remote_update(client: Any) -> Optional[str]:
+    """Newest remote ``updated_at`` (the next pull's watermark), if available."""
+    try:
+        data = client.table("artifacts").select("updated_at").order("updated_at", desc=True).limit(1).execute().data
+    except Exception:
+        return None
+    if isinstance(data, list) and data and isinstance(data[0], dict):
+        value = data[0].get("updated_at")
+        return value if isinstance(value, str) else None
+    return None
+
+
+def pull_rows(client: Any, since: Optional[str] = None, until: Optional[str] = None,
+              size: Optional[int] = None,
+              on_page: Optional[Callable[[int], None]] = None) -> List[Dict[str, Any]]:
+    """Fetch rows with ``since <= updated_at <= until``, one keyset page at a time.
+
+    Pass the watermark captured before the pull as ``until``: a row updated
+    mid-pull then leaves the range instead of being read twice, and the
+    next pull (``since`` = that watermark) picks it up. Each page starts
+    after the last row's ``(updated_at, id, type)``, so no row is skipped
+    when others change. Returns rows in key order.
+
+    Raises:
+        Exception: If a page still fails after :func:`fetch_page`'s retries.
+    """
+    size = size or page_size()
+    rows: List[Dict[str, Any]] = []
+    after = None
+    while True:
+        page = fetch_page(client, after, size, since=since, until=until)
+        rows.extend(page)
+        if on_page:
+            on_page(len(page))
+        if len(page) < size:
+            return rows
+        after = row_key(page[-1])
+        if after is None:
+            # Rows without updated_at sort last and cannot be paged past
+            print("Warning: stopping pull at a row without updated_at.")
+            return rows
@@ -13,11 +13,13 @@
 # limitations under the License.
 
 import difflib
+import hashlib
 import unicodedata
 import concurrent.futures
 import json
 import logging
 import re
+import threading
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
@@ -30,11 +32,16 @@ from agent.core.secrets import get_secret
 logger = logging.getLogger(__name__)
 
 STATE_FILE = config.cache_dir / "notion_state.json"
+# Content hash + remote last_edited_time of pages verified in sync by the last push
+PUSH_CACHE_FILE = config.cache_dir / "notion_push_cache.json"
 
 # Constants
 MAX_STATUS_LENGTH = 50
+PUSH_WORKERS = 4
 
 class NotionSync:
+    _prompt_lock = threading.Lock()
+
     def __init__(self):
         # Refactored to use 'notion' service for secrets
         self.token = get_secret("notion_token", service="notion")
@@ -357,38 +364,86 @@ class NotionSync:
         if not silent:
             logger.info(f"Syncing {len(artifacts)} {category_name} to Notion...")
 
-        updated = 0
-        created = 0
-
-        for art in artifacts:
-            try:
-                # Query by ID
-                results = self.client.query_database(db_id, filter={
-                    "property": "ID",
-                    "rich_text": {
-                        "equals": art["id"]
-                    }
-                })
-
-                if results:
-                    # Update
-                    page_id = results[0]["id"]
-                    if self._update_page(page_id, art, force, silent):
-                        updated += 1
-                else:
-                    # Create
-                    self._create_page(db_id, art)
-                    created += 1
-            except Exception as e:
-                logger.error(f"Failed to sync {art['id']}: {e}")
+        # Prefetch the whole database once instead of querying per artifact
+        try:
+            pages_by_id = self._index_pages(self.client.query_database(db_id))
+        except Exception as e:
+            logger.error(f"Failed to query {category_name} from Notion: {e}")
+            return
 
+        push_cache = self._load_push_cache()
+        counts = {"created": 0, "updated": 0, "unchanged": 0, "skipped": 0}
+
+        def push_one(art: Dict[str, Any]) -> str:
+            page = pages_by_id.get(art["id"])
+            if page is None:
+                self._create_page(db_id, art)
+                return "created"
+            cache_key = f"{db_id}:{art['id']}"
+            fingerprint = {
+                "hash": hashlib.sha256(art["content"].encode("utf-8")).hexdigest(),
+                "edited": page.get("last_edited_time"),
+            }
+            if not force and fingerprint["edited"] and push_cache.get(cache_key) == fingerprint:
+                return "unchanged"  # neither side changed since the last verified sync
+            outcome = self._update_page(page, art, force, silent)
+            if outcome == "unchanged":
+                push_cache[cache_key] = fingerprint
+            else:
+                push_cache.pop(cache_key, None)
+            return outcome
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=PUSH_WORKERS) as executor:
+            futures = {executor.submit(push_one, art): art for art in artifacts}
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    counts[future.result()] += 1
+                except Exception as e:
+                    logger.error(f"Failed to sync {futures[future]['id']}: {e}")
+
+        self._save_push_cache(push_cache)
         if not silent:
-            logger.info(f"Finished pushing {category_name}: {created} created, {updated} updated.")
+            logger.info(
+                f"Finished pushing {category_name}: {counts['created']} created, {counts['updated']} updated, "
+                f"{counts['unchanged']} unchanged."
+            )
+
+    def _index_pages(self, pages: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Map artifact ID -> first Notion page carrying it."""
+        pages_by_id: Dict[str, Dict[str, Any]] = {}
+        for page in pages:
+            id_prop = page.get("properties", {}).get("ID", {}).get("rich_text", [])
+            if not id_prop:
+                continue
+            art_id = id_prop[0]["plain_text"]
+            if art_id in pages_by_id:
+                logger.warning(f"Duplicate ID detected: {art_id}. Pushing to the first matching page.")
+                continue
+            pages_by_id[art_id] = page
+        return pages_by_id
+
+    def _load_push_cache(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(PUSH_CACHE_FILE, "r") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
 
-    def _update_page(self, page_id: str, art: Dict[str, Any], force: bool, silent: bool = False) -> bool:
-        # 1. Safety Check: Verify Title matches to prevent accidental ID collision
-        # We must fetch the page properties first
-        remote_page = self.client.retrieve_page(page_id)
+    def _save_push_cache(self, cache: Dict[str, Dict[str, Any]]) -> None:
+        try:
+            PUSH_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            PUSH_CACHE_FILE.write_text(json.dumps(cache, indent=2, sort_keys=True))
+        except OSError as e:
+            logger.debug(f"Could not write Notion push cache: {e}")
+
+    def _confirm(self, prompt: str, default: bool) -> bool:
+        # Pages are pushed concurrently; keep interactive prompts one at a time
+        with self._prompt_lock:
+            return Confirm.ask(prompt, default=default)
+
+    def _update_page(self, remote_page: Dict[str, Any], art: Dict[str, Any], force: bool, silent: bool = False) -> str:
+        """Push ``art`` to an existing page. Returns "updated", "unchanged" or "skipped"."""
+        page_id = remote_page["id"]
         remote_props = remote_page["properties"]
         # Extract title safeley
         remote_title_objs = remote_props.get("Title", {}).get("title", [])
@@ -404,13 +459,7 @@ class NotionSync:
                 # Only warn — since we matched by ID, this is a title update, not a collision
                 if not silent:
                     logger.info(f"[{art['id']}] Title will be updated: '{remote_title}' -> '{local_title}'")
-        
-        # 2. Update Metadata (including Title now!)
-        props = {
-            "Title": { "title": [{"text": {"content": local_title}}] },
-            "Status": { "select": {"name": art["status"]} },
-            "ID": { "rich_text": [{"text": {"content": art["id"]}}] }
-        }
+
         # Safe extraction of remote status
         remote_status_prop = remote_props.get("Status", {})
         remote_select = remote_status_prop.get("select") if remote_status_prop else None
@@ -419,8 +468,17 @@ class NotionSync:
         if remote_status_name != art["status"]:
             if not silent:
                 logger.info(f"[{art['id']}] Updating status: {remote_status_name} -> {art['status']}")
-            
-        self.client.update_page_properties(page_id, props)
+
+        # Update Metadata (including Title) only when it actually differs
+        wrote = False
+        if force or remote_title != local_title or remote_status_name != art["status"]:
+            props = {
+                "Title": { "title": [{"text": {"content": local_title}}] },
+                "Status": { "select": {"name": art["status"]} },
+                "ID": { "rich_text": [{"text": {"content": art["id"]}}] }
+            }
+            self.client.update_page_properties(page_id, props)
+            wrote = True
 
         # Smart Content Sync (Diff & Overwrite)
         # 1. Fetch Remote
@@ -453,23 +511,19 @@ class NotionSync:
 
                 if silent:
                     logger.info(f"Skipping {art['id']} (Conflict detected in silent mode).")
-                    should_update = False
-                else:
-                    should_update = Confirm.ask(
-                        f"[bold red]Conflict detected for {art['id']}[/bold red]. Local content differs from Remote.\n"
-                        f"Overwrite [bold]REMOTE[/bold] Notion page with local content?",
-                        default=True
-                    )
-                    if not should_update:
-                         logger.info(f"Skipping {art['id']} (User chose to keep remote).")
-            else:
-                # Content matches
-                pass
+                    return "skipped"
+                should_update = self._confirm(
+                    f"[bold red]Conflict detected for {art['id']}[/bold red]. Local content differs from Remote.\n"
+                    f"Overwrite [bold]REMOTE[/bold] Notion page with local content?",
+                    default=True
+                )
+                if not should_update:
+                     logger.info(f"Skipping {art['id']} (User chose to keep remote).")
+                     return "skipped"
         
         if should_update:
             logger.info(f"[{art['id']}] Overwriting remote content...")
-            # DELETE all existing blocks (in batches)
-            # DELETE all existing blocks (in batches) - PARALLELIZED
+            # DELETE all existing blocks - PARALLELIZED (paced by the client's rate limiter)
             with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
                 future_to_block = {executor.submit(self.client.delete_block, block["id"]): block["id"] for block in remote_blocks}
                 for future in concurrent.futures.as_completed(future_to_block):
@@ -486,9 +540,9 @@ class NotionSync:
             for i in range(0, len(new_blocks), chunk_size):
                 chunk = new_blocks[i:i + chunk_size]
                 self.client.append_block_children(page_id, chunk)
-            return True
+            return "updated"
             
-        return False
+        return "updated" if wrote else "unchanged"
 
     def _create_page(self, db_id: str, art: Dict[str, Any]):
         payload = {
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, List
+from typing import Any, List, Optional, Tuple
 from time import sleep
 
 try:
@@ -20,15 +20,48 @@ try:
 except ImportError:
     Client = Any
 
-def fetch_page(client: Client, cursor: int, page_size: int, retries: int = 3) -> List[Any]:
+# Sort key for keyset pagination: (updated_at, id, type) is unique per row
+Key = Tuple[str, str, str]
+
+
+def _quote(value: str) -> str:
+    """Quote a value for a PostgREST ``or`` filter (commas, dots, colons are reserved)."""
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def after_filter(key: Key) -> str:
+    """PostgREST ``or`` filter selecting rows that sort after ``key``."""
+    updated_at, id_, type_ = (_quote(v) for v in key)
+    return (
+        f"updated_at.gt.{updated_at},"
+        f"and(updated_at.eq.{updated_at},id.gt.{id_}),"
+        f"and(updated_at.eq.{updated_at},id.eq.{id_},type.gt.{type_})"
+    )
+
+
+def row_key(row: dict) -> Optional[Key]:
+    """The keyset position of ``row``, or None if it has no ``updated_at``."""
+    if not row.get("updated_at"):
+        return None
+    return (str(row["updated_at"]), str(row.get("id", "")), str(row.get("type", "")))
+
+
+def fetch_page(client: Client, after: Optional[Key], page_size: int, retries: int = 3,
+               since: Optional[str] = None, until: Optional[str] = None) -> List[Any]:
     """
-    Fetches a page of artifacts based on a cursor and page size with retry mechanics.
+    Fetches the page of artifacts that sorts after ``after``, with retry mechanics.
+
+    Rows are ordered by ``(updated_at, id, type)``. Paging by key rather than
+    offset means a row updated mid-pull cannot shift later rows past a page
+    boundary.
 
     Args:
     client (Client): The Supabase client instance.
-    cursor (int): The starting index of the page.
+    after (tuple): Key of the last row already fetched, or None for the first page.
     page_size (int): The number of records to fetch.
     retries (int): Number of retries for fetching the data with exponential backoff.
+    since (str): Only fetch rows whose ``updated_at`` is at or after this timestamp.
+    until (str): Only fetch rows whose ``updated_at`` is at or before this timestamp.
 
     Returns:
     list: A list of fetched records.
@@ -38,7 +71,15 @@ def fetch_page(client: Client, cursor: int, page_size: int, retries: int = 3) ->
     """
     for attempt in range(retries):
         try:
-            results = client.table('artifacts').select("*").range(cursor, cursor + page_size - 1).execute()
+            query = client.table('artifacts').select("*")
+            if since:
+                query = query.gte("updated_at", since)
+            if until:
+                query = query.lte("updated_at", until)
+            if after:
+                query = query.or_(after_filter(after))
+            query = query.order("updated_at").order("id").order("type")
+            results = query.limit(page_size).execute()
             if results.data:
                 return results.data
             else:
@@ -49,4 +90,4 @@ def fetch_page(client: Client, cursor: int, page_size: int, retries: int = 3) ->
                 sleep(2 ** attempt)
             else:
                 raise e
-    return []
\ No newline at end of file
+    return []
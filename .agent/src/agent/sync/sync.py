@@ -13,6 +13,7 @@
 # limitations under the License.
 import os
 import re
+import time
 from pathlib import Path
 
 import typer
@@ -22,11 +23,12 @@ from agent.db.client import (
     get_all_artifacts_content,
     get_artifact_counts,
     get_artifacts_metadata,
-    upsert_artifact,
+    upsert_artifacts,
 )
+from agent.db.pool import close_connections
 from agent.core.config import config
+from agent.sync import bulk
 from agent.sync.client import get_supabase_client
-from agent.sync.pagination import fetch_page
 from agent.sync.progress import ProgressTracker
 
 
@@ -39,11 +41,16 @@ def save_checkpoint(cursor: int):
     # This function should be implemented to save to a checkpoint store.
     pass
 
-def get_total_artifacts(client) -> int:
-    """Fetch total count of artifacts from Supabase."""
+def get_total_artifacts(client, since: str = None, until: str = None) -> int:
+    """Fetch total count of artifacts (changed between ``since`` and ``until``) from Supabase."""
     try:
         # head=True means we only get the count, not the data
-        count = client.table('artifacts').select("*", count='exact', head=True).execute().count
+        query = client.table('artifacts').select("*", count='exact', head=True)
+        if since:
+            query = query.gte("updated_at", since)
+        if until:
+            query = query.lte("updated_at", until)
+        count = query.execute().count
         return count if count is not None else 0
     except Exception as e:
         print(f"Error fetching total count: {e}")
@@ -129,32 +136,30 @@ def _write_to_disk(id: str, type: str, content: str):
     except Exception as e:
         print(f"Failed to write {id} to disk: {e}")
 
-def process_page(page):
-    """Processes each page of artifacts by upserting them to the local DB and writing to disk."""
+def process_page(page) -> bool:
+    """Upserts pulled artifacts into the local DB in one transaction, then writes them to disk.
+
+    Returns False if the local DB write failed.
+    """
     if not page:
-        return
-        
+        return True
+
+    # Upsert into local SQLite (single transaction for the whole pull)
+    rows = [item for item in page if item.get('id') and item.get('type') and item.get('content') is not None]
+    result = upsert_artifacts(rows, author="remote", skip_unchanged=True)
+
     for item in page:
         try:
             id = item.get('id')
             type = item.get('type')
             content = item.get('content')
-            author = item.get('author', 'remote')
-
-            # Upsert into local SQLite
-            upsert_artifact(
-                id=id,
-                type=type,
-                content=content,
-                author=author
-            )
-            
             # Write to Disk
             if id and type and content:
                 _write_to_disk(id, type, content)
 
         except Exception as e:
             print(f"Error processing artifact {item.get('id')}: {e}")
+    return result.ok
 
 from agent.commands.secret import _prompt_password
 from agent.core.secrets import get_secret_manager
@@ -176,7 +181,7 @@ def pull(verbose: bool = False, backend: str = None, force: bool = False, artifa
     
     # 1. Supabase (Core)
     if run_all or backend in ["supabase", "core"]:
-        _pull_supabase(verbose, strict=(backend in ["supabase", "core"])) # TODO: Pass artifact_id filter to supabase logic
+        _pull_supabase(verbose, strict=(backend in ["supabase", "core"]), force=force) # TODO: Pass artifact_id filter to supabase logic
         
     # 2. Notion
     if run_all or backend == "notion":
@@ -200,7 +205,7 @@ def pull(verbose: bool = False, backend: str = None, force: bool = False, artifa
     if run_all or backend == "notion":
         scan(verbose=verbose)
 
-def _pull_supabase(verbose: bool = False, strict: bool = False):
+def _pull_supabase(verbose: bool = False, strict: bool = False, force: bool = False):
     """Internal Supabase Pull Logic"""
     client = get_supabase_client(verbose=verbose)
     
@@ -225,39 +230,32 @@ def _pull_supabase(verbose: bool = False, strict: bool = False):
                 print("Tip: Run 'agent secret set supabase service_role_key' or set SUPABASE_SERVICE_ROLE_KEY env var.")
         return
 
-    total = get_total_artifacts(client)  # Fetch total count from Supabase
+    # Only rows changed since the last complete pull (everything with --force),
+    # up to the newest change at the start of this one
+    since = None if force else bulk.load_watermarks().get("pull")
+    watermark = bulk.latest_remote_update(client)
+    total = get_total_artifacts(client, since=since, until=watermark)  # Fetch total count from Supabase
     
     if total == 0:
-        print("No artifacts found on remote.")
+        print("Local cache is up to date with remote." if since else "No artifacts found on remote.")
         return
         
     tracker = ProgressTracker(total)
-    page_size = int(os.getenv("AGENT_SYNC_PAGE_SIZE", 100))
-    cursor = read_checkpoint() or 0
 
     print(f"Syncing {total} artifacts from remote...")
 
-    while cursor < total:
-        try:
-            page = fetch_page(client, cursor, page_size)
-            if not page:
-                break
-                
-            process_page(page)
-            
-            # Update cursor and progress
-            count = len(page)
-            cursor += count
-            tracker.update(count)
-            save_checkpoint(cursor)
-            
-        except KeyboardInterrupt:
-            print("\nSync interrupted. Saving progress...")
-            save_checkpoint(cursor)
-            break
-        except Exception as e:
-            print(f"\nError during sync: {e}")
-            break
+    try:
+        rows = bulk.pull_rows(client, since=since, until=watermark, on_page=tracker.update)
+    except KeyboardInterrupt:
+        print("\nSync interrupted.")
+        return
+    except Exception as e:
+        print(f"\nError during sync: {e}")
+        return
+
+    if process_page(rows):
+        save_checkpoint(total)
+        bulk.save_watermark("pull", watermark)
 
 def push(verbose: bool = False, backend: str = None, force: bool = False, artifact_id: str = None, artifact_type: str = None, silent: bool = False):
     """Push local artifacts to remote."""
@@ -267,7 +265,7 @@ def push(verbose: bool = False, backend: str = None, force: bool = False, artifa
     
     # 1. Supabase (Core)
     if run_all or backend in ["supabase", "core"]:
-        _push_supabase(verbose, artifact_id, strict=(backend in ["supabase", "core"])) # Type filtering not strictly needed for Supabase yet (ID is unique per table usually, but good to add later)
+        _push_supabase(verbose, artifact_id, strict=(backend in ["supabase", "core"]), force=force) # Type filtering not strictly needed for Supabase yet (ID is unique per table usually, but good to add later)
         
     # 2. Notion
     if run_all or backend == "notion":
@@ -287,7 +285,7 @@ def push(verbose: bool = False, backend: str = None, force: bool = False, artifa
             if not silent:
                 print("Skipping Notion sync: NOTION_TOKEN not found.")
 
-def _push_supabase(verbose: bool = False, artifact_id: str = None, strict: bool = False):
+def _push_supabase(verbose: bool = False, artifact_id: str = None, strict: bool = False, force: bool = False):
     """Internal Supabase Push Logic"""
     client = get_supabase_client(verbose=verbose)
     
@@ -317,33 +315,32 @@ def _push_supabase(verbose: bool = False, artifact_id: str = None, strict: bool
         print("No local artifacts to push.")
         return
 
+    # Only artifacts modified since the last push (all of them with --force or an explicit ID)
+    since = None if force or artifact_id else bulk.load_watermarks().get("push")
+    if since:
+        artifacts = [a for a in artifacts if (a.get("last_modified") or "") >= since]
+        if not artifacts:
+            print("Remote is up to date; no artifacts changed since the last push.")
+            return
+
     print(f"Pushing {len(artifacts)} artifacts to remote...")
-    
-    success_count = 0
-    error_count = 0
-    
-    for art in artifacts:
-        try:
-            # Prepare payload matching Supabase schema
-            payload = {
-                "id": art["id"],
-                "type": art["type"],
-                "content": art["content"],
-                "version": art["version"],
-                "state": art["state"],
-                "author": art["author"],
-                # Let Supabase handle timestamps or use local modified time?
-                # Using upsert
-            }
-            
-            client.table("artifacts").upsert(payload).execute()
-            success_count += 1
-            if verbose:
-                print(f"  Pushed {art['id']}")
-                
-        except Exception as e:
-            error_count += 1
-            print(f"Failed to push {art.get('id')}: {e}")
+
+    # Prepare payloads matching Supabase schema
+    payloads = [
+        {
+            "id": art["id"],
+            "type": art["type"],
+            "content": art["content"],
+            "version": art["version"],
+            "state": art["state"],
+            "author": art["author"],
+        }
+        for art in artifacts
+    ]
+    success_count, error_count = bulk.push_rows(client, payloads, verbose=verbose)
+
+    if not error_count and not artifact_id:
+        bulk.save_watermark("push", max((a.get("last_modified") or "" for a in artifacts), default=None))
 
     print(f"Push complete. {success_count} success, {error_count} errors.")
 
@@ -439,11 +436,12 @@ def scan(verbose: bool = False):
         (adr_dir, "adr"),
     ]
 
-    total_added = 0
     total_errors = 0
+    rows = []
 
     print("Scanning local artifacts...")
-    
+    started = time.perf_counter()
+
     for path, type in paths_to_scan:
         if not path.exists():
             if verbose: print(f"Skipping missing directory: {path}")
@@ -468,18 +466,25 @@ def scan(verbose: bool = False):
                 if verbose:
                     print(f"  Found {type.upper()}: {art_id} ({file})")
 
-                # Upsert
-                if upsert_artifact(art_id, type, content, author="scanner"):
-                    total_added += 1
-                else:
-                    total_errors += 1
-                    print(f"Failed to upsert {art_id}")
+                rows.append({"id": art_id, "type": type, "content": content})
 
             except Exception as e:
                 total_errors += 1
                 print(f"Error processing {file}: {e}")
 
-    print(f"Scan complete. Processed {total_added} artifacts with {total_errors} errors.")
+    # One transaction for the whole scan; unchanged files are not re-versioned
+    result = upsert_artifacts(rows, author="scanner", skip_unchanged=True)
+    if not result.ok:
+        total_errors += len(rows)
+        print(f"Failed to upsert {len(rows)} artifacts")
+
+    elapsed = time.perf_counter() - started
+    rate = len(rows) / elapsed if elapsed > 0 else 0.0
+    print(
+        f"Scan complete. Processed {result.total} artifacts "
+        f"({result.written} written, {result.unchanged} unchanged) with {total_errors} errors "
+        f"in {elapsed:.2f}s ({rate:.0f} rows/s)."
+    )
 
 
 
@@ -577,7 +582,11 @@ def flush(hard: bool = False):
 
     # Delete
     if db_file.exists():
+        close_connections()
         db_file.unlink()
+        # WAL sidecars would otherwise be replayed into the next database
+        for suffix in ("-wal", "-shm"):
+            Path(f"{db_file}{suffix}").unlink(missing_ok=True)
         console.print(f"  [red]✗[/red] Deleted {db_file.name}")
 
     for d in artifact_dirs:
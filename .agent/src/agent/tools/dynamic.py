@@ -20,11 +20,24 @@ import logging
 import os
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 logger = logging.getLogger(__name__)
 
 
+_created_listeners: List[Callable[[Path], None]] = []
+
+
+def on_tool_created(callback: Callable[[Path], None]) -> None:
+    """Call *callback* with the tool's path after each successful ``create_tool``.
+
+    Lets caches built from tool modules (e.g. the voice tool catalog) drop
+    stale entries without polling.
+    """
+    if callback not in _created_listeners:
+        _created_listeners.append(callback)
+
+
 class SecurityError(Exception):
     """Base class for security-related errors in the dynamic tool engine."""
     pass
@@ -208,6 +221,11 @@ def create_tool(file_path: str, code: str) -> str:
         # guess the directory, keeping tests hermetic.
         module_name = target_path.stem
         reload_status = import_tool(module_name, tool_path=target_path)
+        for callback in list(_created_listeners):
+            try:
+                callback(target_path)
+            except Exception as e:
+                logger.warning(f"Tool-created listener failed for {target_path}: {e}")
 
         return f"Success: Tool created at {target_path}. {reload_status}"
 
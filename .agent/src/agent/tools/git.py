@@ -24,6 +24,7 @@ import re
 import subprocess
 from pathlib import Path
 from typing import Any, Dict, List, Optional
+from agent.core.git_state import git_state
 from agent.core.utils import scrub_sensitive_data
 
 def _validate_path(path: str, repo_root: Path) -> Path:
@@ -35,7 +36,7 @@ def _validate_path(path: str, repo_root: Path) -> Path:
 
 def _run_git(args: List[str], repo_root: Path) -> str:
     """
-    Executes a git command using subprocess.run.
+    Executes a git command through the shared git state service.
 
     Args:
         args: List of command line arguments (excluding 'git').
@@ -48,14 +49,7 @@ def _run_git(args: List[str], repo_root: Path) -> str:
         RuntimeError: If the git command fails.
     """
     try:
-        result = subprocess.run(
-            ["git"] + args,
-            cwd=str(repo_root),
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=30
-        )
+        result = git_state.run(*args, cwd=repo_root, check=True, timeout=30)
         return result.stdout
     except subprocess.CalledProcessError as e:
         error_msg = e.stderr or e.stdout or str(e)
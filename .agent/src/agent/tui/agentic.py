@@ -178,6 +178,7 @@ async def run_agentic_loop(
     provider: str,
     model: Optional[str] = None,
     on_thought: Optional[Callable[[str, int], None]] = None,
+    on_thought_delta: Optional[Callable[[str, int], None]] = None,
     on_tool_call: Optional[Callable[[str, Dict[str, Any], int], None]] = None,
     on_tool_result: Optional[Callable[[str, str, int], None]] = None,
     on_final_answer: Optional[Callable[[str], None]] = None,
@@ -196,6 +197,7 @@ async def run_agentic_loop(
         provider: The AI provider to use.
         model: Optional model override.
         on_thought: Callback for when the agent thinks.
+        on_thought_delta: Callback with Thought text as it streams in.
         on_tool_call: Callback when a tool is called.
         on_tool_result: Callback with the result of a tool call.
         on_final_answer: Callback for the final answer.
@@ -250,6 +252,10 @@ async def run_agentic_loop(
                     if on_thought and "content" in event:
                         on_thought(str(event["content"]), step)
 
+                elif event_type == "thought_delta":
+                    if on_thought_delta and "content" in event:
+                        on_thought_delta(str(event["content"]), step)
+
                 elif event_type == "tool_call":
                     if on_tool_call and "tool" in event and "input" in event:
                         tool_input = event["input"]
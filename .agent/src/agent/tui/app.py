@@ -53,7 +53,13 @@ from agent.tui.commands import (
     format_help_text,
     parse_input,
 )
-from agent.tui.session import ConversationSession, Message, SessionStore, TokenBudget
+from agent.tui.session import (
+    RESUME_MESSAGE_LIMIT,
+    ConversationSession,
+    Message,
+    SessionStore,
+    TokenBudget,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -206,6 +212,7 @@ class ConsoleApp(ChatWorkerMixin, App):
         # Plain text buffer for copy-to-clipboard
         self._chat_text: list[str] = []
         self._streaming_text = ""
+        self._thought_preview = ""
 
         # Security: Global tool approval for the current session
         self._tools_approved_for_session = False
@@ -324,7 +331,7 @@ class ConsoleApp(ChatWorkerMixin, App):
                 model_list.append(item)
 
         # Resume or create session
-        session = self._store.get_latest_session()
+        session = self._store.get_latest_session(message_limit=RESUME_MESSAGE_LIMIT)
         if session and session.messages:
             self._session = session
             self._replay_history()
@@ -379,6 +386,7 @@ class ConsoleApp(ChatWorkerMixin, App):
 
     def _write_chunk(self, text: str) -> None:
         """Update the active streaming widget with new token."""
+        self._thought_preview = ""
         self._streaming_text += text
         self._stream_widget.update(self._streaming_text)
 
@@ -609,7 +617,9 @@ class ConsoleApp(ChatWorkerMixin, App):
                 if idx < 0 or idx >= len(sessions):
                     self._write_system("[red]Invalid conversation number.[/red]")
                     return
-                target = self._store.get_session(sessions[idx].id)
+                target = self._store.get_session(
+                    sessions[idx].id, message_limit=RESUME_MESSAGE_LIMIT
+                )
                 if not target:
                     self._write_system("[red]Conversation not found.[/red]")
                     return
@@ -656,7 +666,9 @@ class ConsoleApp(ChatWorkerMixin, App):
                 self._write_system("[red]Invalid conversation number.[/red]")
                 return
             # Reload full session with messages (list_sessions skips them)
-            target = self._store.get_session(sessions[idx].id)
+            target = self._store.get_session(
+                sessions[idx].id, message_limit=RESUME_MESSAGE_LIMIT
+            )
             if not target:
                 self._write_system("[red]Conversation not found.[/red]")
                 return
@@ -699,7 +711,7 @@ class ConsoleApp(ChatWorkerMixin, App):
                     f'[dim]Deleted: "{deleted_title}"[/dim]'
                 )
                 # Switch to latest or create new
-                latest = self._store.get_latest_session()
+                latest = self._store.get_latest_session(message_limit=RESUME_MESSAGE_LIMIT)
                 if latest:
                     self._session = latest
                     self._replay_history()
@@ -1017,10 +1029,21 @@ class ConsoleApp(ChatWorkerMixin, App):
             # ReAct "Action:" text instead of actually calling tools.
             await self._stream_response(_get_system_prompt(), raw, use_tools=True)
 
+    def _write_thought_delta(self, text: str, step: int) -> None:
+        """Preview a Thought in the streaming widget while it is generated."""
+        self._thought_preview += text
+        self._stream_widget.display = True
+        self._stream_widget.update(f"Step {step} 🤔 {self._thought_preview}")
+
     def _write_thought(self, thought: str, step: int) -> None:
         """Display agent's thought process in the execution panel."""
         import re
         from rich.markup import escape
+
+        # The parsed thought replaces the live preview
+        if self._thought_preview:
+            self._thought_preview = ""
+            self._stream_widget.update(self._streaming_text)
         
         # Clean the thought of typical ReAct garbage
         cleaned = re.sub(r'```json.*?```', '', thought, flags=re.DOTALL|re.IGNORECASE)
@@ -313,8 +313,9 @@ class ChatWorkerMixin:
         try:
             # Run the synchronous generator in a thread but iterate it here
             def _gen():
+                # Interactive: hedge slow first tokens if AGENT_AI_HEDGE is on
                 return ai_service.stream_complete(
-                    pruned_system, history_text, model=model
+                    pruned_system, history_text, model=model, hedge=None
                 )
 
             # We use to_thread for the creation and then iterate safely
@@ -385,6 +386,7 @@ class ChatWorkerMixin:
                 provider=provider,
                 model=model,
                 on_thought=self._write_thought,
+                on_thought_delta=self._write_thought_delta,
                 on_tool_call=self._write_tool_call,
                 on_tool_result=self._write_tool_result,
                 on_final_answer=lambda text: self._write_chunk(text),
@@ -28,6 +28,7 @@ class TUISession:
         """AC-5: Retrieve the list of tools from the unified registry."""
         return self.tool_registry.list_tools()
 
+import bisect
 import logging
 import os
 import sqlite3
@@ -41,13 +42,35 @@ logger = logging.getLogger(__name__)
 
 MessageRole = Literal["user", "assistant"]
 
+# Messages are fetched from console.db in pages of this size
+MESSAGE_PAGE_SIZE = 500
+# Most recent messages loaded (and replayed) when the console resumes
+RESUME_MESSAGE_LIMIT = 1000
+
 
 @dataclass
 class Message:
-    """A single message in a conversation."""
+    """A single message in a conversation.
+
+    ``tokens`` caches the token count of ``content`` as computed for
+    ``token_provider``; it is persisted alongside the content so resumed
+    sessions never need re-tokenizing.
+    """
 
     role: MessageRole
     content: str
+    tokens: Optional[int] = field(default=None, compare=False)
+    token_provider: Optional[str] = field(default=None, compare=False)
+    id: Optional[int] = field(default=None, compare=False)
+
+    def token_count(self, provider: str) -> int:
+        """Return the token count for ``provider``, counting at most once."""
+        if self.tokens is None or self.token_provider != provider:
+            from agent.core.tokens import token_manager
+
+            self.tokens = token_manager.count_tokens(self.content or "", provider=provider)
+            self.token_provider = provider
+        return self.tokens
 
 
 @dataclass
@@ -91,6 +114,8 @@ class SessionStore:
         self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
 
         self._conn.row_factory = sqlite3.Row
+        # WAL lets the UI read while a worker thread appends messages
+        self._conn.execute("PRAGMA journal_mode=WAL")
         self._init_schema()
 
     def _init_schema(self) -> None:
@@ -109,9 +134,19 @@ class SessionStore:
                 role TEXT NOT NULL,
                 content TEXT NOT NULL,
                 created_at TEXT NOT NULL,
+                token_count INTEGER,
+                token_provider TEXT,
                 FOREIGN KEY (session_id) REFERENCES sessions(id) ON DELETE CASCADE
             );
         """)
+        # Databases created before token counts were stored
+        columns = {r["name"] for r in self._conn.execute("PRAGMA table_info(messages)")}
+        for column, ddl in (("token_count", "INTEGER"), ("token_provider", "TEXT")):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE messages ADD COLUMN {column} {ddl}")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_messages_session ON messages(session_id, id)"
+        )
         self._conn.execute("PRAGMA foreign_keys = ON")
         self._conn.commit()
 
@@ -137,21 +172,67 @@ class SessionStore:
             messages=[],
         )
 
-    def get_session(self, session_id: str) -> Optional[ConversationSession]:
-        """Retrieve a session by ID, including all messages."""
+    def get_messages(
+        self,
+        session_id: str,
+        before_id: Optional[int] = None,
+        limit: int = MESSAGE_PAGE_SIZE,
+    ) -> List[Message]:
+        """Return up to ``limit`` messages older than ``before_id``, oldest first.
+
+        Uses keyset pagination on the ``(session_id, id)`` index, so each
+        page costs the same regardless of how deep into the history it is.
+        """
+        query = (
+            "SELECT id, role, content, token_count, token_provider FROM messages "
+            "WHERE session_id = ?"
+        )
+        params: list = [session_id]
+        if before_id is not None:
+            query += " AND id < ?"
+            params.append(before_id)
+        query += " ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+        rows = self._conn.execute(query, params).fetchall()
+        return [
+            Message(
+                role=r["role"],
+                content=r["content"],
+                tokens=r["token_count"],
+                token_provider=r["token_provider"],
+                id=r["id"],
+            )
+            for r in reversed(rows)
+        ]
+
+    def get_session(
+        self, session_id: str, message_limit: Optional[int] = None
+    ) -> Optional[ConversationSession]:
+        """Retrieve a session by ID with its messages.
+
+        Args:
+            session_id: The session to load.
+            message_limit: Load only the most recent N messages; older
+                pages can be fetched with :meth:`get_messages`. ``None``
+                loads the full history.
+        """
         row = self._conn.execute(
             "SELECT * FROM sessions WHERE id = ?", (session_id,)
         ).fetchone()
         if not row:
             return None
 
-        messages = [
-            Message(role=r["role"], content=r["content"])
-            for r in self._conn.execute(
-                "SELECT role, content FROM messages WHERE session_id = ? ORDER BY id",
-                (session_id,),
-            ).fetchall()
-        ]
+        messages: List[Message] = []
+        before_id: Optional[int] = None
+        while message_limit is None or len(messages) < message_limit:
+            page_size = MESSAGE_PAGE_SIZE
+            if message_limit is not None:
+                page_size = min(page_size, message_limit - len(messages))
+            page = self.get_messages(session_id, before_id=before_id, limit=page_size)
+            messages[:0] = page
+            if len(page) < page_size:
+                break
+            before_id = page[0].id
         return ConversationSession(
             id=row["id"],
             title=row["title"],
@@ -162,11 +243,14 @@ class SessionStore:
             messages=messages,
         )
 
-    def get_latest_session(self) -> Optional[ConversationSession]:
+    def get_latest_session(
+        self, message_limit: Optional[int] = None
+    ) -> Optional[ConversationSession]:
         """Get the most recently updated session that has messages.
 
         Prefers sessions with actual conversation content. Falls back to
         the most recent empty session only if none have messages.
+        ``message_limit`` is passed through to :meth:`get_session`.
         """
         # First try: session with messages (active conversation)
         row = self._conn.execute(
@@ -177,14 +261,14 @@ class SessionStore:
                ORDER BY s.updated_at DESC LIMIT 1"""
         ).fetchone()
         if row:
-            return self.get_session(row["id"])
+            return self.get_session(row["id"], message_limit=message_limit)
 
         # Fallback: any session (may be empty)
         row = self._conn.execute(
             "SELECT id FROM sessions ORDER BY updated_at DESC LIMIT 1"
         ).fetchone()
         if row:
-            return self.get_session(row["id"])
+            return self.get_session(row["id"], message_limit=message_limit)
         return None
 
     def list_sessions(self) -> List[ConversationSession]:
@@ -194,10 +278,6 @@ class SessionStore:
         ).fetchall()
         sessions = []
         for row in rows:
-            msg_count = self._conn.execute(
-                "SELECT COUNT(*) FROM messages WHERE session_id = ?",
-                (row["id"],),
-            ).fetchone()[0]
             sessions.append(
                 ConversationSession(
                     id=row["id"],
@@ -211,13 +291,32 @@ class SessionStore:
             )
         return sessions
 
-    def add_message(self, session_id: str, role: MessageRole, content: str) -> None:
-        """Append a message to a session."""
+    def add_message(
+        self,
+        session_id: str,
+        role: MessageRole,
+        content: str,
+        token_count: Optional[int] = None,
+        token_provider: Optional[str] = None,
+    ) -> None:
+        """Append a message to a session.
+
+        The token count is stored with the message; when not supplied it is
+        computed once here for ``token_provider`` (default: the session's
+        provider).
+        """
         now = datetime.now(timezone.utc).isoformat()
+        if token_count is None:
+            if token_provider is None:
+                row = self._conn.execute(
+                    "SELECT provider FROM sessions WHERE id = ?", (session_id,)
+                ).fetchone()
+                token_provider = (row["provider"] if row else "") or "gemini"
+            token_count = Message(role, content).token_count(token_provider)
         self._conn.execute(
-            "INSERT INTO messages (session_id, role, content, created_at) "
-            "VALUES (?, ?, ?, ?)",
-            (session_id, role, content, now),
+            "INSERT INTO messages (session_id, role, content, created_at, token_count, token_provider) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (session_id, role, content, now, token_count, token_provider),
         )
         self._conn.execute(
             "UPDATE sessions SET updated_at = ? WHERE id = ?",
@@ -256,10 +355,39 @@ class TokenBudget:
 
     Prunes oldest turns FIFO while preserving the system prompt and the
     most recent turns. Logs when pruning occurs (@Observability).
+
+    Per-message counts come from :meth:`Message.token_count` and running
+    prefix sums are kept between turns, so assembling a turn only counts
+    the messages appended since the previous call.
     """
 
     def __init__(self, max_tokens: int = 8192) -> None:
         self.max_tokens = max_tokens
+        self._prefix: List[int] = [0]
+        self._tail: Optional[Message] = None
+        self._provider: Optional[str] = None
+
+    def _prefix_sums(self, messages: List[Message], provider: str) -> List[int]:
+        """Return prefix sums for ``messages``, extending the cached ones.
+
+        The cache is reused when ``messages`` extends the previously seen
+        history (same provider and same message object at the old tail).
+        """
+        known = len(self._prefix) - 1
+        reusable = (
+            provider == self._provider
+            and 0 < known <= len(messages)
+            and messages[known - 1] is self._tail
+        )
+        if not reusable:
+            self._prefix = [0]
+            known = 0
+        for message in messages[known:]:
+            self._prefix.append(self._prefix[-1] + message.token_count(provider))
+        self._provider = provider
+        self._tail = messages[-1] if messages else None
+        # Callers may pass a shorter history than last time (e.g. [:-1])
+        return self._prefix[: len(messages) + 1]
 
     def build_context(
         self,
@@ -294,35 +422,25 @@ class TokenBudget:
         # Always keep at least the last 2 turns (user + assistant)
         min_keep = min(2, len(messages))
 
-        # Count tokens for each message
-        msg_tokens = [
-            token_manager.count_tokens(m.content or "", provider=provider)
-            for m in messages
-        ]
-
-        total_msg_tokens = sum(msg_tokens)
+        prefix = self._prefix_sums(messages, provider)
+        total_msg_tokens = prefix[-1]
 
         if total_msg_tokens <= remaining:
             return system_prompt, list(messages)
 
-        # Prune oldest messages until we fit
-        pruned = list(messages)
-        pruned_tokens = list(msg_tokens)
-        tokens_before = total_msg_tokens
-        turns_pruned = 0
-
-        while sum(pruned_tokens) > remaining and len(pruned) > min_keep:
-            pruned.pop(0)
-            pruned_tokens.pop(0)
-            turns_pruned += 1
+        # Drop the shortest prefix whose removal makes the rest fit:
+        # tokens kept from index i = total - prefix[i] <= remaining
+        start = bisect.bisect_left(prefix, total_msg_tokens - remaining)
+        turns_pruned = min(start, len(messages) - min_keep)
+        pruned = messages[turns_pruned:]
 
-        tokens_after = sum(pruned_tokens)
+        tokens_after = total_msg_tokens - prefix[turns_pruned]
         if turns_pruned > 0:
             logger.info(
                 "Token budget pruning applied",
                 extra={
                     "turns_pruned": turns_pruned,
-                    "tokens_before": tokens_before,
+                    "tokens_before": total_msg_tokens,
                     "tokens_after": tokens_after,
                     "budget": self.max_tokens,
                 },
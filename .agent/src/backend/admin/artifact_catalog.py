@@ -0,0 +1,340 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+In-memory catalog of governance artifacts for the admin API.
+
+Stories, plans, runbooks, ADRs and preflight logs are parsed once and then
+kept up to date per file: a ``watchdog`` observer (when installed) marks
+changed paths dirty, and a periodic stat-only reconcile catches anything
+the watcher missed (or replaces it when ``watchdog`` is unavailable).
+Each change produces a new immutable :class:`CatalogSnapshot` holding the
+artifact list, an ID index, the precomputed estate graph and an ETag.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional, Sequence, Set, Tuple
+
+from pydantic import BaseModel
+
+from backend.admin.logger import log_bus
+
+logger = logging.getLogger(__name__)
+
+# Stat-walk interval when file events are available (safety net) / not available
+RECONCILE_INTERVAL_S = 60.0
+POLL_INTERVAL_S = 2.0
+
+ArtifactType = Literal["story", "plan", "runbook", "adr", "preflight"]
+
+_TITLE_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+_STATE_RE = re.compile(r'^##\s+State\s*\n\s*(\w+)', re.MULTILINE | re.IGNORECASE)
+_STATUS_RE = re.compile(r'^Status:\s*(\w+)', re.MULTILINE | re.IGNORECASE)
+_ID_RE = re.compile(r'([A-Z]+-\d+|ADR-\d+)')
+_STORY_LINK_RE = re.compile(r'\[([A-Z]+-\d+)\]')
+_ADR_LINK_RE = re.compile(r'(ADR-\d+)')
+
+
+class Artifact(BaseModel):
+    id: str         # Logical ID (WEB-005)
+    uid: str        # Unique ID for Graph (WEB-005-story)
+    type: ArtifactType
+    title: str
+    status: str
+    path: str
+    content: Optional[str] = None
+    links: List[str] = []
+
+
+def parse_markdown_links(content: str) -> List[str]:
+    """Find [ID] or [Link](...) references to other artifacts."""
+    links = []
+    # Match [WEB-005]
+    links.extend(_STORY_LINK_RE.findall(content))
+    # Match ADR-XXX
+    links.extend(_ADR_LINK_RE.findall(content))
+    return list(set(links))
+
+
+def parse_artifact(path: Path, art_type: str) -> Optional[Artifact]:
+    """Parse one markdown file into an :class:`Artifact` (None if unreadable)."""
+    try:
+        content = path.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log_bus.broadcast("error", f"Failed to process file {path}: {e}")
+        return None
+
+    # Extract title (first line # Title)
+    title_match = _TITLE_RE.search(content)
+    title = title_match.group(1).strip() if title_match else path.name
+
+    # Extract status, falling back to old syntax "Status: OPEN"
+    status_match = _STATE_RE.search(content) or _STATUS_RE.search(content)
+    status = status_match.group(1).upper() if status_match else "UNKNOWN"
+
+    # Extract ID from filename (WEB-005-... or governance-WEB-005-...)
+    id_match = _ID_RE.search(path.name)
+    art_id = id_match.group(1) if id_match else path.stem
+
+    return Artifact(
+        id=art_id,
+        uid=f"{art_id}-{art_type}",
+        type=art_type,
+        title=title,
+        status=status,
+        path=str(path),
+        links=parse_markdown_links(content),
+    )
+
+
+def file_etag(path: Path) -> Optional[str]:
+    """Weak ETag for a single file derived from its mtime and size."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return f'W/"{st.st_mtime_ns:x}-{st.st_size:x}"'
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """Immutable view of the catalog at one point in time."""
+
+    artifacts: List[Artifact]
+    by_id: Dict[str, Artifact]
+    graph: Dict[str, List[Dict[str, Any]]]
+    etag: str
+
+    def get(self, art_id: str) -> Optional[Artifact]:
+        """O(1) lookup by logical ID (first artifact in scan order wins)."""
+        return self.by_id.get(art_id)
+
+
+def _link_implicit(artifacts: List[Artifact]) -> Dict[str, List[Artifact]]:
+    """Add Runbook -> Story links and return the logical ID index."""
+    logical_map: Dict[str, List[Artifact]] = {}
+    for art in artifacts:
+        logical_map.setdefault(art.id, []).append(art)
+    for art in artifacts:
+        if art.type == 'runbook':
+            if any(sib.type == 'story' for sib in logical_map.get(art.id, [])) and art.id not in art.links:
+                art.links.append(art.id)  # Link purely by Logical ID for now
+    return logical_map
+
+
+def _build_graph(artifacts: List[Artifact], lookup: Dict[str, List[Artifact]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Build ReactFlow nodes and de-duplicated edges for the estate graph."""
+    nodes = [
+        {
+            "id": art.uid,  # Use Unique ID for Node
+            "type": "custom",
+            "data": {
+                "label": art.id,
+                "title": art.title,
+                "type": art.type,
+                "status": art.status,
+                "logical_id": art.id,
+            },
+            "position": {"x": 0, "y": 0},
+        }
+        for art in artifacts
+    ]
+    edges = []
+    edge_set: Set[str] = set()
+    for art in artifacts:
+        for link_id in art.links:
+            for target in lookup.get(link_id, []):
+                if target.uid == art.uid:
+                    continue
+                edge_id = f"{art.uid}->{target.uid}"
+                if edge_id in edge_set:
+                    continue
+                edges.append({"id": edge_id, "source": art.uid, "target": target.uid, "type": "smoothstep"})
+                edge_set.add(edge_id)
+    return {"nodes": nodes, "edges": edges}
+
+
+class ArtifactCatalog:
+    """
+    Watched, incrementally updated catalog of governance artifacts.
+
+    ``roots`` is an ordered list of ``(directory, artifact_type)``; the
+    order defines scan order and therefore which artifact wins an ID
+    lookup when several share a logical ID (e.g. story before runbook).
+    """
+
+    def __init__(self, roots: Sequence[Tuple[Path, str]], watch: bool = True) -> None:
+        self._roots = [(Path(d), t) for d, t in roots]
+        self._lock = threading.RLock()
+        self._parsed: Dict[str, Tuple[Tuple[int, int], Artifact]] = {}
+        self._dirty: Set[str] = set()
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._last_reconcile = 0.0
+        self._observer = None
+        if watch:
+            self._start_watcher()
+
+    # -- file watching -----------------------------------------------------
+
+    def _start_watcher(self) -> None:
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            logger.info("watchdog not installed; artifact catalog will poll for changes")
+            return
+
+        catalog = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory:
+                    return
+                for attr in ("src_path", "dest_path"):
+                    path = getattr(event, attr, None)
+                    if path and str(path).endswith(".md"):
+                        catalog.mark_dirty(Path(os.fsdecode(path)))
+
+        observer = Observer()
+        observer.daemon = True
+        watched = 0
+        for directory, _ in self._roots:
+            if directory.is_dir():
+                observer.schedule(_Handler(), str(directory), recursive=True)
+                watched += 1
+        if not watched:
+            return
+        try:
+            observer.start()
+        except Exception as e:
+            logger.warning(f"Artifact watcher failed to start, polling instead: {e}")
+            return
+        self._observer = observer
+
+    def stop(self) -> None:
+        """Stop the file watcher (if running)."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+
+    def mark_dirty(self, path: Path) -> None:
+        """Schedule ``path`` to be re-parsed on the next snapshot."""
+        with self._lock:
+            self._dirty.add(str(path))
+
+    # -- refresh -----------------------------------------------------------
+
+    def _type_for(self, path: Path) -> Optional[str]:
+        for directory, art_type in self._roots:
+            try:
+                path.relative_to(directory)
+            except ValueError:
+                continue
+            return art_type
+        return None
+
+    @staticmethod
+    def _signature(path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _update_path_locked(self, key: str) -> bool:
+        """Re-parse one file if its signature changed. Returns True on change."""
+        path = Path(key)
+        art_type = self._type_for(path)
+        signature = self._signature(path) if art_type else None
+        previous = self._parsed.get(key)
+        if signature is None:
+            return self._parsed.pop(key, None) is not None
+        if previous is not None and previous[0] == signature:
+            return False
+        artifact = parse_artifact(path, art_type)
+        if artifact is None:
+            return self._parsed.pop(key, None) is not None
+        self._parsed[key] = (signature, artifact)
+        return True
+
+    def _reconcile_locked(self) -> bool:
+        """Stat-walk every root; re-parse only new or modified files."""
+        seen: Set[str] = set()
+        changed = False
+        for directory, _ in self._roots:
+            if not directory.is_dir():
+                continue
+            for path in directory.rglob("*.md"):
+                key = str(path)
+                seen.add(key)
+                changed |= self._update_path_locked(key)
+        for key in [k for k in self._parsed if k not in seen]:
+            del self._parsed[key]
+            changed = True
+        self._dirty.clear()
+        self._last_reconcile = time.monotonic()
+        return changed
+
+    def _rebuild_locked(self) -> CatalogSnapshot:
+        def sort_key(key: str) -> Tuple[int, str]:
+            path = Path(key)
+            for index, (directory, _) in enumerate(self._roots):
+                if path.is_relative_to(directory):
+                    return index, key
+            return len(self._roots), key
+
+        # Copies, so implicit links never leak into the cached parse results
+        artifacts = [self._parsed[k][1].model_copy(deep=True) for k in sorted(self._parsed, key=sort_key)]
+        lookup = _link_implicit(artifacts)
+        by_id: Dict[str, Artifact] = {}
+        for art in artifacts:
+            by_id.setdefault(art.id, art)
+        graph = _build_graph(artifacts, lookup)
+        digest = hashlib.sha256(
+            json.dumps([a.model_dump() for a in artifacts], sort_keys=True).encode("utf-8")
+        ).hexdigest()[:32]
+        return CatalogSnapshot(artifacts=artifacts, by_id=by_id, graph=graph, etag=f'"{digest}"')
+
+    def refresh(self, path: Optional[Path] = None) -> CatalogSnapshot:
+        """Re-read ``path`` (or reconcile everything) and return a snapshot."""
+        with self._lock:
+            changed = self._update_path_locked(str(path)) if path else self._reconcile_locked()
+            if changed or self._snapshot is None:
+                self._snapshot = self._rebuild_locked()
+            return self._snapshot
+
+    def snapshot(self) -> CatalogSnapshot:
+        """Return the current snapshot, applying any pending file changes."""
+        with self._lock:
+            interval = RECONCILE_INTERVAL_S if self._observer is not None else POLL_INTERVAL_S
+            if self._snapshot is None or time.monotonic() - self._last_reconcile >= interval:
+                changed = self._reconcile_locked()
+            else:
+                dirty, self._dirty = self._dirty, set()
+                changed = False
+                for key in dirty:
+                    changed |= self._update_path_locked(key)
+            if changed or self._snapshot is None:
+                self._snapshot = self._rebuild_locked()
+            return self._snapshot
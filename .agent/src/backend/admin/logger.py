@@ -12,24 +12,36 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import asyncio
 import json
 import time
 from typing import Set
 
+from backend.bounded_queue import BoundedQueue
+
+# Per-subscriber backlog; a stalled browser tab loses the oldest entries
+SUBSCRIBER_QUEUE_SIZE = 1000
+
+
 class ActivityLogBus:
-    """A simple event bus to broadcast agent activity to WebSocket clients."""
+    """A simple event bus to broadcast agent activity to WebSocket clients.
+
+    Each subscriber gets a bounded drop-oldest queue, so a slow client
+    costs at most ``SUBSCRIBER_QUEUE_SIZE`` messages of memory and never
+    slows down the broadcaster or other subscribers.
+    """
     
-    def __init__(self):
-        self._clients: Set[asyncio.Queue] = set()
+    def __init__(self, queue_size: int = SUBSCRIBER_QUEUE_SIZE):
+        self._clients: Set[BoundedQueue] = set()
+        self._queue_size = queue_size
 
-    async def subscribe(self) -> asyncio.Queue:
-        queue = asyncio.Queue()
+    async def subscribe(self) -> BoundedQueue:
+        queue = BoundedQueue(self._queue_size, name="activity_log")
         self._clients.add(queue)
         return queue
 
-    def unsubscribe(self, queue: asyncio.Queue):
+    def unsubscribe(self, queue: BoundedQueue):
         self._clients.discard(queue)
+        queue.close()
 
     def broadcast(self, type: str, content: str, level: str = "info"):
         message = {
@@ -40,7 +52,7 @@ class ActivityLogBus:
         }
         raw = json.dumps(message)
         for queue in self._clients:
-            queue.put_nowait(raw)
+            queue.put_nowait(raw, kind=type)
 
 # Singleton
 log_bus = ActivityLogBus()
@@ -0,0 +1,227 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Bounded per-subscriber queues for streaming to WebSocket clients.
+
+A drop-in replacement for the ``asyncio.Queue`` subset used by the
+activity log stream and the voice sender (``put``/``put_nowait``/``get``/
+``task_done``/``qsize``). When full, the queue makes room according to a
+per-message :class:`Policy`:
+
+- ``DROP_OLDEST``: the oldest droppable message is evicted.
+- ``COALESCE``: a queued message with the same key is replaced in place
+  (e.g. only the latest ``status`` matters).
+- ``KEEP``: never dropped. ``put()`` waits for space (backpressure);
+  ``put_nowait()`` is allowed to overflow and is counted.
+
+Policies are re-evaluated at eviction time, so "keep audio for the active
+generation" stops protecting a chunk once its generation is superseded.
+"""
+
+import asyncio
+import collections
+import enum
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from prometheus_client import Counter, Gauge
+
+
+class Policy(str, enum.Enum):
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
+    KEEP = "keep"
+
+
+# (kind used as metric label, policy, coalescing key)
+Classification = Tuple[str, Policy, Optional[str]]
+
+queue_depth = Gauge(
+    "backend_stream_queue_depth",
+    "Messages waiting in WebSocket subscriber queues",
+    ["queue"],
+)
+queue_dropped_total = Counter(
+    "backend_stream_queue_dropped_total",
+    "Messages dropped or coalesced by bounded subscriber queues",
+    ["queue", "kind", "reason"],
+)
+queue_overflow_total = Counter(
+    "backend_stream_queue_overflow_total",
+    "Never-drop messages enqueued beyond a subscriber queue's bound",
+    ["queue", "kind"],
+)
+
+
+def _drop_oldest(item: Any) -> Classification:
+    return "message", Policy.DROP_OLDEST, None
+
+
+class _Entry:
+    __slots__ = ("item", "kind", "key")
+
+    def __init__(self, item: Any, kind: str, key: Optional[str]) -> None:
+        self.item = item
+        self.kind = kind
+        self.key = key
+
+
+class BoundedQueue:
+    """Bounded async queue with per-message drop/coalesce policies."""
+
+    def __init__(
+        self,
+        maxsize: int,
+        name: str,
+        classify: Callable[[Any], Classification] = _drop_oldest,
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.name = name
+        self._classify = classify
+        self._entries: Deque[_Entry] = collections.deque()
+        self._keyed: Dict[str, _Entry] = {}
+        self._getters: Deque[asyncio.Future] = collections.deque()
+        self._putters: Deque[asyncio.Future] = collections.deque()
+        self.dropped = 0
+        self._depth = queue_depth.labels(queue=name)
+        # Resolved metric children; labels() is too slow for the fan-out path
+        self._drop_counters: Dict[Tuple[str, str], Any] = {}
+
+    def qsize(self) -> int:
+        return len(self._entries)
+
+    def empty(self) -> bool:
+        return not self._entries
+
+    def full(self) -> bool:
+        return len(self._entries) >= self.maxsize
+
+    def _count_drop(self, kind: str, reason: str) -> None:
+        self.dropped += 1
+        counter = self._drop_counters.get((kind, reason))
+        if counter is None:
+            counter = queue_dropped_total.labels(queue=self.name, kind=kind, reason=reason)
+            self._drop_counters[(kind, reason)] = counter
+        counter.inc()
+
+    @staticmethod
+    def _wake(waiters: Deque[asyncio.Future]) -> None:
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    def _remove(self, entry: _Entry) -> None:
+        """Unlink ``entry``; the caller accounts for the depth gauge."""
+        if self._entries[0] is entry:
+            self._entries.popleft()
+        else:
+            self._entries.remove(entry)
+        if entry.key is not None and self._keyed.get(entry.key) is entry:
+            del self._keyed[entry.key]
+
+    def _evict_one(self) -> bool:
+        """Evict the oldest message whose current policy allows dropping."""
+        for entry in self._entries:
+            if self._classify(entry.item)[1] is not Policy.KEEP:
+                self._remove(entry)
+                self._count_drop(entry.kind, "evicted")
+                return True
+        return False
+
+    def put_nowait(self, item: Any, kind: Optional[str] = None) -> bool:
+        """Enqueue ``item`` without waiting. Returns False if it was dropped.
+
+        ``kind`` overrides the classifier's metric label (the policy still
+        comes from the classifier).
+        """
+        item_kind, policy, key = self._classify(item)
+        kind = kind or item_kind
+
+        if policy is Policy.COALESCE and key is not None and key in self._keyed:
+            self._keyed[key].item = item
+            self._count_drop(kind, "coalesced")
+            return True
+
+        replaced = False
+        if self.full():
+            replaced = self._evict_one()
+            if not replaced:
+                if policy is not Policy.KEEP:
+                    self._count_drop(kind, "rejected")
+                    return False
+                # KEEP messages are never dropped; record that the bound was exceeded
+                queue_overflow_total.labels(queue=self.name, kind=kind).inc()
+
+        entry = _Entry(item, kind, key if policy is Policy.COALESCE else None)
+        self._entries.append(entry)
+        if entry.key is not None:
+            self._keyed[entry.key] = entry
+        if not replaced:
+            self._depth.inc()
+        self._wake(self._getters)
+        return True
+
+    async def put(self, item: Any) -> None:
+        """Enqueue ``item``; ``KEEP`` messages wait while the queue is full."""
+        loop = asyncio.get_running_loop()
+        while self.full() and self._classify(item)[1] is Policy.KEEP:
+            if any(self._classify(e.item)[1] is not Policy.KEEP for e in self._entries):
+                break  # put_nowait can make room by evicting
+            putter = loop.create_future()
+            self._putters.append(putter)
+            try:
+                await putter
+            except asyncio.CancelledError:
+                putter.cancel()
+                raise
+        self.put_nowait(item)
+
+    def get_nowait(self) -> Any:
+        if not self._entries:
+            raise asyncio.QueueEmpty
+        entry = self._entries[0]
+        self._remove(entry)
+        self._depth.dec()
+        self._wake(self._putters)
+        return entry.item
+
+    async def get(self) -> Any:
+        loop = asyncio.get_running_loop()
+        while not self._entries:
+            getter = loop.create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except asyncio.CancelledError:
+                getter.cancel()
+                raise
+        return self.get_nowait()
+
+    def task_done(self) -> None:
+        """Compatibility no-op for ``asyncio.Queue`` consumers."""
+
+    def close(self) -> None:
+        """Discard queued messages (subscriber gone) and release waiters."""
+        self._depth.dec(len(self._entries))
+        self._entries.clear()
+        self._keyed.clear()
+        for waiter in (*self._getters, *self._putters):
+            if not waiter.done():
+                waiter.cancel()
+        self._getters.clear()
+        self._putters.clear()
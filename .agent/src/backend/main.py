@@ -125,3 +125,11 @@ async def admin_logs_websocket(websocket: WebSocket):
 @app.get("/health")
 async def health_check():
     return {"status": "ok"}
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus scrape endpoint (stream queue depth/drops, token usage, ...)."""
+    from fastapi import Response
+    from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
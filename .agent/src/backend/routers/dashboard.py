@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+
 from fastapi import APIRouter, HTTPException
 from typing import List, Dict
 from backend.routers.governance import scan_artifacts
@@ -23,7 +25,7 @@ router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
 async def get_stories() -> List[Dict[str, Any]]:
     """Returns all stories."""
     try:
-        artifacts = scan_artifacts()
+        artifacts = await asyncio.to_thread(scan_artifacts)
         stories = [art.dict() for art in artifacts if art.type == 'story']
         # Sort by ID descending (newest first)
         stories.sort(key=lambda x: x['id'], reverse=True)
@@ -35,7 +37,7 @@ async def get_stories() -> List[Dict[str, Any]]:
 async def get_stats():
     """Returns project statistics."""
     try:
-        artifacts = scan_artifacts()
+        artifacts = await asyncio.to_thread(scan_artifacts)
         
         stories = [a for a in artifacts if a.type == 'story']
         adrs = [a for a in artifacts if a.type == 'adr']
@@ -12,12 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from pydantic import BaseModel
-from typing import List, Dict, Literal, Optional, Any
+import asyncio
 import os
 import re
 from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request, Response
+from pydantic import BaseModel
+
+from backend.admin.artifact_catalog import (  # noqa: F401 — re-exported API
+    Artifact,
+    ArtifactCatalog,
+    CatalogSnapshot,
+    file_etag,
+    parse_markdown_links,
+)
 from backend.admin.logger import log_bus
 
 router = APIRouter(prefix="/api/admin/governance", tags=["governance"])
@@ -31,16 +41,6 @@ RULES_DIR = BASE_DIR / ".agent" / "rules"
 ADR_DIR = BASE_DIR / ".agent" / "adrs"
 LOG_DIR = BASE_DIR / ".agent" / "logs"
 
-class Artifact(BaseModel):
-    id: str         # Logical ID (WEB-005)
-    uid: str        # Unique ID for Graph (WEB-005-story)
-    type: Literal["story", "plan", "runbook", "adr", "preflight"]
-    title: str
-    status: str
-    path: str
-    content: Optional[str] = None
-    links: List[str] = []
-
 class EstateGraph(BaseModel):
     nodes: List[Dict[str, Any]]
     edges: List[Dict[str, Any]]
@@ -48,168 +48,72 @@ class EstateGraph(BaseModel):
 class ArtifactUpdate(BaseModel):
     content: str
 
-def parse_markdown_links(content: str) -> List[str]:
-    """Find [ID] or [Link](...) references to other artifacts."""
-    links = []
-    # Match [WEB-005]
-    story_matches = re.findall(r'\[([A-Z]+-\d+)\]', content)
-    links.extend(story_matches)
-    # Match ADR-XXX
-    adr_matches = re.findall(r'(ADR-\d+)', content)
-    links.extend(adr_matches)
-    return list(set(links))
+_catalog: Optional[ArtifactCatalog] = None
+
+def get_catalog() -> ArtifactCatalog:
+    """Return the process-wide artifact catalog, starting its watcher on first use."""
+    global _catalog
+    if _catalog is None:
+        _catalog = ArtifactCatalog([
+            (CACHE_DIR / "stories", "story"),
+            (CACHE_DIR / "plans", "plan"),
+            (CACHE_DIR / "runbooks", "runbook"),
+            (ADR_DIR, "adr"),
+            (LOG_DIR, "preflight"),
+        ])
+    return _catalog
 
 def scan_artifacts() -> List[Artifact]:
-    artifacts = []
-    
-    # helper to process file
-    def process_file(path: Path, art_type: str):
-        if not path.exists(): return
-        try:
-            content = path.read_text(encoding='utf-8')
-            
-            # Extract title (first line # Title)
-            title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
-            title = title_match.group(1).strip() if title_match else path.name
-            
-            # Extract status
-            status_match = re.search(r'^##\s+State\s*\n\s*(\w+)', content, re.MULTILINE | re.IGNORECASE)
-            # Fallback for old syntax "Status: OPEN"
-            if not status_match:
-                 status_match = re.search(r'^Status:\s*(\w+)', content, re.MULTILINE | re.IGNORECASE)
-            
-            status = status_match.group(1).upper() if status_match else "UNKNOWN"
-            
-            # Extract ID from filename (WEB-005-... or governance-WEB-005-...)
-            id_match = re.search(r'([A-Z]+-\d+|ADR-\d+)', path.name)
-            art_id = id_match.group(1) if id_match else path.stem
-            
-            # Generate Unique ID for Graph/ReactFlow
-            # e.g. WEB-005-story
-            uid = f"{art_id}-{art_type}"
-            
-            links = parse_markdown_links(content)
-            
-            artifacts.append(Artifact(
-                id=art_id,
-                uid=uid,
-                type=art_type,
-                title=title,
-                status=status,
-                path=str(path),
-                links=links
-            ))
-        except Exception as e:
-            log_bus.broadcast("error", f"Failed to process file {path}: {e}")
-
-    # Stories
-    for f in (CACHE_DIR / "stories").rglob("*.md"): process_file(f, "story")
-    # Plans
-    for f in (CACHE_DIR / "plans").rglob("*.md"): process_file(f, "plan")
-    # Runbooks
-    for f in (CACHE_DIR / "runbooks").rglob("*.md"): process_file(f, "runbook")
-    # ADRs
-    if ADR_DIR.exists():
-        for f in ADR_DIR.rglob("*.md"): process_file(f, "adr")
-    
-    # Preflight Logs
-    if LOG_DIR.exists():
-        for f in LOG_DIR.rglob("*.md"): process_file(f, "preflight")
-        
-    # Post-process: Implicit Links & Validating Links to UIDs
-    # We need to map logical connections (Story WEB-005 -> Plan WEB-005)
-    # And Explicit links (Text "WEB-005") -> Target UID
-    
-    # 1. Map Logical ID to List of UIDs
-    # e.g. "WEB-005" -> ["WEB-005-story", "WEB-005-runbook"]
-    logical_map = {}
-    for art in artifacts:
-        if art.id not in logical_map:
-            logical_map[art.id] = []
-        logical_map[art.id].append(art)
-        
-    # 2. Logic: Implicit Link (Runbook <-> Story)
-    for art in artifacts:
-        if art.type == 'runbook':
-            # Find matching story
-            siblings = logical_map.get(art.id, [])
-            for sib in siblings:
-                if sib.type == 'story':
-                    # Add implicit link
-                    if sib.id not in art.links:
-                        art.links.append(sib.id) # Link purely by Logical ID for now
-    
-    return artifacts
+    """Return all artifacts from the in-memory catalog."""
+    return get_catalog().snapshot().artifacts
+
+async def _snapshot() -> CatalogSnapshot:
+    # Applying pending changes may parse files; keep it off the event loop
+    return await asyncio.to_thread(get_catalog().snapshot)
+
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Return a 304 response when the client's If-None-Match matches ``etag``."""
+    if_none_match = request.headers.get("if-none-match", "")
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    if etag in candidates or "*" in candidates:
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
+
+def _write_atomic(path: Path, content: str) -> None:
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(content, encoding='utf-8')
+    os.replace(tmp_path, path)
 
 @router.get("/artifacts", response_model=List[Artifact])
-async def list_artifacts():
+async def list_artifacts(request: Request, response: Response):
     try:
-        return scan_artifacts()
+        snapshot = await _snapshot()
+        cached = _not_modified(request, snapshot.etag)
+        if cached:
+            return cached
+        response.headers["ETag"] = snapshot.etag
+        return snapshot.artifacts
     except Exception as e:
         log_bus.broadcast("error", f"List artifacts failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/graph", response_model=EstateGraph)
-async def get_estate_graph():
+async def get_estate_graph(request: Request, response: Response):
     try:
-        artifacts = scan_artifacts()
-        nodes = []
-        edges = []
-        
-        # logical_id -> [uid, uid...]
-        lookup = {}
-        for art in artifacts:
-            if art.id not in lookup: lookup[art.id] = []
-            lookup[art.id].append(art)
-            
-        for art in artifacts:
-            nodes.append({
-                "id": art.uid, # Use Unique ID for Node
-                "type": "custom",
-                "data": { 
-                    "label": art.id, 
-                    "title": art.title,
-                    "type": art.type,
-                    "status": art.status,
-                    "logical_id": art.id
-                },
-                "position": { "x": 0, "y": 0 }
-            })
-            
-        edge_set = set() # Avoid duplicates
-        
-        for art in artifacts:
-            for link_id in art.links:
-                # link_id is usually a Logical ID (e.g. "WEB-005")
-                # We need to find the target UID.
-                targets = lookup.get(link_id, [])
-                
-                for target in targets:
-                    # Avoid self-loops
-                    if target.uid == art.uid: continue
-                    
-                    # Create edge: Sender UID -> Target UID
-                    edge_id = f"{art.uid}->{target.uid}"
-                    if edge_id in edge_set: continue
-                    
-                    edges.append({
-                        "id": edge_id,
-                        "source": art.uid,
-                        "target": target.uid,
-                        "type": "smoothstep"
-                    })
-                    edge_set.add(edge_id)
-                    
-        return EstateGraph(nodes=nodes, edges=edges)
+        snapshot = await _snapshot()
+        cached = _not_modified(request, snapshot.etag)
+        if cached:
+            return cached
+        response.headers["ETag"] = snapshot.etag
+        return EstateGraph(**snapshot.graph)
     except Exception as e:
         log_bus.broadcast("error", f"Graph generation failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/artifact/{art_id}")
-async def get_artifact_content(art_id: str):
+async def get_artifact_content(art_id: str, request: Request, response: Response):
     try:
-        artifacts = scan_artifacts()
-        target = next((a for a in artifacts if a.id == art_id), None)
+        target = (await _snapshot()).get(art_id)
         
         if not target:
             raise HTTPException(status_code=404, detail="Artifact not found")
@@ -217,8 +121,15 @@ async def get_artifact_content(art_id: str):
         path = Path(target.path)
         if not path.is_relative_to(Path(".")): # Simple check, better would be resolved check
              raise HTTPException(status_code=403, detail="Access denied")
-             
-        return {"content": path.read_text(encoding='utf-8')}
+
+        etag = file_etag(path)
+        if etag is None:
+            raise HTTPException(status_code=404, detail="File not found")
+        cached = _not_modified(request, etag)
+        if cached:
+            return cached
+        response.headers["ETag"] = etag
+        return {"content": await asyncio.to_thread(path.read_text, encoding='utf-8')}
     except HTTPException:
         raise
     except Exception as e:
@@ -228,8 +139,7 @@ async def get_artifact_content(art_id: str):
 @router.post("/artifact/{art_id}")
 async def update_artifact(art_id: str, update: ArtifactUpdate):
     try:
-        artifacts = scan_artifacts()
-        target = next((a for a in artifacts if a.id == art_id), None)
+        target = (await _snapshot()).get(art_id)
         
         if not target:
             raise HTTPException(status_code=404, detail="Artifact not found")
@@ -237,9 +147,9 @@ async def update_artifact(art_id: str, update: ArtifactUpdate):
         path = Path(target.path)
         
         # Atomic Write
-        tmp_path = path.with_suffix(".tmp")
-        tmp_path.write_text(update.content, encoding='utf-8')
-        os.replace(tmp_path, path)
+        await asyncio.to_thread(_write_atomic, path, update.content)
+        # Don't wait for the watcher: make the write visible to the next read
+        await asyncio.to_thread(get_catalog().refresh, path)
         
         log_bus.broadcast("info", f"Updated artifact {art_id}")
         return {"status": "success"}
@@ -250,11 +160,30 @@ async def update_artifact(art_id: str, update: ArtifactUpdate):
 class StatusUpdate(BaseModel):
     status: str
 
+def _apply_status(content: str, new_status: str) -> str:
+    """Rewrite ``## State`` / ``Status:`` in ``content`` (or append a State section)."""
+    # Regex to find ## State <status> or Status: <status>
+    # We try both common patterns.
+    
+    # Pattern 1: ## State\nOPEN
+    state_pattern = r'(^##\s+State\s*\n\s*)(\w+)'
+    
+    if re.search(state_pattern, content, re.MULTILINE | re.IGNORECASE):
+        return re.sub(state_pattern, f"\\g<1>{new_status}", content, count=1, flags=re.MULTILINE | re.IGNORECASE)
+
+    # Pattern 2: Status: OPEN (YAML frontmatter style or list)
+    status_pattern = r'(^Status:\s*)(\w+)'
+    if re.search(status_pattern, content, re.MULTILINE | re.IGNORECASE):
+        return re.sub(status_pattern, f"\\g<1>{new_status}", content, count=1, flags=re.MULTILINE | re.IGNORECASE)
+
+    # Fallback: Append to end if not found
+    # Add standard "## State" header
+    return content + f"\n\n## State\n{new_status}\n"
+
 @router.patch("/artifact/{art_id}/status")
 async def update_artifact_status(art_id: str, update: StatusUpdate):
     try:
-        artifacts = scan_artifacts()
-        target = next((a for a in artifacts if a.id == art_id), None)
+        target = (await _snapshot()).get(art_id)
         
         if not target:
             raise HTTPException(status_code=404, detail="Artifact not found")
@@ -263,31 +192,13 @@ async def update_artifact_status(art_id: str, update: StatusUpdate):
         if not path.exists():
             raise HTTPException(status_code=404, detail="File not found")
             
-        content = path.read_text(encoding='utf-8')
+        content = await asyncio.to_thread(path.read_text, encoding='utf-8')
         new_status = update.status.upper()
-        
-        # Regex to find ## State <status> or Status: <status>
-        # We try both common patterns.
-        
-        # Pattern 1: ## State\nOPEN
-        state_pattern = r'(^##\s+State\s*\n\s*)(\w+)'
-        
-        if re.search(state_pattern, content, re.MULTILINE | re.IGNORECASE):
-            new_content = re.sub(state_pattern, f"\\g<1>{new_status}", content, count=1, flags=re.MULTILINE | re.IGNORECASE)
-        else:
-            # Pattern 2: Status: OPEN (YAML frontmatter style or list)
-            status_pattern = r'(^Status:\s*)(\w+)'
-            if re.search(status_pattern, content, re.MULTILINE | re.IGNORECASE):
-                new_content = re.sub(status_pattern, f"\\g<1>{new_status}", content, count=1, flags=re.MULTILINE | re.IGNORECASE)
-            else:
-                # Fallback: Append to end if not found
-                # Add standard "## State" header
-                new_content = content + f"\n\n## State\n{new_status}\n"
+        new_content = _apply_status(content, new_status)
         
         # Atomic Write
-        tmp_path = path.with_suffix(".tmp")
-        tmp_path.write_text(new_content, encoding='utf-8')
-        os.replace(tmp_path, path)
+        await asyncio.to_thread(_write_atomic, path, new_content)
+        await asyncio.to_thread(get_catalog().refresh, path)
         
         log_bus.broadcast("info", f"Updated status of {art_id} to {new_status}")
         return {"status": "success", "new_status": new_status}
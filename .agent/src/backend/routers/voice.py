@@ -20,6 +20,7 @@ from uuid import uuid4
 from collections import defaultdict
 from datetime import datetime, timedelta
 
+from backend.bounded_queue import BoundedQueue, Classification, Policy
 from backend.voice.orchestrator import VoiceOrchestrator
 
 router = APIRouter()
@@ -52,6 +53,42 @@ def check_rate_limit(session_id: str) -> bool:
 
 import asyncio
 
+# Output backlog per voice session before non-essential events are shed
+OUTPUT_QUEUE_SIZE = 256
+
+# Latest-value-wins UI state: only the newest queued one is worth sending
+_COALESCED_EVENTS = {"status", "vad_state"}
+
+
+def output_classifier(orchestrator: VoiceOrchestrator):
+    """Per-message queue policy for a voice session's output stream.
+
+    Audio for the generation currently being spoken and the control
+    messages the client depends on (final transcripts, ``clear_buffer``,
+    the stop sentinel) are never dropped. Superseded audio, streaming
+    partials and bus events are shed oldest-first; status/VAD updates
+    coalesce.
+    """
+    def classify(item) -> Classification:
+        if item is None:
+            return "sentinel", Policy.KEEP, None
+        msg_type, data = item
+        if msg_type == "audio":
+            if data[0] == orchestrator.current_generation_id:
+                return "audio", Policy.KEEP, None
+            return "audio_stale", Policy.DROP_OLDEST, None
+        event = data.get("type", "event")
+        if event in _COALESCED_EVENTS:
+            return event, Policy.COALESCE, event
+        if event == "transcript" and data.get("partial"):
+            return "transcript_partial", Policy.DROP_OLDEST, None
+        if event in ("transcript", "clear_buffer"):
+            return event, Policy.KEEP, None
+        return "event", Policy.DROP_OLDEST, None
+
+    return classify
+
+
 @router.websocket("/ws/voice")
 async def websocket_endpoint(websocket: WebSocket):
     """
@@ -75,8 +112,10 @@ async def websocket_endpoint(websocket: WebSocket):
     
     orchestrator = VoiceOrchestrator(session_id)
     
-    # Unified output queue for audio and JSON events
-    output_queue = asyncio.Queue()
+    # Unified output queue for audio and JSON events (bounded, see output_classifier)
+    output_queue = BoundedQueue(
+        OUTPUT_QUEUE_SIZE, name="voice_output", classify=output_classifier(orchestrator)
+    )
 
     # Callback to route Orchestrator events (tool calls, transcripts) to client
     def on_event_callback(event_type: str, payload: dict):
@@ -146,8 +185,9 @@ async def websocket_endpoint(websocket: WebSocket):
     finally:
         # Cleanup
         orchestrator.stop()
-        await output_queue.put(None) # Stop sender
+        output_queue.put_nowait(None) # Stop sender (never blocks on a full queue)
         await sender_future
+        output_queue.close()
 
 
 @router.get("/history/{session_id}")
@@ -0,0 +1,207 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Process-wide catalog of voice tools.
+
+Every ``VoiceOrchestrator`` needs the same tool schemas and handlers. The
+catalog builds the canonical ``ToolRegistry`` part once per repo root and
+loads each module in ``custom/`` once, re-executing it only when the file's
+content hash changes (a cheap ``stat`` gates the hash). A ``create_tool``
+event from :mod:`agent.tools.dynamic` drops everything so the next snapshot
+is rebuilt from scratch.
+
+Orchestrators receive a :class:`CatalogSnapshot`; the same snapshot object
+is handed out until something changes.
+"""
+
+import hashlib
+import inspect
+import logging
+import os
+import sys
+import threading
+import types
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from agent.core.adk.tools import ToolRegistry
+from agent.tools import dynamic
+
+logger = logging.getLogger(__name__)
+
+CUSTOM_DIR = Path(os.path.dirname(__file__)) / "custom"
+CUSTOM_PACKAGE = "backend.voice.tools.custom"
+
+
+def custom_schema(fn: Callable) -> Dict[str, Any]:
+    """OpenAI function-call schema for a custom tool (mirrors ``ToolRegistry``)."""
+    sig = inspect.signature(fn)
+    params: Dict[str, Any] = {"type": "object", "properties": {}, "required": []}
+    for name, param in sig.parameters.items():
+        prop: Dict[str, Any] = {"type": "string"}
+        if param.annotation is int:
+            prop["type"] = "integer"
+        elif param.annotation is bool:
+            prop["type"] = "boolean"
+        params["properties"][name] = prop
+        if param.default is inspect.Parameter.empty:
+            params["required"].append(name)
+    return {
+        "type": "function",
+        "function": {
+            "name": fn.__name__,
+            "description": (fn.__doc__ or "").strip(),
+            "parameters": params,
+        },
+    }
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """Immutable view of the tools available to one orchestrator.
+
+    ``schemas`` and ``handlers`` cover registry and custom tools (registry
+    names win); ``tools`` is the ``get_all_tools`` list, which keeps every
+    custom function even when its name shadows a registry tool.
+    """
+
+    schemas: Tuple[Dict[str, Any], ...]
+    handlers: Mapping[str, Callable]
+    tools: Tuple[Callable, ...]
+
+
+@dataclass
+class _CustomModule:
+    stamp: Tuple[int, int]
+    digest: str
+    functions: Tuple[Callable, ...] = ()
+    schemas: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+
+class ToolCatalog:
+    """Caches voice tool schemas and handlers across orchestrator sessions."""
+
+    def __init__(self, custom_dir: Path = CUSTOM_DIR, package: str = CUSTOM_PACKAGE) -> None:
+        self.custom_dir = custom_dir
+        self.package = package
+        self.loads = 0
+        self._lock = threading.Lock()
+        self._registry: Dict[str, Tuple[Tuple[Dict[str, Any], ...], Tuple[Callable, ...]]] = {}
+        self._modules: Dict[Path, _CustomModule] = {}
+        self._snapshots: Dict[str, CatalogSnapshot] = {}
+
+    def snapshot(self, repo_root: Optional[Path] = None) -> CatalogSnapshot:
+        """Current tools for ``repo_root``, reusing cached work where possible."""
+        key = str(repo_root) if repo_root is not None else ""
+        with self._lock:
+            changed = self._refresh_custom()
+            if changed or key not in self._snapshots:
+                self._snapshots[key] = self._build(repo_root, key)
+            return self._snapshots[key]
+
+    def invalidate(self, path: Any = None) -> None:
+        """Drop every cached registry part, custom module and snapshot.
+
+        Signature-compatible with :func:`agent.tools.dynamic.on_tool_created`.
+        """
+        with self._lock:
+            self._registry.clear()
+            self._modules.clear()
+            self._snapshots.clear()
+
+    def _registry_part(self, repo_root: Optional[Path], key: str):
+        if key not in self._registry:
+            registry = ToolRegistry(repo_root=repo_root)
+            self._registry[key] = (
+                tuple(registry.get_tool_schemas(all=True)),
+                tuple(registry.list_tools(all=True)),
+            )
+        return self._registry[key]
+
+    def _build(self, repo_root: Optional[Path], key: str) -> CatalogSnapshot:
+        schemas, tools = self._registry_part(repo_root, key)
+        schema_list: List[Dict[str, Any]] = list(schemas)
+        handlers: Dict[str, Callable] = {fn.__name__: fn for fn in tools}
+        all_tools: List[Callable] = list(tools)
+        for path in sorted(self._modules):
+            entry = self._modules[path]
+            for fn in entry.functions:
+                if fn not in all_tools:
+                    all_tools.append(fn)
+                if fn.__name__ not in handlers and fn.__name__ in entry.schemas:
+                    schema_list.append(entry.schemas[fn.__name__])
+                    handlers[fn.__name__] = fn
+        return CatalogSnapshot(tuple(schema_list), MappingProxyType(handlers), tuple(all_tools))
+
+    def _refresh_custom(self) -> bool:
+        """Sync ``_modules`` with ``custom_dir``. Returns True if anything changed."""
+        try:
+            paths = sorted(
+                p for p in self.custom_dir.iterdir()
+                if p.suffix == ".py" and not p.stem.startswith("__")
+            )
+        except OSError:
+            paths = []
+        changed = False
+        for gone in set(self._modules) - set(paths):
+            del self._modules[gone]
+            changed = True
+        for path in paths:
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            stamp = (st.st_mtime_ns, st.st_size)
+            entry = self._modules.get(path)
+            if entry is not None and entry.stamp == stamp:
+                continue
+            try:
+                source = path.read_bytes()
+            except OSError:
+                continue
+            digest = hashlib.sha256(source).hexdigest()
+            if entry is not None and entry.digest == digest:
+                entry.stamp = stamp  # touched, not edited
+                continue
+            self._modules[path] = self._load(path, source, stamp, digest)
+            changed = True
+        return changed
+
+    def _load(self, path: Path, source: bytes, stamp: Tuple[int, int], digest: str) -> _CustomModule:
+        entry = _CustomModule(stamp=stamp, digest=digest)
+        module_name = f"{self.package}.{path.stem}"
+        # Execute the bytes that were hashed rather than going through the
+        # import system, whose bytecode cache can miss same-second edits.
+        module = types.ModuleType(module_name)
+        module.__file__ = str(path)
+        try:
+            exec(compile(source, str(path), "exec"), module.__dict__)
+        except Exception as exc:
+            logger.warning("custom_tool_load_error", extra={"file": path.name, "error": str(exc)})
+            return entry
+        sys.modules[module_name] = module
+        self.loads += 1
+        entry.functions = tuple(fn for _, fn in inspect.getmembers(module, inspect.isfunction))
+        for fn in entry.functions:
+            try:
+                entry.schemas[fn.__name__] = custom_schema(fn)
+            except Exception as exc:
+                logger.warning("custom_tool_schema_error", extra={"tool": fn.__name__, "error": str(exc)})
+        return entry
+
+
+tool_catalog = ToolCatalog()
+dynamic.on_tool_created(tool_catalog.invalidate)
@@ -18,6 +18,7 @@ import logging
 from pathlib import Path
 from backend.voice.events import EventBus
 from agent.core.execution_context import get_session_id
+from agent.core.git_state import git_state
 from agent.core.utils import sanitize_id
 
 logger = logging.getLogger(__name__)
@@ -32,13 +33,7 @@ def get_git_status(repo_root: Path) -> str:
     """
     session_id = get_session_id()  # ADR-100
     try:
-        result = subprocess.run(
-            ["git", "status", "--short"], 
-            capture_output=True, 
-            text=True, 
-            check=True,
-            cwd=str(repo_root)
-        )
+        result = git_state.run("status", "--short", cwd=repo_root, check=True)
         
         status_data = {
             "staged": [],
@@ -94,13 +89,8 @@ def get_git_diff(repo_root: Path) -> str:
     """
     session_id = get_session_id()  # ADR-100
     try:
-        result = subprocess.run(
-            ["git", "diff", "--cached"], 
-            capture_output=True, 
-            text=True, 
-            check=True,
-            cwd=str(repo_root)
-        )
+        result = git_state.query("diff", "--cached", cwd=repo_root)
+        result.check_returncode()
         if not result.stdout:
             return "No staged changes."
 
@@ -124,13 +114,8 @@ def get_git_log(repo_root: Path, limit: int = 5) -> str:
         limit: Number of commits to show (default: 5).
     """
     try:
-        result = subprocess.run(
-            ["git", "log", f"-n {limit}", "--oneline"], 
-            capture_output=True, 
-            text=True, 
-            check=True,
-            cwd=str(repo_root)
-        )
+        result = git_state.query("log", f"-n {limit}", "--oneline", cwd=repo_root)
+        result.check_returncode()
         return result.stdout
     except subprocess.CalledProcessError as e:
         return f"Error getting git log: {e}"
@@ -144,13 +129,8 @@ def get_git_branch(repo_root: Path) -> str:
         repo_root: Root path of the repository.
     """
     try:
-        result = subprocess.run(
-            ["git", "branch", "--show-current"], 
-            capture_output=True, 
-            text=True, 
-            check=True,
-            cwd=str(repo_root)
-        )
+        result = git_state.query("branch", "--show-current", cwd=repo_root)
+        result.check_returncode()
         branch_name = result.stdout.strip() or "HEAD (detached)"
         logger.info(f"Tool get_git_branch returned: {branch_name}")
         return f"Current Git Branch: {branch_name}"
@@ -170,13 +150,7 @@ def git_stage_changes(repo_root: Path, files: list[str] = None) -> str:
     
     try:
         cmd = ["git", "add"] + targets
-        subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True,
-            cwd=str(repo_root)
-        )
+        git_state.run(*cmd[1:], cwd=repo_root, check=True)
         
         # Summarize for voice
         if "." in targets:
@@ -245,13 +219,7 @@ def run_commit(repo_root: Path, message: str = None, story_id: str = None) -> st
         
         if process.returncode == 0:
             # Fetch the commit details
-            log_result = subprocess.run(
-                ["git", "log", "-1", "--stat"],
-                capture_output=True,
-                text=True,
-                check=False,
-                cwd=str(repo_root)
-            )
+            log_result = git_state.query("log", "-1", "--stat", cwd=repo_root)
             return f"Commit successful.\n\n{log_result.stdout}"
         else:
             return f"Error committing changes:\n{''.join(output_buffer)}"
@@ -385,11 +353,8 @@ def git_push_branch(repo_root: Path) -> str:
             EventBus.publish(session_id, "console", "⚠️  Upstream not set. Setting upstream to origin...\n")
             
             # Get current branch
-            branch_proc = subprocess.run(
-                ["git", "branch", "--show-current"], 
-                capture_output=True, text=True, check=True,
-                cwd=str(repo_root)
-            )
+            branch_proc = git_state.query("branch", "--show-current", cwd=repo_root)
+            branch_proc.check_returncode()
             current_branch = branch_proc.stdout.strip()
             
             # Retry with --set-upstream
@@ -54,3 +54,64 @@ def test_markdown_parsing_logic():
     assert "WEB-005" in links
     assert "ADR-004" in links
     assert "WEB-004" in links
+
+
+@pytest.fixture
+def catalog_dirs(tmp_path, monkeypatch):
+    from backend.admin.artifact_catalog import ArtifactCatalog
+    from backend.routers import governance
+
+    stories = tmp_path / "stories"
+    runbooks = tmp_path / "runbooks"
+    stories.mkdir()
+    runbooks.mkdir()
+    (stories / "WEB-005-login.md").write_text("# Login\n\n## State\nDRAFT\n\nSee ADR-004.\n")
+    (runbooks / "WEB-005-runbook.md").write_text("# Login runbook\n")
+
+    catalog = ArtifactCatalog([(stories, "story"), (runbooks, "runbook")], watch=False)
+    monkeypatch.setattr(governance, "_catalog", catalog)
+    return stories, catalog
+
+
+def test_catalog_links_and_lookup(catalog_dirs):
+    _, catalog = catalog_dirs
+    snapshot = catalog.snapshot()
+
+    assert snapshot.get("WEB-005").type == "story"
+    assert snapshot.get("WEB-005").status == "DRAFT"
+    runbook = next(a for a in snapshot.artifacts if a.type == "runbook")
+    assert "WEB-005" in runbook.links
+    assert {"id": "WEB-005-runbook->WEB-005-story", "source": "WEB-005-runbook",
+            "target": "WEB-005-story", "type": "smoothstep"} in snapshot.graph["edges"]
+
+
+def test_catalog_reparses_only_changed_files(catalog_dirs, mocker):
+    from backend.admin import artifact_catalog
+
+    stories, catalog = catalog_dirs
+    catalog.snapshot()
+    spy = mocker.spy(artifact_catalog, "parse_artifact")
+
+    assert catalog.snapshot() is catalog.snapshot()
+    new_story = stories / "WEB-006-search.md"
+    new_story.write_text("# Search\n")
+    catalog.mark_dirty(new_story)
+    snapshot = catalog.snapshot()
+
+    assert [c.args[0] for c in spy.call_args_list] == [new_story]
+    assert snapshot.get("WEB-006").title == "Search"
+
+
+def test_artifacts_etag_round_trip(catalog_dirs):
+    first = client.get("/api/admin/governance/artifacts")
+    etag = first.headers["etag"]
+
+    cached = client.get("/api/admin/governance/artifacts", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+    client.patch("/api/admin/governance/artifact/WEB-005/status", json={"status": "in_progress"})
+    changed = client.get("/api/admin/governance/artifacts", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    story = next(a for a in changed.json() if a["uid"] == "WEB-005-story")
+    assert story["status"] == "IN_PROGRESS"
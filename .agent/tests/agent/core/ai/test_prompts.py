@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import pytest
-from agent.core.ai.prompts import generate_block_prompt
+from agent.core.ai.prompts import block_prompt_prefix, generate_block_prompt
 
 def test_generate_block_prompt_injects_prior_changes():
     """Validate that prior_changes context is correctly injected into the prompt (AC-4)."""
@@ -85,3 +85,15 @@ def test_generate_block_prompt_no_context_by_default():
 
     assert isinstance(prompt, str)
     assert "Implementation Specialist" in prompt
+
+
+def test_generate_block_prompt_can_omit_shared_prefix():
+    """The shared prefix is sent separately (and cached) by the runbook pipeline."""
+    args = ("Title", "Desc", '{"sections": []}', "STORY-BODY", "CONTEXT-BODY")
+    prefix = block_prompt_prefix(*args[2:])
+    full = generate_block_prompt(*args)
+    suffix = generate_block_prompt(*args, include_shared=False)
+
+    assert full.startswith(prefix)
+    assert "STORY-BODY" not in suffix and "CONTEXT-BODY" not in suffix
+    assert "Title: Title" in suffix
@@ -0,0 +1,92 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from backend.admin.logger import ActivityLogBus
+from backend.bounded_queue import BoundedQueue, Policy, queue_dropped_total
+from backend.routers.voice import output_classifier
+
+
+def test_drop_oldest_keeps_newest_messages():
+    queue = BoundedQueue(3, name="test_drop")
+    for i in range(5):
+        queue.put_nowait(i)
+
+    assert queue.qsize() == 3
+    assert [queue.get_nowait() for _ in range(3)] == [2, 3, 4]
+    assert queue.dropped == 2
+
+
+def _status_coalesces(item):
+    if item[0] == "status":
+        return "status", Policy.COALESCE, "status"
+    return "msg", Policy.DROP_OLDEST, None
+
+
+def test_coalesce_replaces_queued_message_in_place():
+    classify = _status_coalesces
+    queue = BoundedQueue(10, name="test_coalesce", classify=classify)
+    queue.put_nowait(("status", "thinking"))
+    queue.put_nowait(("msg", 1))
+    queue.put_nowait(("status", "speaking"))
+
+    assert [queue.get_nowait() for _ in range(2)] == [("status", "speaking"), ("msg", 1)]
+    assert queue_dropped_total.labels(queue="test_coalesce", kind="status", reason="coalesced")._value.get() == 1
+
+
+@pytest.mark.asyncio
+async def test_keep_messages_apply_backpressure():
+    queue = BoundedQueue(2, name="test_keep", classify=lambda item: ("audio", Policy.KEEP, None))
+    await queue.put(1)
+    await queue.put(2)
+
+    pending = asyncio.create_task(queue.put(3))
+    await asyncio.sleep(0)
+    assert not pending.done()
+
+    assert await queue.get() == 1
+    await asyncio.wait_for(pending, 1)
+    assert [queue.get_nowait(), queue.get_nowait()] == [2, 3]
+    assert queue.dropped == 0
+
+
+def test_voice_policy_never_drops_active_audio():
+    orchestrator = SimpleNamespace(current_generation_id=2)
+    queue = BoundedQueue(3, name="test_voice", classify=output_classifier(orchestrator))
+    queue.put_nowait(("audio", (1, b"old")))
+    queue.put_nowait(("json", {"type": "status", "state": "thinking"}))
+    queue.put_nowait(("audio", (2, b"a")))
+    queue.put_nowait(("json", {"type": "status", "state": "speaking"}))  # coalesced
+    queue.put_nowait(("audio", (2, b"b")))  # evicts stale audio
+    queue.put_nowait(("audio", (2, b"c")))  # evicts status
+
+    items = [queue.get_nowait() for _ in range(queue.qsize())]
+    assert items == [("audio", (2, b"a")), ("audio", (2, b"b")), ("audio", (2, b"c"))]
+
+
+@pytest.mark.asyncio
+async def test_log_bus_bounds_slow_subscribers():
+    bus = ActivityLogBus(queue_size=10)
+    slow = await bus.subscribe()
+    for i in range(25):
+        bus.broadcast("thought", str(i))
+
+    assert slow.qsize() == 10
+    assert slow.dropped == 15
+    bus.unsubscribe(slow)
+    assert slow.empty()
@@ -0,0 +1,55 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Local artifact scan throughput into agent.db."""
+
+import time
+
+import pytest
+
+from agent.db import pool
+from agent.sync import sync
+
+ARTIFACTS = 5_000
+
+
+@pytest.mark.benchmark
+def test_scan_throughput(tmp_path, monkeypatch, capsys):
+    db_path = tmp_path / "agent.db"
+    monkeypatch.setattr("agent.db.client.get_db_path", lambda: db_path)
+    monkeypatch.setattr("agent.db.init.get_db_path", lambda: db_path)
+    monkeypatch.chdir(tmp_path)
+    stories = tmp_path / ".agent" / "cache" / "stories" / "BENCH"
+    stories.mkdir(parents=True)
+    for i in range(ARTIFACTS):
+        (stories / f"BENCH-{i}-story.md").write_text(f"# BENCH-{i}: Story\n\n## State\n\nDRAFT\n\nBody {i}\n")
+    pool.close_connections()
+
+    try:
+        start = time.perf_counter()
+        sync.scan()
+        cold_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sync.scan()
+        warm_s = time.perf_counter() - start
+    finally:
+        pool.close_connections()
+
+    out = capsys.readouterr().out
+    assert f"({ARTIFACTS} written, 0 unchanged)" in out
+    assert f"(0 written, {ARTIFACTS} unchanged)" in out
+    with capsys.disabled():
+        print(f"\nscan {ARTIFACTS} files: {cold_s:.2f}s ({ARTIFACTS / cold_s:,.0f} rows/s); "
+              f"unchanged rescan: {warm_s:.2f}s ({ARTIFACTS / warm_s:,.0f} rows/s)")
@@ -0,0 +1,57 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Turn assembly and resume cost for a 5,000-message console session."""
+
+import time
+
+import pytest
+
+from agent.tui.session import RESUME_MESSAGE_LIMIT, SessionStore, TokenBudget
+
+MESSAGES = 5000
+TURNS = 20
+
+
+@pytest.mark.benchmark
+def test_long_session_turn_assembly(tmp_path):
+    store = SessionStore(db_path=tmp_path / "console.db")
+    session = store.create_session(provider="gemini")
+    for i in range(MESSAGES):
+        role = "user" if i % 2 == 0 else "assistant"
+        store.add_message(session.id, role, f"message {i}: " + "lorem ipsum dolor sit amet " * 8)
+
+    start = time.perf_counter()
+    resumed = store.get_latest_session(message_limit=RESUME_MESSAGE_LIMIT)
+    resume_s = time.perf_counter() - start
+    assert len(resumed.messages) == RESUME_MESSAGE_LIMIT
+
+    history = store.get_session(session.id).messages
+    budget = TokenBudget(max_tokens=128_000)
+    start = time.perf_counter()
+    budget.build_context("System prompt.", history, provider="gemini")
+    first_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(TURNS):
+        store.add_message(session.id, "user", f"follow-up {i}")
+        history.append(store.get_messages(session.id, limit=1)[0])
+        _, pruned = budget.build_context("System prompt.", history, provider="gemini")
+    per_turn_s = (time.perf_counter() - start) / TURNS
+    store.close()
+
+    print(f"\n{MESSAGES} messages: resume {resume_s * 1e3:.2f} ms, first build "
+          f"{first_s * 1e3:.2f} ms, per turn {per_turn_s * 1e3:.3f} ms ({len(pruned)} kept)")
+    assert pruned[-1].content == f"follow-up {TURNS - 1}"
+    assert per_turn_s < first_s
@@ -0,0 +1,62 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Fan-out cost and memory bound of the activity log bus under slow subscribers."""
+
+import asyncio
+import time
+
+import pytest
+
+from backend.admin.logger import ActivityLogBus
+
+SUBSCRIBERS = 300
+ACTIVE = 10          # subscribers that keep draining; the rest never read
+MESSAGES = 5_000
+QUEUE_SIZE = 500
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_log_bus_fan_out_with_stalled_subscribers():
+    bus = ActivityLogBus(queue_size=QUEUE_SIZE)
+    queues = [await bus.subscribe() for _ in range(SUBSCRIBERS)]
+    received = [0] * ACTIVE
+
+    async def drain(i):
+        while True:
+            await queues[i].get()
+            received[i] += 1
+
+    readers = [asyncio.create_task(drain(i)) for i in range(ACTIVE)]
+    start = time.perf_counter()
+    for n in range(MESSAGES):
+        bus.broadcast("thought" if n % 2 else "tool", f"step {n}")
+        if n % 100 == 0:
+            await asyncio.sleep(0)  # let the active readers run
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(0)
+    for task in readers:
+        task.cancel()
+
+    stalled = queues[ACTIVE:]
+    print(f"\n{SUBSCRIBERS} subscribers x {MESSAGES} messages: "
+          f"{elapsed / MESSAGES * 1e6:.1f} us/broadcast, "
+          f"{sum(q.dropped for q in stalled)} dropped for stalled clients")
+
+    assert all(q.qsize() <= QUEUE_SIZE for q in queues)
+    assert all(q.dropped == MESSAGES - QUEUE_SIZE for q in stalled)
+    assert min(received) > QUEUE_SIZE  # active readers were not starved
+    for q in queues:
+        bus.unsubscribe(q)
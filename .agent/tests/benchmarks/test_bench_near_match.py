@@ -0,0 +1,68 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Near-match lookup of a drifted SEARCH block in a 10k-line module."""
+
+import difflib
+import random
+import time
+
+import pytest
+
+from agent.core.implement.near_match import LineIndex, context_windows
+
+LINES = 10_000
+
+
+def _module() -> list:
+    rng = random.Random(7)
+    lines = []
+    for i in range(LINES):
+        if i % 25 == 0:
+            lines.append(f"def step_{i}(ctx, data):")
+        elif i % 25 == 24:
+            lines.append("")
+        else:
+            lines.append(f"    data['k{i}'] = transform(ctx, {rng.randint(0, 999)})")
+    return lines
+
+
+@pytest.mark.benchmark
+def test_near_match_locator_10k_lines(capsys):
+    lines = _module()
+    content = "\n".join(lines)
+    target = 7_250
+    # Re-indented, with one edited line: what an LLM typically gets wrong
+    search = "\n".join(line.replace("    ", "  ") for line in lines[target:target + 12])
+    search = search.replace("transform", "transfrom", 1)
+
+    start = time.perf_counter()
+    longest = difflib.SequenceMatcher(None, lines, search.splitlines()).find_longest_match(0, len(lines), 0, 12)
+    longest_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = LineIndex(content)
+    build_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    found = index.candidates(search)
+    window = context_windows(content, search, budget_tokens=800, index=index)
+    query_s = time.perf_counter() - start
+
+    assert (found[0].start_line, found[0].end_line) == (target, target + 12)
+    assert lines[target] in window
+    with capsys.disabled():
+        print(f"\nfind_longest_match: {longest_s * 1000:.1f}ms (matched {longest.size} lines); index build: {build_s * 1000:.1f}ms; "
+              f"top-{len(found)} + window: {query_s * 1000:.2f}ms ({len(window)} chars)")
+
@@ -0,0 +1,55 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Span-end overhead of the PII pipeline on 100 KB attributes."""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+
+from agent.core.span_policy import SpanPolicy
+from agent.core.telemetry import PiiScrubbingSpanProcessor
+
+ITERATIONS = 50
+PAYLOAD = ("Thought: contact dev@example.com with key sk-" + "a" * 30 + "\n") * 1400  # ~100 KB
+
+
+def _span_end_seconds(processor: PiiScrubbingSpanProcessor) -> float:
+    tracer = TracerProvider().get_tracer("bench")
+    elapsed = 0.0
+    for _ in range(ITERATIONS):
+        span = tracer.start_span("agent.think", attributes={"llm_response": PAYLOAD, "user_prompt": PAYLOAD})
+        span.end()
+        start = time.perf_counter()
+        processor.on_end(span)
+        elapsed += time.perf_counter() - start
+    return elapsed / ITERATIONS
+
+
+@pytest.mark.benchmark
+def test_span_end_overhead_100kb():
+    """Report span-end cost of inline scrubbing versus capping with deferred scrubbing."""
+    assert len(PAYLOAD) >= 100_000
+
+    inline = _span_end_seconds(
+        PiiScrubbingSpanProcessor(MagicMock(), policy=SpanPolicy(max_attr_chars=0), scrub_inline=True)
+    )
+    deferred = _span_end_seconds(
+        PiiScrubbingSpanProcessor(MagicMock(), policy=SpanPolicy(), scrub_inline=False)
+    )
+
+    print(f"\nspan end (2 x 100 KB attrs): inline scrub {inline * 1e3:.3f} ms, "
+          f"capped/deferred {deferred * 1e3:.3f} ms")
@@ -0,0 +1,167 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Supabase sync throughput against a local PostgREST-compatible stub."""
+
+import bisect
+import json
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+
+from agent.sync import sync
+
+ARTIFACTS = 50_000
+
+
+class PostgrestStub:
+    """Just enough of PostgREST's /rest/v1/artifacts for the sync client."""
+
+    def __init__(self, count):
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self.rows = {
+            (f"STUB-{i}", "story"): {
+                "id": f"STUB-{i}", "type": "story", "version": 1, "state": "DRAFT", "author": "remote",
+                "content": f"# STUB-{i}: Story {i}\n\n## State\n\nDRAFT\n\nBody {i}\n",
+                "updated_at": (base + timedelta(seconds=i)).isoformat(),
+            }
+            for i in range(count)
+        }
+        self.requests = {"GET": 0, "HEAD": 0, "POST": 0}
+        self.lock = threading.Lock()
+        self._sorted = {}  # (filter, order) -> rows; keeps the stub itself off the profile
+
+    def select(self, params):
+        bounds = tuple(v for k, v in params if k == "updated_at")
+        options = dict(params)
+        key = (bounds, options.get("order", ""))
+        if key not in self._sorted:
+            rows = list(self.rows.values())
+            for bound in bounds:
+                op, value = bound.split(".", 1)
+                if op == "gte":
+                    rows = [r for r in rows if r["updated_at"] >= value]
+                else:
+                    rows = [r for r in rows if r["updated_at"] <= value]
+            for order in reversed(key[1].split(",")):
+                if order:
+                    column, direction = order.split(".")[:2]
+                    rows.sort(key=lambda r: r[column], reverse=direction == "desc")
+            self._sorted[key] = rows
+        rows = self._sorted[key]
+        total = len(rows)
+        offset = int(options.get("offset", 0))
+        if "or" in options:
+            # Keyset page: the (updated_at, id, type) key follows each ".gt."
+            after = tuple(re.findall(r'\.gt\."([^"]*)"', options["or"]))
+            offset = bisect.bisect_right(rows, after, key=lambda r: (r["updated_at"], r["id"], r["type"]))
+        limit = int(options.get("limit", total))
+        return rows[offset:offset + limit], offset, total
+
+    def upsert(self, body):
+        now = datetime.now(timezone.utc).isoformat()
+        self._sorted.clear()
+        for row in body:
+            self.rows[(row["id"], row["type"])] = dict(row, updated_at=row.get("updated_at") or now)
+
+
+@pytest.fixture
+def stub():
+    stub = PostgrestStub(ARTIFACTS)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _reply(self, status, payload=None, headers=()):
+            data = json.dumps(payload).encode() if payload is not None else b""
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            for name, value in headers:
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            if self.command != "HEAD":
+                self.wfile.write(data)
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            with stub.lock:
+                stub.requests[self.command] += 1
+                rows, offset, total = stub.select(parse_qsl(url.query))
+            content_range = f"{offset}-{offset + len(rows) - 1}/{total}" if rows else f"*/{total}"
+            self._reply(200, rows, [("Content-Range", content_range)])
+
+        do_HEAD = do_GET
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            with stub.lock:
+                stub.requests["POST"] += 1
+                stub.upsert(body)
+            self._reply(201)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    stub.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield stub
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.benchmark
+def test_supabase_pull_and_push_throughput(stub, tmp_path, monkeypatch):
+    from supabase import create_client
+
+    db_path = tmp_path / "agent.db"
+    monkeypatch.setattr("agent.sync.bulk.WATERMARK_FILE", tmp_path / "supabase_sync.json")
+    client = create_client(stub.url, "stub.jwt.key")
+
+    with patch("agent.db.client.get_db_path", return_value=db_path), \
+         patch("agent.db.init.get_db_path", return_value=db_path), \
+         patch("agent.sync.sync.get_supabase_client", return_value=client), \
+         patch("agent.sync.sync._write_to_disk"), \
+         patch("agent.sync.progress.print"):
+        start = time.perf_counter()
+        sync.pull(backend="supabase")
+        pull_s = time.perf_counter() - start
+        pull_requests = stub.requests["GET"]
+
+        import sqlite3
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM artifacts").fetchone()[0] == ARTIFACTS
+
+        # Nothing changed remotely: the watermark limits the next pull to the boundary row
+        stub.requests["GET"] = 0
+        start = time.perf_counter()
+        sync.pull(backend="supabase")
+        incremental_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sync.push(backend="supabase")
+        push_s = time.perf_counter() - start
+
+    print(f"\npull {ARTIFACTS} rows: {pull_s:.2f}s ({ARTIFACTS / pull_s:,.0f} rows/s, {pull_requests} GETs); "
+          f"incremental pull: {incremental_s * 1000:.0f} ms; "
+          f"push {ARTIFACTS} rows: {push_s:.2f}s ({ARTIFACTS / push_s:,.0f} rows/s, {stub.requests['POST']} POSTs)")
+    assert stub.requests["GET"] <= 3
+    assert stub.requests["POST"] == ARTIFACTS // 500
@@ -118,7 +118,7 @@ def test_new_runbook_command(mock_generate, mock_deps):
 def test_match_story_command(mock_complete, mock_deps):
      with patch("agent.core.auth.decorators.validate_credentials"), \
           patch("agent.core.config.config.stories_dir", mock_deps["root"] / ".agent" / "stories"), \
-          patch("agent.core.utils.subprocess.check_output") as mock_git:
+          patch("subprocess.check_output") as mock_git:
           
         mock_git.return_value = b"file1.py\nfile2.py"
         mock_complete.return_value = "INFRA-123"
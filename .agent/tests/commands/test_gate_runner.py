@@ -0,0 +1,163 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the concurrent gate scheduler."""
+
+import threading
+import time
+
+from agent.commands import gate_runner
+from agent.commands.gate_runner import GateTask, default_jobs, format_durations, run_gates
+from agent.commands.gates import GateResult, run_qa_gate
+
+
+def _command_gate(name: str, cmd: str) -> GateTask:
+    def run(ctx) -> GateResult:
+        outcome = ctx.run_command(cmd, timeout=30)
+        return GateResult(name, outcome.returncode == 0, 0.0, "cancelled" if outcome.cancelled else "")
+    return GateTask(name, run)
+
+
+def test_independent_gates_run_concurrently():
+    tasks = [_command_gate(f"suite{i}", "sleep 0.5") for i in range(3)]
+
+    start = time.perf_counter()
+    results = run_gates(tasks, jobs=3)
+    elapsed = time.perf_counter() - start
+
+    assert all(r.passed for r in results)
+    assert elapsed < 1.2
+    assert all(r.elapsed_seconds >= 0.4 for r in results)
+
+
+def test_job_limit_serializes_gates():
+    tasks = [_command_gate(f"suite{i}", "sleep 0.3") for i in range(2)]
+
+    start = time.perf_counter()
+    run_gates(tasks, jobs=1)
+
+    assert time.perf_counter() - start >= 0.6
+
+
+def test_fail_fast_cancels_running_and_queued_gates():
+    tasks = [
+        _command_gate("slow", "sleep 10"),
+        _command_gate("broken", "exit 3"),
+        _command_gate("queued", "sleep 10"),
+    ]
+
+    start = time.perf_counter()
+    results = run_gates(tasks, jobs=2, fail_fast=True)
+
+    assert time.perf_counter() - start < 5
+    assert [r.passed for r in results] == [False, False, False]
+    assert results[0].details == "cancelled"
+    # "queued" is either never started or killed right after it starts
+    assert results[2].details.lower().startswith("cancelled")
+
+
+def test_output_is_streamed_with_gate_labels():
+    lines = []
+    run_gates(
+        [_command_gate("web", "echo one; echo two"), _command_gate("api", "echo three")],
+        on_output=lambda gate, line: lines.append((gate, line)),
+    )
+
+    assert ("web", "one") in lines and ("web", "two") in lines
+    assert ("api", "three") in lines
+
+
+def test_crashing_gate_is_reported_as_failure():
+    def boom(ctx):
+        raise RuntimeError("kaboom")
+
+    [result] = run_gates([GateTask("Broken", boom)])
+
+    assert result.passed is False
+    assert "kaboom" in result.details
+
+
+def test_qa_gate_reports_per_suite_durations():
+    result = run_qa_gate({"web/": "true", "mobile/": "true"}, modified_files=None)
+
+    assert result.passed is True
+    assert "web" in result.details and "mobile" in result.details
+
+
+def test_fail_fast_kills_qa_suites_nested_in_the_outer_run():
+    lines = []
+    qa = GateTask("QA Validation", lambda ctx: run_qa_gate(
+        {"web/": "echo started; sleep 10", "api/": "sleep 10"}, jobs=2, fail_fast=True, context=ctx,
+    ))
+
+    start = time.perf_counter()
+    results = run_gates(
+        [qa, _command_gate("broken", "sleep 0.3; exit 3")],
+        jobs=3, fail_fast=True, on_output=lambda gate, line: lines.append((gate, line)),
+    )
+
+    assert time.perf_counter() - start < 5
+    assert results[0].passed is False and "cancelled" in results[0].details
+    assert ("QA Validation", "[web] started") in lines
+
+
+def test_nested_runs_share_the_outer_job_limit():
+    lock = threading.Lock()
+    running = [0]
+    peak = [0]
+
+    def leaf(name):
+        def run(ctx):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.1)
+            with lock:
+                running[0] -= 1
+            return GateResult(name, True, 0.0)
+        return GateTask(name, run)
+
+    def nested(ctx):
+        inner = run_gates([leaf(f"suite{i}") for i in range(4)], jobs=4, parent=ctx)
+        return GateResult("QA Validation", all(r.passed for r in inner), 0.0)
+
+    results = run_gates([GateTask("QA Validation", nested), leaf("lint"), leaf("types")], jobs=2)
+
+    assert all(r.passed for r in results)
+    assert peak[0] == 2
+
+
+def test_timeout_kills_commands_that_ignore_sigterm(monkeypatch):
+    monkeypatch.setattr(gate_runner, "KILL_GRACE_S", 0.2)
+    tasks = [GateTask("stubborn", lambda ctx: GateResult(
+        "stubborn", not ctx.run_command("trap '' TERM; sleep 30", timeout=0.2).timed_out, 0.0,
+    ))]
+
+    start = time.perf_counter()
+    [result] = run_gates(tasks)
+
+    assert time.perf_counter() - start < 5
+    assert result.passed is False
+
+
+def test_default_jobs_reads_env(monkeypatch):
+    monkeypatch.setenv("AGENT_GATE_JOBS", "7")
+    assert default_jobs() == 7
+    monkeypatch.setenv("AGENT_GATE_JOBS", "nope")
+    assert 1 <= default_jobs() <= 4
+
+
+def test_format_durations_lists_slowest_first():
+    results = [GateResult("fast", True, 0.1), GateResult("slow", True, 2.0)]
+    assert format_durations(results) == "slow 2.00s, fast 0.10s"
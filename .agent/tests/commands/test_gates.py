@@ -138,11 +138,12 @@ class TestRunQaGate:
         """Verify default test command is 'pytest .agent/tests'."""
         # We just check the function accepts no args
         # (don't actually run pytest here)
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value.returncode = 0
+        with patch("agent.commands.gate_runner.subprocess.Popen") as mock_popen:
+            mock_popen.return_value.stdout = []
+            mock_popen.return_value.returncode = 0
             result = run_qa_gate()
-            mock_run.assert_called_once()
-            call_args = mock_run.call_args
+            mock_popen.assert_called_once()
+            call_args = mock_popen.call_args
             assert call_args[0][0] == "pytest"
 
 
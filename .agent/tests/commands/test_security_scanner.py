@@ -0,0 +1,96 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the compiled, cached security-pattern scanner."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from agent.commands import security_scanner
+from agent.commands.security_scanner import SecurityScanner, load_scanner, scan_files
+
+PATTERNS = {
+    "api_key_generic": r"(?i)(api[_-]?key|secret[_-]?key)\s*=\s*['\"][^'\"]{8,}",
+    "eval_exec": r"\b(eval|exec)\s*\(",
+    "hardcoded_password": r"(?i)(password|passwd|pwd)\s*=\s*['\"][^'\"]{4,}",
+}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    security_scanner.clear_cache()
+    yield
+    security_scanner.clear_cache()
+
+
+def test_combined_pass_matches_per_pattern_search():
+    scanner = SecurityScanner(PATTERNS)
+    text = 'PASSWORD = "hunter22"\nresult = eval(user_input)\n'
+    assert scanner.scan_text(text) == ["eval_exec", "hardcoded_password"]
+    assert scanner.scan_text("print('hello')\n") == []
+
+
+def test_masked_pattern_at_same_position_is_still_reported():
+    # "eval(" matches both alternatives at the same offset; the first wins in
+    # the combined regex, the second must still be found.
+    scanner = SecurityScanner({"a": r"eval\(", "b": r"\beval\b"})
+    assert scanner.scan_text("x = eval(y)") == ["a", "b"]
+
+
+def test_backreference_falls_back_to_individual_patterns():
+    scanner = SecurityScanner({"repeat": r"(\w+) \1", "eval_exec": r"\beval\("})
+    assert scanner._combined is None
+    assert scanner.scan_text("the the eval(x)") == ["repeat", "eval_exec"]
+
+
+def test_large_file_scanned_in_chunks_across_boundary(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(security_scanner, "CHUNK_SIZE", 64)
+    monkeypatch.setattr(security_scanner, "CHUNK_OVERLAP", 16)
+    target = tmp_path / "big.py"
+    target.write_text("#" * 60 + "eval(x)\n" + "#" * 200)
+    _, findings = SecurityScanner(PATTERNS).scan_file(target)
+    assert findings == ["eval_exec"]
+
+
+def test_scanner_compiled_once_per_patterns_file(tmp_path: Path):
+    patterns = tmp_path / "patterns.yaml"
+    patterns.write_text("eval_exec: 'eval\\('\n")
+    assert load_scanner(patterns) is load_scanner(patterns)
+    patterns.write_text('other: "forbidden"\n')
+    assert load_scanner(patterns).names == ["other"]
+
+
+def test_unchanged_files_are_not_rescanned(tmp_path: Path):
+    files = [tmp_path / f"mod{i}.py" for i in range(3)]
+    for f in files:
+        f.write_text("print('ok')\n")
+    files[1].write_text("eval(x)\n")
+    scanner = SecurityScanner(PATTERNS)
+
+    first = scan_files(scanner, files + [tmp_path / "missing.py"])
+    assert [(p.name, found) for p, found in first] == [
+        ("mod0.py", []), ("mod1.py", ["eval_exec"]), ("mod2.py", []),
+    ]
+
+    with patch.object(SecurityScanner, "scan_file", wraps=scanner.scan_file) as spy:
+        again = scan_files(scanner, files)
+        assert again == first
+        spy.assert_not_called()
+
+        files[2].write_text("exec(code)\n")
+        changed = scan_files(scanner, files)
+        assert spy.call_count == 1
+    assert changed[2][1] == ["eval_exec"]
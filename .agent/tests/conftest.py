@@ -19,6 +19,8 @@ import os
 # This prevents `agent.core.secrets.get_secret_manager()` from calling
 # keyring.get_password() which triggers a blocking system dialog on macOS.
 os.environ.setdefault("AGENT_SKIP_KEYRING", "1")
+os.environ.setdefault("AGENT_USAGE_LEDGER", "0")
+os.environ.setdefault("AGENT_NO_REVIEW_CACHE", "1")
 
 @pytest.fixture(autouse=True)
 def set_terminal_width():
@@ -49,6 +51,43 @@ def isolate_secrets_dir(tmp_path, monkeypatch):
     # Reset singleton to force recreation using the mocked init
     monkeypatch.setattr(agent.core.secrets, "_secret_manager", None)
 
+@pytest.fixture(autouse=True)
+def reset_ai_routing_state():
+    """Keep breaker, router health, hedge budget and context-cache state from leaking between tests."""
+    from agent.core.ai.hedging import hedge_budget
+    from agent.core.ai.prompt_cache import genai_context_cache
+    from agent.core.ai.resilience import reset_breakers
+    from agent.core.router_stats import router_stats
+    reset_breakers()
+    router_stats.reset()
+    hedge_budget.reset()
+    genai_context_cache.reset()
+    yield
+    reset_breakers()
+    router_stats.reset()
+    hedge_budget.reset()
+    genai_context_cache.reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_git_state():
+    """Mocked git output must not be served to later tests from the shared cache."""
+    from agent.core.git_state import git_state
+    git_state.reset()
+    yield
+    git_state.reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_tool_catalog():
+    """Tools built under one test's patches must not leak into the next."""
+    import sys
+    catalog = sys.modules.get("backend.voice.tools.catalog")
+    if catalog is not None:
+        catalog.tool_catalog.invalidate()
+    yield
+
+
 @pytest.fixture(autouse=True)
 def check_memory_leak():
     """Fail the test suite if memory exceeds a critical limit due to a memory leak."""
@@ -0,0 +1,179 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agent.core.ai import usage as usage_mod
+from agent.core.ai.hedging import HedgeBudget, ai_hedged_requests_total, hedge_delay, hedged_stream
+from agent.core.ai.service import AIService, ai_command_runs_total
+from agent.core.ai.usage import UsageLedger
+from agent.core.router_stats import router_stats
+
+
+def _outcome(provider, outcome):
+    return ai_hedged_requests_total.labels(provider=provider, outcome=outcome)._value.get()
+
+
+def _stream(chunks, delay=0.0, closed=None):
+    def factory():
+        try:
+            if delay:
+                time.sleep(delay)
+            yield from chunks
+        finally:
+            if closed is not None:
+                closed.set()
+    return factory
+
+
+def test_fast_primary_never_starts_secondary():
+    secondary = MagicMock()
+    before = _outcome("fast", "not_needed")
+
+    assert list(hedged_stream(_stream(["a", "b"]), secondary, 1.0, "fast", HedgeBudget())) == ["a", "b"]
+    secondary.assert_not_called()
+    assert _outcome("fast", "not_needed") == before + 1
+
+
+def test_slow_primary_loses_to_secondary_and_is_cancelled():
+    primary_closed = threading.Event()
+    before = _outcome("slow", "secondary_won")
+
+    chunks = list(hedged_stream(
+        _stream(["late", "more"], delay=0.3, closed=primary_closed),
+        _stream(["quick", "answer"]), 0.05, "slow", HedgeBudget(ratio=1.0),
+    ))
+
+    assert chunks == ["quick", "answer"]
+    assert primary_closed.wait(2)
+    assert _outcome("slow", "secondary_won") == before + 1
+
+
+def test_exhausted_budget_waits_for_primary():
+    budget = HedgeBudget(ratio=0.0, burst=0)
+    secondary = MagicMock()
+    before = _outcome("capped", "budget_exhausted")
+
+    assert list(hedged_stream(_stream(["late"], delay=0.1), secondary, 0.01, "capped", budget)) == ["late"]
+    secondary.assert_not_called()
+    assert _outcome("capped", "budget_exhausted") == before + 1
+
+
+def test_primary_error_before_output_hedges_immediately():
+    def broken():
+        raise ConnectionError("refused")
+        yield  # pragma: no cover
+
+    assert list(hedged_stream(broken, _stream(["rescued"]), 10.0, "err", HedgeBudget(ratio=1.0))) == ["rescued"]
+    with pytest.raises(ConnectionError):
+        list(hedged_stream(broken, None, 10.0, "err", HedgeBudget(ratio=1.0)))
+
+
+def test_hedge_delay_uses_first_token_percentile(monkeypatch):
+    monkeypatch.setenv("AGENT_AI_HEDGE_DELAY_S", "7")
+    assert hedge_delay("openai", "gpt") == 7.0
+    for ttft in (0.1, 0.2, 0.3, 0.4, 2.0):
+        router_stats.record("openai", "gpt", ttft + 1, 10, True, first_token_s=ttft)
+    assert hedge_delay("openai", "gpt") == 2.0
+    monkeypatch.setenv("AGENT_AI_HEDGE_PERCENTILE", "50")
+    assert hedge_delay("openai", "gpt") == 0.3
+
+
+@pytest.fixture
+def hedging_env(monkeypatch):
+    monkeypatch.setenv("AGENT_AI_HEDGE_DELAY_S", "0.05")
+    monkeypatch.setenv("AGENT_AI_HEDGE_MAX_RATIO", "1")
+
+
+def _service(provider, *providers):
+    svc = AIService()
+    svc._initialized = True
+    svc.is_forced = True
+    svc.provider = provider
+    svc.models = {p: f"{p}-model" for p in (provider, *providers)}
+    svc.clients = {p: MagicMock() for p in (provider, *providers)}
+    return svc
+
+
+def test_complete_hedges_to_next_provider_with_closed_breaker(monkeypatch):
+    monkeypatch.setenv("AGENT_AI_HEDGE_DELAY_S", "0.05")
+    monkeypatch.setenv("AGENT_AI_HEDGE_MAX_RATIO", "1")
+    svc = AIService()
+    svc._initialized = True
+    svc.is_forced = True
+    svc.provider = "gemini"
+    svc.models = {"gemini": "gemini-test", "openai": "gpt-test"}
+    svc.clients = {"gemini": MagicMock(), "openai": MagicMock()}
+
+    def fake_stream(provider, *args):
+        if provider == "gemini":
+            time.sleep(0.5)
+        yield f"from {provider} "
+
+    with patch.object(svc, "_stream_provider", side_effect=fake_stream):
+        assert svc.complete("sys", "user", hedge=True) == "from openai"
+    # Hedging never switches the session's provider
+    assert svc.provider == "gemini"
+
+
+def test_hedged_complete_records_metrics_and_usage_of_both_attempts(hedging_env, tmp_path, monkeypatch):
+    ledger = UsageLedger(tmp_path / "usage.db")
+    monkeypatch.setattr(usage_mod, "_ledger", ledger)
+    monkeypatch.setenv("AGENT_USAGE_LEDGER", "1")
+    monkeypatch.setenv("AGENT_AI_FIRST_BYTE_TIMEOUT_S", "0")
+    svc = _service("openai", "ollama")
+
+    def chunks(*texts, delay=0.0):
+        if delay:
+            time.sleep(delay)
+        for text in texts:
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))], usage=None)
+
+    svc.clients["openai"].chat.completions.create.side_effect = lambda **kw: chunks("late", "more", delay=0.3)
+    svc.clients["ollama"].chat.completions.create.side_effect = lambda **kw: chunks("quick")
+    runs = ai_command_runs_total.labels(provider="ollama")._value.get()
+
+    assert svc.complete("sys", "user", hedge=True) == "quick"
+    assert ai_command_runs_total.labels(provider="ollama")._value.get() == runs + 1
+
+    # The cancelled primary is billed too, once it notices it lost
+    deadline = time.time() + 2
+    while len(ledger.summarize(group_by="provider")) < 2 and time.time() < deadline:
+        time.sleep(0.02)
+    assert sorted(r["provider"] for r in ledger.summarize(group_by="provider")) == ["ollama", "openai"]
+    ledger.close()
+
+
+def test_hedged_complete_falls_back_only_when_asked(hedging_env):
+    svc = _service("gemini", "openai", "anthropic")
+
+    def failing_stream(provider, *args):
+        raise PermissionError(f"{provider}: invalid API key")
+        yield  # pragma: no cover
+
+    with patch.object(svc, "_stream_provider", side_effect=failing_stream), \
+            patch.object(svc, "_try_complete", return_value="from anthropic") as fallback:
+        with pytest.raises(PermissionError):
+            svc.complete("sys", "user", hedge=True)
+        fallback.assert_not_called()
+
+        # Both hedged providers failed, so the normal path takes the next one
+        assert svc.complete("sys", "user", hedge=True, auto_fallback=True) == "from anthropic"
+    assert fallback.call_args.args[0] == "anthropic"
+    assert svc.provider == "anthropic"
@@ -0,0 +1,130 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agent.core.ai.prompt_cache import (
+    GenaiContextCache,
+    anthropic_content,
+    cacheable_prefix,
+    genai_request,
+    max_output_tokens,
+)
+
+PREFIX = "<rules>" + "shared governance context " * 50 + "</rules>"
+
+
+@pytest.fixture(autouse=True)
+def small_cache_threshold(monkeypatch):
+    monkeypatch.setenv("AGENT_AI_CACHE_MIN_TOKENS", "10")
+
+
+@pytest.fixture
+def service():
+    from agent.core.ai.service import AIService
+
+    svc = AIService()
+    svc._initialized = True
+    svc.is_forced = True
+    svc.models = {"anthropic": "claude-sonnet-4-5", "openai": "gpt-test", "gemini": "gemini-test"}
+    svc.clients = {"anthropic": MagicMock(), "openai": MagicMock(), "gemini": MagicMock()}
+    return svc
+
+
+def test_cacheable_prefix_respects_provider_size_and_switch(monkeypatch):
+    assert cacheable_prefix("anthropic", PREFIX) == PREFIX
+    assert cacheable_prefix("openai", PREFIX) is None
+    assert cacheable_prefix("anthropic", "tiny") is None
+    monkeypatch.setenv("AGENT_AI_PROMPT_CACHE", "0")
+    assert cacheable_prefix("anthropic", PREFIX) is None
+
+
+def test_max_output_tokens_defaults_and_override(monkeypatch):
+    assert max_output_tokens("claude-sonnet-4-5") == 16384
+    assert max_output_tokens("claude-3-haiku-20240307") == 4096
+    monkeypatch.setenv("AGENT_AI_MAX_OUTPUT_TOKENS", "2048")
+    assert max_output_tokens("claude-sonnet-4-5") == 2048
+
+
+def test_anthropic_request_marks_shared_prefix_as_cached(service):
+    service.provider = "anthropic"
+    client = service.clients["anthropic"]
+    stream = MagicMock()
+    stream.text_stream = ["ok"]
+    client.messages.stream.return_value.__enter__.return_value = stream
+
+    assert service.complete("role prompt", "<diff>d</diff>", cache_prefix=PREFIX) == "ok"
+
+    kwargs = client.messages.stream.call_args.kwargs
+    # Shared context is user content; the role instructions stay the system prompt
+    assert kwargs["system"] == "role prompt"
+    content = kwargs["messages"][0]["content"]
+    assert content == anthropic_content("<diff>d</diff>", PREFIX)
+    assert content[0] == {"type": "text", "text": PREFIX, "cache_control": {"type": "ephemeral"}}
+    assert content[1] == {"type": "text", "text": "<diff>d</diff>"}
+    assert kwargs["max_tokens"] == 16384
+
+
+def test_uncached_provider_gets_prefix_prepended(service):
+    service.provider = "openai"
+    client = service.clients["openai"]
+    client.chat.completions.create.return_value.choices = [MagicMock(message=MagicMock(content="done"))]
+
+    assert service.complete("sys", "suffix", cache_prefix="prefix") == "done"
+    messages = client.chat.completions.create.call_args.kwargs["messages"]
+    assert messages[1]["content"] == "prefix\n\nsuffix"
+
+
+def test_genai_context_cache_is_created_once_and_reused():
+    client = MagicMock()
+    client.caches.create.return_value.name = "cachedContents/abc"
+    cache = GenaiContextCache()
+
+    with patch("agent.core.ai.prompt_cache.genai_context_cache", cache):
+        first = genai_request(client, "gemini", "gemini-test", "role", "diff", PREFIX)
+        second = genai_request(client, "gemini", "gemini-test", "role", "diff 2", PREFIX)
+
+    assert first == ({"cached_content": "cachedContents/abc"}, "diff")
+    assert second == ({"cached_content": "cachedContents/abc"}, "diff 2")
+    assert client.caches.create.call_count == 1
+
+
+def test_genai_cache_keeps_role_prompt_as_system_instruction():
+    client = MagicMock()
+    cache = GenaiContextCache()
+
+    with patch("agent.core.ai.prompt_cache.genai_context_cache", cache):
+        genai_request(client, "gemini", "gemini-test", "role", "diff", PREFIX)
+        genai_request(client, "gemini", "gemini-test", "other role", "diff", PREFIX)
+
+    configs = [c.kwargs["config"] for c in client.caches.create.call_args_list]
+    assert [c.system_instruction for c in configs] == ["role", "other role"]
+    assert configs[0].contents[0].parts[0].text == PREFIX
+
+
+def test_genai_cache_failure_falls_back_to_inline_prefix():
+    client = MagicMock()
+    client.caches.create.side_effect = Exception("400 cached content is too small")
+    cache = GenaiContextCache()
+
+    with patch("agent.core.ai.prompt_cache.genai_context_cache", cache):
+        config, contents = genai_request(client, "vertex", "gemini-test", "role", "diff", PREFIX)
+        genai_request(client, "vertex", "gemini-test", "role", "diff", PREFIX)
+
+    assert config == {"system_instruction": "role"}
+    assert contents == PREFIX + "\n\ndiff"
+    # Failed creates are not retried on every call
+    assert client.caches.create.call_count == 1
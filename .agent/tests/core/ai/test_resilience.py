@@ -0,0 +1,232 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+import openai
+import pytest
+
+from agent.core.ai.protocols import (
+    AIAuthenticationError,
+    AIConnectionError,
+    AIInvalidRequestError,
+    AIRateLimitError,
+)
+from agent.core.ai.resilience import (
+    CircuitBreaker,
+    FirstByteTimeout,
+    backoff_delay,
+    breaker_for,
+    classify,
+    first_byte_deadline,
+    is_retryable,
+)
+
+
+def _response(status, headers=None):
+    return httpx.Response(status, headers=headers or {}, request=httpx.Request("POST", "https://api.test/v1"))
+
+
+def test_classify_typed_sdk_errors_and_retry_after():
+    err = openai.RateLimitError("slow down", response=_response(429, {"retry-after": "7"}), body=None)
+    failure = classify(err, "openai")
+    assert isinstance(failure, AIRateLimitError)
+    assert failure.retry_after == 7.0
+    assert failure.provider == "openai" and failure.original_exception is err
+
+    conn = openai.APIConnectionError(request=httpx.Request("POST", "https://api.test/v1"))
+    assert isinstance(classify(conn), AIConnectionError)
+    assert isinstance(classify(httpx.ReadError("reset")), AIConnectionError)
+    auth = openai.AuthenticationError("bad key", response=_response(401), body=None)
+    assert not is_retryable(classify(auth))
+    assert isinstance(classify(auth), AIAuthenticationError)
+
+
+def test_classify_by_status_then_message():
+    class Coded(Exception):
+        code = 503
+
+    class BadRequest(Exception):
+        status_code = 400
+
+    assert isinstance(classify(Coded("overloaded")), AIRateLimitError)
+    assert isinstance(classify(BadRequest("429 in the prompt text")), AIInvalidRequestError)
+    assert isinstance(classify(Exception("GH Rate Limited (Max Retries)")), AIRateLimitError)
+    assert not is_retryable(classify(ValueError("Unknown provider: x")))
+
+
+def test_backoff_delay_is_jittered_capped_and_honours_retry_after():
+    assert backoff_delay(0, base=5, rand=lambda: 0.0) == 2.5
+    assert backoff_delay(1, base=5, rand=lambda: 1.0) == 10
+    assert backoff_delay(10, base=5, rand=lambda: 1.0) == 60
+    assert backoff_delay(0, base=1, retry_after=12, rand=lambda: 1.0) == 12
+
+
+def test_circuit_breaker_opens_probes_and_closes():
+    now = [0.0]
+    breaker = CircuitBreaker(threshold=2, cooldown=10, clock=lambda: now[0])
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow()
+
+    now[0] = 11
+    assert breaker.allow()  # single half-open probe
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    now[0] = 22
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.allow()
+
+
+def test_probe_without_a_verdict_is_released(service, monkeypatch):
+    monkeypatch.setenv("AGENT_AI_BREAKER_THRESHOLD", "1")
+    monkeypatch.setenv("AGENT_AI_BREAKER_COOLDOWN_S", "0")
+    breaker = breaker_for("gemini", "gemini-test")
+    breaker.record_failure()
+
+    def rejected(provider, *args):
+        raise openai.BadRequestError("bad", response=_response(400), body=None)
+        yield  # pragma: no cover
+
+    def chatty(provider, *args):
+        yield "a"
+        yield "b"
+
+    with patch.object(service, "_stream_provider", side_effect=rejected):
+        with pytest.raises(openai.BadRequestError):
+            list(service.stream_complete("sys", "user"))
+    assert breaker.allow()  # the 400 probe was released
+    breaker.release()
+
+    with patch.object(service, "_stream_provider", side_effect=chatty):
+        stream = service.stream_complete("sys", "user")
+        assert next(stream) == "a"
+        stream.close()
+    assert breaker.allow()
+
+
+def test_gh_stream_probes_its_breaker_once(monkeypatch):
+    from agent.core.ai.service import AIService
+
+    monkeypatch.setenv("AGENT_AI_BREAKER_THRESHOLD", "1")
+    monkeypatch.setenv("AGENT_AI_BREAKER_COOLDOWN_S", "0")
+    svc = AIService()
+    svc._initialized = True
+    svc.is_forced = True
+    svc.provider = "gh"
+    svc.models = {"gh": "gpt-4o"}
+    svc.clients = {"gh": "gh-cli"}
+    breaker = breaker_for("gh", "gpt-4o")
+    breaker.record_failure()  # open; the next stream is the half-open probe
+
+    done = MagicMock(returncode=0, stdout="answer\n", stderr="")
+    with patch("agent.core.ai.service.subprocess.run", return_value=done):
+        assert list(svc.stream_complete("sys", "user")) == ["answer"]
+    assert breaker.state == "closed"
+
+    failed = MagicMock(returncode=1, stdout="", stderr="GH Context Limit: too large")
+    with patch("agent.core.ai.service.subprocess.run", return_value=failed):
+        with pytest.raises(Exception, match="Context Limit"):
+            list(svc.stream_complete("sys", "user"))
+    # A rejected request gives no verdict on gh, so the breaker stays usable
+    assert breaker.allow()
+
+
+def test_first_byte_deadline_raises_and_closes_source():
+    closed = threading.Event()
+    release = threading.Event()
+
+    def slow():
+        try:
+            release.wait(2)
+            yield "late"
+        finally:
+            closed.set()
+
+    with pytest.raises(FirstByteTimeout):
+        list(first_byte_deadline(slow(), 0.05))
+    release.set()
+    assert closed.wait(2)
+    assert list(first_byte_deadline(iter(["a", "b"]), 1)) == ["a", "b"]
+
+
+@pytest.fixture
+def service():
+    from agent.core.ai.service import AIService
+
+    svc = AIService()
+    svc._initialized = True
+    svc.provider = "gemini"
+    svc.models = {"gemini": "gemini-test", "openai": "gpt-test"}
+    svc.clients = {"gemini": MagicMock(), "openai": MagicMock()}
+    return svc
+
+
+def test_stream_fails_over_when_first_byte_is_late(service, monkeypatch):
+    monkeypatch.setenv("AGENT_AI_FIRST_BYTE_TIMEOUT_S", "0.05")
+
+    def fake_stream(provider, *args):
+        if provider == "gemini":
+            time.sleep(0.5)
+        yield f"from {provider}"
+
+    with patch.object(service, "_stream_provider", side_effect=fake_stream):
+        chunks = list(service.stream_complete("sys", "user", auto_fallback=True))
+
+    assert chunks == ["from openai"]
+    assert service.provider == "openai"
+
+
+def test_stream_retries_before_first_byte_then_skips_open_circuit(service, monkeypatch):
+    monkeypatch.setenv("AGENT_AI_BREAKER_THRESHOLD", "1")
+    calls = []
+
+    def failing(provider, *args):
+        calls.append(provider)
+        raise openai.RateLimitError("busy", response=_response(429), body=None)
+        yield  # pragma: no cover
+
+    with patch.object(service, "_stream_provider", side_effect=failing), \
+            patch("agent.core.ai.service.time.sleep") as sleep:
+        with pytest.raises(openai.RateLimitError):
+            list(service.stream_complete("sys", "user"))
+        assert calls == ["gemini"] * 3
+        assert sleep.call_count == 2
+        assert breaker_for("gemini", "gemini-test").state == "open"
+
+        # Open breaker: fail fast without touching the provider
+        with pytest.raises(Exception, match="Circuit open"):
+            list(service.stream_complete("sys", "user"))
+        assert len(calls) == 3
+
+
+def test_stream_error_after_first_chunk_is_not_retried(service):
+    def flaky(provider, *args):
+        yield "partial"
+        raise ConnectionError("dropped")
+
+    with patch.object(service, "_stream_provider", side_effect=flaky):
+        seen = []
+        with pytest.raises(ConnectionError):
+            for chunk in service.stream_complete("sys", "user", auto_fallback=True):
+                seen.append(chunk)
+    assert seen == ["partial"]
+    assert service.provider == "gemini"
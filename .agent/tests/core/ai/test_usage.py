@@ -0,0 +1,187 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import stat
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agent.commands.usage import estimate_cost, parse_since
+from agent.core.ai import usage as usage_mod
+from agent.core.ai.service import AIService
+from agent.core.ai.usage import (
+    TokenUsage,
+    UsageLedger,
+    current_labels,
+    set_default_labels,
+    usage_from_anthropic,
+    usage_from_genai,
+    usage_from_openai,
+    usage_scope,
+)
+
+
+@pytest.fixture
+def ledger(tmp_path, monkeypatch):
+    ledger = UsageLedger(tmp_path / "usage.db")
+    monkeypatch.setattr(usage_mod, "_ledger", ledger)
+    monkeypatch.setenv("AGENT_USAGE_LEDGER", "1")
+    yield ledger
+    ledger.close()
+
+
+@pytest.fixture(autouse=True)
+def _reset_labels():
+    yield
+    set_default_labels(command=None, story=None, role=None)
+
+
+def test_extractors_normalise_provider_shapes():
+    openai = SimpleNamespace(
+        prompt_tokens=120, completion_tokens=30,
+        prompt_tokens_details=SimpleNamespace(cached_tokens=100),
+    )
+    assert usage_from_openai(openai) == TokenUsage(120, 30, cached_input_tokens=100)
+
+    anthropic = SimpleNamespace(
+        input_tokens=20, output_tokens=5,
+        cache_read_input_tokens=100, cache_creation_input_tokens=0,
+    )
+    assert usage_from_anthropic(anthropic) == TokenUsage(120, 5, cached_input_tokens=100)
+
+    genai = SimpleNamespace(prompt_token_count=50, candidates_token_count=7, thoughts_token_count=3)
+    assert usage_from_genai(genai) == TokenUsage(50, 10)
+
+
+def test_extractors_ignore_unpopulated_objects():
+    assert usage_from_openai(MagicMock()) is None
+    assert usage_from_anthropic(None) is None
+    assert usage_from_genai(SimpleNamespace(prompt_token_count=None)) is None
+
+
+def test_scope_overrides_defaults_per_thread():
+    set_default_labels(command="preflight")
+    seen = {}
+
+    def worker(role):
+        with usage_scope(story="INFRA-1", role=role):
+            seen[role] = current_labels()
+
+    threads = [threading.Thread(target=worker, args=(r,)) for r in ("security", "qa")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert seen["security"] == {"command": "preflight", "story": "INFRA-1", "role": "security"}
+    assert seen["qa"]["role"] == "qa"
+    assert current_labels() == {"command": "preflight"}
+
+
+def test_ledger_summarizes_by_label(ledger):
+    ledger.record("openai", "gpt-4o", TokenUsage(100, 10), {"command": "preflight", "role": "qa"})
+    ledger.record("openai", "gpt-4o", TokenUsage(50, 5), {"command": "preflight", "role": "security"})
+    ledger.record("gh", "gpt-4o-mini", TokenUsage(7, 3, estimated=True), {"command": "story"})
+
+    rows = {r["command"]: r for r in ledger.summarize(group_by="command")}
+
+    assert rows["preflight"]["calls"] == 2
+    assert rows["preflight"]["input_tokens"] == 150
+    assert rows["story"]["estimated_calls"] == 1
+    assert stat.S_IMODE(ledger._db_path.stat().st_mode) == 0o600
+
+
+def test_ledger_rejects_unknown_group(ledger):
+    with pytest.raises(ValueError):
+        ledger.summarize(group_by="ts; DROP TABLE llm_usage")
+
+
+def test_try_complete_records_openai_usage(ledger):
+    service = AIService()
+    service._initialized = True
+    mock_client = MagicMock()
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = "answer"
+    response.usage = SimpleNamespace(prompt_tokens=42, completion_tokens=8, prompt_tokens_details=None)
+    mock_client.chat.completions.create.return_value = response
+    service.clients = {"openai": mock_client}
+    service.models = {"openai": "gpt-4o"}
+
+    with patch("agent.core.config.config") as mock_cfg, usage_scope(story="INFRA-9", role="qa"):
+        mock_cfg.panel_num_retries = 3
+        assert service._try_complete("openai", "sys", "user") == "answer"
+
+    [row] = ledger.summarize(group_by="role")
+    assert row["role"] == "qa"
+    assert (row["provider"], row["model"]) == ("openai", "gpt-4o")
+    assert (row["input_tokens"], row["output_tokens"], row["estimated_calls"]) == (42, 8, 0)
+
+
+def test_missing_usage_falls_back_to_estimate(ledger):
+    usage_mod.record_completion("gh", "gpt-4o", None, ("system", "hello world"), "hi there")
+
+    [row] = ledger.summarize(group_by="provider")
+    assert row["estimated_calls"] == 1
+    assert row["input_tokens"] > 0 and row["output_tokens"] > 0
+
+
+def test_disabled_ledger_is_not_written(ledger, monkeypatch):
+    monkeypatch.setenv("AGENT_USAGE_LEDGER", "0")
+    usage_mod.record_usage("openai", "gpt-4o", TokenUsage(1, 1))
+    assert ledger.summarize() == []
+
+
+def test_estimate_cost_uses_router_pricing():
+    prices = {("openai", "gpt-4o"): {"cost_per_1k_input": 0.005, "cost_per_1k_output": 0.015}}
+    row = {"provider": "openai", "model": "gpt-4o", "input_tokens": 2000, "output_tokens": 1000}
+
+    assert estimate_cost(row, prices) == pytest.approx(0.025)
+    assert estimate_cost({**row, "model": "unknown"}, prices) is None
+
+
+def test_parse_since_accepts_durations_and_dates():
+    assert parse_since("7d") < parse_since("24h")
+    assert parse_since("2026-01-31").year == 2026
+    assert parse_since(None) is None
+
+
+def test_stream_closed_early_still_records_usage_and_breaker(ledger, monkeypatch):
+    from agent.core.ai.resilience import breaker_for
+
+    monkeypatch.setenv("AGENT_AI_FIRST_BYTE_TIMEOUT_S", "0")
+    monkeypatch.setenv("AGENT_AI_BREAKER_THRESHOLD", "1")
+    monkeypatch.setenv("AGENT_AI_BREAKER_COOLDOWN_S", "0")
+    service = AIService()
+    service._initialized = True
+    service.provider = "openai"
+    service.models = {"openai": "gpt-4o"}
+    mock_client = MagicMock()
+    mock_client.chat.completions.create.return_value = iter([
+        SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))], usage=None)
+        for text in ("Action: ", "{}", " Observation: hallucinated")
+    ])
+    service.clients = {"openai": mock_client}
+    breaker = breaker_for("openai", "gpt-4o")
+    breaker.record_failure()  # open; the next call is the half-open probe
+
+    stream = service.stream_complete("sys", "user")
+    assert next(stream) == "Action: "
+    stream.close()
+
+    [row] = ledger.summarize(group_by="provider")
+    assert row["provider"] == "openai" and row["estimated_calls"] == 1
+    assert breaker.state == "closed"
@@ -17,10 +17,10 @@ from unittest.mock import patch, MagicMock
 from agent.core.check.impact import run_impact_analysis
 
 @patch("pathlib.Path.read_text")
-@patch("agent.core.config.config.stories_dir", new_callable=MagicMock)
+@patch("agent.core.check.impact.find_story_file")
 @patch("subprocess.run")
-def test_run_impact_analysis_offline(mock_run, mock_stories_dir, mock_read_text, tmp_path):
-    mock_stories_dir.rglob.return_value = [tmp_path / "INFRA-123-test.md"]
+def test_run_impact_analysis_offline(mock_run, mock_find_story, mock_read_text, tmp_path):
+    mock_find_story.return_value = tmp_path / "INFRA-123-test.md"
     mock_read_text.return_value = "# Story Details"
     
     # Mock git diff
@@ -60,10 +60,10 @@ def test_run_impact_analysis_offline(mock_run, mock_stories_dir, mock_read_text,
         assert "tests/test_main.py" in result["test_markers"]
 
 @patch("pathlib.Path.read_text")
-@patch("agent.core.config.config.stories_dir", new_callable=MagicMock)
+@patch("agent.core.check.impact.find_story_file")
 @patch("subprocess.run")
-def test_run_impact_analysis_ai_error_fallback(mock_run, mock_stories_dir, mock_read_text, tmp_path):
-    mock_stories_dir.rglob.return_value = [tmp_path / "INFRA-123-test.md"]
+def test_run_impact_analysis_ai_error_fallback(mock_run, mock_find_story, mock_read_text, tmp_path):
+    mock_find_story.return_value = tmp_path / "INFRA-123-test.md"
     mock_read_text.return_value = "# Story Details"
     
     mock_proc = MagicMock()
@@ -172,3 +172,48 @@ async def test_persistent_malformed_output():
     assert mock_mcp.call_tool.call_count == 0
     # LLM should have been called max_steps times
     assert mock_llm.complete.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_executor_streams_thought_and_dispatches_on_action_close():
+    mock_llm = MagicMock()
+    mock_mcp = AsyncMock()
+    mock_mcp.list_tools.return_value = [Tool(name="search", description="Search web", inputSchema={})]
+    mock_mcp.call_tool.return_value = "foo is bar"
+
+    def stream(text):
+        return (text[i:i + 4] for i in range(0, len(text), 4))
+
+    first = 'Thought: Look up data.\nAction: {"tool": "search", "tool_input": {"query": "foo"}}\nObservation: made up'
+    second = 'Thought: Done.\nAction: {"tool": "Final Answer", "tool_input": "bar"}'
+    mock_llm.stream_complete.side_effect = [stream(first), stream(second)]
+
+    executor = AgentExecutor(llm=mock_llm, mcp_client=mock_mcp, max_steps=5)
+    events = [e async for e in executor.run("What is foo?")]
+
+    deltas = "".join(e["content"] for e in events if e["type"] == "thought_delta")
+    assert deltas.startswith("Look up data.")
+    types = [e["type"] for e in events]
+    assert types.index("thought_delta") < types.index("tool_call")
+    assert events[-1] == {"type": "final_answer", "content": "bar"}
+    mock_mcp.call_tool.assert_called_once_with("search", {"query": "foo"})
+    mock_llm.complete.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_executor_falls_back_to_complete_when_stream_fails():
+    mock_llm = MagicMock()
+    mock_mcp = AsyncMock()
+    mock_mcp.list_tools.return_value = []
+
+    def broken(**kwargs):
+        raise RuntimeError("no streaming")
+        yield  # pragma: no cover
+
+    mock_llm.stream_complete.side_effect = broken
+    mock_llm.complete.return_value = 'Action: {"tool": "Final Answer", "tool_input": "ok"}'
+
+    executor = AgentExecutor(llm=mock_llm, mcp_client=mock_mcp, max_steps=2)
+    events = [e async for e in executor.run("Go")]
+    assert events[-1] == {"type": "final_answer", "content": "ok"}
+    mock_llm.complete.assert_called_once()
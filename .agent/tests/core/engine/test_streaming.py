@@ -0,0 +1,97 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+import pytest
+
+from agent.core.engine.streaming import ReActStreamScanner, stream_chunks
+
+
+def _scan(text: str, size: int = 3):
+    scanner = ReActStreamScanner()
+    deltas = []
+    for i in range(0, len(text), size):
+        deltas.append(scanner.feed(text[i:i + size]))
+        if scanner.closed:
+            break
+    else:
+        deltas.append(scanner.flush())
+    return "".join(deltas), scanner
+
+
+@pytest.mark.parametrize("size", [1, 2, 5, 64])
+def test_scanner_closes_on_json_action(size):
+    text = (
+        'Thought: Look up data.\n'
+        'Action: { "tool": "search", "tool_input": {"query": "a } \\" b"} }\n'
+        'Observation: invented'
+    )
+    thought, scanner = _scan(text, size)
+    assert thought == "Look up data."
+    assert scanner.closed
+    assert "Observation" not in scanner.text
+    assert scanner.text.rstrip().endswith("} }")
+
+
+def test_scanner_closes_on_action_input_line():
+    thought, scanner = _scan("Thought: read it\nAction: read_file\nAction Input: a.py\nObservation: x", 1)
+    assert thought == "read it"
+    assert scanner.closed
+    assert scanner.text.endswith("Action Input: a.py\n")
+
+
+def test_scanner_skips_actions_without_tool():
+    _, scanner = _scan('Thought: hm\nAction: {"x": 1}\nAction: {"tool": "t", "tool_input": {}} tail')
+    assert scanner.closed
+    assert '"tool": "t"' in scanner.text
+
+
+def test_scanner_final_answer_streams_whole_text():
+    thought, scanner = _scan("Thought: I know. Final Answer: 42")
+    assert not scanner.closed
+    assert thought == "I know. Final Answer: 42"
+
+
+@pytest.mark.asyncio
+async def test_stream_chunks_closes_provider_on_early_exit():
+    closed = threading.Event()
+
+    def produce():
+        try:
+            for i in range(1000):
+                yield f"c{i}"
+        finally:
+            closed.set()
+
+    seen = []
+    async for chunk in stream_chunks(produce):
+        seen.append(chunk)
+        if len(seen) == 3:
+            break
+    assert seen == ["c0", "c1", "c2"]
+    assert closed.wait(2)
+
+
+@pytest.mark.asyncio
+async def test_stream_chunks_reraises_provider_errors():
+    def produce():
+        yield "a"
+        raise RuntimeError("boom")
+
+    seen = []
+    with pytest.raises(RuntimeError, match="boom"):
+        async for chunk in stream_chunks(produce):
+            seen.append(chunk)
+    assert seen == ["a"]
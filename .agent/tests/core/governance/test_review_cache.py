@@ -0,0 +1,110 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import PropertyMock, patch
+
+import pytest
+
+from agent.core.governance import convene_council_full
+from agent.core.governance.review_cache import (
+    ReviewCache,
+    attribute_review,
+    merge_entries,
+    split_diff_by_file,
+)
+
+
+def _file_diff(path, body):
+    return f"diff --git a/{path} b/{path}\n--- a/{path}\n+++ b/{path}\n@@ -1 +1 @@\n-old\n+{body}\n"
+
+
+def test_split_diff_by_file_keeps_every_line():
+    diff = "preamble\n" + _file_diff("src/a.py", "x") + _file_diff("docs/b.md", "y")
+    sections = split_diff_by_file(diff)
+    assert list(sections) == ["", "src/a.py", "docs/b.md"]
+    assert "".join(sections.values()) == diff
+
+
+def test_attribute_review_pins_findings_to_cited_files():
+    entries = attribute_review(
+        "BLOCK", "Unsafe call",
+        ["eval of user input in a.py:3 (Source: src/a.py)", "REFERENCES:"],
+        [], ["ADR-001"], ["src/a.py", "docs/b.md"],
+    )
+    assert entries["src/a.py"]["verdict"] == "BLOCK"
+    assert entries["docs/b.md"] == {
+        "verdict": "PASS", "summary": "Unsafe call", "findings": [],
+        "required_changes": [], "references": ["ADR-001"],
+    }
+    assert merge_entries(entries.values())["verdict"] == "BLOCK"
+
+    # A cited finding that names no reviewed file cannot be cached safely
+    assert attribute_review("BLOCK", "", ["Violates ADR-9 (Source: ADR-009)"], [], [], ["src/a.py"]) is None
+    assert attribute_review("BLOCK", "", [], [], [], ["src/a.py"]) is None
+
+
+def test_review_cache_round_trips_and_ignores_other_versions(tmp_path):
+    path = tmp_path / "review_cache.json"
+    cache = ReviewCache(path)
+    cache.put("k", {"verdict": "PASS"})
+    cache.save()
+    assert ReviewCache(path).get("k")["verdict"] == "PASS"
+    path.write_text('{"version": 0, "entries": {"k": {}}}')
+    assert ReviewCache(path).get("k") is None
+
+
+@pytest.fixture
+def council(tmp_path, monkeypatch):
+    monkeypatch.delenv("AGENT_NO_REVIEW_CACHE", raising=False)
+    with patch("agent.core.config.Config.panel_engine", new_callable=PropertyMock, return_value="native"), \
+            patch("agent.core._governance_legacy.ai_service") as ai, \
+            patch("agent.core._governance_legacy.load_roles", return_value=[{"name": "Security", "focus": "Vulns"}]), \
+            patch("agent.core._governance_legacy.ReviewCache", lambda: ReviewCache(tmp_path / "rc.json")):
+        ai.provider = "openai"
+
+        def run(diff):
+            return convene_council_full(
+                story_id="TEST-1", story_content="Story", rules_content="Rules",
+                instructions_content="Inst", full_diff=diff, use_review_cache=True,
+            )
+        yield ai, run
+
+
+def test_retry_only_re_reviews_changed_files(council):
+    ai, run = council
+    ai.complete.return_value = "VERDICT: PASS\nSUMMARY: ok\nFINDINGS:\n- None"
+    unchanged = _file_diff("src/a.py", "kept")
+
+    assert run(unchanged + _file_diff("src/b.py", "first"))["verdict"] == "PASS"
+    assert ai.complete.call_count == 1
+
+    run(unchanged + _file_diff("src/b.py", "fixed"))
+    assert ai.complete.call_count == 2
+    user_prompt = ai.complete.call_args.args[1]
+    assert "src/b.py" in user_prompt and "src/a.py" not in user_prompt
+
+    # Nothing changed: every verdict comes from the cache
+    assert run(unchanged + _file_diff("src/b.py", "fixed"))["verdict"] == "PASS"
+    assert ai.complete.call_count == 2
+
+
+@pytest.mark.parametrize("reply", ["", "SUMMARY: cut off mid-"])
+def test_replies_without_a_verdict_are_not_cached(council, reply):
+    ai, run = council
+    ai.complete.return_value = reply
+    diff = _file_diff("src/a.py", "body")
+
+    run(diff)
+    run(diff)
+    assert ai.complete.call_count == 2
@@ -0,0 +1,88 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from agent.core.implement.block_match import locate_block
+from agent.core.implement.verification_orchestrator import RunbookStep, VerificationOrchestrator
+from agent.core.implement.verifier import RunbookVerifier
+
+SOURCE = (
+    "class Service:\r\n"
+    "    def start(self, host,\r\n"
+    "              port):\r\n"
+    "        self.host = host  \r\n"
+    "\r\n"
+    "    def options(self):\r\n"
+    "        return dict(\r\n"
+    "            retries=3,\r\n"
+    "            timeout=30,\r\n"
+    "        )\r\n"
+)
+
+
+@pytest.mark.parametrize("search, tier", [
+    ("    def options(self):", "exact"),
+    ("        self.host = host\n", "whitespace"),
+    ("        return dict(\n            retries=3,\n            timeout=30\n        )", "whitespace"),
+    ("def options(self):\n    return dict(", "indentation"),
+    ("    def options(self):\n        return dict(\n            retries=5,\n            timeout=30,", "fuzzy"),
+])
+def test_tiers_return_the_verbatim_region(search, tier):
+    match = locate_block(SOURCE, search)
+    assert match.tier == tier
+    assert SOURCE[match.offset:match.offset + len(match.text)] == match.text
+    assert match.apply(SOURCE, "X").count("X") == 1
+
+
+def test_ambiguous_or_hallucinated_blocks_do_not_match():
+    source = "a = 1\nb = 2\n\na = 1\nb = 2\n"
+    assert locate_block(source, "a = 1 \nb = 2") is None
+    assert locate_block(SOURCE, "def stop(self):\n    pass") is None
+    assert locate_block(SOURCE, "    def options(self):\n        return list(\n", fuzzy_threshold=None) is None
+
+
+def test_dedented_replacement_is_shifted_into_the_region(tmp_path):
+    source = "class A:\n    def f(self):\n        if x:\n            y()\n        return 1\n"
+    search = "if x:\n    y()"
+    replace = "if x:\n    y()\n    z()\nw()"
+    match = locate_block(source, search)
+    assert match.tier == "indentation"
+    patched = match.apply(source, replace)
+    compile(patched, "a.py", "exec")
+    assert "            z()\n        w()\n        return 1" in patched
+
+    (tmp_path / "a.py").write_text(source)
+    orchestrator = VerificationOrchestrator(RunbookVerifier(tmp_path), MagicMock(), max_retries=1)
+    ok, fixed = orchestrator.verify_and_correct(
+        [RunbookStep(action="MODIFY", path="a.py", search=search, replace=replace)]
+    )
+    assert ok
+    assert fixed[0].replace == "        if x:\n            y()\n            z()\n        w()"
+
+
+def test_orchestrator_repairs_layout_drift_without_a_rewrite(tmp_path):
+    (tmp_path / "svc.py").write_text("def run(a,\n        b):\n    return a\n")
+    ai = MagicMock()
+    orchestrator = VerificationOrchestrator(RunbookVerifier(tmp_path), ai, max_retries=1)
+    steps = [RunbookStep(action="MODIFY", path="svc.py", search="def run(a,\n  b):", replace="x")]
+
+    ok, fixed = orchestrator.verify_and_correct(steps)
+
+    assert ok
+    assert fixed[0].search == "def run(a,\n        b):"
+    assert orchestrator.repairs == {"indentation": 1}
+    ai.complete.assert_not_called()
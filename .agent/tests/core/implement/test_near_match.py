@@ -0,0 +1,64 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from agent.core.implement.near_match import LineIndex, context_windows
+from agent.core.implement.verifier import RunbookVerifier
+
+
+def _module(functions: int = 400) -> str:
+    lines = []
+    for n in range(functions):
+        lines += [f"def handler_{n}(event, context):", f"    payload = load(event, key={n})",
+                  f"    return respond(payload, status={200 + n % 7})", ""]
+    return "\n".join(lines)
+
+
+def test_candidates_rank_the_drifted_region_first():
+    content = _module()
+    search = "def handler_123(event, context):\n  payload = load(event, key=123)\n  return respond(payload, status=205)"
+
+    best = LineIndex(content).candidates(search)[0]
+
+    assert (best.start_line, best.end_line) == (492, 495)
+    assert best.score > 0.5
+
+
+def test_candidates_are_distinct_and_capped():
+    content = "\n".join(["x = compute(1)", "y = compute(2)", "", "x = compute(1)", "y = compute(3)"] * 3)
+    found = LineIndex(content).candidates("x = compute(1)\ny = compute(2)", top_k=2)
+    assert len(found) == 2
+    assert found[0].end_line <= found[1].start_line or found[1].end_line <= found[0].start_line
+
+
+def test_context_windows_respect_the_token_budget():
+    content = _module()
+    search = "def handler_300(event, context):\n    payload = load(event, key=300)"
+
+    window = context_windows(content, search, budget_tokens=100)
+
+    assert len(window) <= 100 * 4 + 200  # excerpts plus their headers
+    assert "def handler_300(event, context):" in window
+    assert context_windows("small = True\n", "big = False") == "small = True\n"
+
+
+def test_verifier_context_points_at_the_intended_region(tmp_path, monkeypatch):
+    monkeypatch.setenv("AGENT_VERIFY_CONTEXT_TOKENS", "200")
+    (tmp_path / "handlers.py").write_text(_module())
+    verifier = RunbookVerifier(tmp_path)
+
+    ok, error = verifier.verify_block("handlers.py", "def handler_77(event, ctx):\n    payload = load(event, key=77)")
+
+    assert not ok
+    assert "def handler_77(event, context):" in error.suggested_context
+    assert "def handler_3(event, context):" not in error.suggested_context
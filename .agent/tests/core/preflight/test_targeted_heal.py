@@ -0,0 +1,138 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""TestHealer targeted re-runs and per-file SEARCH/REPLACE repairs."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agent.core.preflight import test_healer as healer_mod
+from agent.core.preflight.test_healer import targeted_command
+
+TRACEBACK = (
+    'agent/core/calc.py:2: in add\n'
+    '    return a - b\n'
+    'agent/core/fmt.py:1: AssertionError\n'
+    '=========================== short test summary info ============================\n'
+    'FAILED tests/test_calc.py::test_add - assert -1 == 3\n'
+    'FAILED tests/test_fmt.py::test_fmt[x] - AssertionError\n'
+)
+
+
+def _bare(tb: str) -> str:
+    # Bare-path form that _FILE_RE recognises
+    return tb.replace("agent/core/", ".agent/src/agent/core/")
+
+
+@pytest.fixture
+def sources(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    core = tmp_path / ".agent" / "src" / "agent" / "core"
+    core.mkdir(parents=True)
+    (core / "calc.py").write_text("def add(a, b):\n    return a - b\n")
+    (core / "fmt.py").write_text("def fmt(x):\n    return str(x)\n")
+    return core
+
+
+def _ai(user_prompt, **_):
+    if "calc.py" in user_prompt.split("\n", 1)[0]:
+        return "<<<SEARCH\n    return a - b\n===\n    return a + b\n>>>"
+    return "<<<SEARCH\n    return str(x)\n===\n    return repr(x)\n>>>"
+
+
+def _runner(targeted_rc, full_rc=0):
+    calls = []
+
+    def run(cmd, **kwargs):
+        calls.append(cmd)
+        if cmd[0] == "git":
+            return MagicMock(returncode=0)
+        return MagicMock(returncode=targeted_rc if "::" in cmd[-1] else full_rc, stdout="", stderr="")
+    return run, calls
+
+
+def test_targeted_command_keeps_options_and_swaps_selection():
+    cmd = ["python", "-m", "pytest", "-q", "-k", "slow", "--tb=short", "-p", "no:cacheprovider", "tests/", "backend"]
+    assert targeted_command(cmd, ["tests/test_a.py::test_x"]) == [
+        "python", "-m", "pytest", "-q", "--tb=short", "-p", "no:cacheprovider", "tests/test_a.py::test_x",
+    ]
+    assert targeted_command(["npm", "test"], ["a::b"]) is None
+
+
+def test_files_are_repaired_with_search_replace_and_only_failing_nodes_rerun(sources):
+    run, calls = _runner(targeted_rc=0)
+    with patch("agent.core.preflight.test_healer.ai_service.complete", side_effect=_ai) as complete, \
+         patch("agent.core.preflight.test_healer.subprocess.run", side_effect=run), \
+         patch("agent.core.preflight.test_healer.git_state.run") as git_run:
+        healed = healer_mod.TestHealer().heal_failure(_bare(TRACEBACK), ["python", "-m", "pytest", "tests/"])
+
+    assert healed
+    assert complete.call_count == 2
+    # Staged once, after every repair finished
+    [add] = git_run.call_args_list
+    assert add.args[0] == "add" and sorted(Path(p).name for p in add.args[1:]) == ["calc.py", "fmt.py"]
+    assert (sources / "calc.py").read_text() == "def add(a, b):\n    return a + b\n"
+    assert (sources / "fmt.py").read_text() == "def fmt(x):\n    return repr(x)\n"
+    test_runs = [c for c in calls if c[0] != "git"]
+    assert test_runs == [
+        ["python", "-m", "pytest", "tests/test_calc.py::test_add", "tests/test_fmt.py::test_fmt[x]"],
+        ["python", "-m", "pytest", "tests/"],
+    ]
+
+
+def test_full_suite_is_skipped_when_targeted_rerun_still_fails(sources):
+    run, calls = _runner(targeted_rc=1)
+    with patch("agent.core.preflight.test_healer.ai_service.complete", side_effect=_ai), \
+         patch("agent.core.preflight.test_healer.subprocess.run", side_effect=run):
+        healed = healer_mod.TestHealer().heal_failure(_bare(TRACEBACK), ["python", "-m", "pytest", "tests/"])
+
+    assert not healed
+    assert [c for c in calls if c[0] != "git"] == [
+        ["python", "-m", "pytest", "tests/test_calc.py::test_add", "tests/test_fmt.py::test_fmt[x]"],
+    ]
+
+
+def test_unmatched_search_leaves_the_file_untouched(sources):
+    run, calls = _runner(targeted_rc=0)
+    with patch("agent.core.preflight.test_healer.ai_service.complete",
+               return_value="<<<SEARCH\n    return a * b\n===\n    return 0\n>>>"), \
+         patch("agent.core.preflight.test_healer.subprocess.run", side_effect=run):
+        healed = healer_mod.TestHealer().heal_failure(_bare(TRACEBACK), ["python", "-m", "pytest", "tests/"])
+
+    assert not healed
+    assert (sources / "calc.py").read_text() == "def add(a, b):\n    return a - b\n"
+    assert calls == []
+
+
+def test_fuzzy_matches_are_not_applied(sources):
+    # One line off from the file: the fuzzy tier would place it, the healer must not
+    reply = "<<<SEARCH\ndef add(a, c):\n    return a - b\n===\ndef add(a, b):\n    return a + b\n>>>"
+    run, calls = _runner(targeted_rc=0)
+    with patch("agent.core.preflight.test_healer.ai_service.complete", return_value=reply), \
+         patch("agent.core.preflight.test_healer.subprocess.run", side_effect=run):
+        healed = healer_mod.TestHealer().heal_failure(_bare(TRACEBACK), ["python", "-m", "pytest", "tests/"])
+
+    assert not healed
+    assert (sources / "calc.py").read_text() == "def add(a, b):\n    return a - b\n"
+    assert calls == []  # nothing staged, no test command re-run
+
+
+def test_large_files_are_sent_as_excerpts_around_cited_lines():
+    content = "\n".join(f"line_{i} = {i}" for i in range(5000))
+    context = healer_mod.TestHealer._file_context(content, [2500])
+    assert "line_2499 = 2499" in context
+    assert "line_10 = 10\n" not in context
+    assert len(context) < len(content) // 10
@@ -166,10 +166,11 @@ def test_rate_limit_retry_backoff(ai_service):
     # Should have retried same provider, not switched
     assert ai_service.provider == "openai"
     assert call_count == 3
-    # Exponential backoff: 5*(2^0)=5, 5*(2^1)=10
+    # Jittered exponential backoff: 5*(2^0)=5, 5*(2^1)=10, each within [half, full]
     assert mock_sleep.call_count == 2
-    mock_sleep.assert_any_call(5)
-    mock_sleep.assert_any_call(10)
+    first, second = (c.args[0] for c in mock_sleep.call_args_list)
+    assert 2.5 <= first <= 5
+    assert 5 <= second <= 10
 
 
 # ── Ollama Provider Tests ──
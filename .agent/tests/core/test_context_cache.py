@@ -0,0 +1,128 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the fingerprint-keyed context section cache."""
+
+import asyncio
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from agent.core import context_docs, context_source
+from agent.core.context import ContextLoader
+from agent.core.context_cache import SectionCache, fingerprint, section_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    section_cache.clear()
+    yield
+    section_cache.clear()
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    pkg = tmp_path / "src" / "pkg"
+    pkg.mkdir(parents=True)
+    (pkg / "mod.py").write_text("import os\n\ndef run():\n    pass\n")
+    adrs = tmp_path / "adrs"
+    adrs.mkdir()
+    (adrs / "ADR-001-x.md").write_text("# ADR-001: X\n\n## State\n\nACCEPTED\n\n## Decision\n\nUse X.\n")
+    return tmp_path
+
+
+def _bump(path: Path, text: str) -> None:
+    path.write_text(text)
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_fingerprint_tracks_mtime_size_and_new_files(tmp_path):
+    (tmp_path / "a.py").write_text("x")
+    before = fingerprint([tmp_path])
+    assert fingerprint([tmp_path]) == before
+
+    _bump(tmp_path / "a.py", "xy")
+    changed = fingerprint([tmp_path])
+    assert changed != before
+
+    (tmp_path / "notes.txt").write_text("ignored")
+    assert fingerprint([tmp_path], suffixes=(".py",)) == fingerprint([tmp_path], suffixes=(".py",))
+    (tmp_path / "b.py").write_text("")
+    assert fingerprint([tmp_path]) != changed
+    assert fingerprint([tmp_path / "missing"]) != fingerprint([tmp_path])
+
+
+def test_section_rebuilt_only_when_inputs_change(repo):
+    calls = []
+    cache = SectionCache()
+
+    def build():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get("s", [repo / "src"], build) == 1
+    assert cache.get("s", [repo / "src"], build) == 1
+    _bump(repo / "src" / "pkg" / "mod.py", "import sys\n")
+    assert cache.get("s", [repo / "src"], build) == 2
+    assert cache.get("s", [repo / "src"], build, extra="budget") == 3
+
+
+def test_cache_can_be_disabled(repo, monkeypatch):
+    monkeypatch.setenv("AGENT_NO_CONTEXT_CACHE", "1")
+    cache = SectionCache()
+    values = iter(range(10))
+    assert cache.get("s", [repo], lambda: next(values)) == 0
+    assert cache.get("s", [repo], lambda: next(values)) == 1
+
+
+def test_source_and_adr_sections_are_cached(repo):
+    with patch("agent.core.context_source.config") as cfg, patch("agent.core.context_docs.config", cfg):
+        cfg.agent_dir = repo
+        cfg.repo_root = repo
+        tree = context_source.load_source_tree()
+        outline = context_source.load_source_snippets()
+        adrs = context_docs.load_adrs()
+        assert "mod.py" in tree and "def run()" in outline and "Use X." in adrs
+
+        with patch("os.walk", side_effect=AssertionError("rebuilt")), \
+             patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+            assert context_source.load_source_tree() == tree
+            assert context_source.load_source_snippets() == outline
+            assert context_docs.load_adrs() == adrs
+
+        (repo / "src" / "pkg" / "new.py").write_text("def added():\n    pass\n")
+        assert "new.py" in context_source.load_source_tree()
+        assert "def added()" in context_source.load_source_snippets()
+
+
+def test_load_context_builds_sections_concurrently(repo):
+    loader = ContextLoader()
+    loader.rules_dir = repo / "rules"
+    loader.agents_path = repo / "agents.yaml"
+    loader.instructions_dir = repo / "instructions"
+    (repo / "rules").mkdir()
+    (repo / "rules" / "a.mdc").write_text("Rule A")
+    with patch("agent.core.context_source.config") as cfg, patch("agent.core.context_docs.config", cfg):
+        cfg.agent_dir = repo
+        cfg.repo_root = repo
+        with patch("asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            ctx = asyncio.run(loader.load_context(legacy_context=True))
+        assert to_thread.call_count == 6
+        assert "Rule A" in ctx["rules"] and "ADR-001" in ctx["adrs"] and "mod.py" in ctx["source_tree"]
+
+        _bump(repo / "rules" / "a.mdc", "Rule A2")
+        assert "Rule A2" in asyncio.run(loader.load_context(legacy_context=True))["rules"]
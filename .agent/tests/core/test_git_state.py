@@ -0,0 +1,120 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import subprocess
+
+import pytest
+
+from agent.core.git_state import GitState, find_git_dirs, index_paths
+
+
+def _git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "dev@example.com")
+    _git(tmp_path, "config", "user.name", "Dev")
+    (tmp_path / "a.py").write_text("a = 1\n")
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "b.py").write_text("b = 1\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+    return tmp_path
+
+
+def test_index_paths_match_ls_files(repo):
+    git_dir, common = find_git_dirs(repo / "pkg")
+    assert git_dir == common == repo / ".git"
+    assert index_paths(git_dir / "index") == ["a.py", "pkg/b.py"]
+
+
+def test_staged_queries_are_memoized_until_the_index_changes(repo):
+    state = GitState()
+    assert state.changed_files(cwd=repo) == []
+    assert state.changed_files(cwd=repo) == []
+    assert state.total_spawns() == 1
+
+    (repo / "a.py").write_text("a = 2\n")
+    _git(repo, "add", "a.py")
+    assert state.changed_files(cwd=repo) == ["a.py"]
+    assert "a = 2" in state.query("diff", "--cached", cwd=repo).stdout
+    assert state.total_spawns() == 3
+
+
+def test_head_and_branch_follow_commits_and_checkouts(repo):
+    state = GitState()
+    first = state.head(cwd=repo)
+    assert state.head(cwd=repo) == first
+
+    (repo / "a.py").write_text("a = 3\n")
+    _git(repo, "commit", "-q", "-am", "second")
+    assert state.head(cwd=repo) != first
+
+    _git(repo, "checkout", "-q", "-b", "feature")
+    assert state.branch(cwd=repo) == "feature"
+
+
+def test_worktree_queries_see_unstaged_edits(repo):
+    state = GitState()
+    assert state.unstaged_files(cwd=repo) == []
+    assert state.unstaged_files(cwd=repo) == []
+    assert state.total_spawns() == 1
+
+    (repo / "pkg" / "b.py").write_text("b = 22\n")
+    assert state.unstaged_files(cwd=repo) == ["pkg/b.py"]
+    assert state.total_spawns() == 2
+
+
+def test_failed_queries_are_not_cached(repo, monkeypatch):
+    state = GitState()
+    real_run = GitState.run
+    codes = [128]  # e.g. index.lock held by a concurrent git
+
+    def flaky_run(self, *args, **kwargs):
+        result = real_run(self, *args, **kwargs)
+        if codes:
+            result.returncode = codes.pop()
+        return result
+
+    monkeypatch.setattr(GitState, "run", flaky_run)
+    assert state.query("diff", "--cached", "--name-only", cwd=repo).returncode == 128
+    assert state.query("diff", "--cached", "--name-only", cwd=repo).returncode == 0
+    assert state.query("diff", "--cached", "--name-only", cwd=repo).returncode == 0
+    assert state.total_spawns() == 2
+
+
+def test_outside_a_repository_nothing_is_cached(tmp_path, monkeypatch):
+    state = GitState()
+    monkeypatch.setattr("agent.core.git_state.find_git_dirs", lambda start: None)
+    state.query("--version", cwd=tmp_path)
+    state.query("--version", cwd=tmp_path)
+    assert state.total_spawns() == 2
+
+
+def test_spawns_are_counted_per_command(repo):
+    from agent.core.ai.usage import set_default_labels
+
+    state = GitState()
+    set_default_labels(command="preflight")
+    try:
+        state.head(cwd=repo)
+        state.run("status", "--short", cwd=repo)
+    finally:
+        set_default_labels(command=None)
+    assert state.spawn_counts() == {("preflight", "rev-parse"): 1, ("preflight", "status"): 1}
+    assert state.total_spawns("preflight") == 2
+    assert state.total_spawns("commit") == 0
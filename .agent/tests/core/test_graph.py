@@ -167,3 +167,72 @@ class TestBuildFromRepo:
             assert len(result["nodes"]) > 0
         finally:
             os.chdir(original_dir)
+
+
+def _bump_mtime(path):
+    import os
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestTypedIncrementalGraph:
+    """Typed edge indexes, change-feed updates and the persisted snapshot."""
+
+    @pytest.fixture
+    def repo(self, fixture_dir):
+        adrs = fixture_dir / ".agent" / "adrs"
+        adrs.mkdir(parents=True)
+        (adrs / "ADR-007-storage.md").write_text("# ADR-007: Storage\n")
+        journeys = fixture_dir / ".agent" / "cache" / "journeys" / "INFRA"
+        journeys.mkdir(parents=True)
+        (journeys / "JRN-001-db.yaml").write_text("id: JRN-001\ntitle: DB journey\nstate: COMMITTED\n# covers STORY-001\n")
+        story = fixture_dir / ".agent" / "cache" / "stories" / "INFRA" / "STORY-001-database.md"
+        story.write_text(story.read_text() + "\nSee ADR-007.\n")
+        return fixture_dir
+
+    def test_typed_edges(self, repo):
+        graph = ProjectGraph(str(repo))
+        result = graph.build()
+
+        types = {n["id"]: n["type"] for n in result["nodes"]}
+        assert types["ADR-007"] == "adr" and types["JRN-001"] == "journey"
+        assert graph.edges_of_type("contains") == [("PLAN-001", "STORY-001")]
+        assert graph.edges_of_type("journey") == [("STORY-001", "JRN-001")]
+        assert graph.edges_of_type("adr") == [("STORY-001", "ADR-007")]
+        assert graph.neighbours("STORY-001") == ["ADR-007", "JRN-001", "PLAN-001"]
+        assert graph.neighbours("STORY-001", edge_type="contains", direction="in") == ["PLAN-001"]
+        assert graph.impact("PLAN-001", depth=1) == {"STORY-001"}
+        assert graph.impact("PLAN-001") == {"STORY-001", "ADR-007", "JRN-001"}
+
+    def test_changes_are_applied_incrementally(self, repo):
+        graph = ProjectGraph(str(repo))
+        graph.build()
+        assert graph.sync() == 0
+
+        story = repo / ".agent" / "cache" / "stories" / "INFRA" / "STORY-001-database.md"
+        story.write_text("# STORY-001: Setup Database\n\n## State\nCOMMITTED\n")
+        _bump_mtime(story)
+        assert graph.sync() == 1
+        # The plan and ADR links came from the story; the journey still names it
+        assert graph.neighbours("STORY-001") == ["JRN-001"]
+
+        (repo / ".agent" / "cache" / "runbooks" / "INFRA" / "RUNBOOK-001-database.md").unlink()
+        assert graph.sync() == 1
+        result = graph.build()
+        assert "RUNBOOK-001" not in {n["id"] for n in result["nodes"]}
+        assert not any(n["type"] == "code" for n in result["nodes"])
+        assert not any(e["source"] == "RUNBOOK-001" for e in result["edges"])
+
+    def test_snapshot_is_reused_by_a_new_graph(self, repo):
+        first = ProjectGraph(str(repo)).build()
+        assert (repo / ".agent" / "cache" / "project_graph.json").exists()
+
+        graph = ProjectGraph(str(repo))
+        assert graph.load_snapshot()
+        assert graph.sync() == 0
+        assert graph.build() == first
+
+    def test_unreadable_snapshot_falls_back_to_full_build(self, repo):
+        expected = ProjectGraph(str(repo)).build()
+        (repo / ".agent" / "cache" / "project_graph.json").write_text("{not json")
+        assert ProjectGraph(str(repo)).build() == expected
@@ -107,3 +107,80 @@ def test_route_context_window_limit(mock_tokens, mock_router):
     
     # Then: Should pick Gemini Flash (only one that fits)
     assert result["key"] == "gemini-1.5-flash"
+
+
+@pytest.fixture
+def stats_router():
+    from agent.core.router_stats import RouterStats
+
+    now = [0.0]
+    stats = RouterStats(window=20, clock=lambda: now[0])
+    with patch("agent.core.router.SmartRouter._load_config", return_value=MOCK_ROUTER_CONFIG):
+        router = SmartRouter(config_path=Path("dummy"), stats=stats)
+    router.now = now
+    return router
+
+
+def test_router_stats_window_percentiles_and_throughput():
+    from agent.core.router_stats import RouterStats
+
+    stats = RouterStats(window=10)
+    for latency in range(1, 21):  # only the last 10 (11..20) are kept
+        stats.record("openai", "gpt-4o", float(latency), output_tokens=100)
+    stats.record("openai", "gpt-4o", 99.0, ok=False)
+    health = stats.health("openai", "gpt-4o")
+    assert health.samples == 10
+    assert health.p50_s == 16.0 and health.p95_s == 20.0
+    assert health.error_rate == pytest.approx(0.1)
+    assert health.tokens_per_s == pytest.approx(900 / sum(range(12, 21)))
+    assert stats.health("openai", "unknown") is None
+
+
+@patch("agent.core.router.token_manager")
+def test_route_skips_rate_limited_and_failing_models(mock_tokens, stats_router):
+    mock_tokens.count_tokens.return_value = 100
+    stats_router.stats.record("gemini", "gemini-1.5-flash-latest", 1.0, ok=False, rate_limited_for=30)
+    assert stats_router.route("p", tier="light")["key"] == "gpt-4o-mini"
+
+    stats_router.now[0] = 31  # cooldown over, but the model keeps failing
+    for _ in range(5):
+        stats_router.stats.record("gemini", "gemini-1.5-flash-latest", 1.0, ok=False)
+    assert stats_router.route("p", tier="light")["key"] == "gpt-4o-mini"
+
+    # Everything unhealthy: fall back to the static ranking rather than nothing
+    stats_router.stats.record("openai", "gpt-4o-mini", 1.0, ok=False, rate_limited_for=30)
+    stats_router.stats.record("openai", "gpt-4o", 1.0, ok=False, rate_limited_for=30)
+    assert stats_router.route("p", tier="light")["key"] == "gemini-1.5-flash"
+
+
+@patch("agent.core.router.token_manager")
+def test_route_latency_policies(mock_tokens, stats_router):
+    mock_tokens.count_tokens.return_value = 100
+    for _ in range(5):
+        stats_router.stats.record("gemini", "gemini-1.5-flash-latest", 40.0)
+        stats_router.stats.record("openai", "gpt-4o-mini", 8.0)
+        stats_router.stats.record("openai", "gpt-4o", 3.0)
+
+    assert stats_router.route("p", tier="light", policy="fastest")["key"] == "gpt-4o"
+    # Flash is cheapest but too slow; mini is the cheapest within budget
+    assert stats_router.route("p", tier="light", policy="cheapest_under_p95", p95_budget_s=10)["key"] == "gpt-4o-mini"
+    # Nothing meets the budget: take the fastest
+    assert stats_router.route("p", tier="light", policy="cheapest_under_p95", p95_budget_s=1)["key"] == "gpt-4o"
+    # Default policy is unchanged
+    assert stats_router.route("p", tier="light")["key"] == "gemini-1.5-flash"
+
+
+def test_complete_feeds_router_stats():
+    from agent.core.ai.service import AIService
+    from agent.core.router_stats import router_stats
+
+    service = AIService()
+    service._initialized = True
+    service.provider = "openai"
+    service.is_forced = True
+    service.models = {"openai": "gpt-test"}
+    service.clients = {"openai": object()}
+    with patch.object(service, "_try_complete", return_value="some output"):
+        assert service.complete("sys", "user") == "some output"
+    health = router_stats.health("openai", "gpt-test")
+    assert health.samples == 1 and health.error_rate == 0.0
@@ -0,0 +1,189 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from agent.core import unlock_agent
+from agent.core.secret_cache import SecretCache, wipe_buffer
+from agent.core.secrets import SecretManager
+
+PASSWORD = "CachePassword123!"
+
+
+@pytest.fixture
+def manager(tmp_path):
+    mgr = SecretManager(secrets_dir=tmp_path / "secrets")
+    mgr.initialize(PASSWORD)
+    mgr.set_secret("openai", "api_key", "sk-first")
+    return mgr
+
+
+def test_get_secret_decrypts_once(manager, mocker):
+    spy = mocker.spy(manager, "_decrypt_value")
+
+    assert manager.get_secret("openai", "api_key") == "sk-first"
+    assert manager.get_secret("openai", "api_key") == "sk-first"
+
+    assert spy.call_count == 1
+
+
+def test_cache_hit_is_still_audited(manager, mocker):
+    log = mocker.patch.object(manager, "_log_operation")
+
+    manager.get_secret("openai", "api_key")
+    manager.get_secret("openai", "api_key")
+
+    assert [c.args for c in log.call_args_list] == [("get", "openai", "api_key", "success")] * 2
+
+
+def test_external_file_change_invalidates(manager, tmp_path):
+    assert manager.get_secret("openai", "api_key") == "sk-first"
+
+    # Another process rewrites the service file
+    other = SecretManager(secrets_dir=tmp_path / "secrets")
+    other.unlock(PASSWORD)
+    other.set_secret("openai", "api_key", "sk-second-value")
+
+    assert manager.get_secret("openai", "api_key") == "sk-second-value"
+
+
+def test_set_and_delete_invalidate(manager):
+    manager.get_secret("openai", "api_key")
+    manager.set_secret("openai", "api_key", "sk-new")
+    assert manager.get_secret("openai", "api_key") == "sk-new"
+
+    manager.delete_secret("openai", "api_key")
+    assert manager.get_secret("openai", "api_key") is None
+
+
+def test_lock_wipes_cache(manager):
+    manager.get_secret("openai", "api_key")
+    assert len(manager._cache) == 1
+
+    manager.lock()
+
+    assert len(manager._cache) == 0
+    assert not manager.is_unlocked()
+
+
+def test_wipe_buffer_zeroes_in_place():
+    buf = bytearray(b"super-secret")
+    wipe_buffer(buf)
+    assert buf == bytearray(len(b"super-secret"))
+
+
+def test_cache_rejects_missing_signature():
+    cache = SecretCache()
+    cache.put("svc", "key", None, "value")
+    assert cache.get("svc", "key", None) is None
+    assert len(cache) == 0
+
+
+@pytest.fixture
+def socket_path():
+    # Keep the path short: AF_UNIX sun_path is limited to ~104 bytes
+    short_dir = tempfile.mkdtemp(prefix="agt")
+    yield Path(short_dir) / "unlock.sock"
+    shutil.rmtree(short_dir, ignore_errors=True)
+
+
+@pytest.mark.skipif(not unlock_agent.is_supported(), reason="requires AF_UNIX")
+def test_unlock_agent_round_trip(manager, tmp_path, socket_path, mocker):
+    server = threading.Thread(
+        target=unlock_agent.serve,
+        args=(manager._master_key, manager._salt, socket_path, 30),
+        daemon=True,
+    )
+    server.start()
+    deadline = time.monotonic() + 5
+    while not unlock_agent.agent_status(socket_path) and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+    fresh = SecretManager(secrets_dir=tmp_path / "secrets")
+    derive = mocker.patch.object(fresh, "_derive_key")
+
+    assert fresh.unlock_from_agent(socket_path) is True
+    assert fresh.get_secret("openai", "api_key") == "sk-first"
+    derive.assert_not_called()
+
+    assert unlock_agent.stop_agent(socket_path) is True
+    server.join(timeout=5)
+    assert not socket_path.exists()
+
+
+@pytest.mark.skipif(not unlock_agent.is_supported(), reason="requires AF_UNIX")
+def test_unlock_agent_rejects_other_salt(manager, socket_path):
+    server = threading.Thread(
+        target=unlock_agent.serve,
+        args=(manager._master_key, os.urandom(16), socket_path, 30),
+        daemon=True,
+    )
+    server.start()
+    deadline = time.monotonic() + 5
+    while not unlock_agent.agent_status(socket_path) and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+    try:
+        assert unlock_agent.request_key(manager._salt, socket_path) is None
+    finally:
+        unlock_agent.stop_agent(socket_path)
+        server.join(timeout=5)
+
+
+@pytest.mark.skipif(not unlock_agent.is_supported(), reason="requires AF_UNIX")
+def test_client_ignores_socket_with_loose_mode(manager, socket_path):
+    server = threading.Thread(
+        target=unlock_agent.serve,
+        args=(manager._master_key, manager._salt, socket_path, 30),
+        daemon=True,
+    )
+    server.start()
+    deadline = time.monotonic() + 5
+    while not unlock_agent.agent_status(socket_path) and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+    try:
+        os.chmod(socket_path, 0o666)
+        assert unlock_agent.request_key(manager._salt, socket_path) is None
+        os.chmod(socket_path, 0o600)
+        assert unlock_agent.request_key(manager._salt, socket_path) == manager._master_key
+    finally:
+        unlock_agent.stop_agent(socket_path)
+        server.join(timeout=5)
+
+
+def test_default_socket_lives_in_a_private_directory(tmp_path, monkeypatch):
+    monkeypatch.delenv(unlock_agent.SOCKET_ENV_VAR, raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    assert unlock_agent.default_socket_path(tmp_path / "secrets").parent == tmp_path
+
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    path = unlock_agent.default_socket_path(tmp_path / "secrets")
+    assert path.parent == tmp_path / f"agent-unlock-{os.getuid()}"
+    unlock_agent._prepare_socket_dir(path)
+    assert path.parent.stat().st_mode & 0o777 == 0o700
+
+
+def test_unlock_from_agent_without_agent(manager, socket_path):
+    manager.lock()
+    assert manager.unlock_from_agent(socket_path) is False
+    assert not manager.is_unlocked()
@@ -75,4 +75,98 @@ async def test_trace_llm_call_records_latency():
         calls = [call.args for call in mock_span.set_attribute.call_args_list]
         latency_call = [c for c in calls if c[0] == ATTR_LATENCY_MS]
         assert len(latency_call) == 1
-        assert isinstance(latency_call[0][1], float)
\ No newline at end of file
+        assert isinstance(latency_call[0][1], float)
+
+def _ended_span(name="agent.think", attributes=None):
+    """Create a real ended SDK span with the given attributes."""
+    from opentelemetry.sdk.trace import TracerProvider
+
+    provider = TracerProvider()
+    span = provider.get_tracer("test").start_span(name, attributes=attributes or {})
+    span.end()
+    return span
+
+
+def test_processor_caps_oversized_attributes():
+    """Oversized strings are replaced by prefix + length + hash before queueing."""
+    from agent.core.span_policy import SpanPolicy
+    from agent.core.telemetry import PiiScrubbingSpanProcessor
+
+    downstream = MagicMock()
+    processor = PiiScrubbingSpanProcessor(
+        downstream, policy=SpanPolicy(max_attr_chars=100, attr_caps={"tool": 0}), scrub_inline=True
+    )
+    span = _ended_span(attributes={"llm_response": "x" * 10_000, "tool": "y" * 500})
+
+    processor.on_end(span)
+
+    capped = span.attributes["llm_response"]
+    assert len(capped) < 400
+    assert "truncated 10000 chars sha256:" in capped
+    assert span.attributes["tool"] == "y" * 500  # cap of 0 disables capping
+    downstream.on_end.assert_called_once_with(span)
+
+
+def test_processor_defers_scrubbing_to_exporter():
+    """With scrub_inline=False, PII survives on_end and is removed at export."""
+    from agent.core.telemetry import PiiScrubbingSpanExporter, PiiScrubbingSpanProcessor
+
+    processor = PiiScrubbingSpanProcessor(MagicMock(), scrub_inline=False)
+    span = _ended_span(attributes={"llm_response": "mail me at jane@example.com"})
+
+    processor.on_end(span)
+    assert "jane@example.com" in span.attributes["llm_response"]
+
+    inner = MagicMock()
+    PiiScrubbingSpanExporter(inner).export([span])
+
+    assert span.attributes["llm_response"] == "mail me at [REDACTED_EMAIL]"
+    inner.export.assert_called_once()
+
+
+@pytest.mark.parametrize("scrub_inline", [True, False])
+def test_secrets_are_scrubbed_before_capping(scrub_inline):
+    """A secret straddling the truncation point is redacted, not cut in half."""
+    import hashlib
+
+    from agent.core.span_policy import SpanPolicy
+    from agent.core.telemetry import PiiScrubbingSpanExporter, PiiScrubbingSpanProcessor
+
+    policy = SpanPolicy(max_attr_chars=300)
+    value = "x" * 240 + "key sk-" + "a" * 30 + " end" + "y" * 1000
+    span = _ended_span(attributes={"llm_response": value})
+
+    PiiScrubbingSpanProcessor(MagicMock(), policy=policy, scrub_inline=scrub_inline).on_end(span)
+    if not scrub_inline:
+        PiiScrubbingSpanExporter(MagicMock(), policy=policy).export([span])
+
+    capped = span.attributes["llm_response"]
+    scrubbed = value.replace("sk-" + "a" * 30, "[REDACTED_SECRET]")
+    assert "sk-a" not in capped
+    assert capped.startswith("x" * 240 + "key [REDACTED")
+    assert hashlib.sha256(scrubbed.encode()).hexdigest()[:16] in capped
+
+
+def test_span_name_sampler_rules(monkeypatch):
+    """Sampling rules match span names by glob; unmatched names are kept."""
+    from opentelemetry.sdk.trace.sampling import Decision
+    from agent.core.span_policy import SpanNameSampler, SpanPolicy
+
+    monkeypatch.setenv("AGENT_TRACE_SAMPLING", "agent.parse=0,tool.*=1")
+    sampler = SpanNameSampler(SpanPolicy.from_env())
+
+    assert sampler.should_sample(None, 1, "agent.parse").decision == Decision.DROP
+    assert sampler.should_sample(None, 1, "tool.read_file").decision == Decision.RECORD_AND_SAMPLE
+    assert sampler.should_sample(None, 1, "agent.run").decision == Decision.RECORD_AND_SAMPLE
+
+
+def test_span_policy_from_env_ignores_invalid(monkeypatch):
+    """Malformed values fall back to defaults instead of breaking startup."""
+    from agent.core.span_policy import DEFAULT_MAX_ATTR_CHARS, SpanPolicy
+
+    monkeypatch.setenv("AGENT_TRACE_ATTR_MAX_CHARS", "lots")
+    monkeypatch.setenv("AGENT_TRACE_ATTR_CAPS", "llm_response=2048,bad=x,junk")
+    policy = SpanPolicy.from_env()
+
+    assert policy.max_attr_chars == DEFAULT_MAX_ATTR_CHARS
+    assert policy.attr_caps == {"llm_response": 2048}
@@ -0,0 +1,143 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for agent.db.artifact_catalog."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from agent.db import artifact_catalog
+from agent.db.artifact_catalog import ArtifactCatalog
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    return ArtifactCatalog(tmp_path / "agent.db")
+
+
+def _bump_mtime(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_markdown_fields_are_parsed(tmp_path, catalog):
+    stories = tmp_path / "stories" / "INFRA"
+    stories.mkdir(parents=True)
+    (stories / "INFRA-001-login.md").write_text(
+        "# INFRA-001: Login flow\n\n## State\n\nCOMMITTED\n\nPlan: INFRA-100, see ADR-007\n"
+    )
+
+    [entry] = catalog.entries("story", tmp_path / "stories")
+
+    assert (entry.artifact_id, entry.heading_id, entry.heading_title) == ("INFRA-001", "INFRA-001", "Login flow")
+    assert entry.state == "COMMITTED"
+    assert set(entry.refs) == {"INFRA-001", "INFRA-100", "ADR-007"}
+
+
+def test_only_changed_files_are_reparsed(tmp_path, catalog):
+    root = tmp_path / "plans"
+    root.mkdir()
+    first = root / "INFRA-001-plan.md"
+    first.write_text("# INFRA-001: Plan\nState: DRAFT\n")
+    (root / "INFRA-002-plan.md").write_text("# INFRA-002: Other\n")
+
+    assert catalog.refresh("plan", root) == 2
+    assert catalog.refresh("plan", root) == 0
+
+    first.write_text("# INFRA-001: Plan\nState: ACCEPTED\n")
+    _bump_mtime(first)
+    assert catalog.refresh("plan", root) == 1
+    assert catalog.entries("plan", root)[0].state == "ACCEPTED"
+
+    first.unlink()
+    assert [e.artifact_id for e in catalog.entries("plan", root)] == ["INFRA-002"]
+
+
+def test_catalog_persists_across_instances(tmp_path):
+    root = tmp_path / "runbooks"
+    root.mkdir()
+    (root / "INFRA-001-runbook.md").write_text("# Runbook\n[NEW] src/app/main.py\n")
+    ArtifactCatalog(tmp_path / "agent.db").refresh("runbook", root)
+
+    reopened = ArtifactCatalog(tmp_path / "agent.db")
+    with patch.object(artifact_catalog, "parse_file", side_effect=AssertionError("re-parsed")):
+        [entry] = reopened.entries("runbook", root)
+    assert entry.meta["code_paths"] == ["src/app/main.py"]
+
+
+def test_journey_fields(tmp_path, catalog):
+    scope = tmp_path / "journeys" / "INFRA"
+    scope.mkdir(parents=True)
+    data = {"id": "JRN-004", "title": "Sync", "state": "committed", "actor": "dev",
+            "implementation": {"files": ["src/a.py"], "tests": []}}
+    (scope / "JRN-004-sync.yaml").write_text("# Journey: JRN-004\n# State: DRAFT\n" + yaml.dump(data))
+
+    [entry] = catalog.entries("journey", tmp_path / "journeys")
+
+    assert (entry.artifact_id, entry.state) == ("JRN-004", "COMMITTED")
+    assert entry.meta["comment"] == {"journey": "JRN-004", "state": "DRAFT"}
+    assert entry.meta["files"] == ["src/a.py"] and entry.meta["tests"] == []
+
+
+def test_find_matches_name_prefix_case_sensitively(tmp_path, catalog):
+    root = tmp_path / "stories"
+    root.mkdir()
+    (root / "INFRA-010-b.md").write_text("# INFRA-010: B\n")
+    (root / "infra-010-lower.md").write_text("# lower\n")
+
+    assert catalog.find("story", root, "INFRA-010") == root / "INFRA-010-b.md"
+    assert catalog.find("story", root, "INFRA-011") is None
+    assert catalog.find("story", tmp_path / "missing", "INFRA-010") is None
+
+
+def test_unwritable_database_falls_back_to_memory(tmp_path):
+    root = tmp_path / "stories"
+    root.mkdir()
+    (root / "INFRA-001-a.md").write_text("# INFRA-001: A\n")
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+
+    catalog = ArtifactCatalog(blocker / "agent.db")
+
+    assert [e.artifact_id for e in catalog.entries("story", root)] == ["INFRA-001"]
+
+
+def test_change_feed_reports_updates_and_removals(tmp_path, catalog):
+    root = tmp_path / "stories"
+    root.mkdir()
+    first = root / "INFRA-001-a.md"
+    first.write_text("# INFRA-001: A\n")
+    (root / "INFRA-002-b.md").write_text("# INFRA-002: B\n")
+
+    initial = catalog.changes("story", root)
+    assert initial.full
+    assert [e.artifact_id for e in initial.updated] == ["INFRA-001", "INFRA-002"]
+
+    unchanged = catalog.changes("story", root, initial.cursor)
+    assert (unchanged.full, unchanged.updated, unchanged.removed) == (False, [], [])
+
+    first.write_text("# INFRA-001: A2\n")
+    _bump_mtime(first)
+    (root / "INFRA-002-b.md").unlink()
+    delta = catalog.changes("story", root, unchanged.cursor)
+    assert [e.heading_title for e in delta.updated] == ["A2"]
+    assert delta.removed == [root / "INFRA-002-b.md"]
+
+    # A cursor from another database is not trusted
+    other = ArtifactCatalog(tmp_path / "other.db").changes("story", root)
+    assert catalog.changes("story", root, other.cursor).full
@@ -0,0 +1,152 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the pooled, transactional bulk artifact upsert."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from agent.db import client, pool
+from agent.db.client import upsert_artifact, upsert_artifacts
+
+
+@pytest.fixture
+def db_path(tmp_path: Path, monkeypatch) -> Path:
+    path = tmp_path / "agent.db"
+    monkeypatch.setattr("agent.db.client.get_db_path", lambda: path)
+    monkeypatch.setattr("agent.db.init.get_db_path", lambda: path)
+    pool.close_connections()
+    yield path
+    pool.close_connections()
+
+
+def _query(path: Path, sql: str) -> list:
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(sql).fetchall()
+    finally:
+        conn.close()
+
+
+def test_bulk_upsert_initialises_schema_and_links(db_path):
+    rows = [
+        {"id": "PLAN-1", "type": "plan", "content": "# Plan\n## Related Stories\n- STORY-1\n- STORY-9\n"},
+        {"id": "STORY-1", "type": "story", "content": "# STORY-1\n## State\nCOMMITTED\n"},
+        {"id": "STORY-1", "type": "runbook", "content": "# Runbook\n"},
+    ]
+    result = upsert_artifacts(rows, author="scanner")
+
+    assert (result.written, result.unchanged, result.ok) == (3, 0, True)
+    assert _query(db_path, "PRAGMA journal_mode") == [("wal",)]
+    assert _query(db_path, "SELECT id, type, version, state, author FROM artifacts ORDER BY id, type") == [
+        ("PLAN-1", "plan", 1, "UNKNOWN", "scanner"),
+        ("STORY-1", "runbook", 1, "UNKNOWN", "scanner"),
+        ("STORY-1", "story", 1, "COMMITTED", "scanner"),
+    ]
+    # The plan is written before its story, but links are resolved after all rows land;
+    # STORY-9 does not exist so no link is created for it.
+    assert sorted(_query(db_path, "SELECT source_id, source_type, target_id, rel_type FROM links")) == [
+        ("PLAN-1", "plan", "STORY-1", "contains"),
+        ("STORY-1", "runbook", "STORY-1", "implements"),
+    ]
+    assert _query(db_path, "SELECT COUNT(*) FROM history") == [(3,)]
+
+
+def test_unchanged_rows_are_skipped(db_path):
+    rows = [{"id": f"STORY-{i}", "type": "story", "content": f"# STORY-{i}\n"} for i in range(5)]
+    assert upsert_artifacts(rows, skip_unchanged=True).written == 5
+
+    rows[2] = dict(rows[2], content="# STORY-2 edited\n")
+    result = upsert_artifacts(rows, skip_unchanged=True)
+
+    assert (result.written, result.unchanged) == (1, 4)
+    assert _query(db_path, "SELECT id, version FROM artifacts WHERE version > 1") == [("STORY-2", 2)]
+    assert _query(db_path, "SELECT COUNT(*) FROM history") == [(6,)]
+
+
+def test_explicit_upsert_still_versions_unchanged_content(db_path):
+    assert upsert_artifact("ADR-001", "adr", "# ADR 1") is True
+    assert upsert_artifact("ADR-001", "adr", "# ADR 1") is True
+    assert _query(db_path, "SELECT version FROM artifacts") == [(2,)]
+
+
+def test_unchanged_row_gains_link_when_target_appears(db_path):
+    story = {"id": "STORY-1", "type": "story", "content": "# S\n## Linked ADRs\n- ADR-001\n"}
+    upsert_artifacts([story], skip_unchanged=True)
+    assert _query(db_path, "SELECT * FROM links") == []
+
+    result = upsert_artifacts([story, {"id": "ADR-001", "type": "adr", "content": "# ADR"}], skip_unchanged=True)
+
+    assert (result.written, result.unchanged) == (1, 1)
+    assert _query(db_path, "SELECT source_id, target_id, rel_type FROM links") == [("STORY-1", "ADR-001", "related")]
+
+
+def test_duplicate_keys_in_one_batch_get_distinct_versions(db_path):
+    result = upsert_artifacts([
+        {"id": "STORY-1", "type": "story", "content": "first"},
+        {"id": "STORY-1", "type": "story", "content": "second"},
+    ])
+    assert result.written == 2
+    assert _query(db_path, "SELECT content, version FROM artifacts") == [("second", 2)]
+    assert _query(db_path, "SELECT COUNT(*) FROM history") == [(2,)]
+
+
+def test_failed_batch_writes_nothing(db_path, monkeypatch):
+    upsert_artifacts([{"id": "STORY-1", "type": "story", "content": "v1"}])
+
+    def boom(content):
+        if content == "bad":
+            raise RuntimeError("scrubber failed")
+        return content
+
+    monkeypatch.setattr(client, "scrub_sensitive_data", boom)
+    result = upsert_artifacts([
+        {"id": "STORY-1", "type": "story", "content": "v2"},
+        {"id": "STORY-2", "type": "story", "content": "bad"},
+    ])
+
+    assert result.ok is False
+    assert _query(db_path, "SELECT id, content FROM artifacts") == [("STORY-1", "v1")]
+
+
+def test_connection_is_reused_and_reopened_after_delete(db_path):
+    upsert_artifact("STORY-1", "story", "one")
+    first = pool.pooled_connection(db_path)
+    upsert_artifact("STORY-2", "story", "two")
+    assert pool.pooled_connection(db_path) is first
+
+    pool.close_connections()
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+    assert upsert_artifact("STORY-3", "story", "three") is True
+    assert pool.pooled_connection(db_path) is not first
+    assert _query(db_path, "SELECT id FROM artifacts") == [("STORY-3",)]
+
+
+def test_legacy_database_gains_content_hash_column(db_path):
+    schema = (Path(client.__file__).parent / "schema.sql").read_text()
+    conn = sqlite3.connect(db_path)
+    conn.executescript("\n".join(line for line in schema.splitlines() if "content_hash" not in line))
+    conn.execute("INSERT INTO artifacts VALUES ('STORY-1', 'story', 'old', '2026-01-01', 3, 'DRAFT', 'x')")
+    conn.commit()
+    conn.close()
+
+    result = upsert_artifacts([{"id": "STORY-1", "type": "story", "content": "old"}], skip_unchanged=True)
+
+    # No stored hash yet, so the row is rewritten once and then recognised
+    assert result.written == 1
+    assert upsert_artifacts([{"id": "STORY-1", "type": "story", "content": "old"}], skip_unchanged=True).unchanged == 1
+    assert _query(db_path, "SELECT version FROM artifacts") == [(4,)]
@@ -100,27 +100,13 @@ def test_new_adr_command():
         assert result.exit_code == 0
         assert "Created ADR" in result.stdout
 
-def test_list_stories_command():
-    # Mock config.stories_dir attribute on the singleton config object
-    mock_path = MagicMock()
-    mock_path.rglob.return_value = [Path("/path/to/INFRA-001-test.md")]
-    
-    # We also need to mock Path.read_text for the yielded file
-    # Only applicable if we use real Path objects in regex, but we mocked rglob to return a Path-like.
-    # But here we returned a real Path object "/path/to...". Reading it will fail in real FS.
-    # Better to return a MagicMock that acts like a Path.
-    mock_file = MagicMock()
-    mock_file.read_text.return_value = "## State\nACCEPTED\n\n# INFRA-001: Test Story"
-    # Mock open() context manager
-    mock_open = MagicMock()
-    mock_open.__enter__.return_value.readline.return_value = "# INFRA-001: Test Story"
-    mock_file.open.return_value = mock_open
-    
-    mock_file.name = "INFRA-001-test.md"
-    mock_file.relative_to.return_value = "INFRA-001-test.md"
-    mock_path.rglob.return_value = [mock_file]
+def test_list_stories_command(tmp_path):
+    # Stories are read through the artifact catalog, so use a real directory
+    stories_dir = tmp_path / "stories"
+    stories_dir.mkdir()
+    (stories_dir / "INFRA-001-test.md").write_text("# INFRA-001: Test Story\n\n## State\nACCEPTED\n")
 
-    with patch.object(config, "stories_dir", mock_path):
+    with patch.object(config, "stories_dir", stories_dir), patch.object(config, "repo_root", tmp_path):
         result = runner.invoke(app, ["list-stories"])
         if result.exit_code != 0:
             print(result.output)
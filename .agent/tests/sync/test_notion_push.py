@@ -0,0 +1,249 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Notion client and push sync against a local fake Notion HTTP server."""
+
+import itertools
+import json
+import re
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from agent.core.notion.client import NotionAPIError, NotionClient
+from agent.core.notion.rate_limit import TokenBucket
+from agent.sync import notion as notion_sync
+from agent.sync.notion import NotionSync
+
+
+class FakeNotion:
+    """Minimal in-memory Notion API: one database, pages, blocks."""
+
+    def __init__(self):
+        self.pages = {}
+        self.blocks = {}
+        self.calls = Counter()
+        self.connections = 0
+        self.throttle = 0  # respond 429 to this many upcoming requests
+        self._ids = itertools.count(1)
+        self._clock = itertools.count(1)
+        self.lock = threading.Lock()
+
+    def add_page(self, art_id, title, status="DRAFT", body=()):
+        page_id = f"page-{next(self._ids)}"
+        self.pages[page_id] = self._page(page_id, art_id, title, status)
+        self.blocks[page_id] = [self._block(b) for b in body]
+        return page_id
+
+    def _page(self, page_id, art_id, title, status):
+        return {
+            "object": "page",
+            "id": page_id,
+            "last_edited_time": f"t{next(self._clock)}",
+            "properties": {
+                "ID": {"rich_text": [{"plain_text": art_id}]},
+                "Title": {"title": [{"plain_text": title}]},
+                "Status": {"select": {"name": status}},
+            },
+        }
+
+    def _block(self, block):
+        block = json.loads(json.dumps(block))
+        for rt in block[block["type"]].get("rich_text", []):
+            rt["plain_text"] = rt["text"]["content"]
+        block["id"] = f"block-{next(self._ids)}"
+        return block
+
+    def _touch(self, page_id):
+        self.pages[page_id]["last_edited_time"] = f"t{next(self._clock)}"
+
+    def handle(self, method, path, query, body):
+        if self.throttle:
+            self.throttle -= 1
+            return 429, {"code": "rate_limited"}
+        route = re.sub(r"(page|block)-\d+", "{id}", path)
+        self.calls[f"{method} {route}"] += 1
+        if m := re.fullmatch(r"/v1/databases/(\w+)/query", path):
+            ordered = sorted(self.pages.values(), key=lambda p: p["id"])
+            start = int(body.get("start_cursor") or 0)
+            end = start + int(body.get("page_size", 100))
+            return 200, {
+                "results": ordered[start:end],
+                "has_more": end < len(ordered),
+                "next_cursor": str(end) if end < len(ordered) else None,
+            }
+        if m := re.fullmatch(r"/v1/blocks/([\w-]+)/children", path):
+            page_id = m.group(1)
+            if method == "GET":
+                return 200, {"results": self.blocks[page_id], "has_more": False, "next_cursor": None}
+            self.blocks[page_id].extend(self._block(b) for b in body["children"])
+            self._touch(page_id)
+            return 200, {"results": []}
+        if m := re.fullmatch(r"/v1/blocks/([\w-]+)", path):
+            for page_id, blocks in self.blocks.items():
+                if any(b["id"] == m.group(1) for b in blocks):
+                    self.blocks[page_id] = [b for b in blocks if b["id"] != m.group(1)]
+                    self._touch(page_id)
+            return 200, {}
+        if m := re.fullmatch(r"/v1/pages/([\w-]+)", path):
+            page = self.pages[m.group(1)]
+            if method == "PATCH":
+                for name, prop in body["properties"].items():
+                    for rt in prop.get("title") or prop.get("rich_text") or []:
+                        rt["plain_text"] = rt["text"]["content"]
+                    page["properties"][name] = prop
+                self._touch(page["id"])
+            return 200, page
+        if path == "/v1/pages" and method == "POST":
+            props = body["properties"]
+            page_id = self.add_page(
+                props["ID"]["rich_text"][0]["text"]["content"],
+                props["Title"]["title"][0]["text"]["content"],
+                props["Status"]["select"]["name"],
+                body.get("children", []),
+            )
+            return 200, self.pages[page_id]
+        return 404, {"code": "object_not_found"}
+
+
+@pytest.fixture
+def fake_notion():
+    fake = FakeNotion()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive
+
+        def setup(self):
+            super().setup()
+            with fake.lock:
+                fake.connections += 1
+
+        def _serve(self):
+            path, _, query = self.path.partition("?")
+            length = int(self.headers.get("Content-Length") or 0)
+            body = json.loads(self.rfile.read(length)) if length else {}
+            with fake.lock:
+                status, payload = fake.handle(self.command, path, query, body)
+            data = json.dumps(payload).encode()
+            self.send_response(status)
+            if status == 429:
+                self.send_header("Retry-After", "0")
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        do_GET = do_POST = do_PATCH = do_DELETE = _serve
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    fake.url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    yield fake
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(fake_notion):
+    with NotionClient("secret", base_url=fake_notion.url, rate=1000) as c:
+        yield c
+
+
+def _md(art_id, title, body, status="DRAFT"):
+    return f"# {art_id}: {title}\n\n## State\n\n{status}\n\n{body}\n"
+
+
+def _blocks(art_id, title, body, status="DRAFT"):
+    return NotionSync._markdown_to_blocks(None, _md(art_id, title, body, status))
+
+
+def test_query_database_follows_cursors_over_one_connection(fake_notion, client):
+    for i in range(250):
+        fake_notion.add_page(f"INFRA-{i:03d}", f"Story {i}")
+    pages = client.query_database("db")
+    assert len(pages) == 250
+    assert fake_notion.calls["POST /v1/databases/db/query"] == 3
+    assert fake_notion.connections == 1
+
+
+def test_rate_limited_request_honours_retry_after(fake_notion, client):
+    fake_notion.add_page("INFRA-001", "Story")
+    fake_notion.throttle = 2
+    assert len(client.query_database("db")) == 1
+    assert fake_notion.calls["POST /v1/databases/db/query"] == 1
+
+
+def test_error_response_raises_with_status(fake_notion, client):
+    with pytest.raises(NotionAPIError, match="404") as exc:
+        client.retrieve_database("missing/thing")
+    assert exc.value.status == 404
+    assert "object_not_found" in str(exc.value)
+
+
+def test_token_bucket_paces_after_burst():
+    now = [0.0]
+    waits = []
+    bucket = TokenBucket(rate=2, capacity=2, clock=lambda: now[0], sleep=waits.append)
+    assert [bucket.acquire() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    bucket.penalize(3)
+    assert bucket.acquire() == pytest.approx(3.5)
+
+
+def test_push_prefetches_once_and_skips_unchanged_pages(fake_notion, tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(notion_sync, "PUSH_CACHE_FILE", tmp_path / "push_cache.json")
+    stories = tmp_path / "stories"
+    stories.mkdir()
+    same = fake_notion.add_page("INFRA-001", "Same", body=_blocks("INFRA-001", "Same", "Unchanged body"))
+    edited = fake_notion.add_page("INFRA-002", "Edited", body=_blocks("INFRA-002", "Edited", "Old body"))
+    for i in range(3, 120):  # pushes the database past one query page
+        fake_notion.add_page(f"INFRA-{i:03d}", f"Remote only {i}")
+    (stories / "INFRA-001-same.md").write_text(_md("INFRA-001", "Same", "Unchanged body"))
+    (stories / "INFRA-002-edited.md").write_text(_md("INFRA-002", "Edited", "New body", status="IN_PROGRESS"))
+    (stories / "INFRA-500-new.md").write_text(_md("INFRA-500", "New", "Fresh body"))
+
+    with patch("agent.sync.notion.get_secret", return_value="secret"), \
+         patch.object(NotionSync, "_load_state", return_value={"Stories": "db"}):
+        sync = NotionSync()
+    sync.client = NotionClient("secret", base_url=fake_notion.url, rate=1000)
+
+    with patch("agent.sync.notion.Confirm.ask", return_value=True) as confirm:
+        sync._push_category("Stories", stories, "Stories", force=False)
+    confirm.assert_called_once()  # only the edited page conflicts
+    calls = fake_notion.calls
+    assert calls["POST /v1/databases/db/query"] == 2
+    assert calls["GET /v1/pages/{id}"] == 0
+    assert calls["PATCH /v1/pages/{id}"] == 1  # status change on INFRA-002 only
+    assert calls["POST /v1/pages"] == 1
+    assert fake_notion.pages[edited]["properties"]["Status"]["select"]["name"] == "IN_PROGRESS"
+    assert "New body" in json.dumps(fake_notion.blocks[edited])
+    assert fake_notion.connections <= notion_sync.PUSH_WORKERS + 5
+
+    # Second run: the verified-unchanged page is skipped without a block fetch
+    calls.clear()
+    sync._push_category("Stories", stories, "Stories", force=False)
+    assert calls["GET /v1/blocks/{id}/children"] == 2  # INFRA-002 + INFRA-500 re-verified
+    calls.clear()
+    sync._push_category("Stories", stories, "Stories", force=False)
+    assert calls["GET /v1/blocks/{id}/children"] == 0
+    assert sum(v for k, v in calls.items() if not k.startswith("POST /v1/databases")) == 0
+    assert fake_notion.blocks[same]
+    sync.client.close()
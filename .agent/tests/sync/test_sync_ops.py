@@ -21,6 +21,7 @@ import pytest
 # Ensure src is in path for imports if running directly
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
 
+from agent.db.client import UpsertResult
 from agent.sync import sync
 
 
@@ -32,9 +33,16 @@ def mock_supabase():
 @pytest.fixture
 def mock_db_client():
     with patch("agent.sync.sync.get_all_artifacts_content") as mock_get, \
-         patch("agent.sync.sync.upsert_artifact") as mock_upsert:
+         patch("agent.sync.sync.upsert_artifacts") as mock_upsert:
+        mock_upsert.side_effect = lambda rows, author="agent", skip_unchanged=False: UpsertResult(written=len(rows))
         yield {"get": mock_get, "upsert": mock_upsert}
 
+@pytest.fixture(autouse=True)
+def watermark_file(tmp_path, monkeypatch):
+    path = tmp_path / "supabase_sync.json"
+    monkeypatch.setattr("agent.sync.bulk.WATERMARK_FILE", path)
+    return path
+
 def test_nothing():
     pass
 
@@ -84,7 +92,8 @@ def test_pull_success(mock_supabase, mock_db_client, capsys):
     
     # Mock page fetch
     page_data = [{"id": "A1", "type": "story", "content": "foo", "version": 1, "state": "C", "author": "remote"}]
-    mock_client.table.return_value.select.return_value.range.return_value.execute.return_value.data = page_data
+    ordered = mock_client.table.return_value.select.return_value.order.return_value.order.return_value.order.return_value
+    ordered.limit.return_value.execute.return_value.data = page_data
     
     # Prevent filesystem side effects and scan() from interfering
     with patch("agent.sync.sync._write_to_disk"), \
@@ -99,7 +108,106 @@ def test_pull_success(mock_supabase, mock_db_client, capsys):
         captured = capsys.readouterr()
         assert "Syncing 1 artifacts" in captured.out
         
-        # Verify upsert_artifact called with expected args
-        mock_db_client["upsert"].assert_any_call(
-            id="A1", type="story", content="foo", author="remote"
-        )
+        # Verify all pulled rows are upserted in one call
+        mock_db_client["upsert"].assert_called_once()
+        rows = mock_db_client["upsert"].call_args[0][0]
+        assert [(r["id"], r["type"], r["content"], r["author"]) for r in rows] == [("A1", "story", "foo", "remote")]
+
+
+def _artifact(i, modified):
+    return {"id": f"A{i}", "type": "story", "content": f"body {i}", "version": 1,
+            "state": "DRAFT", "author": "me", "last_modified": modified}
+
+
+def test_push_batches_and_advances_watermark(mock_supabase, mock_db_client, watermark_file, monkeypatch, capsys):
+    """Rows go up as array-body upserts; a second push only sends rows modified since."""
+    monkeypatch.setenv("AGENT_SYNC_BATCH_SIZE", "2")
+    mock_db_client["get"].return_value = [_artifact(i, f"2026-01-01 00:00:0{i}") for i in range(5)]
+    upsert = mock_supabase.return_value.table.return_value.upsert
+
+    sync.push(backend="supabase")
+    batches = [c.args[0] for c in upsert.call_args_list]
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert all(c.kwargs["returning"] == "minimal" for c in upsert.call_args_list)
+    assert not any("updated_at" in r for b in batches for r in b)  # stamped by the server
+    assert "2026-01-01 00:00:04" in watermark_file.read_text()
+
+    upsert.reset_mock()
+    mock_db_client["get"].return_value.append(_artifact(9, "2026-01-02 00:00:00"))
+    sync.push(backend="supabase")
+    assert [r["id"] for c in upsert.call_args_list for r in c.args[0]] == ["A4", "A9"]
+
+    upsert.reset_mock()
+    sync.push(backend="supabase", force=True)
+    assert sum(len(c.args[0]) for c in upsert.call_args_list) == 6
+    assert capsys.readouterr().out.rstrip().endswith("6 success, 0 errors.")
+
+
+def test_failed_batch_keeps_watermark(mock_supabase, mock_db_client, watermark_file, capsys):
+    mock_db_client["get"].return_value = [_artifact(1, "2026-01-01 00:00:01")]
+    mock_supabase.return_value.table.return_value.upsert.return_value.execute.side_effect = RuntimeError("boom")
+    sync.push(backend="supabase")
+    assert "0 success, 1 errors" in capsys.readouterr().out
+    assert not watermark_file.exists()
+
+
+def test_pull_rows_pages_by_key_within_the_watermark():
+    """A row updated mid-pull neither shifts later rows nor is read twice."""
+    from agent.sync import bulk
+
+    table = [{"id": f"A{n}", "type": "story", "updated_at": f"2026-01-01T00:00:{n:02d}+00:00"}
+             for n in range(25)]
+    until = table[-1]["updated_at"]
+    calls = []
+
+    def fake_fetch(client, after, page_size, since=None, until=None):
+        calls.append((after, since, until))
+        if after == bulk.row_key(table[9]):
+            # A0 is updated between pages; offset paging would now skip A10
+            table.append(dict(table.pop(0), updated_at="2026-01-01T00:01:00+00:00"))
+        rows = [r for r in table if (since is None or r["updated_at"] >= since)
+                and (until is None or r["updated_at"] <= until)
+                and (after is None or bulk.row_key(r) > after)]
+        return rows[:page_size]
+
+    with patch("agent.sync.bulk.fetch_page", side_effect=fake_fetch):
+        rows = bulk.pull_rows(object(), since="2026-01-01T00:00:00+00:00", until=until, size=10)
+    assert [r["id"] for r in rows] == [f"A{n}" for n in range(25)]
+    assert [c[0] for c in calls] == [None, bulk.row_key(rows[9]), bulk.row_key(rows[19])]
+    assert {c[1:] for c in calls} == {("2026-01-01T00:00:00+00:00", until)}
+
+
+def test_fetch_page_filters_after_the_last_key():
+    from agent.sync.pagination import fetch_page
+
+    client = MagicMock()
+    query = client.table.return_value.select.return_value.lte.return_value
+    fetch_page(client, ("2026-01-01T00:00:01+00:00", "A1", "story"), 10, until="2026-02-01")
+    assert query.or_.call_args.args[0].startswith('updated_at.gt."2026-01-01T00:00:01+00:00",')
+    query.or_.return_value.order.return_value.order.return_value.order.return_value.limit.assert_called_once_with(10)
+
+
+def test_scan_bulk_upserts_and_skips_unchanged(tmp_path, monkeypatch, capsys):
+    """Scan writes every artifact in one pass and leaves unchanged files alone on rescan."""
+    from agent.db import pool
+
+    db_path = tmp_path / "agent.db"
+    monkeypatch.setattr("agent.db.client.get_db_path", lambda: db_path)
+    monkeypatch.setattr("agent.db.init.get_db_path", lambda: db_path)
+    monkeypatch.chdir(tmp_path)
+    stories = tmp_path / ".agent" / "cache" / "stories" / "INFRA"
+    stories.mkdir(parents=True)
+    for i in range(3):
+        (stories / f"INFRA-00{i}-story.md").write_text(f"# INFRA-00{i}\n")
+    pool.close_connections()
+    try:
+        sync.scan()
+        assert "Processed 3 artifacts (3 written, 0 unchanged) with 0 errors" in capsys.readouterr().out
+
+        (stories / "INFRA-001-story.md").write_text("# INFRA-001 edited\n")
+        sync.scan()
+        out = capsys.readouterr().out
+        assert "Processed 3 artifacts (1 written, 2 unchanged) with 0 errors" in out
+        assert "rows/s" in out
+    finally:
+        pool.close_connections()
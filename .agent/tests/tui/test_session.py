@@ -139,6 +139,31 @@ class TestSessionStore:
     def test_get_latest_session_empty(self, store):
         assert store.get_latest_session() is None
 
+    def test_token_counts_persisted(self, store):
+        session = store.create_session(provider="gemini")
+        store.add_message(session.id, "user", "x" * 40)
+        [msg] = store.get_session(session.id).messages
+        assert (msg.tokens, msg.token_provider) == (10, "gemini")
+
+    def test_message_limit_loads_latest_page(self, store, monkeypatch):
+        monkeypatch.setattr("agent.tui.session.MESSAGE_PAGE_SIZE", 3)
+        session = store.create_session()
+        for i in range(10):
+            store.add_message(session.id, "user", f"m{i}", token_count=1)
+
+        full = store.get_session(session.id)
+        assert [m.content for m in full.messages] == [f"m{i}" for i in range(10)]
+
+        recent = store.get_session(session.id, message_limit=4)
+        assert [m.content for m in recent.messages] == ["m6", "m7", "m8", "m9"]
+        older = store.get_messages(session.id, before_id=recent.messages[0].id, limit=2)
+        assert [m.content for m in older] == ["m4", "m5"]
+
+    def test_messages_index_and_wal(self, store):
+        indexes = {r["name"] for r in store._conn.execute("PRAGMA index_list(messages)")}
+        assert "idx_messages_session" in indexes
+        assert store._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
     def test_db_file_permissions(self, tmp_db):
         """@Security: DB should be created with 0600 permissions."""
         store = SessionStore(db_path=tmp_db)
@@ -206,3 +231,24 @@ class TestTokenBudget:
         budget = TokenBudget(max_tokens=1000)
         sys_out, msgs_out = budget.build_context("System", [], provider="gemini")
         assert msgs_out == []
+
+    def test_prunes_to_budget_with_prefix_sums(self):
+        budget = TokenBudget(max_tokens=1000)
+        messages = [Message(role="user", content="x" * 400) for _ in range(20)]  # 100 tokens each
+        _, msgs_out = budget.build_context("S" * 400, messages, provider="gemini")
+        # 100 system + 9 * 100 messages fits; 10 would not
+        assert msgs_out == messages[-9:]
+
+    def test_incremental_turns_count_only_new_messages(self, mocker):
+        from agent.core.tokens import token_manager
+
+        budget = TokenBudget(max_tokens=100000)
+        history = [Message(role="user", content=f"turn {i}") for i in range(50)]
+        budget.build_context("System", history, provider="gemini")
+
+        history.append(Message(role="assistant", content="new reply"))
+        spy = mocker.spy(token_manager, "count_tokens")
+        budget.build_context("System", history, provider="gemini")
+
+        counted = [c.args[0] for c in spy.call_args_list]
+        assert counted == ["System", "new reply"]
@@ -153,17 +153,17 @@ class TestGHFallback:
         ai_service.provider = "gh"
 
         with patch.object(
-            ai_service, "complete", return_value="full gh response"
+            ai_service, "_try_complete", return_value="full gh response"
         ):
             chunks = list(ai_service.stream_complete("system", "user"))
 
         assert chunks == ["full gh response"]
         assert len(chunks) == 1
 
-    def test_yields_nothing_when_complete_returns_none(self, ai_service):
+    def test_yields_nothing_when_gh_returns_none(self, ai_service):
         ai_service.provider = "gh"
 
-        with patch.object(ai_service, "complete", return_value=None):
+        with patch.object(ai_service, "_try_complete", return_value=None):
             chunks = list(ai_service.stream_complete("system", "user"))
 
         assert chunks == []
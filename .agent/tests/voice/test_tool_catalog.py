@@ -0,0 +1,109 @@
+# Copyright 2026 Justin Cook
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the process-wide voice tool catalog."""
+
+import os
+
+import pytest
+
+from agent.tools import dynamic
+from backend.voice.tools import catalog as catalog_mod
+from backend.voice.tools.catalog import ToolCatalog
+
+
+class _FakeRegistry:
+    builds = 0
+
+    def __init__(self, repo_root=None):
+        type(self).builds += 1
+
+    def list_tools(self, all=False):
+        def read_file(path: str) -> str:
+            """Read a file."""
+            return path
+        return [read_file]
+
+    def get_tool_schemas(self, all=False):
+        return [catalog_mod.custom_schema(fn) for fn in self.list_tools(all=all)]
+
+
+@pytest.fixture
+def catalog(tmp_path, monkeypatch):
+    _FakeRegistry.builds = 0
+    monkeypatch.setattr(catalog_mod, "ToolRegistry", _FakeRegistry)
+    (tmp_path / "greet.py").write_text('def greet(name: str, times: int = 1):\n    """Say hi."""\n    return "hi " * times + name\n')
+    return ToolCatalog(custom_dir=tmp_path, package="voice_catalog_test")
+
+
+def _bump(path):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_snapshot_is_reused_until_something_changes(catalog):
+    first = catalog.snapshot()
+    assert catalog.snapshot() is first
+    assert _FakeRegistry.builds == 1
+    assert catalog.loads == 1
+    assert [s["function"]["name"] for s in first.schemas] == ["read_file", "greet"]
+    assert first.schemas[1]["function"]["parameters"]["required"] == ["name"]
+    with pytest.raises(TypeError):
+        first.handlers["x"] = print  # type: ignore[index]
+
+
+def test_touched_file_is_not_reloaded(catalog, tmp_path):
+    first = catalog.snapshot()
+    _bump(tmp_path / "greet.py")
+    assert catalog.snapshot() is first
+    assert catalog.loads == 1
+
+
+def test_edited_file_is_reloaded(catalog, tmp_path):
+    catalog.snapshot()
+    path = tmp_path / "greet.py"
+    path.write_text('def greet(name: str):\n    """Say hello."""\n    return "hello " + name\n')
+    _bump(path)
+    snap = catalog.snapshot()
+    assert catalog.loads == 2
+    assert snap.handlers["greet"]("bob") == "hello bob"
+    assert _FakeRegistry.builds == 1
+
+
+def test_added_and_removed_modules(catalog, tmp_path):
+    catalog.snapshot()
+    (tmp_path / "extra.py").write_text("def extra():\n    return 1\n")
+    assert "extra" in catalog.snapshot().handlers
+    (tmp_path / "extra.py").unlink()
+    assert "extra" not in catalog.snapshot().handlers
+    assert catalog.loads == 2
+
+
+def test_registry_names_win_over_custom(catalog, tmp_path):
+    (tmp_path / "shadow.py").write_text("def read_file(path):\n    return 'custom'\n")
+    snap = catalog.snapshot()
+    assert snap.handlers["read_file"]("x") == "x"
+    assert [s["function"]["name"] for s in snap.schemas].count("read_file") == 1
+    assert len(snap.tools) == 3
+
+
+def test_create_tool_event_invalidates(catalog, monkeypatch):
+    monkeypatch.setattr(dynamic, "_created_listeners", [])
+    monkeypatch.setattr(dynamic, "import_tool", lambda *a, **k: "Tool imported.")
+    monkeypatch.setattr(dynamic, "_get_custom_tools_dir", lambda: catalog.custom_dir / "agent_tools")
+    dynamic.on_tool_created(catalog.invalidate)
+    first = catalog.snapshot()
+    dynamic.create_tool("made.py", "def made():\n    return 2\n")
+    assert catalog.snapshot() is not first
+    assert _FakeRegistry.builds == 2